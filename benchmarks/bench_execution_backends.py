@@ -0,0 +1,148 @@
+# This file is part of pydidas.
+#
+# Copyright 2026, Helmholtz-Zentrum Hereon
+# SPDX-License-Identifier: GPL-3.0-only
+#
+# pydidas is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# Pydidas is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pydidas. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Benchmark for the execution backends of the ExecuteWorkflowRunner.
+
+The benchmark compares the throughput of the "processes" backend (the
+AppRunner with worker processes and shared memory buffers) with the
+"threads" backend (the AppThreadRunner with a pool of threads in the main
+process). The workflow consists of a loader for random images and a pyFAI
+azimuthal integration which releases the GIL during the integration.
+
+The throughput includes the startup of the workers and the writing of the
+results and is measured for a range of worker counts.
+
+Usage:
+
+    python benchmarks/bench_execution_backends.py [--n_frames N_FRAMES]
+        [--size SIZE] [--n_workers N_WORKERS [N_WORKERS ...]]
+
+Only long options are used because the ExecuteWorkflowRunner parses the
+command line arguments as well.
+"""
+
+__author__ = "Malte Storm"
+__copyright__ = "Copyright 2026, Helmholtz-Zentrum Hereon"
+__license__ = "GPL-3.0-only"
+__maintainer__ = "Malte Storm"
+__status__ = "Development"
+
+
+import argparse
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from pydidas import unittest_objects
+from pydidas.apps import ExecuteWorkflowRunner
+from pydidas.contexts import DiffractionExperimentContext, ScanContext
+from pydidas.core import PydidasQsettings
+from pydidas.multiprocessing import EXECUTION_BACKENDS
+from pydidas.plugins import PluginCollection
+from pydidas.workflow import WorkflowTree
+
+
+COLL = PluginCollection()
+EXP = DiffractionExperimentContext()
+SCAN = ScanContext()
+TREE = WorkflowTree()
+
+
+def setup_workflow(n_frames: int, size: int) -> None:
+    """Set up the Scan, DiffractionExperiment and WorkflowTree."""
+    COLL.find_and_register_plugins(Path(unittest_objects.__file__).parent)
+    SCAN.restore_all_defaults(True)
+    SCAN.set_param_value("scan_dim", 1)
+    SCAN.set_param_value("scan_dim0_n_points", n_frames)
+    for _key, _value in [
+        ("xray_wavelength", 0.5),
+        ("detector_npixx", size),
+        ("detector_npixy", size),
+        ("detector_pxsizex", 100),
+        ("detector_pxsizey", 100),
+        ("detector_dist", 0.2),
+        ("detector_poni1", 0.5e-4 * size),
+        ("detector_poni2", 0.5e-4 * size),
+    ]:
+        EXP.set_param_value(_key, _value)
+    TREE.clear()
+    TREE.create_and_add_node(
+        COLL.get_plugin_by_name("DummyLoader")(image_height=size, image_width=size)
+    )
+    TREE.create_and_add_node(
+        COLL.get_plugin_by_name("PyFAIazimuthalIntegration")(rad_npoint=1000)
+    )
+
+
+def run(backend: str, n_workers: int, n_frames: int, path: Path) -> float:
+    """
+    Run the benchmark for one backend.
+
+    Returns
+    -------
+    float
+        The throughput in frames per second.
+    """
+    PydidasQsettings().set_value("global/mp_n_workers", n_workers)
+    _output_dir = Path(tempfile.mkdtemp(dir=path))
+    _runner = ExecuteWorkflowRunner(
+        workflow=TREE.copy(),
+        scan=SCAN.copy(),
+        diffraction_exp=EXP.copy(),
+        output_dir=_output_dir,
+        backend=backend,
+    )
+    _t0 = time.perf_counter()
+    _runner.process_scan()
+    _dt = time.perf_counter() - _t0
+    shutil.rmtree(_output_dir)
+    return n_frames / _dt
+
+
+def main():
+    _parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    _parser.add_argument("--n_frames", type=int, default=400)
+    _parser.add_argument("--size", type=int, default=1024)
+    _parser.add_argument("--n_workers", type=int, nargs="+", default=[1, 2, 4])
+    _args, _ = _parser.parse_known_args()
+    _n_workers_setting = PydidasQsettings().value("global/mp_n_workers", int)
+    _path = Path(tempfile.mkdtemp())
+    setup_workflow(_args.n_frames, _args.size)
+    print(
+        f"Execution backend benchmark: {_args.n_frames} frames of shape "
+        f"({_args.size}, {_args.size}), azimuthal integration"
+    )
+    print(
+        f"{'n_workers':<12}"
+        + "".join(f"{_b + ' [1/s]':>22}" for _b in EXECUTION_BACKENDS)
+    )
+    try:
+        for _n_workers in _args.n_workers:
+            _results = [
+                run(_backend, _n_workers, _args.n_frames, _path)
+                for _backend in EXECUTION_BACKENDS
+            ]
+            print(f"{_n_workers:<12}" + "".join(f"{_r:>22.1f}" for _r in _results))
+    finally:
+        PydidasQsettings().set_value("global/mp_n_workers", _n_workers_setting)
+        shutil.rmtree(_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+# This file is part of pydidas.
+#
+# Copyright 2026, Helmholtz-Zentrum Hereon
+# SPDX-License-Identifier: GPL-3.0-only
+#
+# pydidas is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# Pydidas is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pydidas. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Benchmark for the analytic Jacobians of the fit functions.
+
+The benchmark fits synthetic, noisy peaks with scipy.optimize.least_squares,
+once with the Jacobian estimated by finite differences ("2-point") and once
+with the analytic Jacobian of the fit function. It reports the wall time,
+the number of iterations (i.e. Jacobian evaluations) and the total number of
+profile evaluations, including those required for the finite differences.
+The ratio of the final costs shows that both variants converge to the same
+results.
+
+Usage:
+
+    python benchmarks/bench_fit_jacobians.py [--n_fits N_FITS]
+        [--n_points N_POINTS] [--bg_order {-1,0,1}]
+
+A bg_order of -1 fits the peaks without background.
+"""
+
+__author__ = "Malte Storm"
+__copyright__ = "Copyright 2026, Helmholtz-Zentrum Hereon"
+__license__ = "GPL-3.0-only"
+__maintainer__ = "Malte Storm"
+__status__ = "Development"
+
+
+import argparse
+import time
+
+import numpy as np
+from scipy.optimize import least_squares
+
+from pydidas.core.fitting import FitFuncMeta, batch_profile
+
+
+FIT_FUNCS = [
+    "Gaussian",
+    "Lorentzian",
+    "Voigt",
+    "Double Gaussian",
+    "Double Lorentzian",
+    "Double Voigt",
+    "Triple Gaussian",
+    "Triple Lorentzian",
+    "Triple Voigt",
+]
+
+
+def create_data(
+    name: str, n_fits: int, n_points: int, bg_order: int | None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, tuple]:
+    """
+    Create synthetic peaks and the starting guesses for the fits.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray, tuple]
+        The x values, the profiles, the start parameters and the bounds.
+    """
+    _fitter = FitFuncMeta.get_fitter(name)
+    _rng = np.random.default_rng(seed=42)
+    _x = np.linspace(0, 20, n_points)
+    _params = []
+    for _ in range(n_fits):
+        _row = []
+        for _index in range(_fitter.num_peaks):
+            _row += [30 + 10 * _rng.random(), 0.6 + 0.3 * _rng.random()]
+            if _fitter.num_peak_params == 4:
+                _row += [0.3 + 0.2 * _rng.random()]
+            _row += [6 + 4 * _index + _rng.random()]
+        _params.append(_row + [2.0, 0.05])
+    _params = np.array(_params)
+    _y = batch_profile(_fitter, _params, _x)
+    _y += _rng.normal(0, 0.1, _y.shape)
+    _n_bg = {None: 0, 0: 1, 1: 2}[bg_order]
+    _bounds = (
+        _fitter.param_bounds_low + [-np.inf] * _n_bg,
+        _fitter.param_bounds_high + [np.inf] * _n_bg,
+    )
+    _start = _params[:, : _params.shape[1] - 2 + _n_bg]
+    _start = _start * _rng.uniform(0.9, 1.1, _start.shape)
+    return _x, _y, np.clip(_start, _bounds[0], _bounds[1]), _bounds
+
+
+def run(name: str, jac: str, x: np.ndarray, y: np.ndarray, start, bounds) -> dict:
+    """
+    Fit all profiles and collect the statistics.
+
+    Returns
+    -------
+    dict
+        The wall time, the number of iterations and profile evaluations and
+        the final costs.
+    """
+    _fitter = FitFuncMeta.get_fitter(name)
+    _jac = _fitter.delta_jacobian if jac == "analytic" else jac
+    _stats = {"time": 0.0, "n_iter": 0, "n_eval": 0, "costs": []}
+    _t0 = time.perf_counter()
+    for _c0, _y in zip(start, y):
+        _res = least_squares(_fitter.delta, _c0, args=(x, _y), bounds=bounds, jac=_jac)
+        _stats["n_iter"] += _res.njev
+        _stats["n_eval"] += _res.nfev + (
+            _res.njev * _c0.size if jac != "analytic" else 0
+        )
+        _stats["costs"].append(_res.cost)
+    _stats["time"] = time.perf_counter() - _t0
+    _stats["costs"] = np.asarray(_stats["costs"])
+    return _stats
+
+
+def main():
+    _parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    _parser.add_argument("--n_fits", type=int, default=200)
+    _parser.add_argument("--n_points", type=int, default=500)
+    _parser.add_argument("--bg_order", type=int, default=0, choices=[-1, 0, 1])
+    _args = _parser.parse_args()
+    _bg_order = None if _args.bg_order == -1 else _args.bg_order
+    print(
+        f"Fit Jacobian benchmark: {_args.n_fits} fits with {_args.n_points} "
+        f"points, background order {_bg_order}"
+    )
+    print(
+        f"{'fit function':<20}{'2-point [s]':>12}{'analytic [s]':>14}"
+        f"{'speedup':>9}{'iter 2-point':>14}{'iter analytic':>15}"
+        f"{'evals 2-point':>15}{'evals analytic':>16}{'max cost ratio':>16}"
+    )
+    for _name in FIT_FUNCS:
+        _data = create_data(_name, _args.n_fits, _args.n_points, _bg_order)
+        _fd = run(_name, "2-point", *_data)
+        _analytic = run(_name, "analytic", *_data)
+        _ratio = np.amax(_analytic["costs"] / _fd["costs"])
+        print(
+            f"{_name:<20}{_fd['time']:>12.3f}{_analytic['time']:>14.3f}"
+            f"{_fd['time'] / _analytic['time']:>9.2f}"
+            f"{_fd['n_iter'] / _args.n_fits:>14.1f}"
+            f"{_analytic['n_iter'] / _args.n_fits:>15.1f}"
+            f"{_fd['n_eval'] / _args.n_fits:>15.1f}"
+            f"{_analytic['n_eval'] / _args.n_fits:>16.1f}{_ratio:>16.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+# This file is part of pydidas.
+#
+# Copyright 2026, Helmholtz-Zentrum Hereon
+# SPDX-License-Identifier: GPL-3.0-only
+#
+# pydidas is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# Pydidas is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pydidas. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Benchmark for the autosave of results in HDF5 files.
+
+The benchmark compares the throughput of the previous autosave scheme, where
+each frame opened and closed the file and wrote into a contiguous dataset,
+with the ProcessingResultIoHdf5 which keeps the files open, writes into
+chunks of one scan point and optionally compresses the data. The previous
+scheme is reproduced below with the same access pattern.
+
+The results are random integrated azimuthal profiles which are written for
+a 2D scan. The throughput and the file size are given for each scheme.
+
+Usage:
+
+    python benchmarks/bench_hdf5_autosave.py [-n N_FRAMES] [-s SIZE]
+        [-c COMPRESSION [COMPRESSION ...]]
+"""
+
+__author__ = "Malte Storm"
+__copyright__ = "Copyright 2026, Helmholtz-Zentrum Hereon"
+__license__ = "GPL-3.0-only"
+__maintainer__ = "Malte Storm"
+__status__ = "Development"
+
+
+import argparse
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import h5py
+import numpy as np
+
+from pydidas.contexts import ScanContext
+from pydidas.core import Dataset, PydidasQsettings
+from pydidas.workflow.result_io.processing_result_io_hdf5 import ProcessingResultIoHdf5
+
+
+SCAN = ScanContext()
+H5SAVER = ProcessingResultIoHdf5
+
+
+def get_frame(size: int) -> Dataset:
+    """Get a smooth frame which is compressible, similar to real results."""
+    _x = np.linspace(0, 8 * np.pi, num=size)
+    _frame = 1e3 * np.sin(_x[:, None]) ** 2 + np.random.random((size, size))
+    return Dataset(_frame.astype(np.float32))
+
+
+def run_legacy(n_frames: int, frame: Dataset, path: Path) -> tuple[float, int]:
+    """
+    Run the benchmark with the per-frame open and close of the file.
+
+    Returns
+    -------
+    tuple[float, int]
+        The throughput in frames per second and the file size in bytes.
+    """
+    _fname = path / "legacy.h5"
+    with h5py.File(_fname, "w") as _file:
+        _file.create_dataset("data", shape=SCAN.shape + frame.shape, dtype="float32")
+    _t0 = time.perf_counter()
+    for _index in range(n_frames):
+        with h5py.File(_fname, "r+") as _file:
+            _file["data"][SCAN.get_indices_from_ordinal(_index)] = frame.array
+    _dt = time.perf_counter() - _t0
+    return n_frames / _dt, _fname.stat().st_size
+
+
+def run_saver(
+    n_frames: int, frame: Dataset, path: Path, compression: str
+) -> tuple[float, int]:
+    """
+    Run the benchmark with the ProcessingResultIoHdf5.
+
+    Returns
+    -------
+    tuple[float, int]
+        The throughput in frames per second and the file size in bytes.
+    """
+    PydidasQsettings().set_value("global/hdf5_compression", compression)
+    _dir = path / compression
+    H5SAVER.prepare_files_and_directories(
+        _dir,
+        {
+            1: {
+                "node_label": "bench",
+                "plugin_name": "Benchmark",
+                "shape": SCAN.shape + frame.shape,
+            }
+        },
+        scan_context=SCAN,
+    )
+    _t0 = time.perf_counter()
+    for _index in range(n_frames):
+        H5SAVER.export_frame_to_file(_index, {1: frame})
+    H5SAVER.close_files()
+    _dt = time.perf_counter() - _t0
+    return n_frames / _dt, (_dir / H5SAVER._filenames[1]).stat().st_size
+
+
+def main():
+    _parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    _parser.add_argument("-n", "--n_frames", type=int, default=1000)
+    _parser.add_argument("-s", "--size", type=int, default=128)
+    _parser.add_argument(
+        "-c",
+        "--compression",
+        nargs="+",
+        default=["None", "lzf", "gzip", "bitshuffle-lz4"],
+    )
+    _args = _parser.parse_args()
+    _compression_setting = PydidasQsettings().value("global/hdf5_compression", str)
+    _n_y = int(np.ceil(_args.n_frames / 50))
+    SCAN.restore_all_defaults(True)
+    SCAN.set_param_value("scan_dim", 2)
+    SCAN.set_param_value("scan_dim0_n_points", _n_y)
+    SCAN.set_param_value("scan_dim1_n_points", 50)
+    _frame = get_frame(_args.size)
+    _path = Path(tempfile.mkdtemp())
+    print(
+        f"HDF5 autosave benchmark: {_args.n_frames} frames of shape "
+        f"({_args.size}, {_args.size}) in a ({_n_y}, 50) scan"
+    )
+    print(f"{'scheme':<28}{'throughput [1/s]':>20}{'file size [MB]':>20}")
+    try:
+        _results = {"open/close per frame": run_legacy(_args.n_frames, _frame, _path)}
+        for _compression in _args.compression:
+            _results[f"persistent ({_compression})"] = run_saver(
+                _args.n_frames, _frame, _path, _compression
+            )
+        for _scheme, (_throughput, _size) in _results.items():
+            print(f"{_scheme:<28}{_throughput:>20.1f}{_size / 2**20:>20.2f}")
+    finally:
+        H5SAVER.close_files()
+        if _compression_setting is None:
+            PydidasQsettings().remove("global/hdf5_compression")
+        else:
+            PydidasQsettings().set_value(
+                "global/hdf5_compression", _compression_setting
+            )
+        shutil.rmtree(_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+# This file is part of pydidas.
+#
+# Copyright 2026, Helmholtz-Zentrum Hereon
+# SPDX-License-Identifier: GPL-3.0-only
+#
+# pydidas is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# Pydidas is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pydidas. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Benchmark for the shared-memory result buffer of the ExecuteWorkflowApp.
+
+The benchmark compares the throughput of the previous buffer access scheme,
+where every write acquired the mp.Manager lock twice (once to claim a slot
+and once to copy the results), with the partitioned scheme in which each
+writer owns a set of slots and no lock is required. Both schemes are
+reproduced below with the same access pattern as in the ExecuteWorkflowApp:
+workers write results into a free slot and send the slot index to the main
+process which reads the results and releases the slot.
+
+The throughput is measured for a range of worker counts.
+
+Usage:
+
+    python benchmarks/bench_shared_result_buffer.py [-n N_FRAMES] [-s SIZE]
+        [-b N_SLOTS] [-w N_WORKERS [N_WORKERS ...]]
+"""
+
+__author__ = "Malte Storm"
+__copyright__ = "Copyright 2026, Helmholtz-Zentrum Hereon"
+__license__ = "GPL-3.0-only"
+__maintainer__ = "Malte Storm"
+__status__ = "Development"
+
+
+import argparse
+import multiprocessing as mp
+import time
+from collections import deque
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable
+
+import numpy as np
+
+
+def _get_arrays(name: str, n_slots: int, shape: tuple) -> tuple:
+    _data_mem = SharedMemory(name=f"{name}_data")
+    _flag_mem = SharedMemory(name=f"{name}_flag")
+    _data = np.ndarray((n_slots,) + shape, dtype=np.float32, buffer=_data_mem.buf)
+    _flags = np.ndarray((n_slots,), dtype=np.int32, buffer=_flag_mem.buf)
+    return _data_mem, _flag_mem, _data, _flags
+
+
+def legacy_writer(config: dict, tasks: list) -> None:
+    """The writer using the manager lock for every frame."""
+    _lock = config["lock"]
+    _data_mem, _flag_mem, _data, _flags = _get_arrays(
+        config["name"], config["n_slots"], config["shape"]
+    )
+    _frame = np.random.random(config["shape"]).astype(np.float32)
+    for _task in tasks:
+        while True:
+            with _lock:
+                _zeros = np.where(_flags == 0)[0]
+                if _zeros.size > 0:
+                    _pos = _zeros[0]
+                    _flags[_pos] = 1
+                    break
+            time.sleep(0.005)
+        with _lock:
+            _data[_pos] = _frame
+        config["queue"].put((_task, _pos))
+    del _data, _flags
+    _data_mem.close()
+    _flag_mem.close()
+
+
+def partitioned_writer(config: dict, tasks: list) -> None:
+    """The writer using an exclusive partition of the buffer slots."""
+    with config["lock"]:
+        _index = config["n_writers"].value
+        config["n_writers"].value = _index + 1
+    _data_mem, _flag_mem, _data, _flags = _get_arrays(
+        config["name"], config["n_slots"], config["shape"]
+    )
+    _slots = deque(range(_index, config["n_slots"], config["n_partitions"]))
+    _frame = np.random.random(config["shape"]).astype(np.float32)
+    for _task in tasks:
+        _pos = None
+        while _pos is None:
+            for _ in range(len(_slots)):
+                _slot = _slots[0]
+                _slots.rotate(-1)
+                if _flags[_slot] == 0:
+                    _pos = _slot
+                    break
+            else:
+                time.sleep(0.001)
+        _data[_pos] = _frame
+        _flags[_pos] = 1
+        config["queue"].put((_task, _pos))
+    del _data, _flags
+    _data_mem.close()
+    _flag_mem.close()
+
+
+def run(
+    writer: Callable, n_workers: int, n_frames: int, shape: tuple, n_slots: int
+) -> float:
+    """
+    Run the benchmark for one writer scheme.
+
+    Returns
+    -------
+    float
+        The throughput in frames per second.
+    """
+    _manager = mp.Manager()
+    _name = f"pydidas_bench_{mp.current_process().pid}"
+    _data_mem = SharedMemory(
+        name=f"{_name}_data", create=True, size=int(4 * n_slots * np.prod(shape))
+    )
+    _flag_mem = SharedMemory(name=f"{_name}_flag", create=True, size=4 * n_slots)
+    _data = np.ndarray((n_slots,) + shape, dtype=np.float32, buffer=_data_mem.buf)
+    _flags = np.ndarray((n_slots,), dtype=np.int32, buffer=_flag_mem.buf)
+    _flags[:] = 0
+    _config = {
+        "name": _name,
+        "shape": shape,
+        "n_slots": n_slots,
+        "n_partitions": min(n_workers, n_slots),
+        "lock": _manager.Lock(),
+        "n_writers": _manager.Value("I", 0),
+        "queue": mp.Queue(),
+    }
+    _tasks = np.array_split(np.arange(n_frames), n_workers)
+    _workers = [
+        mp.Process(target=writer, args=(_config, list(_tasks[_i])), daemon=True)
+        for _i in range(n_workers)
+    ]
+    _result = np.zeros(shape, dtype=np.float32)
+    _t0 = time.perf_counter()
+    for _worker in _workers:
+        _worker.start()
+    for _ in range(n_frames):
+        _, _pos = _config["queue"].get()
+        if writer is legacy_writer:
+            with _config["lock"]:
+                _result[:] = _data[_pos]
+                _flags[_pos] = 0
+        else:
+            _result[:] = _data[_pos]
+            _flags[_pos] = 0
+    _dt = time.perf_counter() - _t0
+    for _worker in _workers:
+        _worker.join()
+    del _data, _flags
+    _data_mem.close()
+    _data_mem.unlink()
+    _flag_mem.close()
+    _flag_mem.unlink()
+    _config["queue"].close()
+    _manager.shutdown()
+    return n_frames / _dt
+
+
+def main():
+    _parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    _parser.add_argument("-n", "--n_frames", type=int, default=5000)
+    _parser.add_argument("-s", "--size", type=int, default=256)
+    _parser.add_argument("-b", "--n_slots", type=int, default=32)
+    _parser.add_argument("-w", "--n_workers", type=int, nargs="+", default=[1, 2, 4])
+    _args = _parser.parse_args()
+    _shape = (_args.size, _args.size)
+    print(
+        f"Shared buffer benchmark: {_args.n_frames} frames of shape {_shape}, "
+        f"{_args.n_slots} buffer slots"
+    )
+    print(f"{'n_workers':<12}{'manager lock [1/s]':>22}{'partitioned [1/s]':>22}")
+    for _n_workers in _args.n_workers:
+        _legacy = run(legacy_writer, _n_workers, _args.n_frames, _shape, _args.n_slots)
+        _new = run(
+            partitioned_writer, _n_workers, _args.n_frames, _shape, _args.n_slots
+        )
+        print(f"{_n_workers:<12}{_legacy:>22.1f}{_new:>22.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+# This file is part of pydidas.
+#
+# Copyright 2026, Helmholtz-Zentrum Hereon
+# SPDX-License-Identifier: GPL-3.0-only
+#
+# pydidas is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# Pydidas is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pydidas. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Benchmark for the per-task dispatch overhead of the multiprocessing workers.
+
+The benchmark compares the event-driven processor_func and app_processor_func
+with the previous sleep-polling implementations (reproduced below for
+reference). Two scenarios are measured:
+
+1. Bulk throughput: All tasks are queued at once and processed by the
+   workers with a trivial function.
+2. Trickle latency: Tasks are submitted one at a time and the round-trip
+   time for each is measured. This corresponds to the live-processing case
+   where the input queue runs empty regularly.
+
+Usage:
+
+    python benchmarks/bench_worker_dispatch.py [-n N_TASKS] [-w N_WORKERS]
+"""
+
+__author__ = "Malte Storm"
+__copyright__ = "Copyright 2026, Helmholtz-Zentrum Hereon"
+__license__ = "GPL-3.0-only"
+__maintainer__ = "Malte Storm"
+__status__ = "Development"
+
+
+import argparse
+import multiprocessing as mp
+import queue
+import time
+from typing import Any, Callable
+
+from pydidas.core import BaseApp
+from pydidas.multiprocessing.app_processor import app_processor_func
+from pydidas.multiprocessing.processor import processor_func
+
+
+def _identity(x: Any) -> Any:
+    return x
+
+
+class TrivialApp(BaseApp):
+    """An app which returns the task index as result."""
+
+    def multiprocessing_pre_run(self):
+        pass
+
+    def multiprocessing_pre_cycle(self, index: int):
+        self._index = index
+
+    def multiprocessing_carryon(self) -> bool:
+        return True
+
+    def multiprocessing_func(self, index: int) -> int:
+        return index
+
+    def must_send_signal_and_wait_for_response(self) -> None:
+        return None
+
+
+def legacy_processor_func(
+    function: Callable, multiprocessing_config: dict, *func_args, **func_kwargs
+) -> None:
+    """The sleep-polling processor_func implementation used for reference."""
+    input_queue = multiprocessing_config.get("queue_input")
+    output_queue = multiprocessing_config.get("queue_output")
+    stop_queue = multiprocessing_config.get("queue_stop")
+    _shutting_down_queue = multiprocessing_config.get("queue_shutting_down")
+    while True:
+        try:
+            stop_queue.get_nowait()
+            _shutting_down_queue.put(1)
+            break
+        except queue.Empty:
+            pass
+        try:
+            _arg1 = input_queue.get(timeout=0.005)
+            if _arg1 is None:
+                output_queue.put([None, None])
+                break
+            output_queue.put([_arg1, function(_arg1, *func_args, **func_kwargs)])
+        except queue.Empty:
+            time.sleep(0.01)
+
+
+def legacy_app_processor_func(
+    multiprocessing_config: dict, app_class: type, app_params, app_config: dict
+) -> None:
+    """The sleep-polling app_processor_func loop used for reference."""
+    _input_queue = multiprocessing_config.get("queue_input")
+    _output_queue = multiprocessing_config.get("queue_output")
+    _stop_queue = multiprocessing_config.get("queue_stop")
+    _io_lock = multiprocessing_config.get("lock")
+    _app = app_class(app_params, clone_mode=True)
+    _app._config = app_config
+    _app.multiprocessing_pre_run()
+    while True:
+        try:
+            _stop_queue.get_nowait()
+            break
+        except queue.Empty:
+            pass
+        try:
+            _arg = _input_queue.get_nowait()
+        except queue.Empty:
+            time.sleep(0.005)
+            continue
+        if _arg is None:
+            _output_queue.put([None, None])
+            break
+        with _io_lock:
+            pass
+        _app.multiprocessing_pre_cycle(_arg)
+        if _app.multiprocessing_carryon():
+            with _io_lock:
+                pass
+            _results = _app.multiprocessing_func(_arg)
+            _output_queue.put([_arg, _results])
+            with _io_lock:
+                pass
+
+
+_QUEUE_KEYS = [
+    "queue_input",
+    "queue_output",
+    "queue_stop",
+    "queue_shutting_down",
+    "queue_signal",
+]
+
+
+def _create_config(manager: mp.managers.SyncManager) -> dict:
+    return {_key: mp.Queue() for _key in _QUEUE_KEYS} | {
+        "logging_level": 30,
+        "lock": manager.Lock(),
+    }
+
+
+def _worker_args(target: Callable, config: dict) -> tuple:
+    if target in (processor_func, legacy_processor_func):
+        return (_identity, config)
+    _app = TrivialApp()
+    return (config, TrivialApp, _app.params.copy(), _app.get_config())
+
+
+def _start_workers(target: Callable, config: dict, n_workers: int) -> list:
+    _workers = [
+        mp.Process(target=target, args=_worker_args(target, config), daemon=True)
+        for _ in range(n_workers)
+    ]
+    for _worker in _workers:
+        _worker.start()
+    return _workers
+
+
+def _stop_workers(workers: list, config: dict) -> None:
+    for _ in workers:
+        config["queue_input"].put(None)
+    _n_done = 0
+    while _n_done < len(workers):
+        if config["queue_output"].get() == [None, None]:
+            _n_done += 1
+    for _worker in workers:
+        _worker.join()
+    for _key in _QUEUE_KEYS:
+        config[_key].close()
+
+
+def run_bulk(target: Callable, n_tasks: int, n_workers: int) -> float:
+    """
+    Run the bulk throughput benchmark.
+
+    Returns
+    -------
+    float
+        The mean wall time per task in microseconds.
+    """
+    _manager = mp.Manager()
+    _config = _create_config(_manager)
+    _workers = _start_workers(target, _config, n_workers)
+    # warm-up to exclude process startup from the measurement
+    for _index in range(n_workers):
+        _config["queue_input"].put(_index)
+    for _ in range(n_workers):
+        _config["queue_output"].get()
+    _t0 = time.perf_counter()
+    for _index in range(n_tasks):
+        _config["queue_input"].put(_index)
+    for _ in range(n_tasks):
+        _config["queue_output"].get()
+    _dt = time.perf_counter() - _t0
+    _stop_workers(_workers, _config)
+    _manager.shutdown()
+    return 1e6 * _dt / n_tasks
+
+
+def run_trickle(target: Callable, n_tasks: int, n_workers: int) -> float:
+    """
+    Run the trickle latency benchmark.
+
+    Returns
+    -------
+    float
+        The mean round-trip time per task in microseconds.
+    """
+    _manager = mp.Manager()
+    _config = _create_config(_manager)
+    _workers = _start_workers(target, _config, n_workers)
+    _config["queue_input"].put(-1)
+    _config["queue_output"].get()
+    _t0 = time.perf_counter()
+    for _index in range(n_tasks):
+        _config["queue_input"].put(_index)
+        _config["queue_output"].get()
+    _dt = time.perf_counter() - _t0
+    _stop_workers(_workers, _config)
+    _manager.shutdown()
+    return 1e6 * _dt / n_tasks
+
+
+def main():
+    _parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    _parser.add_argument("-n", "--n_tasks", type=int, default=100_000)
+    _parser.add_argument("-w", "--n_workers", type=int, default=4)
+    _parser.add_argument("--n_trickle", type=int, default=500)
+    _args = _parser.parse_args()
+    print(
+        f"Dispatch benchmark: {_args.n_tasks} bulk tasks, {_args.n_trickle} "
+        f"trickle tasks, {_args.n_workers} workers"
+    )
+    print(f"{'implementation':<32}{'bulk [us/task]':>18}{'trickle [us/task]':>20}")
+    for _name, _func in [
+        ("processor_func (polling)", legacy_processor_func),
+        ("processor_func (event)", processor_func),
+        ("app_processor_func (polling)", legacy_app_processor_func),
+        ("app_processor_func (event)", app_processor_func),
+    ]:
+        _bulk = run_bulk(_func, _args.n_tasks, _args.n_workers)
+        _trickle = run_trickle(_func, _args.n_trickle, _args.n_workers)
+        print(f"{_name:<32}{_bulk:>18.2f}{_trickle:>20.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
 # This file is part of pydidas.
 #
-# Copyright 2023 - 2025, Helmholtz-Zentrum Hereon
+# Copyright 2023 - 2026, Helmholtz-Zentrum Hereon
 # SPDX-License-Identifier: GPL-3.0-only
 #
 # pydidas is free software: you can redistribute it and/or modify
@@ -21,7 +21,7 @@ for processing diffraction data.
 """
 
 __author__ = "Malte Storm"
-__copyright__ = "Copyright 2023 - 2025, Helmholtz-Zentrum Hereon"
+__copyright__ = "Copyright 2023 - 2026, Helmholtz-Zentrum Hereon"
 __license__ = "GPL-3.0-only"
 __maintainer__ = "Malte Storm"
 __status__ = "Production"
@@ -29,11 +29,13 @@ __all__ = ["ExecuteWorkflowApp"]
 
 
 import multiprocessing as mp
+import threading
 import time
 import warnings
+from collections import deque
 from multiprocessing.shared_memory import SharedMemory
 from numbers import Integral
-from typing import Optional, Union
+from typing import Iterable, Optional, Union
 
 import numpy as np
 from qtpy import QtCore
@@ -41,15 +43,25 @@ from qtpy import QtCore
 from pydidas.apps.parsers import execute_workflow_app_parser
 from pydidas.contexts import DiffractionExperimentContext, ScanContext
 from pydidas.core import (
+    AsyncWriteQueue,
     BaseApp,
     Dataset,
     FileReadError,
+    Hdf5FileCache,
+    SharedResources,
     UserConfigError,
     get_generic_param_collection,
 )
-from pydidas.core.utils import pydidas_logger
+from pydidas.core.utils import get_param_file_stamps, pydidas_logger
 from pydidas.core.utils.dataset_utils import get_default_property_dict
-from pydidas.workflow import WorkflowResults, WorkflowTree
+from pydidas.plugins import BasePlugin, InputPlugin, OutputPlugin
+from pydidas.workflow import (
+    NodeProfile,
+    ProcessingTree,
+    WorkflowProfile,
+    WorkflowResults,
+    WorkflowTree,
+)
 from pydidas.workflow.result_io import ProcessingResultIoMeta
 from pydidas_qtcore import PydidasQApplication
 
@@ -62,6 +74,58 @@ RESULT_SAVER = ProcessingResultIoMeta
 
 logger = pydidas_logger()
 
+# The datatype kinds which can be stored in the shared memory buffers.
+_SHAREABLE_DTYPE_KINDS = "biufc"
+# The waiting time for a worker if all its buffer slots are in use.
+SLOT_WAIT_INTERVAL = 0.001
+
+
+def _get_result_dtype(result: np.ndarray, plugin: BasePlugin) -> np.dtype:
+    """
+    Get the datatype for storing the results of a plugin.
+
+    Parameters
+    ----------
+    result : np.ndarray
+        The plugin's results.
+    plugin : BasePlugin
+        The plugin. Its result_dtype Parameter allows to downcast the results.
+
+    Returns
+    -------
+    np.dtype
+        The datatype for storing the results.
+    """
+    _dtype = np.asarray(result).dtype
+    _downcast = (
+        "result_dtype" in plugin.params
+        and plugin.get_param_value("result_dtype") == "float32"
+    )
+    if _downcast or _dtype.kind not in _SHAREABLE_DTYPE_KINDS:
+        return np.dtype(np.float32)
+    return _dtype
+
+
+def _get_result_metadata(result: np.ndarray) -> dict:
+    """
+    Get the metadata of a plugin's results without the metadata dictionary.
+
+    Parameters
+    ----------
+    result : np.ndarray
+        The plugin's results.
+
+    Returns
+    -------
+    dict
+        The property dictionary of the results.
+    """
+    if isinstance(result, Dataset):
+        _metadata = result.property_dict
+        _metadata.pop("metadata")
+        return _metadata
+    return get_default_property_dict(result.shape)
+
 
 class ExecuteWorkflowApp(BaseApp):
     """
@@ -96,6 +160,33 @@ class ExecuteWorkflowApp(BaseApp):
     live_processing : bool, optional
         Flag to enable live processing. This will implement checks on file
         existence before processing starts. The default is False.
+    profile_workflow : bool, optional
+        Flag to record the runtime profiles of all plugins. The combined
+        profile of all workers is available through the WorkflowResults
+        get_profile method after processing. The default is False.
+    profile_memory : bool, optional
+        Flag to trace the peak memory allocations of all plugins with
+        tracemalloc while profiling. Memory tracing is stopped after each
+        run. The default is False.
+    n_partitions : int, optional
+        The number of partitions of the scan. Each run of the app only
+        processes the scan points of a single partition. The default is 1.
+    partition_index : int, optional
+        The index of the partition to be processed. The scan points are
+        split into n_partitions contiguous blocks and only the block with
+        the given index is processed. The default is 0.
+
+    Autosaved results and the files of OutputPlugins are written by
+    background writer threads with bounded queues (see the global
+    "async_write_queue_size" and "async_write_batch_size" settings). The
+    queued results are written before the multiprocessing_post_run method
+    returns and the statistics of the result writer are available through
+    the get_write_statistics method.
+
+    The app can also be run in a pool of threads with the AppThreadRunner.
+    Each thread processes the workflow with its own copy of the
+    WorkflowTree and the results are written directly into the
+    WorkflowResults without any shared memory buffers.
 
     The "sig_results_updated" signal will be emitted upon a new update of the
     stored result and can be used
@@ -111,7 +202,14 @@ class ExecuteWorkflowApp(BaseApp):
     """
 
     default_params = get_generic_param_collection(
-        "autosave_results", "autosave_directory", "autosave_format", "live_processing"
+        "autosave_results",
+        "autosave_directory",
+        "autosave_format",
+        "live_processing",
+        "profile_workflow",
+        "profile_memory",
+        "n_partitions",
+        "partition_index",
     )
     parse_func = execute_workflow_app_parser
     attributes_not_to_copy_to_app_clone = (
@@ -120,6 +218,7 @@ class ExecuteWorkflowApp(BaseApp):
             "_shared_arrays",
             "_index",
             "_mp_tasks",
+            "_buffer_slots",
         ]
     )
     sig_results_updated = QtCore.Signal()
@@ -137,10 +236,11 @@ class ExecuteWorkflowApp(BaseApp):
                 "scan_context": {},
                 "exp_context": {},
                 "export_files_prepared": False,
+                "shared_resource_keys": {},
             }
         )
         self._index = -1
-        self._locals = {"shared_memory_buffers": {}}
+        self._locals = {"shared_memory_buffers": {}, "result_writer": None}
         if not self.clone_mode:
             self._prepare_mp_configuration()
         self.reset_runtime_vars()
@@ -153,6 +253,7 @@ class ExecuteWorkflowApp(BaseApp):
 
         - A mp.Manager instance for shared state management
         - A dictionary for the shapes of the results
+        - A dictionary for the datatypes of the results
         - A dictionary for the metadata of the results
         - An Event to signal that the shapes are available which allows
           the main process to query the shapes dictionary and initialize
@@ -160,12 +261,21 @@ class ExecuteWorkflowApp(BaseApp):
         - An Event to signal that the shapes are set and the main process
           has created the shared memory arrays. Workers can then resume
           their work.
-        - A Lock to synchronize access to the shared memory arrays.
+        - A Lock to synchronize the publication of the shapes and the
+          registration of the writers.
+        - The number of workers of the current run.
+        - Counters for the number of buffer partitions and registered
+          writers of the shared memory arrays.
+        - A dictionary for the I/O statistics of the workers' input plugins.
+        - A dictionary for the runtime profiles of the workers' plugins.
         """
         self._mp_manager_instance = mp.Manager()
         for _item, _type in [
             ("shapes_dict", self._mp_manager_instance.dict),
+            ("dtypes_dict", self._mp_manager_instance.dict),
             ("metadata_dict", self._mp_manager_instance.dict),
+            ("io_stats_dict", self._mp_manager_instance.dict),
+            ("profile_dict", self._mp_manager_instance.dict),
             ("shapes_available", self._mp_manager_instance.Event),
             ("shapes_set", self._mp_manager_instance.Event),
             ("lock", self._mp_manager_instance.Lock),
@@ -174,7 +284,13 @@ class ExecuteWorkflowApp(BaseApp):
         self.mp_manager["main_pid"] = self._mp_manager_instance.Value(
             "I", mp.current_process().pid
         )
-        self.mp_manager["buffer_n"] = self._mp_manager_instance.Value("I", 0)
+        for _key in [
+            "n_workers",
+            "buffer_n",
+            "buffer_n_partitions",
+            "buffer_n_writers",
+        ]:
+            self.mp_manager[_key] = self._mp_manager_instance.Value("I", 0)
 
     def reset_runtime_vars(self):
         """
@@ -185,6 +301,10 @@ class ExecuteWorkflowApp(BaseApp):
         self._mp_tasks = np.array(())
         self._index = None
         self._shared_arrays = {}
+        self._buffer_slots = None
+        self._locals["thread_local"] = threading.local()
+        self._locals["thread_trees"] = []
+        self._locals["thread_lock"] = threading.Lock()
         if not self.clone_mode:
             for _key, _val in self.mp_manager.items():
                 if _key.startswith("shape") or _key.endswith("_dict"):
@@ -205,37 +325,189 @@ class ExecuteWorkflowApp(BaseApp):
 
             1. Get the shape of all results from the WorkflowTree and store
                them for internal reference.
-            2. Get all multiprocessing tasks from the ScanContext.
+            2. Get the multiprocessing tasks of the selected scan partition
+               from the ScanContext.
             3. Calculate the required buffer size and verify that the memory
                requirements are okay.
             4. Initialize the shared memory arrays.
 
         Both the cloned and the main applications then initialize local numpy
         arrays from the shared memory.
+
+        App clones in persistent workers keep their WorkflowTree between runs
+        and only pre-execute plugins with changed Parameters, unless the
+        Scan or DiffractionExperiment have changed.
+
+        The main App publishes the SharedResources of all plugins while
+        preparing the WorkflowTree and passes the resource keys to the app
+        clones in the worker processes.
         """
         self.reset_runtime_vars()
-        self._mp_tasks = np.arange(SCAN.n_points)
         if self.clone_mode:
-            self._recreate_context()
+            _context_changed = self._recreate_context()
+            self._mp_tasks = self._get_partition_tasks()
+            if mp.parent_process() is not None:
+                SharedResources().assign_keys(self._config["shared_resource_keys"])
+            TREE.prepare_execution(
+                forced=_context_changed, skip_unchanged=not _context_changed
+            )
+            if isinstance(TREE.root.plugin, InputPlugin):
+                TREE.root.plugin.reset_io_statistics()
         else:
+            self._mp_tasks = self._get_partition_tasks()
             self.close_shared_arrays_and_memory()
             RESULT_SAVER.set_active_savers_and_title([])
             self._store_context()
             RESULTS.prepare_new_results()
             if self.get_param_value("autosave_results"):
                 self._config["export_files_prepared"] = False
-        TREE.prepare_execution()
+            self._prepare_result_writer()
+            TREE.prepare_execution()
+            self._config["shared_resource_keys"] = SharedResources().keys
+        if self.clone_mode:
+            self._configure_async_output()
+        self._configure_prefetching(TREE)
+        TREE.enable_profiling(
+            self.get_param_value("profile_workflow"),
+            trace_memory=self.get_param_value("profile_memory"),
+        )
         self._config["run_prepared"] = True
 
-    def _recreate_context(self):
+    def _prepare_result_writer(self):
+        """
+        Prepare the background writer for the autosave of results.
+
+        No writer is used if autosave is disabled or if the write queue size
+        is set to zero.
+        """
+        self._close_result_writer()
+        self._locals["write_statistics"] = {}
+        _queue_size = self.q_settings_get(
+            "global/async_write_queue_size", int, default=64
+        )
+        if self.get_param_value("autosave_results") and _queue_size > 0:
+            self._locals["result_writer"] = AsyncWriteQueue(
+                self._write_result_batch,
+                _queue_size,
+                self.q_settings_get("global/async_write_batch_size", int, default=16),
+                name="pydidas_result_writer",
+            )
+
+    def _configure_async_output(self):
+        """
+        Configure the asynchronous output of the OutputPlugins.
+
+        The asynchronous output is only enabled in the processes and threads
+        which execute the WorkflowTree and is disabled again in the
+        multiprocessing_post_run method.
+        """
+        OutputPlugin.configure_async_output(
+            self.q_settings_get("global/async_write_queue_size", int, default=64),
+            self.q_settings_get("global/async_write_batch_size", int, default=16),
+        )
+
+    def _configure_prefetching(self, tree: ProcessingTree, enabled: bool = True):
+        """
+        Configure the prefetching of input frames in the tree's InputPlugin.
+
+        Parameters
+        ----------
+        tree : ProcessingTree
+            The tree with the InputPlugin.
+        enabled : bool, optional
+            Flag whether to enable prefetching with the depth from the global
+            settings. If False, prefetching is disabled. The default is True.
+        """
+        if tree.root is None or not isinstance(tree.root.plugin, InputPlugin):
+            return
+        _depth = (
+            self.q_settings_get("global/input_prefetch_depth", int, default=0)
+            if enabled
+            else 0
+        )
+        tree.root.plugin.configure_prefetching(
+            _depth,
+            self.q_settings_get("global/input_prefetch_max_size", float, default=256),
+        )
+
+    @staticmethod
+    def _write_result_batch(batch: list[tuple[int, dict]]):
+        """
+        Write a batch of results to the active savers.
+
+        Parameters
+        ----------
+        batch : list[tuple[int, dict]]
+            The batch of task indices and result dictionaries.
+        """
+        RESULT_SAVER.export_frames_to_active_savers(dict(batch))
+
+    def _close_result_writer(self):
+        """Write all queued results and stop the result writer thread."""
+        _writer = self._locals.get("result_writer", None)
+        if _writer is not None:
+            self._locals["result_writer"] = None
+            try:
+                _writer.close()
+            finally:
+                self._locals["write_statistics"] = _writer.statistics
+
+    def _get_partition_tasks(self) -> np.ndarray:
+        """
+        Get the scan points of the selected partition of the scan.
+
+        Returns
+        -------
+        np.ndarray
+            The ordinals of the scan points in the partition.
+
+        Raises
+        ------
+        UserConfigError
+            If the partition configuration is invalid.
+        """
+        _n_partitions = self.get_param_value("n_partitions")
+        _index = self.get_param_value("partition_index")
+        if not 1 <= _n_partitions <= max(1, SCAN.n_points):
+            raise UserConfigError(
+                f"The number of partitions ({_n_partitions}) must be in the range "
+                f"[1, {SCAN.n_points}] (the number of scan points)."
+            )
+        if not 0 <= _index < _n_partitions:
+            raise UserConfigError(
+                f"The partition index {_index} is out of the range of the "
+                f"partitions [0, {_n_partitions - 1}]."
+            )
+        return np.array_split(np.arange(SCAN.n_points), _n_partitions)[_index]
+
+    def _recreate_context(self) -> bool:
         """
         Recreate the required context from the config for app clones.
+
+        The WorkflowTree is updated incrementally to keep the existing plugins
+        if the structure of the tree has not changed.
+
+        Returns
+        -------
+        bool
+            Flag whether the Scan or DiffractionExperiment or the files
+            referenced by them have changed.
         """
-        TREE.restore_from_string(self._config["tree_str_rep"])
+        _context_hash = hash((hash(SCAN), hash(EXP)))
+        TREE.update_from_string(self._config["tree_str_rep"])
         for _key, _val in self._config["scan_context"].items():
             SCAN.set_param_value(_key, _val)
         for _key, _val in self._config["exp_context"].items():
             EXP.set_param_value(_key, _val)
+        _file_stamps = (
+            get_param_file_stamps(SCAN.params),
+            get_param_file_stamps(EXP.params),
+        )
+        _files_changed = (
+            self._locals.get("context_file_stamps", _file_stamps) != _file_stamps
+        )
+        self._locals["context_file_stamps"] = _file_stamps
+        return _files_changed or hash((hash(SCAN), hash(EXP))) != _context_hash
 
     def close_shared_arrays_and_memory(self):
         """
@@ -281,6 +553,20 @@ class ExecuteWorkflowApp(BaseApp):
         """
         return self._mp_tasks
 
+    def multiprocessing_get_task_locality_keys(self) -> list | None:
+        """
+        Get the locality keys of all tasks from the WorkflowTree's input plugin.
+
+        Returns
+        -------
+        list or None
+            The locality keys (i.e. the file and chunk indices) for each task
+            or None if the WorkflowTree does not start with an InputPlugin.
+        """
+        if TREE.root is None or not isinstance(TREE.root.plugin, InputPlugin):
+            return None
+        return [TREE.root.plugin.get_locality_key(_index) for _index in self._mp_tasks]
+
     def multiprocessing_pre_cycle(self, index: int):
         """
         Store the reference to the frame index internally.
@@ -292,6 +578,24 @@ class ExecuteWorkflowApp(BaseApp):
         """
         self._index = index
 
+    def multiprocessing_upcoming_tasks(self, tasks: Iterable):
+        """
+        Pass the upcoming tasks to the WorkflowTree's InputPlugin.
+
+        The InputPlugin reads the frames of the upcoming tasks ahead, if
+        prefetching is enabled. In live processing, the upcoming files are
+        usually not yet available and the tasks are not passed on.
+
+        Parameters
+        ----------
+        tasks : Iterable
+            The upcoming task indices.
+        """
+        if self.get_param_value("live_processing"):
+            return
+        if TREE.root is not None and isinstance(TREE.root.plugin, InputPlugin):
+            TREE.root.plugin.set_upcoming_ordinals(tasks)
+
     def multiprocessing_carryon(self) -> bool:
         """
         Get the flag value whether to carry on processing.
@@ -319,7 +623,22 @@ class ExecuteWorkflowApp(BaseApp):
         bool
             Flag whether the processing can continue.
         """
-        return self.mp_manager["shapes_set"].is_set()
+        return self._shapes_set()
+
+    def _shapes_set(self) -> bool:
+        """
+        Check whether the shapes have been set and the shared memory exists.
+
+        Once the local arrays have been created from the shared memory, the
+        shapes cannot change during the run and the manager process does not
+        need to be queried anymore.
+
+        Returns
+        -------
+        bool
+            Flag whether the shapes have been set.
+        """
+        return len(self._shared_arrays) > 0 or self.mp_manager["shapes_set"].is_set()
 
     def multiprocessing_func(self, index: int) -> Union[None, int]:
         """
@@ -346,41 +665,284 @@ class ExecuteWorkflowApp(BaseApp):
                 TREE.execute_process(index)
         except FileReadError:
             return -1
-        with self.mp_manager["lock"]:
-            if not self.mp_manager["shapes_available"].is_set():
-                self._publish_shapes_and_metadata_to_manager()
-        if not self.mp_manager["shapes_set"].is_set():
-            if self.clone_mode:
-                self._config["latest_results"] = TREE.get_current_results()
-                return None
-            self._create_shared_memory()
+        if not self._shapes_set():
+            with self.mp_manager["lock"]:
+                if not self.mp_manager["shapes_available"].is_set():
+                    self._publish_shapes_and_metadata_to_manager()
+            if not self.mp_manager["shapes_set"].is_set():
+                if self.clone_mode:
+                    self._config["latest_results"] = TREE.get_current_results()
+                    return None
+                self._create_shared_memory()
         self.__write_results_to_shared_arrays()
         return self._config["buffer_pos"]
 
+    def threading_carryon(self, index: int) -> bool:
+        """
+        Get the flag whether the processing of the index can carry on.
+
+        This method is the thread-safe equivalent of multiprocessing_carryon.
+
+        Parameters
+        ----------
+        index : int
+            The index of the image / frame.
+
+        Returns
+        -------
+        bool
+            Flag whether the processing can carry on or needs to wait.
+        """
+        if self.get_param_value("live_processing"):
+            return self._get_thread_tree().root.plugin.input_available(index)
+        return True
+
+    def threading_func(self, index: int) -> int:
+        """
+        Process the WorkflowTree for the specified index in a worker thread.
+
+        Each thread uses its own copy of the WorkflowTree. The results are
+        stored directly in the WorkflowResults and exported, if autosave is
+        enabled.
+
+        Parameters
+        ----------
+        index : int
+            The task index to be executed.
+
+        Returns
+        -------
+        int
+            The index or -1 if the input file could not be read. The read
+            error is reported by threading_results_received in the main thread.
+        """
+        _tree = self._get_thread_tree()
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                _tree.execute_process(index)
+        except FileReadError:
+            return -1
+        _results = _tree.get_current_results()
+        with self._locals["thread_lock"]:
+            if not self._config["result_metadata_set"]:
+                self._publish_shapes_and_metadata_to_manager(_tree)
+                self._config["result_metadata_set"] = True
+            self._store_and_export_results(index, _results)
+        self.sig_results_updated.emit()
+        return index
+
+    def _get_thread_tree(self) -> ProcessingTree:
+        """
+        Get the ProcessingTree of the current thread.
+
+        The tree is created and prepared at the first call in each thread.
+
+        Returns
+        -------
+        ProcessingTree
+            The tree of the current thread.
+        """
+        _local = self._locals["thread_local"]
+        if not hasattr(_local, "tree"):
+            _tree = ProcessingTree()
+            _tree.restore_from_string(self._config["tree_str_rep"])
+            _tree.prepare_execution()
+            self._configure_prefetching(_tree)
+            _tree.enable_profiling(
+                self.get_param_value("profile_workflow"), trace_memory=False
+            )
+            with self._locals["thread_lock"]:
+                self._configure_async_output()
+                self._locals["thread_trees"].append((threading.get_ident(), _tree))
+            _local.tree = _tree
+        return _local.tree
+
     @QtCore.Slot()
     def multiprocessing_post_run(self):
         """
         Perform operations after running the main parallel processing function.
 
-        This implementation will close the arrays and unlink the shared memory buffers.
+        This implementation will close the arrays, unlink the shared memory
+        buffers and stop the prefetching of input frames. Worker processes
+        publish the I/O statistics of their input plugin and the runtime
+        profiles of their plugins and disable the profiling, which also stops
+        the memory tracing. The main app logs
+        the combined I/O statistics and stores the combined profile in the
+        WorkflowResults. The statistics and profiles of the trees of worker
+        threads are published with the thread IDs as keys. Finally, the
+        queued output is written and the main app emits the pending updated
+        result regions and closes the files of the active result savers and
+        the input files in the Hdf5FileCache.
         """
         self.close_shared_arrays_and_memory()
+        OutputPlugin.configure_async_output(0)
+        for _tree in [TREE] + [_item[1] for _item in self._locals["thread_trees"]]:
+            self._configure_prefetching(_tree, enabled=False)
+        if mp.parent_process() is not None:
+            self._publish_io_statistics()
+            self._publish_profile()
+            TREE.enable_profiling(False)
+        elif not self.clone_mode:
+            for _thread_id, _tree in self._locals["thread_trees"]:
+                self._publish_io_statistics(_tree, _thread_id)
+                self._publish_profile(_tree, _thread_id)
+            self._locals["thread_trees"] = []
+            RESULTS.emit_updated_regions()
+            logger.debug("Workflow I/O statistics: %s" % self.get_io_statistics())
+            if self.get_param_value("profile_workflow"):
+                RESULTS.store_profile(self.get_profile())
+                TREE.enable_profiling(False)
+            if self.get_param_value("autosave_results"):
+                self._close_result_writer()
+                logger.debug(
+                    "Result writer statistics: %s" % self.get_write_statistics()
+                )
+                RESULT_SAVER.close_active_savers()
+            Hdf5FileCache().close()
+
+    def _publish_io_statistics(
+        self, tree: ProcessingTree | None = None, worker_id: int | None = None
+    ):
+        """
+        Publish the I/O statistics of the input plugin to the mp_manager.
+
+        Parameters
+        ----------
+        tree : ProcessingTree or None, optional
+            The tree with the input plugin. If None, the WorkflowTree is used.
+            The default is None.
+        worker_id : int or None, optional
+            The ID of the worker. If None, the process ID is used. The
+            default is None.
+        """
+        _tree = TREE if tree is None else tree
+        if "io_stats_dict" not in self.mp_manager or not isinstance(
+            _tree.root.plugin, InputPlugin
+        ):
+            return
+        _stats = _tree.root.plugin.io_statistics
+        if _stats["n_frames"] > 0:
+            _id = mp.current_process().pid if worker_id is None else worker_id
+            self.mp_manager["io_stats_dict"][_id] = _stats
+
+    def _publish_profile(
+        self, tree: ProcessingTree | None = None, worker_id: int | None = None
+    ):
+        """
+        Publish the runtime profile of the WorkflowTree to the mp_manager.
+
+        Parameters
+        ----------
+        tree : ProcessingTree or None, optional
+            The profiled tree. If None, the WorkflowTree is used. The default
+            is None.
+        worker_id : int or None, optional
+            The ID of the worker. If None, the process ID is used. The
+            default is None.
+        """
+        if "profile_dict" not in self.mp_manager or not self.get_param_value(
+            "profile_workflow"
+        ):
+            return
+        _tree = TREE if tree is None else tree
+        _id = mp.current_process().pid if worker_id is None else worker_id
+        self.mp_manager["profile_dict"][_id] = {
+            _node_id: _node.profile.__getstate__()
+            for _node_id, _node in _tree.nodes.items()
+            if _node.profile is not None
+        }
+
+    def get_profile(self) -> WorkflowProfile:
+        """
+        Get the runtime profile of the plugins of the last processing run.
+
+        The profile combines the profiles published by all workers and the
+        profile of the WorkflowTree in the current process.
 
-    def _publish_shapes_and_metadata_to_manager(self):
+        Returns
+        -------
+        WorkflowProfile
+            The combined profile.
+        """
+        _profile = TREE.get_profile()
+        for _pid, _states in dict(self.mp_manager.get("profile_dict", {})).items():
+            _profile.add_process_profiles(
+                {
+                    _node_id: NodeProfile.from_state(_state)
+                    for _node_id, _state in _states.items()
+                },
+                _pid,
+            )
+        return _profile
+
+    def get_write_statistics(self) -> dict:
+        """
+        Get the statistics of the background result writer of the last run.
+
+        The statistics include the number of written frames and batches, the
+        number of times (and the total time) the processing had to wait for
+        free space in the write queue, the maximum queue length and the total
+        write time.
+
+        Returns
+        -------
+        dict
+            The statistics. The dictionary is empty if no result writer has
+            been used.
+        """
+        _writer = self._locals.get("result_writer", None)
+        if _writer is not None:
+            return _writer.statistics
+        return self._locals.get("write_statistics", {})
+
+    def get_io_statistics(self) -> dict[str, int]:
+        """
+        Get the I/O statistics of the last processing run.
+
+        The statistics are summed over all workers and include the number of
+        frames, the number of file opens (i.e. frames read from a different
+        file than the previous frame of the same worker) and the number of
+        chunk cache hits (i.e. frames read from the same file and HDF5 chunk
+        as the previous frame of the same worker).
+
+        Returns
+        -------
+        dict[str, int]
+            The I/O statistics.
+        """
+        _stats = {"n_workers": 0, "n_frames": 0, "file_opens": 0, "chunk_cache_hits": 0}
+        for _worker_stats in dict(self.mp_manager.get("io_stats_dict", {})).values():
+            _stats["n_workers"] += 1
+            for _key, _value in _worker_stats.items():
+                _stats[_key] += _value
+        return _stats
+
+    def _publish_shapes_and_metadata_to_manager(
+        self, tree: ProcessingTree | None = None
+    ):
         """
         Publish the shapes and metadata to the multiprocessing manager dictionaries.
+
+        The datatype of each node's results is published as well. It is
+        determined by the results and the node's result_dtype policy.
+
+        Parameters
+        ----------
+        tree : ProcessingTree or None, optional
+            The tree with the current results. If None, the WorkflowTree is
+            used. The default is None.
         """
-        _results = TREE.get_current_results()
+        _tree = TREE if tree is None else tree
+        _results = _tree.get_current_results()
         for _node_id, _res in _results.items():
             self.mp_manager["shapes_dict"][_node_id] = _res.shape
-            if isinstance(_res, Dataset):
-                self.mp_manager["metadata_dict"][_node_id] = _res.property_dict
-                self.mp_manager["metadata_dict"][_node_id].pop("metadata")
-            else:
-                self.mp_manager["metadata_dict"][_node_id] = get_default_property_dict(
-                    _res.shape
-                )
+            self.mp_manager["dtypes_dict"][_node_id] = _get_result_dtype(
+                _res, _tree.nodes[_node_id].plugin
+            ).str
+            self.mp_manager["metadata_dict"][_node_id] = _get_result_metadata(_res)
         self.mp_manager["shapes_available"].set()
+        RESULTS.store_frame_dtypes(dict(self.mp_manager["dtypes_dict"]))
         RESULTS.store_frame_metadata(dict(self.mp_manager["metadata_dict"]))
 
     def _create_shared_memory(self):
@@ -409,18 +971,22 @@ class ExecuteWorkflowApp(BaseApp):
         """
         Check the size of results and the buffer size.
 
+        Each worker requires its own partition of the buffer and therefore at
+        least one buffer slot.
+
         Raises
         ------
         UserConfigError
             If the buffer is too small to store a one dataset per MP worker.
         """
         _buffer_size_mb = self.q_settings_get("global/shared_buffer_size", float)
-        _n_worker = self.q_settings_get("global/mp_n_workers", int)
+        _n_worker = self._get_n_workers()
         _n_data = self.q_settings_get("global/shared_buffer_max_n", int)
-        _req_points_per_dataset = sum(
-            np.prod(_shape) for _shape in self.mp_manager["shapes_dict"].values()
+        _req_bytes_per_dataset = sum(
+            np.prod(_shape) * self._get_node_dtype(_node_id).itemsize
+            for _node_id, _shape in self.mp_manager["shapes_dict"].items()
         )
-        _req_mem_per_dataset = max(4 * _req_points_per_dataset / 2**20, 0.01)
+        _req_mem_per_dataset = max(_req_bytes_per_dataset / 2**20, 0.01)
         _n_dataset_in_buffer = int(np.floor(_buffer_size_mb / _req_mem_per_dataset))
         if _n_dataset_in_buffer < _n_worker:
             _min_buffer = _req_mem_per_dataset * _n_worker
@@ -431,22 +997,38 @@ class ExecuteWorkflowApp(BaseApp):
                 "\nPlease update the buffer size or change number of workers in the "
                 "global settings."
             )
-        self.mp_manager["buffer_n"].value = min(
-            _n_dataset_in_buffer, _n_data, self._mp_tasks.size
-        )
+        _buffer_n = min(_n_dataset_in_buffer, _n_data, self._mp_tasks.size)
+        if _buffer_n < min(_n_worker, self._mp_tasks.size):
+            raise UserConfigError(
+                f"The buffer dataframe limit ({_n_data}) is smaller than the number "
+                f"of workers ({_n_worker}). Each worker requires at least one slot "
+                "in the shared buffer.\nPlease increase the buffer dataframe limit "
+                "or decrease the number of workers in the global settings."
+            )
+        self.mp_manager["buffer_n"].value = _buffer_n
 
     def _initialize_shared_memory(self):
         """
         Initialize the shared arrays from the buffer size and result shapes.
+
+        The buffer slots are split into one partition per worker of the run.
+        Each writer owns the slots of one partition and the in_use_flag of
+        every slot is only set by its owner and only reset by the main process
+        after storing the results. Therefore, no lock is required to access
+        the buffer.
         """
         _n = self.mp_manager["buffer_n"].value
+        _n_worker = self._get_n_workers()
+        self.mp_manager["buffer_n_partitions"].value = max(1, min(_n_worker, _n))
+        self.mp_manager["buffer_n_writers"].value = 0
         _pid = self.mp_manager["main_pid"].value
         _buffers = self._locals["shared_memory_buffers"] = {}
         _buffers["in_use_flag"] = SharedMemory(
             name=f"share_in_use_flag_{_pid}", create=True, size=4 * _n
         )
         for _node_id, _shape in self.mp_manager["shapes_dict"].items():
-            _num_bytes = int(4 * _n * np.prod(_shape))
+            _itemsize = self._get_node_dtype(_node_id).itemsize
+            _num_bytes = int(_itemsize * _n * np.prod(_shape))
             _buffers[f"node_{_node_id:03d}"] = SharedMemory(
                 name=f"share_node_{_node_id:03d}_{_pid}", create=True, size=_num_bytes
             )
@@ -461,13 +1043,29 @@ class ExecuteWorkflowApp(BaseApp):
             _shared_mem = self.__get_shared_memory(f"node_{_key:03d}")
             _arr_shape = (_buffer_size,) + _shape
             self._shared_arrays[_key] = np.ndarray(
-                _arr_shape, dtype=np.float32, buffer=_shared_mem.buf
+                _arr_shape, dtype=self._get_node_dtype(_key), buffer=_shared_mem.buf
             )
         _shared_mem = self.__get_shared_memory("in_use_flag")
         self._shared_arrays["in_use_flag"] = np.ndarray(
             (_buffer_size,), dtype=np.int32, buffer=_shared_mem.buf
         )
 
+    def _get_node_dtype(self, node_id: int) -> np.dtype:
+        """
+        Get the published datatype of a node's results.
+
+        Parameters
+        ----------
+        node_id : int
+            The node ID.
+
+        Returns
+        -------
+        np.dtype
+            The datatype. If no datatype has been published, float32 is used.
+        """
+        return np.dtype(self.mp_manager["dtypes_dict"].get(node_id, np.float32))
+
     def __get_shared_memory(self, name: Union[str, int]) -> SharedMemory:
         """
         Get the SharedMemory object from the shared memory buffers.
@@ -488,24 +1086,70 @@ class ExecuteWorkflowApp(BaseApp):
             self._locals["shared_memory_buffers"][name] = _mem_buffer
         return self._locals["shared_memory_buffers"][name]
 
+    def __claim_buffer_slots(self):
+        """
+        Register as writer and claim the slots of a buffer partition.
+
+        This requires the manager lock but is only called once per run.
+        Partitions are never shared because the slots are not locked.
+
+        Raises
+        ------
+        UserConfigError
+            If all buffer partitions have already been claimed.
+        """
+        with self.mp_manager["lock"]:
+            _index = self.mp_manager["buffer_n_writers"].value
+            self.mp_manager["buffer_n_writers"].value = _index + 1
+        _n_partitions = self.mp_manager["buffer_n_partitions"].value
+        if _index >= _n_partitions:
+            raise UserConfigError(
+                f"More writers than shared buffer partitions ({_n_partitions}) "
+                "have been registered. The number of workers must not exceed the "
+                "number of workers set for the run."
+            )
+        self._buffer_slots = deque(
+            range(_index, self.mp_manager["buffer_n"].value, _n_partitions)
+        )
+
+    def __get_free_buffer_slot(self) -> int:
+        """
+        Get the next free slot of the writer's buffer partition.
+
+        The slots are used in a ring-buffer order and the method waits until
+        the main process has released a slot if all slots are in use.
+
+        Returns
+        -------
+        int
+            The index of the free buffer slot.
+        """
+        _in_use = self._shared_arrays["in_use_flag"]
+        while True:
+            for _ in range(len(self._buffer_slots)):
+                _slot = self._buffer_slots[0]
+                self._buffer_slots.rotate(-1)
+                if _in_use[_slot] == 0:
+                    return _slot
+            time.sleep(SLOT_WAIT_INTERVAL)
+
     def __write_results_to_shared_arrays(self):
-        """Write the results from the WorkflowTree execution to the shared array."""
+        """
+        Write the results from the WorkflowTree execution to the shared array.
+
+        The results are written to a free slot owned by this app. The slot is
+        only marked as in use after the results have been written.
+        """
         if self._shared_arrays == dict():
             self._initialize_arrays_from_shared_memory()
-        while True:
-            with self.mp_manager["lock"]:
-                _zeros = np.where(self._shared_arrays["in_use_flag"] == 0)[0]
-                if _zeros.size > 0:
-                    _buffer_pos = _zeros[0]
-                    self._config["buffer_pos"] = _buffer_pos
-                    self._shared_arrays["in_use_flag"][_buffer_pos] = 1
-                    break
-            time.sleep(0.005)
-        with self.mp_manager["lock"]:
-            for _node_id in self.mp_manager["shapes_dict"].keys():
-                self._shared_arrays[_node_id][_buffer_pos] = TREE.nodes[
-                    _node_id
-                ].results
+        if self._buffer_slots is None:
+            self.__claim_buffer_slots()
+        _buffer_pos = self.__get_free_buffer_slot()
+        for _node_id, _arr in self._shared_arrays.items():
+            if _node_id != "in_use_flag":
+                _arr[_buffer_pos] = TREE.nodes[_node_id].results
+        self._shared_arrays["in_use_flag"][_buffer_pos] = 1
+        self._config["buffer_pos"] = _buffer_pos
 
     def must_send_signal_and_wait_for_response(self) -> Optional[str]:
         """
@@ -518,7 +1162,7 @@ class ExecuteWorkflowApp(BaseApp):
         Optional[str]
             The signal to be sent.
         """
-        if not self.mp_manager["shapes_set"].is_set():
+        if not self._shapes_set():
             return "::shapes_not_set::"
         return None
 
@@ -531,11 +1175,62 @@ class ExecuteWorkflowApp(BaseApp):
         dict or None
             The latest results from the WorkflowTree.
         """
-        if not self.mp_manager["shapes_set"].is_set():
+        if not self._shapes_set():
             return None
         self.__write_results_to_shared_arrays()
         return self._config["buffer_pos"]
 
+    def multiprocessing_max_results_per_message(self) -> int:
+        """
+        Get the maximum number of results which are sent in a single message.
+
+        Each result occupies a slot in the shared memory buffer until it has
+        been stored by the main process. The number of results held by each
+        worker is therefore limited to its share of the buffer to prevent
+        workers from blocking each other.
+
+        Returns
+        -------
+        int
+            The maximum number of results per message.
+        """
+        return max(1, self.mp_manager["buffer_n"].value // self._get_n_workers())
+
+    def multiprocessing_set_n_workers(self, n_workers: int):
+        """
+        Set the number of workers which process the app's tasks.
+
+        The number is also published through the multiprocessing manager
+        because the main app requires it to partition the shared buffer.
+
+        Parameters
+        ----------
+        n_workers : int
+            The number of workers.
+        """
+        BaseApp.multiprocessing_set_n_workers(self, n_workers)
+        if "n_workers" in self.mp_manager:
+            self.mp_manager["n_workers"].value = n_workers
+
+    def _get_n_workers(self) -> int:
+        """
+        Get the number of workers of the current run.
+
+        Returns
+        -------
+        int
+            The number of workers which has been set for the run. If no
+            number has been set, the global mp_n_workers setting is used.
+        """
+        _n_workers = 0
+        if "n_workers" in self.mp_manager:
+            _n_workers = self.mp_manager["n_workers"].value
+        if _n_workers == 0:
+            _n_workers = self._config.get("mp_n_workers", 0)
+        if _n_workers == 0:
+            _n_workers = self.q_settings_get("global/mp_n_workers", int, default=1)
+        return max(1, _n_workers)
+
     @QtCore.Slot(str)
     def received_signal_message(self, message: str):
         """
@@ -556,6 +1251,10 @@ class ExecuteWorkflowApp(BaseApp):
         """
         Store the results of the multiprocessing operation.
 
+        The buffer slot is released after the results have been stored and
+        exported. Only the main process resets the in_use_flag and no lock
+        is required.
+
         Parameters
         ----------
         index : Integral
@@ -568,37 +1267,95 @@ class ExecuteWorkflowApp(BaseApp):
         if self._shared_arrays == dict():
             self._initialize_arrays_from_shared_memory()
         if data_index == -1:
-            _filename = TREE.root.plugin.get_filename(index)
-            PydidasQApplication.instance().set_status_message(
-                f"File reading error during processing of scan index #{index}."
-                f" (filename: {_filename})"
-            )
+            self._report_file_read_error(index)
             return
         if not self._config["result_metadata_set"]:
+            RESULTS.store_frame_dtypes(dict(self.mp_manager["dtypes_dict"]))
             RESULTS.store_frame_metadata(dict(self.mp_manager["metadata_dict"]))
             self._config["result_metadata_set"] = True
-        with self.mp_manager["lock"]:
-            _new_results = {
-                _key: _arr[data_index]
-                for _key, _arr in self._shared_arrays.items()
-                if _key != "in_use_flag"
-            }
+        _new_results = {
+            _key: _arr[data_index]
+            for _key, _arr in self._shared_arrays.items()
+            if _key != "in_use_flag"
+        }
+        try:
+            self._store_and_export_results(index, _new_results)
+        finally:
             self._shared_arrays["in_use_flag"][data_index] = 0
-        RESULTS.store_results(index, _new_results)
-        if self.get_param_value("autosave_results"):
-            if not self._config["export_files_prepared"]:
-                RESULTS.prepare_files_for_saving(
-                    self.get_param_value("autosave_directory"),
-                    self.get_param_value("autosave_format"),
-                )
-                _new_results = {
-                    _key: Dataset(_val, **self.mp_manager["metadata_dict"][_key])
-                    for _key, _val in _new_results.items()
-                }
-                self._config["export_files_prepared"] = True
-            RESULT_SAVER.export_frame_to_active_savers(index, _new_results)
         self.sig_results_updated.emit()
 
+    @QtCore.Slot(object, object)
+    def threading_results_received(self, index: int, result: int):
+        """
+        Report file reading errors of the worker threads.
+
+        Parameters
+        ----------
+        index : int
+            The index of the processed task.
+        result : int
+            The return value of the threading_func. A value of -1 denotes
+            a file reading error.
+        """
+        if result == -1:
+            self._report_file_read_error(index)
+
+    def _report_file_read_error(self, index: int):
+        """
+        Report a file reading error in the status message.
+
+        Parameters
+        ----------
+        index : int
+            The index of the task which could not be read.
+        """
+        _filename = TREE.root.plugin.get_filename(index)
+        PydidasQApplication.instance().set_status_message(
+            f"File reading error during processing of scan index #{index}."
+            f" (filename: {_filename})"
+        )
+
+    def _store_and_export_results(self, index: int, results: dict):
+        """
+        Store the results in the WorkflowResults and export them, if enabled.
+
+        The autosave files are prepared before the first results are stored
+        to allow the WorkflowResults to use them as memory-mapped composites.
+
+        Parameters
+        ----------
+        index : int
+            The index of the processed task.
+        results : dict
+            The results with the node IDs as keys.
+        """
+        _autosave = self.get_param_value("autosave_results")
+        if _autosave and not self._config["export_files_prepared"]:
+            RESULTS.prepare_files_for_saving(
+                self.get_param_value("autosave_directory"),
+                self.get_param_value("autosave_format"),
+            )
+            results = {
+                _key: Dataset(_val, **self.mp_manager["metadata_dict"][_key])
+                for _key, _val in results.items()
+            }
+            self._config["export_files_prepared"] = True
+        RESULTS.store_results(index, results)
+        if _autosave:
+            _writer = self._locals.get("result_writer", None)
+            if _writer is None:
+                RESULT_SAVER.export_frame_to_active_savers(index, results)
+            else:
+                _writer.put(
+                    (
+                        index,
+                        {
+                            _key: _val.copy() if isinstance(_val, np.ndarray) else _val
+                            for _key, _val in results.items()
+                        },
+                    )
+                )
+
     def deleteLater(self):
         """
         Delete the instance of the ExecuteWorkflowApp.
@@ -28,6 +28,8 @@ __all__ = ["ExecuteWorkflowRunner"]
 
 
 import argparse
+import os
+import shutil
 from pathlib import Path
 from typing import Any
 
@@ -37,9 +39,10 @@ from pydidas.apps.execute_workflow_app import ExecuteWorkflowApp
 from pydidas.contexts import DiffractionExperimentContext, ScanContext
 from pydidas.contexts.diff_exp import DiffractionExperiment
 from pydidas.contexts.scan import Scan
-from pydidas.core import UserConfigError
-from pydidas.multiprocessing import AppRunner
+from pydidas.core import PydidasQsettings, UserConfigError
+from pydidas.multiprocessing import EXECUTION_BACKENDS, AppRunner, AppThreadRunner
 from pydidas.workflow import ProcessingTree, WorkflowResults, WorkflowTree
+from pydidas.workflow.workflow_profile import PROFILE_EXPORT_FORMATS
 
 
 SCAN = ScanContext()
@@ -47,6 +50,11 @@ TREE = WorkflowTree()
 RES = WorkflowResults()
 EXP = DiffractionExperimentContext()
 
+# The subdirectory of the output directory for the results of scan partitions.
+PARTITION_DIRECTORY = ".partitions"
+# The lock file which is created by the process which merges the partitions.
+PARTITION_MERGE_LOCK = "merge.lock"
+
 
 class ExecuteWorkflowRunner(QtCore.QObject):
     """
@@ -83,6 +91,35 @@ class ExecuteWorkflowRunner(QtCore.QObject):
         overwrite : bool, optional
             Flag to enable writing of results to existing directories, possibly
             overwriting existing results. The default is False.
+        profile : Path or str or None, optional
+            The filename to export the runtime profile of the workflow plugins
+            to. If None, the plugins are not profiled. The default is None.
+        profile_memory : bool, optional
+            Flag to trace the peak memory allocations of the plugins with
+            tracemalloc while profiling. The default is False.
+        profile_format : str, optional
+            The export format of the profile. Supported formats are "json"
+            for the aggregated statistics and "chrome_trace" for a trace of
+            all plugin calls which can be opened with the Chrome tracing
+            tools or Perfetto. The default is "json".
+        backend : str or None, optional
+            The execution backend. "processes" runs the workflow in worker
+            processes and "threads" runs the workflow in a pool of threads
+            in the current process. If None, the global pydidas setting is
+            used. The default is None.
+        n_partitions : int, optional
+            The number of partitions of the scan. For more than one
+            partition, the runner only processes the scan points of a single
+            partition and writes the partial results to a partition file in
+            the output directory. The runner which writes the last partition
+            file merges all partitions into the final results. The default
+            is 1.
+        partition_index : int, optional
+            The index of the partition to be processed. The default is 0.
+        merge_only : bool, optional
+            Flag to only merge existing partition files in the output
+            directory into the final results without processing. The
+            default is False.
     """
 
     def __init__(self, **kwargs: Any) -> None:
@@ -120,6 +157,59 @@ class ExecuteWorkflowRunner(QtCore.QObject):
             "-o",
             help="The output directory to store results in.",
         )
+        parser.add_argument(
+            "--profile",
+            help=(
+                "Enable profiling of the workflow plugins and export the profile "
+                "to the given filename."
+            ),
+        )
+        parser.add_argument(
+            "--profile_memory",
+            action="store_true",
+            help=(
+                "Trace the peak memory allocations of the plugins while profiling. "
+                "Note that memory tracing slows down the processing."
+            ),
+        )
+        parser.add_argument(
+            "--profile_format",
+            default="json",
+            choices=PROFILE_EXPORT_FORMATS,
+            help="The export format of the workflow profile.",
+        )
+        parser.add_argument(
+            "--backend",
+            default=None,
+            choices=EXECUTION_BACKENDS,
+            help=(
+                "The execution backend. If not given, the global pydidas "
+                "setting is used."
+            ),
+        )
+        parser.add_argument(
+            "--n_partitions",
+            type=int,
+            default=1,
+            help=(
+                "The number of partitions of the scan for distributed processing. "
+                "Each run only processes a single partition."
+            ),
+        )
+        parser.add_argument(
+            "--partition_index",
+            type=int,
+            default=0,
+            help="The index of the scan partition to be processed.",
+        )
+        parser.add_argument(
+            "--merge_only",
+            action="store_true",
+            help=(
+                "Only merge the existing partition files in the output directory "
+                "into the final results."
+            ),
+        )
         _options, _unknown = parser.parse_known_args()
         self.parsed_args = dict(vars(_options))
 
@@ -161,6 +251,17 @@ class ExecuteWorkflowRunner(QtCore.QObject):
             self.parsed_args["verbose"] = kwargs["verbose"]
         if "overwrite" in kwargs:
             self.parsed_args["overwrite"] = kwargs["overwrite"]
+        for _key in [
+            "profile",
+            "profile_format",
+            "profile_memory",
+            "backend",
+            "n_partitions",
+            "partition_index",
+            "merge_only",
+        ]:
+            if _key in kwargs:
+                self.parsed_args[_key] = kwargs[_key]
 
     @staticmethod
     @QtCore.Slot(float)
@@ -194,16 +295,144 @@ class ExecuteWorkflowRunner(QtCore.QObject):
         """
         self._app.received_signal_message(message)
 
+    @property
+    def partitioned(self) -> bool:
+        """
+        Flag whether the scan is processed in several partitions.
+
+        Returns
+        -------
+        bool
+            True if the number of partitions is larger than one.
+        """
+        return self.parsed_args["n_partitions"] > 1
+
+    def get_partition_filename(self, index: int) -> Path:
+        """
+        Get the filename of the results of a scan partition.
+
+        Parameters
+        ----------
+        index : int
+            The index of the partition.
+
+        Returns
+        -------
+        Path
+            The full filename of the partition file.
+        """
+        return Path(self.parsed_args["output_dir"]).joinpath(
+            PARTITION_DIRECTORY,
+            f"partition_{index:04d}_of_{self.parsed_args['n_partitions']:04d}.nxs",
+        )
+
     @QtCore.Slot()
     def _write_results_to_disk(self) -> None:
-        """Write the WorkflowResults to disk."""
+        """
+        Write the WorkflowResults (and the profile, if enabled) to disk.
+
+        For partitioned processing, only the results of the processed
+        partition are written and the partitions are merged if all
+        partition files are available.
+        """
+        if self.partitioned:
+            self._write_partition_to_disk()
+        else:
+            RES.save_results_to_disk(
+                self.parsed_args["output_dir"],
+                ".hdf5",
+                overwrite=self.parsed_args["overwrite"],
+            )
+        if self.parsed_args["profile"] is not None and RES.get_profile() is not None:
+            _profile_filename = Path(self.parsed_args["profile"])
+            if self.partitioned:
+                _profile_filename = _profile_filename.with_stem(
+                    f"{_profile_filename.stem}_partition_"
+                    f"{self.parsed_args['partition_index']:04d}"
+                )
+            RES.get_profile().export_to_file(
+                _profile_filename, self.parsed_args["profile_format"]
+            )
+        if self._loop is not None and self._loop.isRunning():
+            self._loop.quit()
+
+    def _write_partition_to_disk(self) -> None:
+        """
+        Write the results of the processed partition to its partition file.
+
+        The file is written under a temporary name and renamed afterwards to
+        make it visible to other processes only after it is complete. The
+        first process which finds all partition files available merges the
+        partitions.
+        """
+        _filename = self.get_partition_filename(self.parsed_args["partition_index"])
+        _filename.parent.mkdir(parents=True, exist_ok=True)
+        _tmp_filename = _filename.with_name(f"{_filename.name}.{os.getpid()}.tmp")
+        RES.export_partition_to_file(
+            _tmp_filename, self._app.multiprocessing_get_tasks()
+        )
+        os.replace(_tmp_filename, _filename)
+        _all_available = all(
+            self.get_partition_filename(_index).is_file()
+            for _index in range(self.parsed_args["n_partitions"])
+        )
+        if _all_available and self._acquire_merge_lock():
+            self.merge_partition_results()
+
+    def _acquire_merge_lock(self) -> bool:
+        """
+        Acquire the lock for merging the partitions.
+
+        The lock is a file which is created atomically and only a single
+        process can acquire the lock.
+
+        Returns
+        -------
+        bool
+            Flag whether the lock has been acquired.
+        """
+        _lock_filename = Path(self.parsed_args["output_dir"]).joinpath(
+            PARTITION_DIRECTORY, PARTITION_MERGE_LOCK
+        )
+        try:
+            _fd = os.open(_lock_filename, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        os.close(_fd)
+        return True
+
+    def merge_partition_results(self) -> None:
+        """
+        Merge the results of all scan partitions and write them to disk.
+
+        The merged results are written in the same format as for
+        non-partitioned processing and the partition files are removed
+        afterwards.
+
+        Raises
+        ------
+        UserConfigError
+            If any partition file is missing.
+        """
+        _filenames = [
+            self.get_partition_filename(_index)
+            for _index in range(self.parsed_args["n_partitions"])
+        ]
+        _missing = [str(_name) for _name in _filenames if not _name.is_file()]
+        if len(_missing) > 0:
+            raise UserConfigError(
+                "Cannot merge the scan partitions because the following partition "
+                "files are missing:\n - " + "\n - ".join(_missing)
+            )
+        RES.import_partition_files(_filenames)
         RES.save_results_to_disk(
             self.parsed_args["output_dir"],
             ".hdf5",
             overwrite=self.parsed_args["overwrite"],
         )
-        if self._loop is not None and self._loop.isRunning():
-            self._loop.quit()
+        shutil.rmtree(_filenames[0].parent)
+        if self.parsed_args["verbose"]:
+            print(f"Merged {len(_filenames)} scan partitions.")
 
     def process_scan(self, **kwargs: Any) -> None:
         """
@@ -221,6 +450,9 @@ class ExecuteWorkflowRunner(QtCore.QObject):
         self.update_parsed_args_from_kwargs(**kwargs)
         self.check_all_args_okay()
         self.update_contexts_from_stored_args()
+        if self.parsed_args["merge_only"]:
+            self.merge_partition_results()
+            return
         self.execute_workflow_in_apprunner()
 
     def update_contexts_from_stored_args(self) -> None:
@@ -264,31 +496,92 @@ class ExecuteWorkflowRunner(QtCore.QObject):
                 "The following keys are required for processing but missing:\n - "
                 + "\n - ".join(_missing_keys)
             )
+        _n_partitions = self.parsed_args["n_partitions"]
+        _index = self.parsed_args["partition_index"]
+        if _n_partitions < 1 or not 0 <= _index < _n_partitions:
+            raise UserConfigError(
+                f"The scan partition configuration is invalid (partition index "
+                f"{_index} of {_n_partitions} partitions). The number of "
+                "partitions must be positive and the partition index must be in "
+                "the range [0, n_partitions - 1]."
+            )
+        if self.parsed_args["merge_only"] and not self.partitioned:
+            raise UserConfigError(
+                "Merging of scan partitions requires more than one partition. "
+                "Please set the number of partitions."
+            )
         _output_dir = Path(self.parsed_args["output_dir"])
-        if (
-            _output_dir.is_dir()
-            and len(list(_output_dir.iterdir())) > 0
-            and not self.parsed_args["overwrite"]
-        ):
+        _existing_items = (
+            [
+                _item
+                for _item in _output_dir.iterdir()
+                if not (self.partitioned and _item.name == PARTITION_DIRECTORY)
+            ]
+            if _output_dir.is_dir()
+            else []
+        )
+        if len(_existing_items) > 0 and not self.parsed_args["overwrite"]:
             raise UserConfigError(
                 "The specified output directory is not empty and overwriting of "
                 "existing files has not been enabled. Please change the output "
                 "directory or enable overwriting of existing files-"
             )
+        if (
+            self.partitioned
+            and not self.parsed_args["merge_only"]
+            and not self.parsed_args["overwrite"]
+            and self.get_partition_filename(
+                self.parsed_args["partition_index"]
+            ).is_file()
+        ):
+            raise UserConfigError(
+                "The results of the partition have already been written and "
+                "overwriting of existing files has not been enabled."
+            )
+
+    def get_execution_backend(self) -> str:
+        """
+        Get the execution backend for processing the workflow.
+
+        Returns
+        -------
+        str
+            The execution backend.
+        """
+        if self.parsed_args["backend"] is not None:
+            return self.parsed_args["backend"]
+        return PydidasQsettings().q_settings_get(
+            "global/mp_execution_backend", str, "processes"
+        )
 
     def execute_workflow_in_apprunner(self) -> None:
-        """Execute the given workflow in an AppRunner with a QEventLoop."""
+        """
+        Execute the given workflow in an AppRunner with a QEventLoop.
+
+        If the "threads" execution backend is selected, an AppThreadRunner
+        is used instead of the AppRunner.
+        """
         self._app = ExecuteWorkflowApp()
+        self._app.set_param_value(
+            "profile_workflow", self.parsed_args["profile"] is not None
+        )
+        self._app.set_param_value("profile_memory", self.parsed_args["profile_memory"])
+        self._app.set_param_value("n_partitions", self.parsed_args["n_partitions"])
+        self._app.set_param_value(
+            "partition_index", self.parsed_args["partition_index"]
+        )
         if self._loop is None:
             self._loop = QtCore.QEventLoop()
         if self._loop.isRunning():
             raise RuntimeError(
                 "An event loop is already running. Cannot start another event loop."
             )
-        runner: AppRunner | None = None
+        runner: AppRunner | AppThreadRunner | None = None
         try:
-            runner = AppRunner(self._app)
-            runner.sig_results.connect(self._app.multiprocessing_store_results)
+            if self.get_execution_backend() == "threads":
+                runner = AppThreadRunner(self._app)
+            else:
+                runner = AppRunner(self._app)
             if self.parsed_args["verbose"]:
                 runner.sig_progress.connect(self._print_progress)
             runner.sig_message_from_worker.connect(self._process_messages)
@@ -94,7 +94,7 @@ class DiffractionExperimentIoHdf5(DiffractionExperimentIoBase):
             diffraction_exp = DiffractionExperimentContext()
         with (
             CatchFileErrors(filename, KeyError, raise_file_read_error=False) as catcher,
-            h5py.File(filename, "r") as file,
+            h5py.File(filename, "r", swmr=True) as file,
         ):
             cls.imported_params = {}
             for _key in diffraction_exp.params.keys():
@@ -93,7 +93,7 @@ class ScanIoHdf5(ScanIoBase):
         _scan = SCAN if scan is None else scan
         with (
             CatchFileErrors(filename, KeyError, raise_file_read_error=False) as catcher,
-            h5py.File(filename, "r") as file,
+            h5py.File(filename, "r", swmr=True) as file,
         ):
             _present_keys = [
                 _key.removeprefix("/entry/pydidas_config/scan/")
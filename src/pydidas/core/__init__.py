@@ -31,12 +31,15 @@ __status__ = "Production"
 from . import constants, generic_params, io_registry, utils
 
 # import items from modules:
+from .async_write_queue import *
 from .base_app import *
 from .dataset import *
 
 # import exceptions first to be used in other modules
 from .exceptions import *
+from .frame_prefetcher import *
 from .generic_parameters import *
+from .hdf5_file_cache import *
 from .object_with_parameter_collection import *
 from .parameter import *
 from .parameter_classes import *
@@ -44,15 +47,19 @@ from .parameter_collection import *
 from .parameter_collection_mixin import *
 from .pydidas_q_settings import *
 from .pydidas_q_settings_mixin import *
+from .shared_resources import *
 from .singleton_context_object import *
 from .singleton_object import *
 
 
 __all__ = ["constants", "generic_params", "io_registry", "utils"] + (
-    base_app.__all__
+    async_write_queue.__all__
+    + base_app.__all__
     + dataset.__all__
     + exceptions.__all__
+    + frame_prefetcher.__all__
     + generic_parameters.__all__
+    + hdf5_file_cache.__all__
     + parameter_classes.__all__
     + object_with_parameter_collection.__all__
     + parameter.__all__
@@ -60,6 +67,7 @@ __all__ = ["constants", "generic_params", "io_registry", "utils"] + (
     + parameter_collection_mixin.__all__
     + pydidas_q_settings.__all__
     + pydidas_q_settings_mixin.__all__
+    + shared_resources.__all__
     + singleton_context_object.__all__
     + singleton_object.__all__
 )
@@ -69,7 +77,9 @@ del (
     base_app,
     dataset,
     exceptions,
+    frame_prefetcher,
     generic_parameters,
+    hdf5_file_cache,
     parameter_classes,
     object_with_parameter_collection,
     parameter,
@@ -77,6 +87,7 @@ del (
     parameter_collection_mixin,
     pydidas_q_settings,
     pydidas_q_settings_mixin,
+    shared_resources,
     singleton_context_object,
     singleton_object,
 )
@@ -0,0 +1,255 @@
+# This file is part of pydidas.
+#
+# Copyright 2026, Helmholtz-Zentrum Hereon
+# SPDX-License-Identifier: GPL-3.0-only
+#
+# pydidas is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# Pydidas is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pydidas. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module with the AsyncWriteQueue class which writes data to disk in a
+background thread.
+"""
+
+__author__ = "Malte Storm"
+__copyright__ = "Copyright 2026, Helmholtz-Zentrum Hereon"
+__license__ = "GPL-3.0-only"
+__maintainer__ = "Malte Storm"
+__status__ = "Production"
+__all__ = ["AsyncWriteQueue"]
+
+
+import queue
+import threading
+import time
+from typing import Any, Callable
+
+from pydidas.core.utils.logger import pydidas_logger
+
+
+logger = pydidas_logger()
+
+# The marker to stop the writer thread.
+_STOP = "::stop_writer::"
+
+
+class AsyncWriteQueue:
+    """
+    A bounded queue with a background thread to write items to disk.
+
+    Items are added to the queue with the put method and the writer thread
+    calls the write function with batches of all queued items (up to the
+    maximum batch size). If the queue is full, the put method blocks until
+    the writer thread has written items (back-pressure). The time spent
+    waiting, the maximum queue length and the write times are collected as
+    statistics.
+
+    Exceptions raised in the write function are re-raised in the calling
+    thread by the next call of put or flush. All items which are written
+    after the exception and before it has been raised are discarded.
+
+    Parameters
+    ----------
+    write_func : Callable[[list], None]
+        The function to write a batch of items.
+    max_size : int, optional
+        The maximum number of items in the queue. The default is 64.
+    max_batch_size : int, optional
+        The maximum number of items written in one batch. The default is 16.
+    name : str, optional
+        The name of the writer thread. The default is "pydidas_writer".
+    """
+
+    def __init__(
+        self,
+        write_func: Callable[[list], None],
+        max_size: int = 64,
+        max_batch_size: int = 16,
+        name: str = "pydidas_writer",
+    ):
+        if max_size < 1 or max_batch_size < 1:
+            raise ValueError("The queue and batch sizes must be positive integers.")
+        self._write_func = write_func
+        self._max_batch_size = max_batch_size
+        self._name = name
+        self._queue = queue.Queue(maxsize=max_size)
+        self._thread = None
+        self._error = None
+        self._lock = threading.Lock()
+        self.reset_statistics()
+
+    @property
+    def max_size(self) -> int:
+        """
+        Get the maximum number of items in the queue.
+
+        Returns
+        -------
+        int
+            The maximum queue size.
+        """
+        return self._queue.maxsize
+
+    @property
+    def max_batch_size(self) -> int:
+        """
+        Get the maximum number of items written in one batch.
+
+        Returns
+        -------
+        int
+            The maximum batch size.
+        """
+        return self._max_batch_size
+
+    @property
+    def active(self) -> bool:
+        """
+        Get the flag whether the writer thread is running.
+
+        Returns
+        -------
+        bool
+            The flag.
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def statistics(self) -> dict[str, Any]:
+        """
+        Get the statistics of the queue.
+
+        The statistics include the number of written items and batches, the
+        number of put calls which had to wait for free space in the queue and
+        the total waiting time, the maximum queue length and the total time
+        spent in the write function.
+
+        Returns
+        -------
+        dict[str, Any]
+            The statistics.
+        """
+        with self._lock:
+            _stats = self._stats.copy()
+        _stats["mean_batch_size"] = _stats["n_items"] / max(1, _stats["n_batches"])
+        return _stats
+
+    def reset_statistics(self) -> None:
+        """Reset the queue statistics."""
+        self._stats = {
+            "n_items": 0,
+            "n_batches": 0,
+            "n_blocked": 0,
+            "blocked_time": 0.0,
+            "max_queue_length": 0,
+            "write_time": 0.0,
+        }
+
+    def put(self, item: Any) -> None:
+        """
+        Add an item to the queue.
+
+        This method blocks if the queue is full.
+
+        Parameters
+        ----------
+        item : Any
+            The item to be written.
+        """
+        self._raise_stored_error()
+        if not self.active:
+            self._start_thread()
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            _t0 = time.perf_counter()
+            self._queue.put(item)
+            with self._lock:
+                self._stats["n_blocked"] += 1
+                self._stats["blocked_time"] += time.perf_counter() - _t0
+        with self._lock:
+            self._stats["max_queue_length"] = max(
+                self._stats["max_queue_length"], self._queue.qsize()
+            )
+
+    def flush(self) -> None:
+        """
+        Wait until all queued items have been written.
+
+        Raises
+        ------
+        Exception
+            Any exception raised by the write function since the last call
+            of put or flush.
+        """
+        if self.active:
+            self._queue.join()
+        self._raise_stored_error()
+
+    def close(self) -> None:
+        """Write all queued items and stop the writer thread."""
+        if self.active:
+            self._queue.put(_STOP)
+            self._thread.join()
+        self._thread = None
+        self._raise_stored_error()
+
+    def _start_thread(self) -> None:
+        """Start the writer thread."""
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+
+    def _raise_stored_error(self) -> None:
+        """Raise the stored exception of the writer thread, if any."""
+        if self._error is not None:
+            _error, self._error = self._error, None
+            raise _error
+
+    def _run(self) -> None:
+        """Write batches of queued items until the stop marker is received."""
+        _stop = False
+        while not _stop:
+            _batch = [self._queue.get()]
+            while len(_batch) < self._max_batch_size:
+                try:
+                    _batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if any(_item is _STOP for _item in _batch):
+                _stop = True
+                _batch = [_item for _item in _batch if _item is not _STOP]
+                self._queue.task_done()
+            self._write_batch(_batch)
+
+    def _write_batch(self, batch: list) -> None:
+        """
+        Write a batch of items and mark them as done.
+
+        Parameters
+        ----------
+        batch : list
+            The items to be written.
+        """
+        _t0 = time.perf_counter()
+        try:
+            if len(batch) > 0 and self._error is None:
+                self._write_func(batch)
+        except Exception as _error:
+            logger.error("Error in the asynchronous writer: %s" % _error)
+            self._error = _error
+        finally:
+            with self._lock:
+                self._stats["n_items"] += len(batch)
+                self._stats["n_batches"] += len(batch) > 0
+                self._stats["write_time"] += time.perf_counter() - _t0
+            for _ in batch:
+                self._queue.task_done()
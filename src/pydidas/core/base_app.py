@@ -30,7 +30,7 @@ __all__ = ["BaseApp"]
 from copy import copy
 from multiprocessing.managers import SyncManager
 from pathlib import Path
-from typing import Any, Optional, Self
+from typing import Any, Iterable, Optional, Self
 
 from qtpy import QtCore
 
@@ -133,11 +133,61 @@ class BaseApp(ObjectWithParameterCollection):
         """
         return self._config.get("latest_results", None)
 
+    def multiprocessing_max_results_per_message(self) -> int | None:
+        """
+        Get the maximum number of results which are sent in a single message.
+
+        If tasks are sent to the workers in chunks, the results of all tasks
+        in a chunk are collected and sent back in a single message. Apps which
+        need to free resources for each result in the main process can limit
+        the number of results held by each worker.
+
+        Returns
+        -------
+        int or None
+            The maximum number of results per message. None corresponds to
+            no limit.
+        """
+        return None
+
+    def multiprocessing_set_n_workers(self, n_workers: int) -> None:
+        """
+        Set the number of workers which process the app's tasks.
+
+        The AppRunner calls this method before each run. The number is stored
+        in the app's config and is therefore also available in the app clones
+        of the workers.
+
+        Parameters
+        ----------
+        n_workers : int
+            The number of workers.
+        """
+        self._config["mp_n_workers"] = n_workers
+
+    def multiprocessing_get_task_locality_keys(self) -> list | None:
+        """
+        Get the locality keys of all multiprocessing tasks.
+
+        Tasks with the same locality key share resources (e.g. the same input
+        file) and should preferably be processed by the same worker. The
+        keys are only used by the locality task scheduler.
+
+        Returns
+        -------
+        list or None
+            The locality key for each task in multiprocessing_get_tasks or
+            None if the app does not define locality keys.
+        """
+        return None
+
     def run(self) -> None:
         """Run the app serially without multiprocessing support."""
+        self.multiprocessing_set_n_workers(1)
         self.multiprocessing_pre_run()
         tasks = self.multiprocessing_get_tasks()
-        for task in tasks:
+        for _index, task in enumerate(tasks):
+            self.multiprocessing_upcoming_tasks(tasks[_index + 1 :])
             self.multiprocessing_pre_cycle(task)
             while True:
                 _carryon = self.multiprocessing_carryon()
@@ -192,6 +242,22 @@ class BaseApp(ObjectWithParameterCollection):
         """
         return
 
+    def multiprocessing_upcoming_tasks(self, tasks: Iterable) -> None:
+        """
+        Receive the tasks which will be processed next, in order of processing.
+
+        This method is called before the pre-cycle of every task. The generic
+        method performs no operation and subclasses only need to re-implement
+        it when they can make use of the information, e.g. to read input ahead.
+
+        Parameters
+        ----------
+        tasks : Iterable
+            The upcoming tasks. This iterable must not be stored because it
+            may change after the call.
+        """
+        return
+
     def multiprocessing_func(self, index: int) -> Any | None:
         """
         Perform key operation with parallel processing.
@@ -237,6 +303,59 @@ class BaseApp(ObjectWithParameterCollection):
         """
         raise NotImplementedError
 
+    def threading_carryon(self, index: int) -> bool:
+        """
+        Check whether the task with the given index can be processed.
+
+        This method is the thread-safe equivalent of multiprocessing_carryon
+        for apps which are run in worker threads by the AppThreadRunner. It
+        must not modify the state of the app.
+
+        Parameters
+        ----------
+        index : int
+            The index to be processed.
+
+        Returns
+        -------
+        bool
+            Flag whether processing can continue or should wait.
+        """
+        return True
+
+    def threading_func(self, index: int) -> Any | None:
+        """
+        Perform the key operation in a worker thread.
+
+        This method is called concurrently by all worker threads of the
+        AppThreadRunner and must be thread-safe. Apps which support threaded
+        execution must store their results directly because the threads
+        share the app instance. This method must be implemented by BaseApp
+        subclasses which support threaded execution.
+
+        Parameters
+        ----------
+        index : int
+            The index to be processed.
+        """
+        raise NotImplementedError
+
+    def threading_results_received(self, index: int, result: Any) -> None:
+        """
+        Process the return value of the threading_func in the main thread.
+
+        This method is connected to the AppThreadRunner's sig_results signal
+        and can be used for any non-thread-safe handling of the results,
+        e.g. GUI updates. The default implementation does nothing.
+
+        Parameters
+        ----------
+        index : int
+            The processed index.
+        result : Any
+            The return value of the threading_func.
+        """
+
     def get_config(self) -> dict:
         """
         Get the App configuration.
@@ -39,11 +39,26 @@ __all__ = [
 
 QSETTINGS_GLOBAL_KEYS = [
     "mp_n_workers",
+    "mp_chunk_size",
+    "mp_adaptive_chunk_size",
+    "mp_persistent_workers",
+    "mp_execution_backend",
+    "mp_task_scheduler",
     "data_buffer_size",
     "data_buffer_hdf5_max_size",
+    "hdf5_file_cache_size",
+    "input_prefetch_depth",
+    "input_prefetch_max_size",
     "shared_buffer_size",
     "shared_buffer_max_n",
     "max_image_size",
+    "hdf5_compression",
+    "hdf5_flush_n_frames",
+    "hdf5_flush_interval",
+    "hdf5_single_file",
+    "result_backing_store",
+    "async_write_queue_size",
+    "async_write_batch_size",
     "plot_update_time",
 ]
 
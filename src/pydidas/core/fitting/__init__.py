@@ -39,14 +39,16 @@ from . import (
     triple_voigt,
     voigt,
 )
+from .batch_fitting import *
 from .fit_func_base import *
 from .fit_func_meta import *
 
 
-__all__ = fit_func_base.__all__ + fit_func_meta.__all__
+__all__ = batch_fitting.__all__ + fit_func_base.__all__ + fit_func_meta.__all__
 
 # Clean up the namespace:
 del (
+    batch_fitting,
     fit_func_base,
     fit_func_meta,
     voigt,
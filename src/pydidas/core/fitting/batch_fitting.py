@@ -0,0 +1,251 @@
+# This file is part of pydidas.
+#
+# Copyright 2026, Helmholtz-Zentrum Hereon
+# SPDX-License-Identifier: GPL-3.0-only
+#
+# pydidas is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# Pydidas is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pydidas. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module with functions to fit a FitFuncBase profile to a stack of datasets at
+once.
+"""
+
+__author__ = "Malte Storm"
+__copyright__ = "Copyright 2026, Helmholtz-Zentrum Hereon"
+__license__ = "GPL-3.0-only"
+__maintainer__ = "Malte Storm"
+__status__ = "Production"
+__all__ = ["batch_jacobian", "batch_least_squares", "batch_profile"]
+
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy import ndarray
+
+
+if TYPE_CHECKING:
+    from pydidas.core.fitting.fit_func_base import FitFuncBase
+
+
+_EPS = np.finfo(float).eps
+
+
+def batch_profile(fitter: type["FitFuncBase"], c: ndarray, x: ndarray) -> ndarray:
+    """
+    Calculate the profiles for a stack of fit parameters.
+
+    Parameters
+    ----------
+    fitter : type[FitFuncBase]
+        The fit function class.
+    c : ndarray
+        The fit parameters in an array of shape (N, n_params).
+    x : ndarray
+        The x data points of shape (n_points,).
+
+    Returns
+    -------
+    ndarray
+        The profiles in an array of shape (N, n_points).
+    """
+    return fitter.profile(c.T[..., None], x) + np.zeros((c.shape[0], x.size))
+
+
+def batch_jacobian(
+    fitter: type["FitFuncBase"], c: ndarray, x: ndarray, f0: ndarray, high: ndarray
+) -> ndarray:
+    """
+    Calculate the Jacobians of the profiles for a stack of fit parameters.
+
+    The analytic Jacobian of the fit function is used, if available.
+    Otherwise, the Jacobians are calculated by forward differences.
+
+    Parameters
+    ----------
+    fitter : type[FitFuncBase]
+        The fit function class.
+    c : ndarray
+        The fit parameters in an array of shape (N, n_params).
+    x : ndarray
+        The x data points of shape (n_points,).
+    f0 : ndarray
+        The profiles for the parameters c of shape (N, n_points).
+    high : ndarray
+        The upper bounds of the parameters of shape (n_params,).
+
+    Returns
+    -------
+    ndarray
+        The Jacobians in an array of shape (N, n_points, n_params).
+    """
+    if fitter.analytic_jacobian:
+        return np.broadcast_to(
+            fitter.jacobian(c.T[..., None], x), f0.shape + c.shape[1:]
+        )
+    return _finite_difference_jacobian(fitter, c, x, f0, high)
+
+
+def _finite_difference_jacobian(
+    fitter: type["FitFuncBase"], c: ndarray, x: ndarray, f0: ndarray, high: ndarray
+) -> ndarray:
+    """
+    Calculate the Jacobians for a stack of fit parameters by forward differences.
+
+    Parameters
+    ----------
+    fitter : type[FitFuncBase]
+        The fit function class.
+    c : ndarray
+        The fit parameters in an array of shape (N, n_params).
+    x : ndarray
+        The x data points of shape (n_points,).
+    f0 : ndarray
+        The profiles for the parameters c of shape (N, n_points).
+    high : ndarray
+        The upper bounds of the parameters of shape (n_params,).
+
+    Returns
+    -------
+    ndarray
+        The Jacobians in an array of shape (N, n_points, n_params).
+    """
+    _jac = np.empty(c.shape[:1] + x.shape + c.shape[1:])
+    for _index in range(c.shape[1]):
+        _h = _EPS**0.5 * np.maximum(1, np.abs(c[:, _index]))
+        _h = np.where(c[:, _index] + _h > high[_index], -_h, _h)
+        _c = c.copy()
+        _c[:, _index] += _h
+        _jac[..., _index] = (batch_profile(fitter, _c, x) - f0) / _h[:, None]
+    return _jac
+
+
+def batch_least_squares(
+    fitter: type["FitFuncBase"],
+    c0: ndarray,
+    x: ndarray,
+    data: ndarray,
+    bounds: tuple = (-np.inf, np.inf),
+    max_iterations: int = 100,
+    ftol: float = 1e-8,
+    xtol: float = 1e-8,
+    gtol: float = 1e-8,
+) -> tuple[ndarray, ndarray]:
+    """
+    Fit a FitFuncBase profile to a stack of datasets with shared x values.
+
+    All datasets are fitted at once with a vectorized Levenberg-Marquardt
+    algorithm. The Jacobians of all datasets are calculated in one batch
+    (analytically for fit functions which support it) and
+    the damped normal equations are solved for all datasets in one call.
+    Each dataset has its own damping factor and datasets are removed from
+    the active batch once they have converged. Parameters are kept strictly
+    within the bounds by shortening the steps of parameters which would
+    cross a bound.
+
+    Parameters
+    ----------
+    fitter : type[FitFuncBase]
+        The fit function class.
+    c0 : ndarray
+        The starting parameters in an array of shape (N, n_params).
+    x : ndarray
+        The x data points of shape (n_points,).
+    data : ndarray
+        The data values in an array of shape (N, n_points).
+    bounds : tuple, optional
+        The lower and upper bounds of the parameters. Each bound can be a
+        scalar or a sequence with one entry per parameter. The default is
+        (-np.inf, np.inf).
+    max_iterations : int, optional
+        The maximum number of iterations. The default is 100.
+    ftol : float, optional
+        The tolerance for the relative change of the cost function. The
+        default is 1e-8.
+    xtol : float, optional
+        The tolerance for the relative change of the parameters. The default
+        is 1e-8.
+    gtol : float, optional
+        The tolerance for the maximum absolute value of the gradient of the
+        free parameters. The default is 1e-8.
+
+    Returns
+    -------
+    c : ndarray
+        The fitted parameters in an array of shape (N, n_params).
+    success : ndarray
+        The boolean flags of shape (N,) whether the fits have converged.
+    """
+    _n_params = c0.shape[1]
+    _low = np.broadcast_to(np.asarray(bounds[0], dtype=float), (_n_params,))
+    _high = np.broadcast_to(np.asarray(bounds[1], dtype=float), (_n_params,))
+    _c = np.clip(np.asarray(c0, dtype=float), _low, _high)
+    with np.errstate(invalid="ignore"):
+        _c = np.where(_c == _low, _low + 1e-10 * np.maximum(1, np.abs(_low)), _c)
+        _c = np.where(_c == _high, _high - 1e-10 * np.maximum(1, np.abs(_high)), _c)
+    _f = batch_profile(fitter, _c, x)
+    _cost = 0.5 * np.sum((_f - data) ** 2, axis=1)
+    _active = np.isfinite(_cost)
+    _success = np.zeros(_c.shape[0], dtype=bool)
+    # a strong initial damping avoids large first steps from poor start values:
+    _lambda = np.ones(_c.shape[0])
+    _scale = np.zeros(_c.shape)
+    for _ in range(max_iterations):
+        _idx = np.flatnonzero(_active)
+        if _idx.size == 0:
+            break
+        _jac = batch_jacobian(fitter, _c[_idx], x, _f[_idx], _high)
+        _grad = np.einsum("nmp,nm->np", _jac, _f[_idx] - data[_idx])
+        # parameters at a bound with a gradient pointing outwards are fixed:
+        _free = ~(
+            ((_c[_idx] <= _low) & (_grad > 0)) | ((_c[_idx] >= _high) & (_grad < 0))
+        )
+        _jac = _jac * _free[:, None, :]
+        _grad = _grad * _free
+        _jtj = np.einsum("nmp,nmq->npq", _jac, _jac)
+        # use the largest diagonal elements so far for scaling (as in MINPACK)
+        _scale[_idx] = np.maximum(_scale[_idx], np.diagonal(_jtj, axis1=1, axis2=2))
+        _diag = np.maximum(
+            _scale[_idx], 1e-12 * np.amax(_scale[_idx], axis=1, keepdims=True)
+        )
+        _diag = _diag + 1e-30
+        _matrix = _jtj + (_lambda[_idx, None] * _diag)[..., None] * np.eye(_n_params)
+        _step = np.linalg.solve(_matrix, -_grad[..., None])[..., 0]
+        # steps across a bound only cover most of the distance to the bound to
+        # keep the parameters strictly feasible, similar to the trust region
+        # reflective algorithm. This is required because some derivatives
+        # vanish at the bounds (e.g. for the sigma of a Voigt profile):
+        _c_new = _c[_idx] + _step
+        _c_new = np.where(_c_new < _low, _c[_idx] + 0.995 * (_low - _c[_idx]), _c_new)
+        _c_new = np.where(_c_new > _high, _c[_idx] + 0.995 * (_high - _c[_idx]), _c_new)
+        _f_new = batch_profile(fitter, _c_new, x)
+        _cost_new = 0.5 * np.sum((_f_new - data[_idx]) ** 2, axis=1)
+        _improved = _cost_new < _cost[_idx]
+        _converged = (np.amax(np.abs(_grad), axis=1) <= gtol) | (
+            _improved
+            & (
+                (_cost[_idx] - _cost_new <= ftol * _cost[_idx])
+                | (
+                    np.linalg.norm(_c_new - _c[_idx], axis=1)
+                    <= xtol * (xtol + np.linalg.norm(_c[_idx], axis=1))
+                )
+            )
+        )
+        _update = _idx[_improved]
+        _c[_update] = _c_new[_improved]
+        _f[_update] = _f_new[_improved]
+        _cost[_update] = _cost_new[_improved]
+        _lambda[_idx] = np.where(_improved, _lambda[_idx] / 3, _lambda[_idx] * 10)
+        _success[_idx[_converged]] = True
+        _active[_idx[_converged | (_lambda[_idx] > 1e16)]] = False
+    return _c, _success
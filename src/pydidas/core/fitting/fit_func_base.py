@@ -54,6 +54,7 @@ class FitFuncBase(metaclass=FitFuncMeta):
     num_peak_params = 3
     center_param_index = 2
     amplitude_param_index = 0
+    analytic_jacobian = False
 
     @staticmethod
     def func(c: tuple[Real], x: ndarray) -> ndarray:
@@ -74,6 +75,31 @@ class FitFuncBase(metaclass=FitFuncMeta):
         """
         return x
 
+    @staticmethod
+    def func_jacobian(c: tuple[Real], x: ndarray) -> tuple[ndarray]:
+        """
+        Get the partial derivatives of the function values for all parameters.
+
+        This method needs to be implemented by fitting functions which set the
+        'analytic_jacobian' class attribute to True.
+
+        Parameters
+        ----------
+        c : tuple[Real]
+            The fit parameters.
+        x : ndarray
+            The input x data points.
+
+        Returns
+        -------
+        tuple[ndarray]
+            The derivatives of the function values with respect to each
+            parameter.
+        """
+        raise NotImplementedError(
+            "The func_jacobian method must be implemented by the specific FitFunc"
+        )
+
     @classmethod
     def profile(cls, c: tuple[Real], x: ndarray) -> ndarray:
         """
@@ -106,6 +132,45 @@ class FitFuncBase(metaclass=FitFuncMeta):
         _background = cls.calculate_background(c, x)
         return _peaks + _background
 
+    @classmethod
+    def jacobian(cls, c: tuple[Real], x: ndarray) -> ndarray:
+        """
+        Calculate the Jacobian of the profile with respect to the parameters.
+
+        The Jacobian includes the derivatives for the background parameters.
+        Like the profile, the Jacobian can be calculated for arrays of
+        parameters which broadcast with x.
+
+        Parameters
+        ----------
+        c : tuple[Real]
+            The tuple with the fit parameters.
+        x : np.ndarray
+            The x data points
+
+        Returns
+        -------
+        np.ndarray
+            The Jacobian with the derivatives for the parameters in the last
+            axis, i.e. with a shape of (x.size, len(c)) for scalar parameters.
+        """
+        _derivatives = []
+        for _i_peak in range(cls.num_peaks):
+            _derivatives.extend(
+                cls.func_jacobian(
+                    c[
+                        _i_peak * cls.num_peak_params : (_i_peak + 1)
+                        * cls.num_peak_params
+                    ],
+                    x,
+                )
+            )
+        _c_bg = c[cls.num_peaks * cls.num_peak_params :]
+        if len(_c_bg) > 2:
+            raise ValueError("The order of the background is not supported.")
+        _derivatives.extend([np.ones_like(x, dtype=float), x][: len(_c_bg)])
+        return np.stack(np.broadcast_arrays(*_derivatives), axis=-1).astype(float)
+
     @classmethod
     def calculate_background(cls, c: tuple[Real], x: ndarray) -> ndarray:
         """
@@ -153,6 +218,30 @@ class FitFuncBase(metaclass=FitFuncMeta):
         """
         return cls.profile(c, x) - data
 
+    @classmethod
+    def delta_jacobian(cls, c: tuple[Real], x: ndarray, data: ndarray) -> ndarray:
+        """
+        Get the Jacobian of the difference between the fit and the data.
+
+        This method has the same signature as the delta method to be used as
+        Jacobian in scipy.optimize.least_squares.
+
+        Parameters
+        ----------
+        c : tuple
+            The tuple with the function parameters.
+        x : np.ndarray
+            The x points to calculate the function values.
+        data : np.ndarray
+            The data values. They do not affect the Jacobian.
+
+        Returns
+        -------
+        np.ndarray
+            The Jacobian of shape (x.size, len(c)).
+        """
+        return cls.jacobian(c, x)
+
     @classmethod
     def area(cls, c: tuple[Real]) -> tuple[Real]:
         """
@@ -46,6 +46,7 @@ class Gaussian(FitFuncBase):
     num_peak_params = 3
     center_param_index = 2
     amplitude_param_index = 0
+    analytic_jacobian = True
 
     @staticmethod
     def func(c: tuple[Real], x: ndarray) -> ndarray:
@@ -80,6 +81,35 @@ class Gaussian(FitFuncBase):
             c[0] * (2 * pi) ** (-0.5) / c[1] * exp(-((x - c[2]) ** 2) / (2 * c[1] ** 2))
         )
 
+    @staticmethod
+    def func_jacobian(c: tuple[Real], x: ndarray) -> tuple[ndarray]:
+        """
+        Get the partial derivatives of the Gaussian function values.
+
+        Parameters
+        ----------
+        c : tuple
+            The tuple with the function parameters.
+            c[0] : amplitude
+            c[1] : sigma
+            c[2] : expectation value
+        x : ndarray
+            The input x data points.
+
+        Returns
+        -------
+        tuple[ndarray]
+            The derivatives with respect to the amplitude, sigma and the
+            expectation value.
+        """
+        _dx = x - c[2]
+        _normed = (2 * pi) ** (-0.5) / c[1] * exp(-(_dx**2) / (2 * c[1] ** 2))
+        return (
+            _normed,
+            c[0] * _normed * (_dx**2 / c[1] ** 3 - 1 / c[1]),
+            c[0] * _normed * _dx / c[1] ** 2,
+        )
+
     @classmethod
     def guess_peak_start_params(
         cls, x: ndarray, y: ndarray, index: Optional[int], **kwargs: Dict
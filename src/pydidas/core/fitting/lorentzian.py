@@ -46,6 +46,7 @@ class Lorentzian(FitFuncBase):
     amplitude_param_index = 0
     num_peak_params = 3
     center_param_index = 2
+    analytic_jacobian = True
 
     @staticmethod
     def func(c: tuple[Real], x: ndarray) -> ndarray:
@@ -77,6 +78,35 @@ class Lorentzian(FitFuncBase):
         """
         return c[0] * (c[1] / pi) / ((x - c[2]) ** 2 + c[1] ** 2)
 
+    @staticmethod
+    def func_jacobian(c: tuple[Real], x: ndarray) -> tuple[ndarray]:
+        """
+        Get the partial derivatives of the Lorentzian function values.
+
+        Parameters
+        ----------
+        c : tuple[Real]
+            The tuple with the function parameters.
+            c[0] : amplitude
+            c[1] : gamma
+            c[2] : center
+        x : ndarray
+            The input x data points.
+
+        Returns
+        -------
+        tuple[ndarray]
+            The derivatives with respect to the amplitude, gamma and the
+            center.
+        """
+        _dx = x - c[2]
+        _denom = _dx**2 + c[1] ** 2
+        return (
+            (c[1] / pi) / _denom,
+            c[0] / pi * (_dx**2 - c[1] ** 2) / _denom**2,
+            c[0] / pi * 2 * c[1] * _dx / _denom**2,
+        )
+
     @classmethod
     def guess_peak_start_params(
         cls, x: ndarray, y: ndarray, index: Optional[int] = None, **kwargs: dict
@@ -29,8 +29,9 @@ __all__ = ["Voigt"]
 from numbers import Real
 from typing import Union
 
-from numpy import amax, amin, inf, ndarray
-from scipy.special import voigt_profile
+from numpy import abs as np_abs
+from numpy import amax, amin, errstate, inf, ndarray, pi, sqrt, where
+from scipy.special import voigt_profile, wofz
 
 from pydidas.core.fitting.fit_func_base import FitFuncBase
 
@@ -47,6 +48,7 @@ class Voigt(FitFuncBase):
     amplitude_param_index = 0
     num_peak_params = 4
     center_param_index = 3
+    analytic_jacobian = True
 
     @staticmethod
     def func(c: tuple[Real], x: ndarray) -> ndarray:
@@ -74,6 +76,47 @@ class Voigt(FitFuncBase):
         """
         return c[0] * voigt_profile(x - c[3], c[1], c[2])
 
+    @staticmethod
+    def func_jacobian(c: tuple[Real], x: ndarray) -> tuple[ndarray]:
+        """
+        Get the partial derivatives of the Voigt function values.
+
+        The derivatives are calculated from the derivatives of the Faddeeva
+        function w(z) with z = (x - center + i * gamma) / (sigma * sqrt(2)).
+        For sigma = 0, the derivatives of the Lorentzian function are used.
+
+        Parameters
+        ----------
+        c : tuple
+            The tuple with the function parameters.
+            c[0] : amplitude
+            c[1] : sigma
+            c[2] : gamma
+            c[3] : center
+        x : ndarray
+            The input x data points.
+
+        Returns
+        -------
+        tuple[ndarray]
+            The derivatives with respect to the amplitude, sigma, gamma and
+            the center.
+        """
+        _dx = x - c[3]
+        _sigma = where(c[1] > 0, c[1], 1)
+        _dw, _d2w = _faddeeva_derivatives((_dx + 1j * c[2]) / (_sigma * sqrt(2)))
+        _scale = c[0] / (2 * _sigma**2 * sqrt(pi))
+        with errstate(divide="ignore", invalid="ignore"):
+            _lorentz_denom = _dx**2 + c[2] ** 2
+            _lorentz_d_gamma = c[0] / pi * (_dx**2 - c[2] ** 2) / _lorentz_denom**2
+            _lorentz_d_center = c[0] / pi * 2 * c[2] * _dx / _lorentz_denom**2
+        return (
+            voigt_profile(_dx, c[1], c[2]),
+            where(c[1] > 0, _scale / sqrt(2) * _d2w.real, 0),
+            where(c[1] > 0, -_scale * _dw.imag, _lorentz_d_gamma),
+            where(c[1] > 0, -_scale * _dw.real, _lorentz_d_center),
+        )
+
     @classmethod
     def guess_peak_start_params(
         cls, x: ndarray, y: ndarray, index: Union[None, int], **kwargs: dict
@@ -176,3 +219,31 @@ class Voigt(FitFuncBase):
             c[_i] * voigt_profile(0, c[_i + 1], c[_i + 2])
             for _i in [4 * _ii for _ii in range(cls.num_peaks)]
         )
+
+
+def _faddeeva_derivatives(z: ndarray) -> tuple[ndarray, ndarray]:
+    """
+    Get the first and second derivatives of the Faddeeva function.
+
+    For large arguments, the asymptotic expansion is used because the
+    derivatives cancel to small values.
+
+    Parameters
+    ----------
+    z : ndarray
+        The complex arguments in the upper half plane.
+
+    Returns
+    -------
+    tuple[ndarray, ndarray]
+        The first and second derivatives.
+    """
+    _w = wofz(z)
+    _dw = -2 * z * _w + 2j / sqrt(pi)
+    _d2w = -2 * _w - 2 * z * _dw
+    with errstate(divide="ignore", invalid="ignore", over="ignore"):
+        _z2 = z**-2
+        _dw_asym = 1j / sqrt(pi) * _z2 * (-1 - _z2 * (1.5 + 3.75 * _z2))
+        _d2w_asym = 1j / sqrt(pi) * _z2 / z * (2 + _z2 * (6 + 22.5 * _z2))
+    _large = np_abs(z) > 100
+    return where(_large, _dw_asym, _dw), where(_large, _d2w_asym, _d2w)
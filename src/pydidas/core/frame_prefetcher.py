@@ -0,0 +1,256 @@
+# This file is part of pydidas.
+#
+# Copyright 2026, Helmholtz-Zentrum Hereon
+# SPDX-License-Identifier: GPL-3.0-only
+#
+# pydidas is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# Pydidas is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pydidas. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module with the FramePrefetcher class which reads frames ahead in a pool of
+background threads.
+"""
+
+__author__ = "Malte Storm"
+__copyright__ = "Copyright 2026, Helmholtz-Zentrum Hereon"
+__license__ = "GPL-3.0-only"
+__maintainer__ = "Malte Storm"
+__status__ = "Production"
+__all__ = ["FramePrefetcher"]
+
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Iterable
+
+import numpy as np
+
+
+class FramePrefetcher:
+    """
+    Read frames ahead of their use in a small pool of background threads.
+
+    The frames which will be required next are announced with the request
+    method and read in the background with the load function. The get
+    method returns the result of a requested frame and waits for the
+    background thread, if the frame is still being read.
+
+    The memory used by the prefetched frames is limited. New frames are only
+    submitted if the size of all prefetched frames (and the estimated size of
+    the frames being read) is below the limit. Frames which are not requested
+    anymore are discarded.
+
+    Exceptions raised in the load function are re-raised by the get method.
+
+    Parameters
+    ----------
+    load_func : Callable[[int], Any]
+        The function to read a frame. It is called with the frame index and
+        the result must be either an array or a tuple with an array as first
+        item.
+    max_size : float, optional
+        The maximum size of all prefetched frames in MB. The default is 256.
+    n_threads : int, optional
+        The number of threads. The default is 4.
+    """
+
+    def __init__(
+        self,
+        load_func: Callable[[int], Any],
+        max_size: float = 256,
+        n_threads: int = 4,
+    ):
+        if max_size <= 0 or n_threads < 1:
+            raise ValueError(
+                "The memory limit and the number of threads must be positive."
+            )
+        self._load_func = load_func
+        self._max_bytes = max_size * 2**20
+        self._n_threads = n_threads
+        self._executor = None
+        self._lock = threading.RLock()
+        self._futures = {}
+        self._nbytes = {}
+        self._wanted = []
+        self._frame_nbytes = 0
+        self.reset_statistics()
+
+    @property
+    def max_size(self) -> float:
+        """
+        Get the maximum size of all prefetched frames in MB.
+
+        Returns
+        -------
+        float
+            The memory limit.
+        """
+        return self._max_bytes / 2**20
+
+    @property
+    def prefetched_frames(self) -> list[int]:
+        """
+        Get the indices of the frames which are prefetched or being read.
+
+        Returns
+        -------
+        list[int]
+            The frame indices.
+        """
+        with self._lock:
+            return list(self._futures.keys())
+
+    @property
+    def statistics(self) -> dict[str, int]:
+        """
+        Get the statistics of the prefetcher.
+
+        The statistics include the number of frames returned from the
+        prefetched frames (hits), the number of frames which had not been
+        prefetched (misses) and the number of prefetched frames which were
+        discarded without being used.
+
+        Returns
+        -------
+        dict[str, int]
+            The statistics.
+        """
+        with self._lock:
+            return self._stats.copy()
+
+    def reset_statistics(self) -> None:
+        """Reset the statistics."""
+        self._stats = {"hits": 0, "misses": 0, "discarded": 0}
+
+    def request(self, frame_indices: Iterable[int]) -> None:
+        """
+        Announce the frames which will be required next, in order of use.
+
+        Prefetched frames which are not included in the new request are
+        discarded.
+
+        Parameters
+        ----------
+        frame_indices : Iterable[int]
+            The indices of the frames.
+        """
+        _wanted = list(dict.fromkeys(frame_indices))
+        with self._lock:
+            for _index in [_i for _i in self._futures if _i not in _wanted]:
+                self._discard(_index)
+            self._wanted = _wanted
+            self._submit_frames()
+
+    def get(self, frame_index: int) -> Any | None:
+        """
+        Get the result of a prefetched frame.
+
+        The frame is removed from the prefetched frames. If the frame is
+        still being read, this method waits for the result.
+
+        Parameters
+        ----------
+        frame_index : int
+            The index of the frame.
+
+        Returns
+        -------
+        Any or None
+            The result of the load function or None if the frame has not
+            been prefetched.
+        """
+        with self._lock:
+            _future = self._futures.pop(frame_index, None)
+            self._stats["hits" if _future is not None else "misses"] += 1
+            if frame_index in self._wanted:
+                self._wanted.remove(frame_index)
+        if _future is None:
+            return None
+        try:
+            return _future.result()
+        finally:
+            with self._lock:
+                self._nbytes.pop(frame_index, None)
+                self._submit_frames()
+
+    def clear(self) -> None:
+        """Discard all prefetched frames."""
+        with self._lock:
+            for _index in list(self._futures):
+                self._discard(_index)
+            self._wanted = []
+
+    def shutdown(self) -> None:
+        """Discard all prefetched frames and stop the threads."""
+        self.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def _discard(self, frame_index: int) -> None:
+        """
+        Discard a prefetched frame.
+
+        This method must be called while holding the lock.
+
+        Parameters
+        ----------
+        frame_index : int
+            The index of the frame.
+        """
+        self._futures.pop(frame_index).cancel()
+        self._nbytes.pop(frame_index, None)
+        self._stats["discarded"] += 1
+
+    def _submit_frames(self) -> None:
+        """
+        Submit the wanted frames to the threads within the memory limit.
+
+        This method must be called while holding the lock.
+        """
+        for _index in self._wanted:
+            if _index in self._futures:
+                continue
+            _n_pending = len(self._futures) - len(self._nbytes)
+            _size = sum(self._nbytes.values()) + _n_pending * self._frame_nbytes
+            if len(self._futures) > 0 and _size + self._frame_nbytes > self._max_bytes:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._n_threads, thread_name_prefix="pydidas_prefetch"
+                )
+            _future = self._executor.submit(self._load_func, _index)
+            self._futures[_index] = _future
+            _future.add_done_callback(
+                lambda _f, _i=_index: self._store_frame_size(_i, _f)
+            )
+
+    def _store_frame_size(self, frame_index: int, future: Future) -> None:
+        """
+        Store the size of a frame which has been read.
+
+        Parameters
+        ----------
+        frame_index : int
+            The index of the frame.
+        future : Future
+            The future of the load function call.
+        """
+        if future.cancelled() or future.exception() is not None:
+            return
+        _result = future.result()
+        _data = _result[0] if isinstance(_result, tuple) else _result
+        _nbytes = np.asarray(_data).nbytes
+        with self._lock:
+            self._frame_nbytes = max(self._frame_nbytes, _nbytes)
+            if self._futures.get(frame_index, None) is future:
+                self._nbytes[frame_index] = _nbytes
@@ -61,6 +61,21 @@ GENERIC_PARAMS_FIT = (
                 "'None' will not impose any limits on the peak height."
             ),
         },
+        "fit_warm_start": {
+            "type": bool,
+            "default": False,
+            "name": "Use previous fit as start values",
+            "choices": [True, False],
+            "unit": "",
+            "allow_None": False,
+            "tooltip": (
+                "Flag to use the fit results of the previous scan point as "
+                "starting values for the fit instead of estimating them from the "
+                "data. This is faster for scans where neighbouring points have "
+                "similar peaks. If the fit from the previous results is rejected, "
+                "the fit is repeated with estimated starting values."
+            ),
+        },
         "fit_func": {
             "type": str,
             "default": "Gaussian",
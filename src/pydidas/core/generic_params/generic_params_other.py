@@ -47,6 +47,61 @@ GENERIC_PARAMS_OTHER = {
             "startup. This will skip checks on file existence and size."
         ),
     },
+    "profile_workflow": {
+        "type": int,
+        "default": 0,
+        "name": "Profile workflow plugins",
+        "choices": [True, False],
+        "unit": "",
+        "allow_None": False,
+        "tooltip": (
+            "Record the runtimes, data sizes and peak memory allocations of all "
+            "plugins during processing. The profiles of all workers are "
+            "combined and stored with the workflow results. Note that profiling "
+            "slows down the processing."
+        ),
+    },
+    "profile_memory": {
+        "type": int,
+        "default": 0,
+        "name": "Profile plugin memory allocations",
+        "choices": [True, False],
+        "unit": "",
+        "allow_None": False,
+        "tooltip": (
+            "Trace the peak memory allocations of all plugins with tracemalloc "
+            "while profiling the workflow. This option is only used if the "
+            "workflow is profiled. Note that memory tracing slows down the "
+            "processing considerably."
+        ),
+    },
+    "n_partitions": {
+        "type": int,
+        "default": 1,
+        "name": "Number of scan partitions",
+        "choices": None,
+        "unit": "",
+        "allow_None": False,
+        "tooltip": (
+            "The number of partitions of the scan. For more than one partition, "
+            "the scan points are split into contiguous blocks and each "
+            "processing run only processes the scan points of a single "
+            "partition. This allows to distribute the processing of a scan "
+            "over several independent processes or computers."
+        ),
+    },
+    "partition_index": {
+        "type": int,
+        "default": 0,
+        "name": "Scan partition index",
+        "choices": None,
+        "unit": "",
+        "allow_None": False,
+        "tooltip": (
+            "The index of the scan partition to be processed. The index must "
+            "be in the range [0, n_partitions - 1]."
+        ),
+    },
     "label": {
         "type": str,
         "default": "",
@@ -72,6 +127,20 @@ GENERIC_PARAMS_OTHER = {
             "even if it is intermediary data and would normally not be stored."
         ),
     },
+    "result_dtype": {
+        "type": str,
+        "default": "native",
+        "name": "Result datatype",
+        "choices": ["native", "float32"],
+        "unit": "",
+        "allow_None": False,
+        "tooltip": (
+            "The datatype used for storing the results of this plugin. 'native' "
+            "keeps the datatype of the plugin output while 'float32' converts "
+            "the results to single precision floats to reduce the memory "
+            "requirements."
+        ),
+    },
     ##################################
     # Parameters for CompositeCreation
     ##################################
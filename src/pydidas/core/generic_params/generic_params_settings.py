@@ -44,6 +44,79 @@ GENERIC_PARAMS_SETTINGS = {
             "performance increases for multiple parallel processes."
         ),
     },
+    "mp_chunk_size": {
+        "type": int,
+        "default": 1,
+        "name": "Task chunk size",
+        "choices": None,
+        "unit": "",
+        "allow_None": False,
+        "tooltip": (
+            "The number of tasks (e.g. scan points) which are sent to a worker "
+            "at once. The results of all tasks are returned in a single message. "
+            "Larger chunks reduce the communication overhead for fast tasks, for "
+            "example for small 1D results."
+        ),
+    },
+    "mp_adaptive_chunk_size": {
+        "type": bool,
+        "default": False,
+        "name": "Adaptive task chunk size",
+        "choices": [True, False],
+        "unit": "",
+        "allow_None": False,
+        "tooltip": (
+            "Flag to adapt the task chunk size automatically to the processing "
+            "time of the tasks. Fast tasks will be sent in larger chunks and the "
+            "chunk size is reduced at the end of the processing to balance the "
+            "load between workers."
+        ),
+    },
+    "mp_persistent_workers": {
+        "type": bool,
+        "default": False,
+        "name": "Keep worker processes alive",
+        "choices": [True, False],
+        "unit": "",
+        "allow_None": False,
+        "tooltip": (
+            "Flag to keep the multiprocessing workers alive between processing "
+            "runs in the GUI. Re-using the workers removes the startup time of "
+            "new processes and allows them to re-use the processing setup for "
+            "repeated runs."
+        ),
+    },
+    "mp_execution_backend": {
+        "type": str,
+        "default": "processes",
+        "name": "Execution backend",
+        "choices": ["processes", "threads"],
+        "unit": "",
+        "allow_None": False,
+        "tooltip": (
+            "The backend for the parallel processing of workflows. 'processes' "
+            "runs the workflow in separate worker processes. 'threads' runs the "
+            "workflow in worker threads of the current process. Threads avoid "
+            "copying data between processes but only run in parallel while "
+            "plugins release the GIL (e.g. pyFAI integration, file reading "
+            "and numpy operations)."
+        ),
+    },
+    "mp_task_scheduler": {
+        "type": str,
+        "default": "ordinal",
+        "name": "Task scheduler",
+        "choices": ["ordinal", "locality"],
+        "unit": "",
+        "allow_None": False,
+        "tooltip": (
+            "The scheduling of tasks to the workers. 'ordinal' sends the tasks "
+            "in order to the next free worker. 'locality' assigns contiguous "
+            "blocks of tasks from the same input file (or HDF5 chunk) to each "
+            "worker and idle workers take over blocks from busy workers at the "
+            "end of the processing."
+        ),
+    },
     "data_buffer_size": {
         "type": float,
         "default": 1500,
@@ -71,6 +144,45 @@ GENERIC_PARAMS_SETTINGS = {
             "This parameter is only relevant for the data browsing frame."
         ),
     },
+    "hdf5_file_cache_size": {
+        "type": int,
+        "default": 8,
+        "name": "HDF5 file handle cache size",
+        "choices": None,
+        "unit": "files",
+        "allow_None": False,
+        "tooltip": (
+            "The maximum number of HDF5 files which are kept open for reading "
+            "in each process. Open files are re-used when reading further "
+            "frames and are re-opened if they have been modified. A value of "
+            "0 disables the cache."
+        ),
+    },
+    "input_prefetch_depth": {
+        "type": int,
+        "default": 0,
+        "name": "Input prefetch depth",
+        "choices": None,
+        "unit": "frames",
+        "allow_None": False,
+        "tooltip": (
+            "The number of frames of upcoming scan points which each worker "
+            "reads ahead in background threads while the current frame is "
+            "processed. All frames of the current scan point are read in "
+            "parallel. A value of 0 disables prefetching."
+        ),
+    },
+    "input_prefetch_max_size": {
+        "type": float,
+        "default": 256,
+        "name": "Input prefetch memory limit",
+        "choices": None,
+        "unit": "MB",
+        "allow_None": False,
+        "tooltip": (
+            "The maximum size of all frames which are read ahead by each worker."
+        ),
+    },
     "shared_buffer_size": {
         "type": float,
         "default": 100,
@@ -97,6 +209,101 @@ GENERIC_PARAMS_SETTINGS = {
             "not be too large."
         ),
     },
+    "hdf5_compression": {
+        "type": str,
+        "default": "None",
+        "name": "HDF5 result compression",
+        "choices": ["None", "gzip", "lzf", "lz4", "zstd", "bitshuffle-lz4"],
+        "unit": "",
+        "allow_None": False,
+        "tooltip": (
+            "The lossless compression filter for writing results to HDF5 files. "
+            "The 'lz4', 'zstd' and 'bitshuffle-lz4' filters are provided by "
+            "hdf5plugin and files written with these filters can only be read "
+            "if the filters are available."
+        ),
+    },
+    "hdf5_flush_n_frames": {
+        "type": int,
+        "default": 50,
+        "name": "HDF5 flush interval (frames)",
+        "choices": None,
+        "unit": "",
+        "allow_None": False,
+        "tooltip": (
+            "The number of frames after which the HDF5 result files are flushed "
+            "to disk during the automatic saving of results."
+        ),
+    },
+    "hdf5_flush_interval": {
+        "type": float,
+        "default": 5.0,
+        "name": "HDF5 flush interval (time)",
+        "choices": None,
+        "unit": "s",
+        "allow_None": False,
+        "tooltip": (
+            "The time after which the HDF5 result files are flushed to disk "
+            "during the automatic saving of results. Files are flushed with the "
+            "first frame written after the interval has passed."
+        ),
+    },
+    "hdf5_single_file": {
+        "type": bool,
+        "default": False,
+        "name": "Single HDF5 result file",
+        "choices": [True, False],
+        "unit": "",
+        "allow_None": False,
+        "tooltip": (
+            "Flag to write the results of all nodes into a single NeXus file "
+            "with shared context groups instead of one file per node. The file "
+            "is written in SWMR mode and can be read while the processing is "
+            "running."
+        ),
+    },
+    "result_backing_store": {
+        "type": str,
+        "default": "memory",
+        "name": "Result composite storage",
+        "choices": ["memory", "memmap"],
+        "unit": "",
+        "allow_None": False,
+        "tooltip": (
+            "The storage of the composite results of a processing run. 'memory' "
+            "keeps the results in RAM. 'memmap' stores the results in "
+            "memory-mapped files which are only loaded on access and allows to "
+            "process scans with results larger than the available memory. If "
+            "results are saved automatically in HDF5 format, the autosave files "
+            "are used as memory-mapped files."
+        ),
+    },
+    "async_write_queue_size": {
+        "type": int,
+        "default": 64,
+        "name": "Asynchronous write queue size",
+        "choices": None,
+        "unit": "frames",
+        "allow_None": False,
+        "tooltip": (
+            "The maximum number of frames waiting to be written to disk by the "
+            "background writer thread. Processing is paused while the queue is "
+            "full. A value of 0 disables the background writer and results are "
+            "written directly."
+        ),
+    },
+    "async_write_batch_size": {
+        "type": int,
+        "default": 16,
+        "name": "Asynchronous write batch size",
+        "choices": None,
+        "unit": "frames",
+        "allow_None": False,
+        "tooltip": (
+            "The maximum number of queued frames which are written together by "
+            "the background writer thread."
+        ),
+    },
     "max_image_size": {
         "type": float,
         "default": 100,
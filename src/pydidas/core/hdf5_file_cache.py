@@ -0,0 +1,226 @@
+# This file is part of pydidas.
+#
+# Copyright 2026, Helmholtz-Zentrum Hereon
+# SPDX-License-Identifier: GPL-3.0-only
+#
+# pydidas is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# Pydidas is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pydidas. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module with the Hdf5FileCache singleton which keeps HDF5 files open for
+reading.
+"""
+
+__author__ = "Malte Storm"
+__copyright__ = "Copyright 2026, Helmholtz-Zentrum Hereon"
+__license__ = "GPL-3.0-only"
+__maintainer__ = "Malte Storm"
+__status__ = "Production"
+__all__ = ["Hdf5FileCache"]
+
+
+import atexit
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+import h5py
+
+from pydidas.core.pydidas_q_settings import PydidasQsettings
+from pydidas.core.singleton_object import SingletonObject
+from pydidas.core.utils.file_utils import get_file_stamp
+
+
+class Hdf5FileCache(SingletonObject):
+    """
+    A least-recently-used cache of HDF5 files which are open for reading.
+
+    Files are identified by their absolute path and their modification time.
+    Modified files are closed and re-opened automatically. Files are opened in
+    SWMR read mode to allow reading files which are being written by other
+    processes.
+
+    Each process has its own cache and files inherited from a parent process
+    are discarded. The maximum number of open files is given by the global
+    "hdf5_file_cache_size" setting. A size of 0 disables the cache and files
+    are closed directly after use.
+
+    HDF5 does not allow opening a file for writing while it is open for
+    reading in the same process. The cache is therefore only used for
+    reading input frames and writers must call the close method with the
+    filename before opening a file for writing.
+    """
+
+    def initialize(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Initialize the Hdf5FileCache.
+
+        Parameters
+        ----------
+        *args : Any
+            Unused positional arguments.
+        **kwargs : Any
+            Supported keyword arguments are:
+
+            max_size : int, optional
+                The maximum number of open files. The default is the global
+                "hdf5_file_cache_size" setting.
+        """
+        self._files = OrderedDict()
+        self._lock = threading.RLock()
+        self._max_size = kwargs.get("max_size", None)
+        if self._max_size is None:
+            self._max_size = PydidasQsettings().q_settings_get(
+                "global/hdf5_file_cache_size", int, 8
+            )
+        atexit.register(self.close)
+        os.register_at_fork(after_in_child=self._discard_inherited_files)
+
+    @property
+    def max_size(self) -> int:
+        """
+        Get the maximum number of open files.
+
+        Returns
+        -------
+        int
+            The maximum number of open files.
+        """
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, size: int) -> None:
+        """
+        Set the maximum number of open files.
+
+        Files exceeding the new size are closed.
+
+        Parameters
+        ----------
+        size : int
+            The new maximum number of open files.
+        """
+        if size < 0:
+            raise ValueError("The cache size must not be negative.")
+        with self._lock:
+            self._max_size = size
+            self._evict()
+
+    @property
+    def filenames(self) -> list[str]:
+        """
+        Get the filenames of the cached files, from least to most recently used.
+
+        Returns
+        -------
+        list[str]
+            The absolute filenames.
+        """
+        with self._lock:
+            return list(self._files.keys())
+
+    @contextmanager
+    def open(self, filename: Path | str) -> Iterator[h5py.File]:
+        """
+        Get an open HDF5 file for reading.
+
+        The file must only be used within the context and must not be closed
+        by the caller.
+
+        Parameters
+        ----------
+        filename : Path or str
+            The filename.
+
+        Yields
+        ------
+        h5py.File
+            The open file.
+        """
+        _key = os.path.abspath(filename)
+        _stamp = get_file_stamp(_key)
+        if self._max_size == 0:
+            with h5py.File(_key, "r", swmr=True) as _h5file:
+                yield _h5file
+            return
+        with self._lock:
+            _entry = self._files.get(_key, None)
+            if _entry is not None and _entry["stamp"] != _stamp:
+                self._discard(_key)
+                _entry = None
+            if _entry is None:
+                _entry = {
+                    "file": h5py.File(_key, "r", swmr=True),
+                    "stamp": _stamp,
+                    "n_users": 0,
+                    "discarded": False,
+                }
+                self._files[_key] = _entry
+            self._files.move_to_end(_key)
+            _entry["n_users"] += 1
+            self._evict()
+        try:
+            yield _entry["file"]
+        finally:
+            with self._lock:
+                _entry["n_users"] -= 1
+                if _entry["discarded"] and _entry["n_users"] == 0:
+                    _entry["file"].close()
+
+    def close(self, filename: Path | str | None = None) -> None:
+        """
+        Close a cached file or all cached files.
+
+        Files which are in use are closed as soon as they are released.
+
+        Parameters
+        ----------
+        filename : Path, str or None, optional
+            The filename of the file to be closed. If None, all files are
+            closed. The default is None.
+        """
+        with self._lock:
+            _keys = (
+                list(self._files.keys())
+                if filename is None
+                else [os.path.abspath(filename)]
+            )
+            for _key in _keys:
+                if _key in self._files:
+                    self._discard(_key)
+
+    def _evict(self) -> None:
+        """Close the least recently used files which exceed the cache size."""
+        while len(self._files) > self._max_size:
+            self._discard(next(iter(self._files)))
+
+    def _discard(self, key: str) -> None:
+        """
+        Remove a file from the cache and close it, if it is not in use.
+
+        Parameters
+        ----------
+        key : str
+            The absolute filename.
+        """
+        _entry = self._files.pop(key)
+        _entry["discarded"] = True
+        if _entry["n_users"] == 0:
+            _entry["file"].close()
+
+    def _discard_inherited_files(self) -> None:
+        """Discard the files inherited from the parent process after a fork."""
+        self._files = OrderedDict()
+        self._lock = threading.RLock()
@@ -96,8 +96,8 @@ class Parameter:
     A class used for storing a value and associated metadata.
 
     The Parameter has the following properties which can be accessed.
-    Only the value and choices properties can be edited at runtime, all other
-    properties are fixed at instantiation.
+    Only the value, choices, range and default properties can be edited at
+    runtime, all other properties are fixed at instantiation.
 
     +------------+-----------+-------------------------------------------+
     | property   | editable  | description                               |
@@ -132,7 +132,7 @@ class Parameter:
     +------------+-----------+-------------------------------------------+
     | tooltip    | False     | A readable tooltip.                       |
     +------------+-----------+-------------------------------------------+
-    | default    | False     | The default value.                        |
+    | default    | True      | The default value.                        |
     +------------+-----------+-------------------------------------------+
     | subtype    | False     | For Iterable datatypes, a subtype can be  |
     |            |           | defined to determine the data type inside |
@@ -389,6 +389,30 @@ class Parameter:
         """
         return self.__meta["default"]
 
+    @default.setter
+    def default(self, default: Any):
+        """
+        Update the default value of the Parameter.
+
+        The current value of the Parameter is not changed.
+
+        Parameters
+        ----------
+        default : Any
+            The new default value.
+
+        Raises
+        ------
+        TypeError
+            If the default value is not of the demanded data type.
+        ValueError
+            If the default value is not included in the Parameter's choices.
+        """
+        _default = self.__convenience_type_conversion(default)
+        if self.choices is not None and _default not in self.choices:
+            raise ValueError(_invalid_choice_str(_default, self.choices))
+        self.__process_default_input(default)
+
     @property
     def unit(self) -> str:
         """
@@ -0,0 +1,458 @@
+# This file is part of pydidas.
+#
+# Copyright 2026, Helmholtz-Zentrum Hereon
+# SPDX-License-Identifier: GPL-3.0-only
+#
+# pydidas is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# Pydidas is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pydidas. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module with the SharedResources singleton which shares large, static arrays
+(e.g. masks or background images) between all pydidas processes.
+"""
+
+__author__ = "Malte Storm"
+__copyright__ = "Copyright 2026, Helmholtz-Zentrum Hereon"
+__license__ = "GPL-3.0-only"
+__maintainer__ = "Malte Storm"
+__status__ = "Production"
+__all__ = ["SharedResources"]
+
+
+import atexit
+import ctypes
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+from pydidas.core.singleton_object import SingletonObject
+from pydidas.core.utils.file_utils import get_file_stamp
+from pydidas.core.utils.logger import pydidas_logger
+
+
+logger = pydidas_logger()
+
+SHARED_RESOURCE_DIR = Path(tempfile.gettempdir()) / "pydidas_shared_resources"
+
+
+def _process_exists(pid: int) -> bool:
+    """
+    Check whether a process with the given PID is running.
+
+    Parameters
+    ----------
+    pid : int
+        The process ID.
+
+    Returns
+    -------
+    bool
+        Flag whether the process is running.
+    """
+    if pid == os.getpid():
+        return True
+    if sys.platform == "win32":
+        _kernel = ctypes.windll.kernel32
+        # 0x1000: PROCESS_QUERY_LIMITED_INFORMATION
+        _handle = _kernel.OpenProcess(0x1000, False, pid)
+        if not _handle:
+            return False
+        _exit_code = ctypes.c_ulong()
+        _kernel.GetExitCodeProcess(_handle, ctypes.byref(_exit_code))
+        _kernel.CloseHandle(_handle)
+        # 259: STILL_ACTIVE
+        return _exit_code.value == 259
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _update_digest(
+    digest: "hashlib._Hash", identifier: Any, file_stamps: bool = True
+) -> None:
+    """
+    Update the hash digest with a single identifier.
+
+    Files are identified by their path and their file stamp, arrays by their
+    shape, dtype and data. All other objects are identified by their repr.
+
+    Parameters
+    ----------
+    digest : hashlib._Hash
+        The digest to be updated.
+    identifier : Any
+        The identifier.
+    file_stamps : bool, optional
+        Flag to include the file stamps of files. The default is True.
+    """
+    if isinstance(identifier, Path) and identifier.is_file():
+        _stamp = get_file_stamp(identifier) if file_stamps else None
+        digest.update(f"file:{identifier.resolve()}:{_stamp}".encode())
+    elif isinstance(identifier, np.ndarray):
+        digest.update(f"array:{identifier.shape}:{identifier.dtype}:".encode())
+        digest.update(np.ascontiguousarray(identifier).data)
+    else:
+        digest.update(f"{type(identifier).__name__}:{identifier!r}".encode())
+    digest.update(b";")
+
+
+class SharedResources(SingletonObject):
+    """
+    Share large, static resources between processes with memory-mapped files.
+
+    Each resource is identified by a key which is computed from all its
+    inputs (see the get_key method). The first process which requests a
+    resource calls the loader and publishes the result as .npy file(s) in the
+    shared resource directory. All other processes (and repeated requests)
+    memory-map the published file(s). The operating system keeps only one
+    copy of the data in the page cache, independent of the number of workers.
+
+    Resources should be published by the main process. The main process can
+    pass the keys of its resources to the worker processes with the keys
+    property and the assign_keys method. Workers use the assigned keys
+    without accessing the input files and do not publish the resources of
+    assigned keys.
+
+    Resources can be numpy arrays or tuples of numpy arrays. Returned arrays
+    are read-only by default. Writable arrays are mapped copy-on-write and
+    modifications are only visible to the calling process.
+
+    Files published by a process are removed when the process exits. Each
+    publisher writes an owner file with its PID and files of processes which
+    are not running anymore (e.g. terminated workers) are removed when the
+    SharedResources are initialized.
+
+    Requests from several threads of the same process are serialized and the
+    loader of a resource is only called once.
+    """
+
+    def initialize(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Initialize the SharedResources.
+
+        Parameters
+        ----------
+        *args : Any
+            Unused positional arguments.
+        **kwargs : Any
+            Supported keyword arguments are:
+
+            directory : Path, optional
+                The directory to store the shared resources. The default is
+                the "pydidas_shared_resources" folder in the system's
+                temporary directory.
+        """
+        self._directory = Path(kwargs.get("directory", SHARED_RESOURCE_DIR))
+        self._cache = {}
+        self._published_files = []
+        self._keys = {}
+        self._assigned_keys = {}
+        self._lock = threading.RLock()
+        self._remove_stale_files()
+        atexit.register(self.clear)
+
+    @property
+    def directory(self) -> Path:
+        """
+        Get the directory of the shared resource files.
+
+        Returns
+        -------
+        Path
+            The directory.
+        """
+        return self._directory
+
+    @property
+    def keys(self) -> dict[str, str]:
+        """
+        Get the resource keys computed in this process.
+
+        Returns
+        -------
+        dict[str, str]
+            The keys of the resources with the keys of their identifiers
+            without file stamps as dictionary keys.
+        """
+        with self._lock:
+            return self._keys.copy()
+
+    def assign_keys(self, keys: dict[str, str]) -> None:
+        """
+        Assign the resource keys of another process.
+
+        The assigned keys are used instead of computing the keys from the
+        identifiers. Previously assigned keys are replaced.
+
+        Parameters
+        ----------
+        keys : dict[str, str]
+            The resource keys, as returned by the keys property.
+        """
+        with self._lock:
+            self._assigned_keys = dict(keys)
+
+    @staticmethod
+    def get_key(*identifiers: Any) -> str:
+        """
+        Get the key of a resource from its identifiers.
+
+        Files are identified by their path and file stamp. If the key has been
+        assigned by another process, the assigned key is returned without
+        accessing any files.
+
+        Parameters
+        ----------
+        *identifiers : Any
+            All identifiers which define the resource, e.g. the resource type,
+            the input file(s) and all processing parameters. Files must be
+            given as Path objects to include their file stamps in the key.
+
+        Returns
+        -------
+        str
+            The resource key.
+        """
+        _digests = {
+            _stamps: hashlib.blake2b(digest_size=20) for _stamps in (False, True)
+        }
+        for _identifier in identifiers:
+            _update_digest(_digests[False], _identifier, file_stamps=False)
+        _base_key = _digests[False].hexdigest()
+        _resources = SharedResources()
+        with _resources._lock:
+            if _base_key in _resources._assigned_keys:
+                return _resources._assigned_keys[_base_key]
+        for _identifier in identifiers:
+            _update_digest(_digests[True], _identifier)
+        _key = _digests[True].hexdigest()
+        with _resources._lock:
+            _resources._keys[_base_key] = _key
+        return _key
+
+    def is_published(self, key: str) -> bool:
+        """
+        Check whether a resource has been published.
+
+        Parameters
+        ----------
+        key : str
+            The resource key.
+
+        Returns
+        -------
+        bool
+            Flag whether the resource file(s) exist.
+        """
+        return self._index_file(key).is_file() or self._array_file(key).is_file()
+
+    def get(
+        self,
+        key: str,
+        loader: Callable[[], np.ndarray | tuple[np.ndarray, ...]],
+        writable: bool = False,
+    ) -> np.ndarray | tuple[np.ndarray, ...]:
+        """
+        Get a shared resource and publish it first, if required.
+
+        Parameters
+        ----------
+        key : str
+            The resource key, as created by the get_key method.
+        loader : Callable[[], np.ndarray | tuple[np.ndarray, ...]]
+            The function to create the resource if it has not been published
+            yet.
+        writable : bool, optional
+            Flag to return writable (copy-on-write) arrays. The default is
+            False.
+
+        Returns
+        -------
+        np.ndarray | tuple[np.ndarray, ...]
+            The resource, as memory-mapped array(s).
+        """
+        _mode = "c" if writable else "r"
+        with self._lock:
+            if (key, _mode) in self._cache:
+                return self._cache[(key, _mode)]
+            if not self.is_published(key):
+                _data = loader()
+                if key in self._assigned_keys.values():
+                    return _data
+                try:
+                    self.publish(key, _data)
+                except OSError as _error:
+                    logger.warning(
+                        "Could not publish the shared resource %s: %s" % (key, _error)
+                    )
+                    return _data
+            _data = self._map(key, _mode)
+            self._cache[(key, _mode)] = _data
+            return _data
+
+    def publish(self, key: str, data: np.ndarray | tuple[np.ndarray, ...]) -> None:
+        """
+        Publish a resource.
+
+        All files are written atomically. The owner file is written first to
+        allow removing the files of terminated processes. The index file of a
+        tuple of arrays is written last to guarantee that all arrays exist.
+
+        Parameters
+        ----------
+        key : str
+            The resource key.
+        data : np.ndarray | tuple[np.ndarray, ...]
+            The resource data.
+        """
+        self._directory.mkdir(parents=True, exist_ok=True)
+        _owner_file = self._directory / f"{key}.{os.getpid()}.owner"
+        _owner_file.touch()
+        self._published_files.append(_owner_file)
+        if isinstance(data, np.ndarray):
+            self._write_atomic(self._array_file(key), np.asarray(data))
+            return
+        for _index, _array in enumerate(data):
+            self._write_atomic(self._array_file(key, _index), np.asarray(_array))
+        self._write_atomic(self._index_file(key), np.array([len(data)]))
+
+    def _array_file(self, key: str, index: int | None = None) -> Path:
+        """
+        Get the path of a resource array file.
+
+        Parameters
+        ----------
+        key : str
+            The resource key.
+        index : int | None, optional
+            The index of the array in a tuple resource. The default is None.
+
+        Returns
+        -------
+        Path
+            The file path.
+        """
+        if index is None:
+            return self._directory / f"{key}.npy"
+        return self._directory / f"{key}.{index}.npy"
+
+    def _index_file(self, key: str) -> Path:
+        """
+        Get the path of the index file of a tuple resource.
+
+        Parameters
+        ----------
+        key : str
+            The resource key.
+
+        Returns
+        -------
+        Path
+            The file path.
+        """
+        return self._directory / f"{key}.index.npy"
+
+    def _write_atomic(self, filename: Path, array: np.ndarray) -> None:
+        """
+        Write an array to a temporary file and move it to the final filename.
+
+        Parameters
+        ----------
+        filename : Path
+            The final filename.
+        array : np.ndarray
+            The array to be written.
+        """
+        if array.dtype.hasobject:
+            raise TypeError("Shared resources cannot include Python objects.")
+        _temp_filename = filename.with_name(
+            f"{filename.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        with open(_temp_filename, "wb") as _file:
+            np.save(_file, array)
+        os.replace(_temp_filename, filename)
+        self._published_files.append(filename)
+
+    def _map(self, key: str, mode: str) -> np.ndarray | tuple[np.ndarray, ...]:
+        """
+        Memory-map a published resource.
+
+        Parameters
+        ----------
+        key : str
+            The resource key.
+        mode : str
+            The numpy mmap_mode.
+
+        Returns
+        -------
+        np.ndarray | tuple[np.ndarray, ...]
+            The memory-mapped array(s) as plain ndarray views.
+        """
+        if not self._index_file(key).is_file():
+            return np.load(self._array_file(key), mmap_mode=mode).view(np.ndarray)
+        _n_arrays = int(np.load(self._index_file(key))[0])
+        return tuple(
+            np.load(self._array_file(key, _index), mmap_mode=mode).view(np.ndarray)
+            for _index in range(_n_arrays)
+        )
+
+    def _remove_stale_files(self) -> None:
+        """
+        Remove all files of resources published by processes which have exited.
+
+        The files of a resource are only removed if none of its owners is
+        running. Temporary files are removed if their writing process has
+        exited.
+        """
+        if not self._directory.is_dir():
+            return
+        _owners = {}
+        for _owner_file in self._directory.glob("*.owner"):
+            _key, _pid = _owner_file.name.split(".")[:2]
+            if _pid.isdigit():
+                _owners.setdefault(_key, []).append(int(_pid))
+        _stale_files = [
+            _file
+            for _key, _pids in _owners.items()
+            if not any(_process_exists(_pid) for _pid in _pids)
+            for _file in self._directory.glob(f"{_key}.*")
+        ] + [
+            _file
+            for _file in self._directory.glob("*.tmp")
+            if _file.name.split(".")[-3].isdigit()
+            and not _process_exists(int(_file.name.split(".")[-3]))
+        ]
+        for _file in _stale_files:
+            try:
+                _file.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        """
+        Clear the cache and remove all files published by this process.
+        """
+        self._cache = {}
+        for _filename in self._published_files:
+            _filename.unlink(missing_ok=True)
+        self._published_files = []
@@ -30,10 +30,13 @@ __all__ = [
     "has_extension",
     "find_valid_python_files",
     "get_file_naming_scheme",
+    "get_file_stamp",
+    "get_param_file_stamps",
     "CatchFileErrors",
 ]
 
 
+import os
 import re
 from numbers import Integral
 from pathlib import Path
@@ -245,6 +248,50 @@ def get_file_naming_scheme(
     return _fnames, range(_index1, _index2 + 1)
 
 
+def get_file_stamp(filename: Path | str) -> tuple[int, int, int, int]:
+    """
+    Get the stamp to identify a version of a file.
+
+    The modification time alone is not sufficient because its resolution is
+    limited by the file system clock. Therefore, the change time, the size and
+    the inode are included as well.
+
+    Parameters
+    ----------
+    filename : Path or str
+        The filename.
+
+    Returns
+    -------
+    tuple[int, int, int, int]
+        The modification time, change time, size and inode of the file.
+    """
+    _stat = os.stat(filename)
+    return (_stat.st_mtime_ns, _stat.st_ctime_ns, _stat.st_size, _stat.st_ino)
+
+
+def get_param_file_stamps(params: dict) -> tuple:
+    """
+    Get the stamps of all files referenced by the Path Parameters.
+
+    Parameters
+    ----------
+    params : dict
+        The ParameterCollection with the Parameters.
+
+    Returns
+    -------
+    tuple
+        The file stamps in the order of the Path Parameters. Parameters which
+        do not reference an existing file have a stamp of None.
+    """
+    return tuple(
+        get_file_stamp(_param.value) if _param.value.is_file() else None
+        for _param in params.values()
+        if _param.dtype == Path
+    )
+
+
 class CatchFileErrors:
     """
     A context manager which allows catching generic file reading errors.
@@ -238,9 +238,9 @@ def _dataset_selection_valid_check(
 
 def get_hdf5_metadata(
     fname: str | Path,
-    meta: Iterable[str] | Literal["dtype", "shape", "size", "ndim", "nbytes"],
+    meta: Iterable[str] | Literal["dtype", "shape", "size", "ndim", "nbytes", "chunks"],
     dset: str | None = None,
-) -> type | tuple[int, ...] | int | dict[str, type | tuple[int, ...] | int]:
+) -> type | tuple[int, ...] | int | None | dict[str, Any]:
     """
     Get metadata about a HDF5 dataset.
 
@@ -248,14 +248,14 @@ def get_hdf5_metadata(
     Input can be given either with file name and dataset parameters or
     using the HDF5 nomenclature with <filename>://</dataset> (note the
     total of 3 slashes). Dataset metadata include the following: dtype,
-    shape, size, ndim, nbytes.
+    shape, size, ndim, nbytes, chunks.
 
     Parameters
     ----------
     fname : str or Path
         The filepath or path to filename and dataset.
     meta : Iterable[str] or Literal["dtype", "shape", "size", "ndim",
-           "nbytes"]
+           "nbytes", "chunks"]
         The metadata item(s). Accepted values are either an iterable
         (list, set or tuple) of the Literal entries or a single string
         of the given literal value.
@@ -265,9 +265,10 @@ def get_hdf5_metadata(
 
     Returns
     -------
-    type or tuple[int, ...] or int or dict
+    type or tuple[int, ...] or int or None or dict
         The return value. If exactly one metadata information has been
-        requested, this information is returned directly. If more than
+        requested, this information is returned directly. The chunks are
+        None for contiguous datasets. If more than
         one piece of information has been requested, a dictionary with
         the information will be returned.
     """
@@ -294,6 +295,8 @@ def get_hdf5_metadata(
             _results["ndim"] = _file[_dset].ndim
         if "nbytes" in meta:
             _results["nbytes"] = _file[_dset].nbytes
+        if "chunks" in meta:
+            _results["chunks"] = _file[_dset].chunks
     if len(_results) == 1:
         _results = tuple(_results.values())[0]
     return _results
@@ -32,7 +32,7 @@ from typing import Union
 
 import fabio
 
-from pydidas.core import Dataset
+from pydidas.core import Dataset, FileReadError
 from pydidas.core.constants import FABIO_EXTENSIONS
 from pydidas.core.utils import CatchFileErrors
 from pydidas.data_io.implementations.io_base import IoBase
@@ -67,16 +67,46 @@ class FabioIo(IoBase):
         binning : int, optional
             The rebinning factor to be applied to the image. The default
             is 1.
+        frame : int or None, optional
+            The index of the frame in a multi-frame file. Only the given
+            frame is decoded. If None, the first frame is read. The default
+            is None.
 
         Returns
         -------
         image : pydidas.core.Dataset
             The image in form of a Dataset (with embedded metadata)
         """
+        _frame = kwargs.get("frame", None)
         with CatchFileErrors(filename, Exception):
-            with fabio.open(filename) as _file:
+            with fabio.open(filename, frame=_frame) as _file:
+                if _frame is not None and not -_file.nframes <= _frame < _file.nframes:
+                    raise FileReadError(
+                        f"The frame index {_frame} is out of range for the "
+                        f"{_file.nframes} frames in the file."
+                    )
                 _data = _file.data
                 _header = _file.header
-
         cls._data = Dataset(_data, metadata=_header)
         return cls.return_data(**kwargs)
+
+    @classmethod
+    def get_number_of_frames(cls, filename: Union[Path, str], **kwargs: dict) -> int:
+        """
+        Get the number of frames in a FabIO-supported file.
+
+        Parameters
+        ----------
+        filename : Union[pathlib.Path, str]
+            The filename.
+        **kwargs : dict
+            Unused keyword arguments.
+
+        Returns
+        -------
+        int
+            The number of frames.
+        """
+        with CatchFileErrors(filename, Exception):
+            with fabio.open(filename) as _file:
+                return _file.nframes
@@ -35,7 +35,7 @@ from typing import Any, Iterable
 import h5py
 from numpy import ndarray, squeeze
 
-from pydidas.core import Dataset, FileReadError, UserConfigError
+from pydidas.core import Dataset, FileReadError, Hdf5FileCache, UserConfigError
 from pydidas.core.constants import HDF5_EXTENSIONS
 from pydidas.core.utils import CatchFileErrors, str_repr_of_slice
 from pydidas.core.utils.converters import convert_to_slice
@@ -93,6 +93,9 @@ class Hdf5Io(IoBase):
             import_metadata : bool, optional
                 Flag to get the nexus metadata from the hdf5 file, if
                 supplied. The default is True.
+            use_file_cache : bool, optional
+                Flag to keep the file open in the Hdf5FileCache for
+                subsequent reads. The default is False.
 
         Returns
         -------
@@ -111,14 +114,28 @@ class Hdf5Io(IoBase):
         auto_squeeze = kwargs.get("auto_squeeze", True)
         with (
             CatchFileErrors(filename),
-            h5py.File(filename, "r") as _h5file,
+            (
+                Hdf5FileCache().open(filename)
+                if kwargs.get("use_file_cache", False)
+                else h5py.File(filename, "r", swmr=True)
+            ) as _h5file,
         ):
             if _h5file[dataset].shape == () and _indices == (slice(None),):
                 _indices = ()
-            _raw_data = _h5file[dataset][_indices]
             _human_readable_indices = (
                 "[" + ", ".join(str_repr_of_slice(_item) for _item in _indices) + "]"
             )
+            _roi_selection = cls._get_selection_with_roi(
+                _h5file[dataset].shape,
+                _indices,
+                kwargs.get("roi", None),
+                kwargs.get("ndim", 2),
+                auto_squeeze,
+            )
+            if _roi_selection is not None:
+                _indices, _squeeze_axes = _roi_selection
+                kwargs = kwargs | {"roi": None}
+            _raw_data = _h5file[dataset][_indices]
             if 0 in _raw_data.shape:
                 _full_shape = _h5file[dataset].shape
                 raise UserConfigError(
@@ -134,11 +151,82 @@ class Hdf5Io(IoBase):
                 cls._update_dataset_metadata(_data, _h5file, dataset, _indices)
                 # TODO [future]: deprecate the axes group reading from legacy results
                 cls.__read_legacy_metadata(_data, _h5file, dataset, _indices)
-            if auto_squeeze:
+            if _roi_selection is not None:
+                _data = _data[
+                    tuple(
+                        0 if _ax in _squeeze_axes else slice(None)
+                        for _ax in range(_data.ndim)
+                    )
+                ]
+            elif auto_squeeze:
                 _data = squeeze(_data)
             cls._data = _data
         return cls.return_data(**kwargs)
 
+    @classmethod
+    def _get_selection_with_roi(
+        cls,
+        shape: tuple[int, ...],
+        selection: tuple[slice, ...],
+        roi: Any,
+        ndim: int,
+        auto_squeeze: bool,
+    ) -> tuple[tuple[slice, ...], tuple[int, ...]] | None:
+        """
+        Get the selection in the HDF5 dataset which includes the ROI.
+
+        The ROI is applied to the (squeezed) selected data. Combining it with
+        the selection allows to read only the data within the ROI from disk.
+
+        Parameters
+        ----------
+        shape : tuple[int, ...]
+            The shape of the HDF5 dataset.
+        selection : tuple[slice, ...]
+            The selection in the HDF5 dataset.
+        roi : Any
+            The ROI in any format accepted by the RoiSliceManager.
+        ndim : int
+            The number of dimensions of the ROI.
+        auto_squeeze : bool
+            Flag whether the selected data is squeezed before applying the ROI.
+
+        Returns
+        -------
+        tuple[tuple[slice, ...], tuple[int, ...]] or None
+            The combined selection and the axes to be squeezed. If no ROI is
+            given or it cannot be combined with the selection, None is
+            returned and the ROI is applied after reading the data.
+        """
+        if roi is None or not 0 < len(selection) <= len(shape):
+            return None
+        cls._roi_controller.ndim = ndim
+        cls._roi_controller.roi = roi
+        _ranges = [
+            range(_n)[_slice]
+            for _n, _slice in zip(
+                shape, selection + (slice(None),) * (len(shape) - len(selection))
+            )
+        ]
+        _squeeze_axes = tuple(
+            _ax
+            for _ax, _range in enumerate(_ranges)
+            if auto_squeeze and len(_range) == 1
+        )
+        _roi_axes = [_ax for _ax in range(len(shape)) if _ax not in _squeeze_axes]
+        if len(_squeeze_axes) == len(shape) or len(_roi_axes) < len(
+            cls._roi_controller.roi
+        ):
+            return None
+        for _ax, _roi_slice in zip(_roi_axes, cls._roi_controller.roi):
+            _ranges[_ax] = _ranges[_ax][_roi_slice]
+        if any(len(_range) == 0 or _range.step < 0 for _range in _ranges):
+            return None
+        return (
+            tuple(slice(_r.start, _r.stop, _r.step) for _r in _ranges),
+            _squeeze_axes,
+        )
+
     @staticmethod
     def _update_dataset_metadata(
         data: Dataset, h5file: h5py.File, dataset: str, slicing_indices: tuple[slice]
@@ -287,5 +375,6 @@ class Hdf5Io(IoBase):
             )
         if not isinstance(data, Dataset):
             data = Dataset(data)
+        Hdf5FileCache().close(filename)
         with h5py.File(filename, "w") as _file:
             _data_group = create_nxdata_entry(_file, _dataset, data)
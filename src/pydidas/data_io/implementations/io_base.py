@@ -31,12 +31,11 @@ __all__ = ["IoBase"]
 from numbers import Integral
 from pathlib import Path
 
-from numpy import amax, amin, ndarray
+from numpy import amax, amin, asarray, ndarray, squeeze
 
 from pydidas.core import Dataset, FileReadError
 from pydidas.core.utils import rebin
 from pydidas.data_io.io_manager import IoManager
-from pydidas.data_io.utils import RoiSliceManager
 
 
 class IoBase(metaclass=IoManager):
@@ -50,9 +49,6 @@ class IoBase(metaclass=IoManager):
     dimensions = []
     allows_metadata_import = False
 
-    _roi_controller = RoiSliceManager()
-    _data = None
-
     @classmethod
     def export_to_file(cls, filename: Path | str, data: ndarray, **kwargs: dict):
         """
@@ -87,6 +83,29 @@ class IoBase(metaclass=IoManager):
         """
         raise NotImplementedError
 
+    @classmethod
+    def get_number_of_frames(cls, filename: Path | str, **kwargs: dict) -> int:
+        """
+        Get the number of frames in a file.
+
+        The generic implementation assumes a single frame in each file.
+        Formats which support multiple frames must re-implement this method.
+
+        Parameters
+        ----------
+        filename : Path or str
+            The filename.
+        **kwargs : dict
+            Any keyword arguments. Supported keywords must be specified by
+            the specific implementation.
+
+        Returns
+        -------
+        int
+            The number of frames.
+        """
+        return 1
+
     @classmethod
     def check_for_existing_file(cls, filename: Path | str, **kwargs: dict):
         """
@@ -178,6 +197,66 @@ class IoBase(metaclass=IoManager):
             _data = _data.astype(_return_type)
         return _data
 
+    @classmethod
+    def return_memmap_data(
+        cls, mmap: ndarray, auto_squeeze: bool, **kwargs: dict
+    ) -> Dataset:
+        """
+        Return the selected data from a memory-mapped array.
+
+        The frame and the ROI are selected in the memory-mapped array before
+        any data is read from disk. Only the selected data is copied into
+        the returned Dataset.
+
+        Parameters
+        ----------
+        mmap : ndarray
+            The memory-mapped array.
+        auto_squeeze : bool
+            Flag to squeeze the data before applying the ROI.
+        **kwargs : dict
+            A dictionary of keyword arguments. Supported keyword arguments
+            are "frame", "zero_copy" and the keywords of the return_data
+            method.
+
+            "frame" is the index of the frame in the first axis. If None,
+            the full array is used. If "zero_copy" is True, the returned
+            Dataset is a read-only view of the memory-mapped file. This
+            requires that neither binning nor datatype conversion are used.
+
+        Raises
+        ------
+        FileReadError
+            If the frame index is out of range.
+
+        Returns
+        -------
+        _data : pydidas.core.Dataset
+            The data in the form of a pydidas Dataset (a subclassed numpy.ndarray).
+        """
+        _data = mmap
+        _frame = kwargs.get("frame", None)
+        if _frame is not None:
+            _n_frames = mmap.shape[0] if mmap.ndim > 0 else 0
+            if not -_n_frames <= _frame < _n_frames:
+                raise FileReadError(
+                    f"The frame index {_frame} is out of range for the "
+                    f"{_n_frames} frames in the file."
+                )
+            _data = _data[_frame]
+        if auto_squeeze:
+            _data = squeeze(_data)
+        if kwargs.get("roi", None) is not None:
+            cls._roi_controller.ndim = kwargs.get("ndim", 2)
+            cls._roi_controller.roi = kwargs.get("roi")
+            _data = _data[cls._roi_controller.roi]
+        if kwargs.get("zero_copy", False):
+            cls._data = asarray(_data).view(Dataset)
+            cls._data.flags.writeable = False
+        else:
+            cls._data = Dataset(_data)
+        return cls.return_data(**(kwargs | {"roi": None}))
+
     @staticmethod
     def raise_filereaderror_from_exception(ex: Exception, filename: str):
         """
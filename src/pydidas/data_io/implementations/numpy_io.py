@@ -47,7 +47,7 @@ class NumpyIo(IoBase):
     dimensions = [1, 2, 3, 4, 5, 6]
 
     @classmethod
-    def import_from_file(cls, filename: Path | str, **kwargs: Any):
+    def import_from_file(cls, filename: Path | str, **kwargs: Any) -> Dataset:
         """
         Read data from a numpy file.
 
@@ -71,6 +71,12 @@ class NumpyIo(IoBase):
             binning : int, optional
                 The rebinning factor to be applied to the image. The default
                 is 1.
+            frame : int or None, optional
+                The index of the frame in the first axis of the data. If
+                None, the full data is returned. The default is None.
+            zero_copy : bool, optional
+                Flag to return a read-only view of the memory-mapped file
+                instead of a copy of the data. The default is False.
 
         Returns
         -------
@@ -78,9 +84,32 @@ class NumpyIo(IoBase):
             The data in the form of a pydidas Dataset (with embedded metadata)
         """
         with CatchFileErrors(filename, EOFError):
-            _data = np.squeeze(np.load(filename))
-        cls._data = Dataset(_data)
-        return cls.return_data(**kwargs)
+            _mmap = np.load(filename, mmap_mode="r")
+        return cls.return_memmap_data(_mmap, True, **kwargs)
+
+    @classmethod
+    def get_number_of_frames(cls, filename: Path | str, **kwargs: Any) -> int:
+        """
+        Get the number of frames in a numpy file.
+
+        Only 3-dimensional arrays are considered as stacks of frames in the
+        first axis.
+
+        Parameters
+        ----------
+        filename : Path | str
+            The filename.
+        **kwargs : Any
+            Unused keyword arguments.
+
+        Returns
+        -------
+        int
+            The number of frames.
+        """
+        with CatchFileErrors(filename, EOFError):
+            _shape = np.load(filename, mmap_mode="r").shape
+        return _shape[0] if len(_shape) == 3 else 1
 
     @classmethod
     def export_to_file(cls, filename: Path | str, data: np.ndarray, **kwargs: Any):
@@ -28,6 +28,7 @@ __status__ = "Production"
 __all__ = []
 
 
+import os
 from pathlib import Path
 from typing import Union
 
@@ -84,6 +85,12 @@ class RawIo(IoBase):
         offset : int, optional
             The reading offset from the file start in bytes. Using an offset
             allows to account for file headers. The default is 0.
+        frame : int or None, optional
+            The index of the frame in the first axis of the data. If None,
+            the full data is returned. The default is None.
+        zero_copy : bool, optional
+            Flag to return a read-only view of the memory-mapped file instead
+            of a copy of the data. The default is False.
 
         Returns
         -------
@@ -94,14 +101,17 @@ class RawIo(IoBase):
             raise KeyError("The datatype has not been specified.")
         _offset = kwargs.get("offset", 0)
         with CatchFileErrors(filename):
-            _data = np.fromfile(filename, dtype=datatype, offset=_offset)
-        if _data.size != np.prod(shape):
+            _size = (os.path.getsize(filename) - _offset) // np.dtype(datatype).itemsize
+        if _size != np.prod(shape):
             cls.raise_filereaderror_from_exception(
                 ValueError("The given shape does not match the data size."),
                 str(filename),
             )
-        cls._data = Dataset(_data.reshape(shape))
-        return cls.return_data(**kwargs)
+        with CatchFileErrors(filename):
+            _mmap = np.memmap(
+                filename, dtype=datatype, mode="r", offset=_offset, shape=tuple(shape)
+            )
+        return cls.return_memmap_data(_mmap, False, **kwargs)
 
     @classmethod
     def export_to_file(
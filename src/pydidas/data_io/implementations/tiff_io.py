@@ -27,20 +27,28 @@ __status__ = "Production"
 __all__ = []
 
 
+import os
+import struct
+import threading
 import warnings
+from collections import OrderedDict
 from pathlib import Path
 from typing import Union
 
 import numpy as np
 from skimage.io import imread, imsave
-from tifffile import TiffFileError
+from tifffile import TiffFile, TiffFileError, TiffPage
 
-from pydidas.core import Dataset
+from pydidas.core import Dataset, FileReadError
 from pydidas.core.constants import TIFF_EXTENSIONS
-from pydidas.core.utils import CatchFileErrors
+from pydidas.core.utils import CatchFileErrors, get_file_stamp
 from pydidas.data_io.implementations.io_base import IoBase
 
 
+# The maximum number of files with cached page offsets:
+_PAGE_OFFSET_CACHE_SIZE = 64
+
+
 class TiffIo(IoBase):
     """IObase implementation for tiff files."""
 
@@ -49,6 +57,9 @@ class TiffIo(IoBase):
     format_name = "Tiff"
     dimensions = [2]
 
+    _page_offsets = OrderedDict()
+    _page_offset_lock = threading.Lock()
+
     @classmethod
     def import_from_file(cls, filename: Union[Path, str], **kwargs: dict) -> Dataset:
         """
@@ -73,20 +84,137 @@ class TiffIo(IoBase):
             binning : int, optional
                 The rebinning factor to be applied to the image. The default
                 is 1.
+            frame : int or None, optional
+                The index of the page in a multi-page tiff file. Only the
+                given page is read and decoded. If None, all pages are read.
+                The default is None.
 
         Returns
         -------
         data : pydidas.core.Dataset
             The data in the form of a pydidas Dataset (with embedded metadata)
         """
+        _frame = kwargs.get("frame", None)
         with CatchFileErrors(filename, TiffFileError):
             with warnings.catch_warnings():
                 warnings.simplefilter("ignore", UserWarning)
-                _data = imread(filename)
-
+                if _frame is None:
+                    _data = imread(filename)
+                else:
+                    _data = cls._read_page(filename, _frame)
         cls._data = Dataset(_data)
         return cls.return_data(**kwargs)
 
+    @classmethod
+    def get_number_of_frames(cls, filename: Union[Path, str], **kwargs: dict) -> int:
+        """
+        Get the number of pages in a tiff file.
+
+        Parameters
+        ----------
+        filename : Union[pathlib.Path, str]
+            The filename.
+        **kwargs : dict
+            Unused keyword arguments.
+
+        Returns
+        -------
+        int
+            The number of pages.
+        """
+        with CatchFileErrors(filename, TiffFileError):
+            with TiffFile(filename) as _tiff:
+                _offsets, _complete = cls._get_page_offsets(_tiff, filename, -1)
+        return len(_offsets)
+
+    @classmethod
+    def _read_page(cls, filename: Union[Path, str], frame: int) -> np.ndarray:
+        """
+        Read a single page from a tiff file.
+
+        Parameters
+        ----------
+        filename : Union[pathlib.Path, str]
+            The filename.
+        frame : int
+            The index of the page.
+
+        Raises
+        ------
+        FileReadError
+            If the file does not have a page with the given index.
+
+        Returns
+        -------
+        np.ndarray
+            The data of the page.
+        """
+        with TiffFile(filename) as _tiff:
+            _offsets, _complete = cls._get_page_offsets(
+                _tiff, filename, frame if frame >= 0 else -1
+            )
+            if not -len(_offsets) <= frame < len(_offsets):
+                raise FileReadError(
+                    f"The frame index {frame} is out of range for the "
+                    f"{len(_offsets)} pages in the file.\n\nFilename: {filename}"
+                )
+            _index = frame % len(_offsets)
+            _tiff.filehandle.seek(_offsets[_index])
+            return TiffPage(_tiff, index=_index).asarray()
+
+    @classmethod
+    def _get_page_offsets(
+        cls, tiff: TiffFile, filename: Union[Path, str], frame: int
+    ) -> tuple[list[int], bool]:
+        """
+        Get the offsets of the pages in the tiff file up to the given frame.
+
+        Only the chain of image file directories is followed without decoding
+        any pages. The offsets are cached for each version of the file and
+        only missing offsets are read.
+
+        Parameters
+        ----------
+        tiff : TiffFile
+            The open tiff file.
+        filename : Union[pathlib.Path, str]
+            The filename.
+        frame : int
+            The index of the last required page. If -1, all pages are
+            required.
+
+        Returns
+        -------
+        list[int]
+            The known page offsets.
+        bool
+            Flag whether all page offsets are known.
+        """
+        _key = (os.path.abspath(filename), get_file_stamp(filename))
+        with cls._page_offset_lock:
+            _offsets, _complete = cls._page_offsets.pop(
+                _key, ([tiff.pages.first.offset], False)
+            )
+            _format = tiff.tiff
+            _fh = tiff.filehandle
+            while not _complete and (frame == -1 or len(_offsets) <= frame):
+                _fh.seek(_offsets[-1])
+                (_n_tags,) = struct.unpack(
+                    _format.tagnoformat, _fh.read(_format.tagnosize)
+                )
+                _fh.seek(_n_tags * _format.tagsize, os.SEEK_CUR)
+                (_next,) = struct.unpack(
+                    _format.offsetformat, _fh.read(_format.offsetsize)
+                )
+                if _next == 0:
+                    _complete = True
+                else:
+                    _offsets.append(_next)
+            cls._page_offsets[_key] = (_offsets, _complete)
+            while len(cls._page_offsets) > _PAGE_OFFSET_CACHE_SIZE:
+                cls._page_offsets.popitem(last=False)
+        return _offsets, _complete
+
     @classmethod
     def export_to_file(
         cls, filename: Union[Path, str], data: np.ndarray, **kwargs: dict
@@ -28,6 +28,7 @@ __status__ = "Production"
 __all__ = ["IoManager"]
 
 
+import threading
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -35,20 +36,70 @@ import numpy as np
 
 from pydidas.core import Dataset, UserConfigError
 from pydidas.core.utils import get_extension
+from pydidas.data_io.utils.roi_slice_manager import RoiSliceManager
 
 
 if TYPE_CHECKING:
     from pydidas.data_io.implementations import IoBase
 
 
+# The state of the importers is stored for each thread to allow importing
+# files in parallel threads:
+_THREAD_STATE = threading.local()
+
+
 class IoManager(type):
     """
     Metaclass to manage imports and exporters for different file types.
+
+    The metaclass also holds the state of the IO classes during an import,
+    i.e. the imported data and the RoiSliceManager. The state is local to
+    each thread, and files can be imported in parallel threads.
     """
 
     registry_import = {}
     registry_export = {}
 
+    @property
+    def _data(cls) -> Dataset | None:
+        """
+        Get the data of the current import of the class in the calling thread.
+
+        Returns
+        -------
+        Dataset or None
+            The imported data.
+        """
+        return getattr(_THREAD_STATE, "data", {}).get(cls, None)
+
+    @_data.setter
+    def _data(cls, data: Dataset | None) -> None:
+        """
+        Set the data of the current import of the class in the calling thread.
+
+        Parameters
+        ----------
+        data : Dataset or None
+            The imported data.
+        """
+        if not hasattr(_THREAD_STATE, "data"):
+            _THREAD_STATE.data = {}
+        _THREAD_STATE.data[cls] = data
+
+    @property
+    def _roi_controller(cls) -> RoiSliceManager:
+        """
+        Get the RoiSliceManager of the calling thread.
+
+        Returns
+        -------
+        RoiSliceManager
+            The RoiSliceManager instance.
+        """
+        if not hasattr(_THREAD_STATE, "roi_controller"):
+            _THREAD_STATE.roi_controller = RoiSliceManager()
+        return _THREAD_STATE.roi_controller
+
     def __new__(cls, clsname: str, bases: tuple[type], attrs: dict) -> type["IoBase"]:
         """
         Call the class' (i.e., the WorkflowTree exporter) __new__ method
@@ -288,6 +339,27 @@ class IoManager(type):
             )
         return _data
 
+    @classmethod
+    def get_number_of_frames(cls, filename: Path | str, **kwargs: Any) -> int:
+        """
+        Get the number of frames in a file, using the importer based on the extension.
+
+        Parameters
+        ----------
+        filename : Path | str
+            The full filename and path.
+        **kwargs : Any
+            Keyword arguments for the concrete importer implementation call.
+
+        Returns
+        -------
+        int
+            The number of frames in the file.
+        """
+        _extension = get_extension(filename)
+        cls.verify_extension_is_registered(_extension, mode="import", filename=filename)
+        return cls.registry_import[_extension].get_number_of_frames(filename, **kwargs)
+
     @classmethod
     def read_metadata_from_file(
         cls, filename: Path | str, **kwargs: Any
@@ -74,6 +74,22 @@ WORKFLOW_RUN_FRAME_BUILD_CONFIG = [
             "parent_widget": "run_app_container",
         },
     ],
+    [
+        "create_param_widget",
+        ("profile_workflow",),
+        {
+            "font_metric_width_factor": FONT_METRIC_CONFIG_WIDTH,
+            "parent_widget": "run_app_container",
+        },
+    ],
+    [
+        "create_param_widget",
+        ("profile_memory",),
+        {
+            "font_metric_width_factor": FONT_METRIC_CONFIG_WIDTH,
+            "parent_widget": "run_app_container",
+        },
+    ],
     [
         "create_button",
         ("but_exec", "Start processing"),
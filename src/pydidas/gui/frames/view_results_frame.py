@@ -31,6 +31,7 @@ __all__ = ["ViewResultsFrame"]
 import os
 from typing import Any
 
+import numpy as np
 from qtpy import QtCore
 
 from pydidas.contexts.diff_exp import DiffractionExperiment
@@ -90,6 +91,7 @@ class ViewResultsFrame(BaseFrameWithApp):
         self._config["enable_import"] = kwargs.get("enable_import", True)
         self._config["enable_app"] = kwargs.get("enable_app", False)
         self._config["export_available"] = False
+        self._config["display_outdated"] = False
         self.set_default_params()
 
     def build_frame(self) -> None:
@@ -127,6 +129,7 @@ class ViewResultsFrame(BaseFrameWithApp):
         )
         self._widgets["but_export_current"].clicked.connect(self._export_current)
         self._widgets["but_export_all"].clicked.connect(self._export_all)
+        self._RESULTS.sig_regions_updated.connect(self._update_displayed_regions)
 
     def import_data_to_workflow_results(self) -> None:
         """Import data to the workflow results."""
@@ -215,6 +218,67 @@ class ViewResultsFrame(BaseFrameWithApp):
         """Update the data to display."""
         self.set_displayed_data(update=True)
 
+    @QtCore.Slot(object)
+    def _update_displayed_regions(self, regions: dict[int, tuple[slice, ...]]):
+        """
+        Update the displayed data if it includes updated result regions.
+
+        Parameters
+        ----------
+        regions : dict[int, tuple[slice, ...]]
+            The updated regions of the results with node ID keys.
+        """
+        if self._active_node_id not in regions:
+            return
+        if not self._config["frame_active"]:
+            self._config["display_outdated"] = True
+            return
+        if self._config["display_outdated"] or self._displayed_data_in_region(
+            regions[self._active_node_id]
+        ):
+            self._config["display_outdated"] = False
+            self.update_displayed_data()
+
+    def _displayed_data_in_region(self, region: tuple[slice, ...]) -> bool:
+        """
+        Check whether the displayed slice of the active node includes a region.
+
+        Parameters
+        ----------
+        region : tuple[slice, ...]
+            The region with one slice for each scan dimension.
+
+        Returns
+        -------
+        bool
+            Flag whether the displayed data includes any point of the region.
+        """
+        _viewer = self._widgets["data_viewer"]
+        if not _viewer.data_is_set:
+            return True
+        _scan_shape = self._RESULTS.frozen_scan.shape
+        if self.get_param_value("use_scan_timeline"):
+            _first = np.ravel_multi_index([_s.start for _s in region], _scan_shape)
+            _last = np.ravel_multi_index([_s.stop - 1 for _s in region], _scan_shape)
+            region = (slice(_first, _last + 1),)
+            _scan_shape = (int(np.prod(_scan_shape)),)
+        # the displayed data is squeezed and only includes dimensions with n > 1:
+        region = [_slice for _slice, _n in zip(region, _scan_shape) if _n > 1]
+        _scan_shape = [_n for _n in _scan_shape if _n > 1]
+        _current_slice = _viewer.current_slice
+        if len(_current_slice) < len(region):
+            return True
+        return all(
+            np.any((_indices >= _slice.start) & (_indices < _slice.stop))
+            for _indices, _slice in zip(
+                [
+                    np.arange(*_view_slice.indices(_n))
+                    for _view_slice, _n in zip(_current_slice, _scan_shape)
+                ],
+                region,
+            )
+        )
+
     @QtCore.Slot(float, float)
     def _show_info_popup(self, data_x: float, data_y: float) -> None:
         """Show the information popup."""
@@ -41,7 +41,7 @@ from pydidas.gui.frames.builders import (
     WORKFLOW_RUN_FRAME_BUILD_CONFIG,
 )
 from pydidas.gui.frames.view_results_frame import ViewResultsFrame
-from pydidas.multiprocessing import AppRunner
+from pydidas.multiprocessing import AppRunner, AppThreadRunner, WorkerPool
 from pydidas.widgets.dialogues import WarningBox
 from pydidas.workflow import WorkflowResults, WorkflowTree
 
@@ -71,10 +71,6 @@ class WorkflowRunFrame(ViewResultsFrame):
         kwargs["workflow_results"] = WorkflowResults()
         ViewResultsFrame.__init__(self, **kwargs)
         self._config["data_use_timeline"] = False
-        self._config["plot_last_update"] = 0
-        self._config["plot_update_time"] = self.q_settings_get(
-            "global/plot_update_time", dtype=float
-        )
         self._config["source_hash"] = self._RESULTS.source_hash
         self._app = ExecuteWorkflowApp()
         self.add_params(self._app.params)
@@ -181,13 +177,16 @@ class WorkflowRunFrame(ViewResultsFrame):
         logger.debug("WorkflowRunFrame: Starting workflow")
         self._prepare_app_run()
         self._app.multiprocessing_pre_run()
-        self._config["plot_last_update"] = time.time()
         self.__set_proc_widget_visibility_for_running(True)
         logger.debug("WorkflowRunFrame: Starting AppRunner")
-        self._runner = AppRunner(self._app)
+        _backend = self.q_settings_get("global/mp_execution_backend", str, "processes")
+        if _backend == "threads":
+            self._runner = AppThreadRunner(self._app)
+            self._runner.sig_worker_exception.connect(self.__report_worker_exception)
+        else:
+            self._runner = AppRunner(self._app, worker_pool=self._get_worker_pool())
         self._runner.sig_progress.connect(self._apprunner_update_progress)
         self._runner.sig_results.connect(self.__update_result_node_information)
-        self._runner.sig_results.connect(self.__check_for_plot_update)
         self._runner.finished.connect(self._apprunner_finished)
         self._runner.sig_final_app_state.connect(self._set_app)
         self._runner.sig_message_from_worker.connect(self.__process_messages)
@@ -198,6 +197,23 @@ class WorkflowRunFrame(ViewResultsFrame):
         logger.debug("WorkflowRunFrame: Running AppRunner")
         self._runner.start()
 
+    def _get_worker_pool(self) -> WorkerPool | None:
+        """
+        Get the persistent WorkerPool, if enabled in the global settings.
+
+        Returns
+        -------
+        WorkerPool or None
+            The WorkerPool or None if the workers are not persistent.
+        """
+        if not self.q_settings_get("global/mp_persistent_workers", bool, False):
+            return None
+        _pool = WorkerPool()
+        if not self._config.get("worker_pool_connected", False):
+            QtWidgets.QApplication.instance().aboutToQuit.connect(_pool.shutdown)
+            self._config["worker_pool_connected"] = True
+        return _pool
+
     @staticmethod
     def _check_tree_is_populated() -> bool:
         """
@@ -238,6 +254,8 @@ class WorkflowRunFrame(ViewResultsFrame):
         self._runner.sig_results.disconnect()
         self._runner.sig_post_run_called.disconnect()
         self._runner.sig_message_from_worker.disconnect()
+        if isinstance(self._runner, AppThreadRunner):
+            self._runner.sig_worker_exception.disconnect()
         self._runner.deleteLater()
         self._runner = None
         logger.debug("WorkflowRunFrame: AppRunner successfully shut down.")
@@ -256,13 +274,6 @@ class WorkflowRunFrame(ViewResultsFrame):
             self._runner.sig_results.disconnect(self.__update_result_node_information)
             self._config["update_node_information_connected"] = False
 
-    @QtCore.Slot()
-    def __check_for_plot_update(self):
-        _dt = time.time() - self._config["plot_last_update"]
-        if _dt > self._config["plot_update_time"] and self._config["frame_active"]:
-            self._config["plot_last_update"] = time.time()
-            self.update_displayed_data()
-
     @QtCore.Slot(str)
     def __process_messages(self, message: str):
         """
@@ -275,6 +286,23 @@ class WorkflowRunFrame(ViewResultsFrame):
         """
         self._app.received_signal_message(message)
 
+    @QtCore.Slot(str)
+    def __report_worker_exception(self, message: str):
+        """
+        Report an exception in a worker thread which stopped the processing.
+
+        Parameters
+        ----------
+        message : str
+            The description of the exception.
+        """
+        self.set_status("Processing stopped because of an error in a worker thread.")
+        WarningBox(
+            "Processing error",
+            "The workflow processing has been stopped because of an error:\n\n"
+            f"{message}",
+        )
+
     def _finish_processing(self):
         """
         Perform finishing touches after the processing has terminated.
@@ -297,6 +325,8 @@ class WorkflowRunFrame(ViewResultsFrame):
             accordingly or not.
         """
         self.param_widgets["live_processing"].setEnabled(not running)
+        self.param_widgets["profile_workflow"].setEnabled(not running)
+        self.param_widgets["profile_memory"].setEnabled(not running)
         self._widgets["but_exec"].setEnabled(not running)
         self._widgets["but_abort"].setVisible(running)
         self._widgets["but_abort"].setEnabled(running)
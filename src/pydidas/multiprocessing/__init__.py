@@ -29,8 +29,18 @@ __status__ = "Production"
 
 from .app_processor import app_processor_func
 from .app_runner import AppRunner
+from .app_thread_runner import EXECUTION_BACKENDS, AppThreadRunner
 from .processor import processor_func
 from .worker_controller import WorkerController
+from .worker_pool import WorkerPool
 
 
-__all__ = ["app_processor_func", "processor_func", "AppRunner", "WorkerController"]
+__all__ = [
+    "app_processor_func",
+    "processor_func",
+    "AppRunner",
+    "AppThreadRunner",
+    "EXECUTION_BACKENDS",
+    "WorkerController",
+    "WorkerPool",
+]
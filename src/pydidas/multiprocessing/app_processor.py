@@ -28,26 +28,176 @@ __status__ = "Production"
 __all__ = ["app_processor_func"]
 
 
+import logging
 import queue
 import time
+from collections import deque
 from typing import Any
 
 from pydidas.core import BaseApp, ParameterCollection
 from pydidas.core.utils import LOGGING_LEVEL, pydidas_logger
+from pydidas.multiprocessing.processor import QUEUE_WAIT_TIMEOUT
+from pydidas.multiprocessing.queue_utils import (
+    TaskChunk,
+    WorkerTaskQueues,
+    create_output_item,
+    get_stop_signal,
+    wait_for_queues,
+)
 
 
 logger = pydidas_logger()
 
+# The time interval to wait before re-checking if the app can carry on.
+APP_WAIT_INTERVAL = 0.005
 
-def _run_taskless_cycle(app: BaseApp, output_queue: queue.Queue) -> bool:
+
+class _TaskCollector:
+    """
+    Keep track of pending tasks and collect the results of TaskChunks.
+
+    The results of single tasks are written directly to the output queue.
+    The results of a TaskChunk are collected and written as a single item
+    once all tasks of the chunk have been processed or when the app limits
+    the number of results which may be held by the worker.
+
+    Parameters
+    ----------
+    app : BaseApp
+        The application instance.
+    output_queue : queue.Queue
+        The output queue.
+    run_id : int or None, optional
+        The ID of the run of a persistent worker to tag the output items.
+        The default is None.
+    """
+
+    def __init__(
+        self, app: BaseApp, output_queue: queue.Queue, run_id: int | None = None
+    ):
+        self._app = app
+        self._output_queue = output_queue
+        self._run_id = run_id
+        self.pending = deque()
+        self._chunk_active = False
+        self._limit = None
+        self._tasks = []
+        self._results = []
+        self._t_start = 0.0
+
+    def add_queue_item(self, item: Any) -> None:
+        """
+        Add a new item from the input queue.
+
+        Parameters
+        ----------
+        item : Any
+            The queue item. This can be either a single task or a TaskChunk.
+        """
+        self._chunk_active = isinstance(item, TaskChunk)
+        if self._chunk_active:
+            self.pending.extend(item)
+            self._limit = None
+        else:
+            self.pending.append(item)
+        self._t_start = time.perf_counter()
+
+    def store_results(self, task: Any, results: Any) -> None:
+        """
+        Store the results of a task and send them if required.
+
+        Parameters
+        ----------
+        task : Any
+            The processed task.
+        results : Any
+            The results of the task.
+        """
+        if not self._chunk_active:
+            self._output_queue.put(create_output_item(task, results, self._run_id))
+            return
+        self._tasks.append(task)
+        self._results.append(results)
+        if self._limit is None:
+            self._limit = self._app.multiprocessing_max_results_per_message()
+        if not self.pending or (
+            self._limit is not None and len(self._results) >= self._limit
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Send all collected results as a single item to the output queue."""
+        if len(self._tasks) == 0:
+            return
+        _now = time.perf_counter()
+        self._output_queue.put(
+            create_output_item(
+                TaskChunk(self._tasks, runtime=_now - self._t_start),
+                self._results,
+                self._run_id,
+            )
+        )
+        self._tasks = []
+        self._results = []
+        self._t_start = _now
+
+
+def _run_taskless_cycle(
+    app: BaseApp, output_queue: queue.Queue, run_id: int | None = None
+) -> bool:
     app.multiprocessing_pre_cycle(-1)
     _app_carryon = app.multiprocessing_carryon()
     if _app_carryon:
         _index, _results = app.multiprocessing_func(-1)
-        output_queue.put([_index, _results])
+        output_queue.put(create_output_item(_index, _results, run_id))
     return _app_carryon
 
 
+def _get_app_instance(
+    app_class: type,
+    app_params: ParameterCollection,
+    app_config: dict,
+    worker_state: dict | None,
+) -> BaseApp:
+    """
+    Get the app instance for processing.
+
+    Workers in a persistent WorkerPool store the app in their worker_state
+    and re-use it for subsequent runs of the same app class. Only the
+    Parameter values and the config are updated in this case.
+
+    Parameters
+    ----------
+    app_class : type
+        The Application class.
+    app_params : ParameterCollection
+        The App ParameterCollection.
+    app_config : dict
+        The dictionary which is used for overwriting the app._config
+        dictionary.
+    worker_state : dict or None
+        The persistent state of the worker or None for single-use workers.
+
+    Returns
+    -------
+    BaseApp
+        The app instance.
+    """
+    _app = None if worker_state is None else worker_state.get("app", None)
+    if type(_app) is app_class:
+        _app.set_param_values_from_dict(
+            {_key: _param.value for _key, _param in app_params.items()}
+        )
+    else:
+        if _app is not None:
+            _app.deleteLater()
+        _app = app_class(app_params, clone_mode=True)
+    _app._config = app_config
+    if worker_state is not None:
+        worker_state["app"] = _app
+    return _app
+
+
 def _wait_for_app_response(app: BaseApp, current_results: Any | None) -> Any:
     """
     Wait for the app to process a signal and continue.
@@ -65,7 +215,7 @@ def _wait_for_app_response(app: BaseApp, current_results: Any | None) -> Any:
         The app result.
     """
     while not app.signal_processed_and_can_continue():
-        time.sleep(0.005)
+        time.sleep(APP_WAIT_INTERVAL)
     if current_results is None:
         current_results = app.get_latest_results()
     return current_results
@@ -85,6 +235,25 @@ def app_processor_func(
     indices supplied by the queue. Results will be written to the output
     queue in a format [input_arg, results]
 
+    The worker blocks on the input and stop queues and is woken up as soon as
+    an item arrives instead of polling the queues in regular intervals.
+
+    Tasks are received from the shared input queue and the worker's local
+    queue. After the worker has finished its own tasks, it takes over tasks
+    from the local queues of other workers (see WorkerTaskQueues).
+
+    Input items can also be TaskChunks. The results of all tasks in a chunk
+    are returned as a single output item [TaskChunk, list_of_results]. The app
+    can limit the number of results per output item with its
+    multiprocessing_max_results_per_message method.
+
+    Workers in a persistent WorkerPool supply their "run_id" and
+    "worker_state" in the multiprocessing_config. The app instance is then
+    kept in the worker_state for the next run instead of being deleted and
+    all output items are tagged with the run ID.
+    The app's multiprocessing_post_run method is called in every worker
+    before the worker signals that it is shutting down.
+
     Parameters
     ----------
     multiprocessing_config : dict
@@ -116,49 +285,68 @@ def app_processor_func(
     _wait_for_output = kwargs.get("wait_for_output_queue", True)
     _use_tasks = kwargs.get("use_tasks", True)
 
-    _input_queue = multiprocessing_config.get("queue_input")
+    _input_queues = WorkerTaskQueues(multiprocessing_config)
     _output_queue = multiprocessing_config.get("queue_output")
     _stop_queue = multiprocessing_config.get("queue_stop")
     _shutting_down_queue = multiprocessing_config.get("queue_shutting_down")
     _signal_queue = multiprocessing_config.get("queue_signal")
     _io_lock = multiprocessing_config.get("lock")
+    _run_id = multiprocessing_config.get("run_id", None)
+    _worker_state = multiprocessing_config.get("worker_state", None)
 
     def _debug_message(msg: str) -> None:
+        # Only acquire the (manager) lock if the message will be logged to
+        # avoid a round trip to the manager process for every task.
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         with _io_lock:
             logger.debug(msg)
 
     _debug_message("Started process")
 
-    _app = app_class(app_params, clone_mode=True)
-    _app._config = app_config
+    _app = _get_app_instance(app_class, app_params, app_config, _worker_state)
     _app_mp_manager = kwargs.get("app_mp_manager", None)
     if _app_mp_manager:
         _app.mp_manager = _app_mp_manager
     _app.multiprocessing_pre_run()
     _arg = None
     _app_carryon = True
+    _tasks = _TaskCollector(_app, _output_queue, _run_id)
     while True:
+        # block until a stop signal or a new task is available. If the app
+        # cannot carry on or tasks are pending, only check for the stop
+        # signal without blocking.
+        if (
+            _use_tasks
+            and _app_carryon
+            and not _tasks.pending
+            and not _input_queues.own_tasks_done
+        ):
+            _ready = wait_for_queues(
+                [_stop_queue, *_input_queues.queues], timeout=QUEUE_WAIT_TIMEOUT
+            )
+        else:
+            _ready = wait_for_queues([_stop_queue], timeout=0)
         # check for stop signal
-        try:
-            _stop_queue.get_nowait()
+        if _stop_queue in _ready and get_stop_signal(_stop_queue, _run_id):
             _debug_message("Received stop queue signal")
             _wait_for_output = False
             break
-        except queue.Empty:
-            pass
         # run processing step
         if _use_tasks:
             if _app_carryon:
-                try:
-                    _arg = _input_queue.get_nowait()
-                except queue.Empty:
-                    time.sleep(0.005)
-                    continue
-                if _arg is None:
-                    _debug_message("Received queue empty signal in input queue.")
-                    _output_queue.put([None, None])
-                    break
-                _debug_message('Received item "%s" from queue' % _arg)
+                if not _tasks.pending:
+                    _received, _item = _input_queues.get(_ready)
+                    if not _received:
+                        continue
+                    if _item is None:
+                        _debug_message("Received queue empty signal in input queue.")
+                        _output_queue.put(create_output_item(None, None, _run_id))
+                        break
+                    _debug_message('Received item "%s" from queue' % _item)
+                    _tasks.add_queue_item(_item)
+                _arg = _tasks.pending.popleft()
+                _app.multiprocessing_upcoming_tasks(_tasks.pending)
                 _app.multiprocessing_pre_cycle(_arg)
             _app_carryon = _app.multiprocessing_carryon()
             if _app_carryon:
@@ -168,14 +356,14 @@ def app_processor_func(
                 if _signal is not None:
                     _signal_queue.put(_signal)
                     _results = _wait_for_app_response(_app, _results)
-                _output_queue.put([_arg, _results])
+                _tasks.store_results(_arg, _results)
                 _debug_message("Finished computation of item %s" % _arg)
             else:
-                time.sleep(0.005)
+                wait_for_queues([_stop_queue], timeout=APP_WAIT_INTERVAL)
         else:
-            _app_carryon = _run_taskless_cycle(_app, _output_queue)
+            _app_carryon = _run_taskless_cycle(_app, _output_queue, _run_id)
             if not _app_carryon:
-                time.sleep(0.005)
+                wait_for_queues([_stop_queue], timeout=APP_WAIT_INTERVAL)
     _debug_message("Worker finished with all tasks.")
 
     _app_carryon = False
@@ -185,5 +373,7 @@ def app_processor_func(
             _app_carryon = True
         time.sleep(0.005)
     _debug_message("Worker shutting down.")
-    _shutting_down_queue.put(1)
-    _app.deleteLater()
+    _app.multiprocessing_post_run()
+    _shutting_down_queue.put(1 if _run_id is None else _run_id)
+    if _worker_state is None:
+        _app.deleteLater()
@@ -36,6 +36,7 @@ from pydidas.core import BaseApp
 from pydidas.core.utils import LOGGING_LEVEL, pydidas_logger
 from pydidas.multiprocessing.app_processor import app_processor_func
 from pydidas.multiprocessing.worker_controller import WorkerController
+from pydidas.multiprocessing.worker_pool import WorkerPool
 
 
 logger = pydidas_logger()
@@ -70,6 +71,21 @@ class AppRunner(WorkerController):
         workers.
     use_app_tasks : bool, optional
         Flag to toggle if the app works with tasks. The default is True.
+    chunk_size : int or None, optional
+        The number of tasks which are sent to a worker as one TaskChunk. The
+        default is None which will use the globally defined pydidas setting.
+    adaptive_chunks : bool or None, optional
+        Flag to adapt the chunk size to the processing time of the tasks.
+        The default is None which will use the globally defined pydidas
+        setting.
+    worker_pool : WorkerPool or None, optional
+        A persistent WorkerPool to run the app in. Workers of the pool keep
+        the app instance and its context between runs. The default is None
+        which will spawn new workers for the run.
+    task_scheduler : str or None, optional
+        The scheduling of tasks to the workers. The "locality" scheduler uses
+        the app's task locality keys. The default is None which will use
+        the globally defined pydidas setting.
     """
 
     sig_final_app_state = QtCore.Signal(object)
@@ -80,9 +96,20 @@ class AppRunner(WorkerController):
         app: BaseApp,
         n_workers: int | None = None,
         use_app_tasks: bool = True,
+        chunk_size: int | None = None,
+        adaptive_chunks: bool | None = None,
+        worker_pool: WorkerPool | None = None,
+        task_scheduler: str | None = None,
     ) -> None:
         logger.debug("AppRunner: Starting AppRunner")
-        WorkerController.__init__(self, n_workers=n_workers)
+        WorkerController.__init__(
+            self,
+            n_workers=n_workers,
+            chunk_size=chunk_size,
+            adaptive_chunks=adaptive_chunks,
+            worker_pool=worker_pool,
+            task_scheduler=task_scheduler,
+        )
         if not app._config["run_prepared"]:
             app.multiprocessing_pre_run()
         self.sig_results.connect(app.multiprocessing_store_results)
@@ -153,9 +180,11 @@ class AppRunner(WorkerController):
         Perform pre-multiprocessing operations.
 
         This time slot is used to prepare the App by running the
-        :py:meth:`app.multiprocessing_pre_run`, settings the tasks and
-        starting the workers.
+        :py:meth:`app.multiprocessing_pre_run`, settings the tasks (and their
+        locality keys for the locality scheduler) and starting the workers.
+        The number of workers is passed to the app before the run.
         """
+        self.__app.multiprocessing_set_n_workers(self.n_workers)
         self.__app.multiprocessing_pre_run()
         self._processor["args"] = (
             self._mp_kwargs,
@@ -167,7 +196,14 @@ class AppRunner(WorkerController):
             "use_tasks": self._use_app_tasks,
             "app_mp_manager": self.__app.mp_manager,
         }
-        self.add_tasks(self.__app.multiprocessing_get_tasks())
+        self.add_tasks(
+            self.__app.multiprocessing_get_tasks(),
+            locality_keys=(
+                self.__app.multiprocessing_get_task_locality_keys()
+                if self.task_scheduler == "locality"
+                else None
+            ),
+        )
         self.finalize_tasks()
         self.sig_results.connect(self.__app.multiprocessing_store_results)
         self.sig_progress.connect(self.__check_progress)
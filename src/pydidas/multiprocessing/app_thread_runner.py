@@ -0,0 +1,253 @@
+# This file is part of pydidas.
+#
+# Copyright 2026, Helmholtz-Zentrum Hereon
+# SPDX-License-Identifier: GPL-3.0-only
+#
+# pydidas is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# Pydidas is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pydidas. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module with the AppThreadRunner class which runs pydidas applications in a
+pool of worker threads.
+"""
+
+__author__ = "Malte Storm"
+__copyright__ = "Copyright 2026, Helmholtz-Zentrum Hereon"
+__license__ = "GPL-3.0-only"
+__maintainer__ = "Malte Storm"
+__status__ = "Production"
+__all__ = ["AppThreadRunner", "EXECUTION_BACKENDS"]
+
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from numbers import Integral
+from typing import Any
+
+from qtpy import QtCore
+
+from pydidas.core import BaseApp, PydidasQsettings
+from pydidas.core.utils import LOGGING_LEVEL, pydidas_logger
+
+
+logger = pydidas_logger()
+logger.setLevel(LOGGING_LEVEL)
+
+EXECUTION_BACKENDS = ("processes", "threads")
+
+# The time to wait before checking again whether a task can be processed.
+CARRYON_WAIT_INTERVAL = 0.01
+# The marker for tasks which have been skipped because of a stop request.
+_TASK_SKIPPED = "::task_skipped::"
+
+
+class AppThreadRunner(QtCore.QThread):
+    """
+    The AppThreadRunner runs a pydidas application in a pool of worker threads.
+
+    In contrast to the AppRunner, the application is not copied to separate
+    worker processes but all worker threads share the app instance in the
+    current process. This removes the process startup time and the transfer
+    of results between processes, but the threads only run in parallel while
+    the processing releases the GIL (e.g. in numpy, h5py or pyFAI).
+
+    The app must implement the thread-safe threading_func (and optionally
+    threading_carryon) methods and store its results itself. The
+    AppThreadRunner has the same signals as the AppRunner and can be used
+    as a drop-in replacement.
+
+    Notes
+    -----
+    The AppThreadRunner has the following signals which can be connected to:
+
+    sig_progress : QtCore.Signal(float)
+        The relative progress of the processing.
+    sig_results : QtCore.Signal(object, object)
+        The task and the return value of the app's threading_func for each
+        processed task. This signal is connected to the app's
+        threading_results_received method.
+    sig_message_from_worker : QtCore.Signal(str)
+        Defined for compatibility with the AppRunner. Worker threads share
+        the app and do not need to send messages.
+    sig_worker_exception : QtCore.Signal(str)
+        This signal emits the description of an exception raised in a worker
+        thread. The processing is stopped after an exception.
+    sig_final_app_state : QtCore.Signal(object)
+        This signal emits the app after all the calculations have been
+        performed.
+    sig_post_run_called : QtCore.Signal()
+        This signal is emitted after processing and is connected to the
+        app's multiprocessing_post_run method.
+
+    Parameters
+    ----------
+    app : pydidas.core.BaseApp
+        The instance of the application to be run.
+    n_threads : int or None, optional
+        The number of worker threads. The default is None which will use
+        the globally defined pydidas setting for the number of workers.
+    """
+
+    sig_progress = QtCore.Signal(float)
+    sig_results = QtCore.Signal(object, object)
+    sig_message_from_worker = QtCore.Signal(str)
+    sig_worker_exception = QtCore.Signal(str)
+    sig_final_app_state = QtCore.Signal(object)
+    sig_post_run_called = QtCore.Signal()
+
+    def __init__(self, app: BaseApp, n_threads: int | None = None) -> None:
+        logger.debug("AppThreadRunner: Starting AppThreadRunner")
+        QtCore.QThread.__init__(self)
+        if not isinstance(app, BaseApp):
+            raise TypeError("The app must be an instance of BaseApp.")
+        if n_threads is None:
+            n_threads = PydidasQsettings().value("global/mp_n_workers", int)
+        self.n_threads = n_threads
+        self._app = app
+        self._stop_requested = threading.Event()
+        self._progress = {"done": 0, "target": 0}
+        if not app._config["run_prepared"]:
+            app.multiprocessing_pre_run()
+        self.sig_results.connect(app.threading_results_received)
+        self.sig_post_run_called.connect(app.multiprocessing_post_run)
+
+    @property
+    def n_threads(self) -> int:
+        """
+        Get the number of worker threads.
+
+        Returns
+        -------
+        int
+            The number of threads.
+        """
+        return self._n_threads
+
+    @n_threads.setter
+    def n_threads(self, number: int) -> None:
+        """
+        Set the number of worker threads.
+
+        *Note*: This change does not take effect until the next run.
+
+        Parameters
+        ----------
+        number : int
+            The new number of threads.
+
+        Raises
+        ------
+        ValueError
+            If number is not a positive integer.
+        """
+        if not isinstance(number, Integral) or number < 1:
+            raise ValueError("The number of threads must be a positive integer.")
+        self._n_threads = number
+
+    @property
+    def progress(self) -> float:
+        """
+        Get the progress level of the current computations.
+
+        Returns
+        -------
+        float
+            The progress, normalized to the range [0, 1]. A value of -1
+            means that no tasks have been defined.
+        """
+        if self._progress["target"] == 0:
+            return -1
+        return self._progress["done"] / self._progress["target"]
+
+    def requestInterruption(self) -> None:
+        """
+        Request the interruption of the processing.
+
+        Tasks which are being processed are finished but no new tasks are
+        started.
+        """
+        self._stop_requested.set()
+        QtCore.QThread.requestInterruption(self)
+
+    send_stop_signal = requestInterruption
+
+    def run(self) -> None:
+        """
+        Process all tasks of the app in the pool of worker threads.
+
+        The tasks are processed in order and the results are emitted in
+        the order of completion. If a task raises an exception, it is logged
+        and emitted with the sig_worker_exception signal and the processing
+        is stopped. The app's multiprocessing_post_run method is called after
+        all tasks have been processed or the processing has been interrupted.
+        """
+        self._stop_requested.clear()
+        _tasks = list(self._app.multiprocessing_get_tasks())
+        self._progress = {"done": 0, "target": len(_tasks)}
+        logger.debug("AppThreadRunner: Processing %d tasks" % len(_tasks))
+        try:
+            with ThreadPoolExecutor(
+                max_workers=self._n_threads, thread_name_prefix="pydidas_worker"
+            ) as _executor:
+                _futures = {
+                    _executor.submit(self._process_task, _task): _task
+                    for _task in _tasks
+                }
+                try:
+                    for _future in as_completed(_futures):
+                        try:
+                            _result = _future.result()
+                        except Exception as _ex:
+                            self._stop_requested.set()
+                            logger.exception(
+                                "AppThreadRunner: Exception in task %s"
+                                % _futures[_future]
+                            )
+                            self.sig_worker_exception.emit(
+                                f"{type(_ex).__name__}: {_ex}"
+                            )
+                            break
+                        if self._stop_requested.is_set():
+                            break
+                        self._progress["done"] += 1
+                        self.sig_results.emit(_futures[_future], _result)
+                        self.sig_progress.emit(self.progress)
+                finally:
+                    for _future in _futures:
+                        _future.cancel()
+        finally:
+            self.sig_final_app_state.emit(self._app)
+            self.sig_post_run_called.emit()
+            logger.debug("AppThreadRunner: Finished processing")
+
+    def _process_task(self, task: Any) -> Any:
+        """
+        Process a single task in a worker thread.
+
+        Parameters
+        ----------
+        task : Any
+            The task.
+
+        Returns
+        -------
+        Any
+            The return value of the app's threading_func.
+        """
+        while not self._app.threading_carryon(task):
+            if self._stop_requested.is_set():
+                return _TASK_SKIPPED
+            time.sleep(CARRYON_WAIT_INTERVAL)
+        if self._stop_requested.is_set():
+            return _TASK_SKIPPED
+        return self._app.threading_func(task)
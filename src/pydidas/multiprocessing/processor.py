@@ -28,10 +28,21 @@ __status__ = "Production"
 __all__ = ["processor_func"]
 
 
-import queue
 import time
 from typing import Any, Callable
 
+from pydidas.multiprocessing.queue_utils import (
+    TaskChunk,
+    WorkerTaskQueues,
+    create_output_item,
+    get_stop_signal,
+    wait_for_queues,
+)
+
+
+# The maximum time to block on the queues before re-entering the loop.
+QUEUE_WAIT_TIMEOUT = 0.5
+
 
 def processor_func(
     function: Callable,
@@ -46,6 +57,22 @@ def processor_func(
     indices supplied by the queue. Results will be written to the output
     queue in a format [input_arg, results]
 
+    The loop is event-driven: The worker blocks on the input and stop queues
+    and is woken up by the operating system as soon as an item arrives.
+
+    If the multiprocessing_config includes a "run_id" key (as supplied by a
+    persistent WorkerPool), only stop signals for this run are accepted and
+    the run ID is used as shutdown signal. All output items are then tagged
+    with the run ID in the format [input_arg, results, run_id].
+
+    If the worker receives a TaskChunk, all tasks of the chunk are processed
+    and the results are written to the output queue as a single item in the
+    format [TaskChunk, list_of_results].
+
+    Tasks are received from the shared input queue and the worker's local
+    queue. After the worker has finished its own tasks, it takes over tasks
+    from the local queues of other workers (see WorkerTaskQueues).
+
     Parameters
     ----------
     function : Callable
@@ -60,34 +87,44 @@ def processor_func(
     **func_kwargs : Any
         The keyword arguments for the function.
     """
-    input_queue = multiprocessing_config.get("queue_input")
+    input_queues = WorkerTaskQueues(multiprocessing_config)
     output_queue = multiprocessing_config.get("queue_output")
     stop_queue = multiprocessing_config.get("queue_stop")
     _shutting_down_queue = multiprocessing_config.get("queue_shutting_down")
+    _run_id = multiprocessing_config.get("run_id", None)
+    _shutdown_item = 1 if _run_id is None else _run_id
 
     while True:
-        # check for stop signal
-        try:
-            stop_queue.get_nowait()
-            _shutting_down_queue.put(1)
+        # block until either a stop signal or a new task is available. After
+        # all own tasks are done, only check for the stop signal.
+        _ready = wait_for_queues(
+            [stop_queue, *input_queues.queues],
+            timeout=0 if input_queues.own_tasks_done else QUEUE_WAIT_TIMEOUT,
+        )
+        if stop_queue in _ready and get_stop_signal(stop_queue, _run_id):
+            _shutting_down_queue.put(_shutdown_item)
             break
-        except queue.Empty:
-            pass
         # run processing step
+        _received, _arg1 = input_queues.get(_ready)
+        if not _received:
+            continue
+        if _arg1 is None:
+            output_queue.put(create_output_item(None, None, _run_id))
+            break
         try:
-            _arg1 = input_queue.get(timeout=0.005)
-            if _arg1 is None:
-                output_queue.put([None, None])
-                break
-            try:
+            if isinstance(_arg1, TaskChunk):
+                _t0 = time.perf_counter()
+                _results = [
+                    function(_task, *func_args, **func_kwargs) for _task in _arg1
+                ]
+                _arg1.runtime = time.perf_counter() - _t0
+            else:
                 _results = function(_arg1, *func_args, **func_kwargs)
-            except Exception as ex:
-                print(f"Exception occurred during function call to: {function}: {ex}")
-                # For some arcane reason, sleep time required to stop queues from
-                # becoming corrupted.
-                time.sleep(0.02)
-                _shutting_down_queue.put(1)
-                break
-            output_queue.put([_arg1, _results])
-        except queue.Empty:
-            time.sleep(0.01)
+        except Exception as ex:
+            print(f"Exception occurred during function call to: {function}: {ex}")
+            # For some arcane reason, sleep time required to stop queues from
+            # becoming corrupted.
+            time.sleep(0.02)
+            _shutting_down_queue.put(_shutdown_item)
+            break
+        output_queue.put(create_output_item(_arg1, _results, _run_id))
@@ -0,0 +1,321 @@
+# This file is part of pydidas.
+#
+# Copyright 2026, Helmholtz-Zentrum Hereon
+# SPDX-License-Identifier: GPL-3.0-only
+#
+# pydidas is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# Pydidas is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pydidas. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module with utility functions to wait on multiple multiprocessing queues
+simultaneously without resorting to sleep-polling and the TaskChunk class to
+send multiple tasks as a single queue item.
+"""
+
+__author__ = "Malte Storm"
+__copyright__ = "Copyright 2026, Helmholtz-Zentrum Hereon"
+__license__ = "GPL-3.0-only"
+__maintainer__ = "Malte Storm"
+__status__ = "Production"
+__all__ = [
+    "wait_for_queues",
+    "get_from_queue",
+    "get_stop_signal",
+    "create_output_item",
+    "TaskChunk",
+    "WorkerTaskQueues",
+]
+
+
+import time
+from multiprocessing.connection import wait
+from numbers import Integral
+from queue import Empty
+from typing import Any, Iterator, Sequence
+
+
+# The sleep interval for queues which do not expose a waitable reader (e.g.
+# queue.Queue instances). mp.Queue instances do not require polling.
+_POLL_INTERVAL = 0.001
+# The maximum time to wait for the read lock of another worker's queue.
+_STEAL_TIMEOUT = 0.01
+
+
+def wait_for_queues(queues: Sequence, timeout: float | None = None) -> list:
+    """
+    Block until at least one of the given queues has an item available.
+
+    For multiprocessing.Queue instances, this function waits on the underlying
+    pipe readers with multiprocessing.connection.wait, i.e. the calling thread
+    is suspended by the operating system until data arrives. Other queue types
+    are polled as a fallback.
+
+    Parameters
+    ----------
+    queues : Sequence
+        The queues to wait for.
+    timeout : float or None, optional
+        The maximum time to wait in seconds. None will block indefinitely.
+        The default is None.
+
+    Returns
+    -------
+    list
+        The list of queues which have items available. The order is the same
+        as in the input. An empty list is returned if the timeout expired.
+    """
+    _readers = [getattr(_queue, "_reader", None) for _queue in queues]
+    if None not in _readers:
+        _ready = wait(_readers, timeout)
+        return [_q for _q, _reader in zip(queues, _readers) if _reader in _ready]
+    _t_end = None if timeout is None else time.perf_counter() + timeout
+    while True:
+        _ready = [_queue for _queue in queues if not _queue.empty()]
+        if _ready or (_t_end is not None and time.perf_counter() >= _t_end):
+            return _ready
+        time.sleep(_POLL_INTERVAL)
+
+
+def get_from_queue(queue: Any, timeout: float = 0.05) -> tuple[bool, Any]:
+    """
+    Get an item from a queue which has been signalled to be ready.
+
+    Multiple consumers can be woken up by the same item. This function
+    therefore uses a short blocking get to let the losing consumers wait on
+    the queue's read lock instead of spinning.
+
+    Parameters
+    ----------
+    queue : Any
+        The queue to get the item from.
+    timeout : float, optional
+        The maximum waiting time for the item. The default is 0.05.
+
+    Returns
+    -------
+    tuple[bool, Any]
+        A flag whether an item was received and the item itself (or None).
+    """
+    try:
+        return True, queue.get(timeout=timeout)
+    except Empty:
+        return False, None
+
+
+def get_stop_signal(stop_queue: Any, run_id: int | None = None) -> bool:
+    """
+    Get an item from the stop queue and check whether it is a valid stop signal.
+
+    Workers in a persistent WorkerPool only accept stop signals with the ID of
+    their current run to discard leftover stop signals from previous runs.
+
+    Parameters
+    ----------
+    stop_queue : Any
+        The stop queue.
+    run_id : int or None, optional
+        The ID of the current run. If None, any item will be accepted as stop
+        signal. The default is None.
+
+    Returns
+    -------
+    bool
+        Flag whether a valid stop signal has been received.
+    """
+    _received, _item = get_from_queue(stop_queue)
+    return _received and (run_id is None or _item == run_id)
+
+
+def create_output_item(task: Any, results: Any, run_id: int | None = None) -> list:
+    """
+    Create an item for the output queue.
+
+    Workers in a persistent WorkerPool tag their output with the ID of their
+    current run to allow the controller to discard late results from
+    previous runs.
+
+    Parameters
+    ----------
+    task : Any
+        The processed task (or TaskChunk).
+    results : Any
+        The results of the task.
+    run_id : int or None, optional
+        The ID of the current run. If None, the item is not tagged. The
+        default is None.
+
+    Returns
+    -------
+    list
+        The output item in the format [task, results] or
+        [task, results, run_id].
+    """
+    if run_id is None:
+        return [task, results]
+    return [task, results, run_id]
+
+
+class TaskChunk:
+    """
+    A chunk of tasks which is sent to a worker as a single queue item.
+
+    Runs of consecutive integer tasks are stored as a range object to keep the
+    pickled size of the chunk independent of the number of tasks. Workers
+    return the (processed) TaskChunk together with a list of the results and
+    store the total computation time for the chunk in the runtime attribute.
+
+    Parameters
+    ----------
+    tasks : Sequence
+        The tasks in the chunk.
+    runtime : float, optional
+        The time required to process the chunk. The default is 0.
+    """
+
+    __slots__ = ("tasks", "runtime")
+
+    def __init__(self, tasks: Sequence, runtime: float = 0.0):
+        self.tasks = self._compress(tasks)
+        self.runtime = runtime
+
+    @staticmethod
+    def _compress(tasks: Sequence) -> Sequence:
+        """
+        Convert consecutive integer tasks to a range.
+
+        Parameters
+        ----------
+        tasks : Sequence
+            The input tasks.
+
+        Returns
+        -------
+        Sequence
+            The tasks as range, if possible, or as list.
+        """
+        if isinstance(tasks, range):
+            return tasks
+        tasks = list(tasks)
+        if len(tasks) > 1 and all(isinstance(_task, Integral) for _task in tasks):
+            _start = int(tasks[0])
+            if all(_task == _start + _i for _i, _task in enumerate(tasks)):
+                return range(_start, _start + len(tasks))
+        return tasks
+
+    def __iter__(self) -> Iterator:
+        return iter(self.tasks)
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+    def __getitem__(self, index: int) -> Any:
+        return self.tasks[index]
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, TaskChunk):
+            return False
+        return list(self.tasks) == list(other.tasks)
+
+    def __repr__(self) -> str:
+        return f"TaskChunk({self.tasks!r})"
+
+
+class WorkerTaskQueues:
+    """
+    The task input queues of a single worker.
+
+    Workers receive tasks from the shared input queue and from their own
+    local queue (if defined), which is used by the locality-aware task
+    scheduling of the WorkerController. Both queues are closed for the worker
+    when it receives the end-of-tasks signal (None).
+
+    Afterwards, the worker steals the remaining items from the local queues
+    of the other workers to balance the load at the end of the processing.
+    End-of-tasks signals of other workers are put back into their queues.
+
+    Parameters
+    ----------
+    multiprocessing_config : dict
+        The multiprocessing configuration of the worker. The "queue_input"
+        key is required, "queue_local" and "queues_steal" are optional.
+    """
+
+    def __init__(self, multiprocessing_config: dict):
+        self._queues = [multiprocessing_config.get("queue_input")]
+        if multiprocessing_config.get("queue_local", None) is not None:
+            self._queues.append(multiprocessing_config["queue_local"])
+        self._steal_queues = list(multiprocessing_config.get("queues_steal", []))
+        self.own_tasks_done = False
+
+    @property
+    def queues(self) -> list:
+        """
+        Get the queues which can deliver new tasks to the worker.
+
+        Returns
+        -------
+        list
+            The queues. The list is empty after the end-of-tasks signal
+            has been received.
+        """
+        return [] if self.own_tasks_done else self._queues
+
+    def get(self, ready: list) -> tuple[bool, Any]:
+        """
+        Get the next task item.
+
+        Parameters
+        ----------
+        ready : list
+            The list of queues which have been signalled to be ready.
+
+        Returns
+        -------
+        tuple[bool, Any]
+            A flag whether an item was received and the item itself. A
+            received None item signals that no tasks are left.
+        """
+        if not self.own_tasks_done:
+            for _queue in self._queues:
+                if _queue not in ready:
+                    continue
+                _received, _item = get_from_queue(_queue)
+                if not _received:
+                    continue
+                if _item is not None:
+                    return True, _item
+                self.own_tasks_done = True
+                break
+            else:
+                return False, None
+        return True, self._steal()
+
+    def _steal(self) -> Any:
+        """
+        Get an item from the local queue of another worker.
+
+        Returns
+        -------
+        Any
+            The stolen task item or None if no tasks are left.
+        """
+        for _queue in self._steal_queues:
+            if _queue.empty():
+                continue
+            _received, _item = get_from_queue(_queue, timeout=_STEAL_TIMEOUT)
+            if not _received:
+                continue
+            if _item is None:
+                _queue.put(None)
+                continue
+            return _item
+        return None
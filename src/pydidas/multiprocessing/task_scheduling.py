@@ -0,0 +1,160 @@
+# This file is part of pydidas.
+#
+# Copyright 2026, Helmholtz-Zentrum Hereon
+# SPDX-License-Identifier: GPL-3.0-only
+#
+# pydidas is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# Pydidas is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pydidas. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module with functions to schedule tasks for the multiprocessing workers.
+"""
+
+__author__ = "Malte Storm"
+__copyright__ = "Copyright 2026, Helmholtz-Zentrum Hereon"
+__license__ = "GPL-3.0-only"
+__maintainer__ = "Malte Storm"
+__status__ = "Production"
+__all__ = ["TASK_SCHEDULERS", "get_block_boundaries", "distribute_tasks_by_locality"]
+
+
+from bisect import bisect_left
+from itertools import pairwise
+from typing import Any, Hashable, Sequence
+
+
+TASK_SCHEDULERS = ("ordinal", "locality")
+
+# The maximum shift of a worker's range boundary to align it with a block
+# boundary, relative to the number of tasks per worker.
+MAX_RELATIVE_BOUNDARY_SHIFT = 0.25
+
+
+def get_block_boundaries(locality_keys: Sequence[Hashable]) -> list[int]:
+    """
+    Get the boundaries of blocks of consecutive tasks with the same locality key.
+
+    Parameters
+    ----------
+    locality_keys : Sequence[Hashable]
+        The locality keys of all tasks.
+
+    Returns
+    -------
+    list[int]
+        The block boundaries, starting with 0 and ending with the number of
+        tasks.
+    """
+    _n = len(locality_keys)
+    return (
+        [0]
+        + [_i for _i in range(1, _n) if locality_keys[_i] != locality_keys[_i - 1]]
+        + [_n]
+    )
+
+
+def _get_worker_boundaries(block_boundaries: list[int], n_workers: int) -> list[int]:
+    """
+    Get the boundaries of the contiguous task ranges of all workers.
+
+    The ranges have (almost) the same number of tasks. Each boundary is moved
+    to the nearest block boundary if the shift is small compared to the range
+    size.
+
+    Parameters
+    ----------
+    block_boundaries : list[int]
+        The block boundaries.
+    n_workers : int
+        The number of workers.
+
+    Returns
+    -------
+    list[int]
+        The boundaries of the workers' ranges.
+    """
+    _n_tasks = block_boundaries[-1]
+    _share = _n_tasks / n_workers
+    _boundaries = [0]
+    for _index in range(1, n_workers):
+        _ideal = round(_index * _share)
+        _pos = bisect_left(block_boundaries, _ideal)
+        _candidates = block_boundaries[max(0, _pos - 1) : _pos + 1]
+        _nearest = min(_candidates, key=lambda _b: abs(_b - _ideal))
+        if abs(_nearest - _ideal) <= MAX_RELATIVE_BOUNDARY_SHIFT * _share:
+            _ideal = _nearest
+        _boundaries.append(max(_boundaries[-1], _ideal))
+    _boundaries.append(_n_tasks)
+    return _boundaries
+
+
+def distribute_tasks_by_locality(
+    tasks: Sequence[Any],
+    locality_keys: Sequence[Hashable],
+    n_workers: int,
+    max_chunk_size: int,
+) -> list[list[list[Any]]]:
+    """
+    Distribute tasks to the workers in contiguous ranges.
+
+    Each worker receives a contiguous range of tasks. The ranges are aligned
+    with the blocks of tasks which share the same locality key (e.g. the same
+    input file), if possible. The range of each worker is split into chunks
+    which do not exceed the maximum chunk size. Chunks only combine complete
+    blocks or are parts of a single block to allow other workers to take over
+    chunks without sharing a block.
+
+    Parameters
+    ----------
+    tasks : Sequence[Any]
+        The tasks.
+    locality_keys : Sequence[Hashable]
+        The locality keys of the tasks.
+    n_workers : int
+        The number of workers.
+    max_chunk_size : int
+        The maximum number of tasks per chunk.
+
+    Returns
+    -------
+    list[list[list[Any]]]
+        The list of chunks for each worker.
+    """
+    _tasks = list(tasks)
+    _block_boundaries = get_block_boundaries(locality_keys)
+    _worker_boundaries = _get_worker_boundaries(_block_boundaries, n_workers)
+    _distribution = []
+    for _start, _stop in pairwise(_worker_boundaries):
+        _cuts = (
+            [_start]
+            + _block_boundaries[
+                bisect_left(_block_boundaries, _start + 1) : bisect_left(
+                    _block_boundaries, _stop
+                )
+            ]
+            + [_stop]
+        )
+        _chunks = []
+        _current = []
+        for _block_start, _block_stop in pairwise(_cuts):
+            _block = _tasks[_block_start:_block_stop]
+            if _current and len(_current) + len(_block) > max_chunk_size:
+                _chunks.append(_current)
+                _current = []
+            while len(_block) > max_chunk_size:
+                _chunks.append(_block[:max_chunk_size])
+                _block = _block[max_chunk_size:]
+            _current = _current + _block
+        if _current:
+            _chunks.append(_current)
+        _distribution.append(_chunks)
+    return _distribution
@@ -31,9 +31,10 @@ __all__ = ["WorkerController"]
 import multiprocessing as mp
 import time
 from contextlib import contextmanager
+from itertools import islice
 from numbers import Integral
 from queue import Empty
-from typing import Any, Callable, Sequence
+from typing import Any, Callable, Iterable, Optional, Sequence
 
 from qtpy import QtCore
 
@@ -42,11 +43,28 @@ from pydidas.core.utils import pydidas_logger
 from pydidas.logging_level import LOGGING_LEVEL
 from pydidas.multiprocessing.processor import processor_func
 from pydidas.multiprocessing.pydidas_process import PydidasProcess
+from pydidas.multiprocessing.queue_utils import TaskChunk, wait_for_queues
+from pydidas.multiprocessing.task_scheduling import (
+    TASK_SCHEDULERS,
+    distribute_tasks_by_locality,
+)
+from pydidas.multiprocessing.worker_pool import WorkerPool
 from pydidas_qtcore import PydidasQApplication
 
 
 logger = pydidas_logger()
 
+# The maximum time to wait for worker items before checking for new tasks.
+CONTROLLER_WAIT_TIMEOUT = 0.005
+
+# The targeted processing time per TaskChunk in adaptive chunk mode (in s).
+ADAPTIVE_CHUNK_TARGET_TIME = 0.05
+ADAPTIVE_CHUNK_MAX_SIZE = 1000
+# The maximum number of chunks per worker in the queue in adaptive chunk mode.
+MAX_CHUNKS_IN_FLIGHT_PER_WORKER = 2
+# The maximum time to wait for the workers of a WorkerPool to finish a run.
+POOL_RUN_FINISH_TIMEOUT = 10
+
 
 class WorkerController(QtCore.QThread):
     """
@@ -72,6 +90,29 @@ class WorkerController(QtCore.QThread):
          The function arguments. The default is an empty tuple.
     func_kwargs : dict or None, optional
         Keywords passed to the function. The default is None.
+    chunk_size : int or None, optional
+        The number of tasks which are sent to a worker as one TaskChunk. The
+        results of all tasks in a chunk are returned in a single message. A
+        chunk size of 1 sends individual tasks. The default is None which
+        will use the globally defined pydidas setting.
+    adaptive_chunks : bool or None, optional
+        Flag to adapt the chunk size to the processing time of the tasks. If
+        True, chunk_size is used as starting value and the chunk size is
+        increased for fast tasks and decreased towards the end of the task
+        list to balance the load between workers. The default is None which
+        will use the globally defined pydidas setting.
+    worker_pool : WorkerPool or None, optional
+        A persistent WorkerPool. If given, the pool's worker processes are
+        re-used instead of spawning new workers for each run and the
+        processes are kept alive after the run. The default is None.
+    task_scheduler : str or None, optional
+        The scheduling of tasks to the workers. "ordinal" puts all tasks in
+        a shared queue and each worker takes the next task. "locality"
+        assigns contiguous ranges of tasks to each worker, aligned with the
+        locality keys of the tasks (see add_tasks). Workers which have
+        finished their own tasks take over chunks of other workers. Adaptive
+        chunk sizes are not used with locality scheduling. The default is
+        None which will use the globally defined pydidas setting.
     """
 
     sig_progress = QtCore.Signal(float)
@@ -84,6 +125,10 @@ class WorkerController(QtCore.QThread):
         function: Callable | None = None,
         func_args: tuple = (),
         func_kwargs: dict | None = None,
+        chunk_size: int | None = None,
+        adaptive_chunks: bool | None = None,
+        worker_pool: WorkerPool | None = None,
+        task_scheduler: str | None = None,
     ) -> None:
         QtCore.QThread.__init__(self)
         self.flags = {
@@ -93,27 +138,57 @@ class WorkerController(QtCore.QThread):
             "stop_after_run": False,
             "must_restart": False,
         }
+        _q_settings = PydidasQsettings()
         if n_workers is None:
-            n_workers = PydidasQsettings().value("global/mp_n_workers", int)
+            n_workers = _q_settings.value("global/mp_n_workers", int)
+        if chunk_size is None:
+            chunk_size = _q_settings.q_settings_get(
+                "global/mp_chunk_size", int, default=1
+            )
+        if adaptive_chunks is None:
+            adaptive_chunks = _q_settings.q_settings_get(
+                "global/mp_adaptive_chunk_size", bool, default=False
+            )
+        if task_scheduler is None:
+            task_scheduler = _q_settings.q_settings_get(
+                "global/mp_task_scheduler", str, default="ordinal"
+            )
         self._n_workers = n_workers
+        self.task_scheduler = task_scheduler
+        self._chunks = {
+            "size": max(1, chunk_size),
+            "initial_size": max(1, chunk_size),
+            "adaptive": adaptive_chunks,
+            "n_in_flight": 0,
+        }
         self._to_process = []
+        self._locality_keys = {}
+        self._local_queues = []
+        self._n_stop_tasks_queued = 0
         self._write_lock = QtCore.QReadWriteLock()
         self._workers = []
         self._workers_done = 0
         self._workers_shutdown = 0
-        self._lock_manager = mp.Manager()
-        self._queues = {
-            "queue_input": mp.Queue(),
-            "queue_output": mp.Queue(),
-            "queue_stop": mp.Queue(),
-            "queue_shutting_down": mp.Queue(),
-            "queue_signal": mp.Queue(),
-        }
-        self._mp_kwargs = {
-            "logging_level": LOGGING_LEVEL,
-            "lock": self._lock_manager.Lock(),
-            **self._queues,
-        }
+        self._worker_pool = worker_pool
+        self._run_id = None
+        if worker_pool is None:
+            self._lock_manager = mp.Manager()
+            self._queues = {
+                "queue_input": mp.Queue(),
+                "queue_output": mp.Queue(),
+                "queue_stop": mp.Queue(),
+                "queue_shutting_down": mp.Queue(),
+                "queue_signal": mp.Queue(),
+            }
+            self._mp_kwargs = {
+                "logging_level": LOGGING_LEVEL,
+                "lock": self._lock_manager.Lock(),
+                **self._queues,
+            }
+        else:
+            self._lock_manager = None
+            self._queues = worker_pool.queues
+            self._mp_kwargs = worker_pool.mp_kwargs
         self._processor = {
             "func": processor_func,
             "args": (None, self._mp_kwargs),
@@ -169,6 +244,66 @@ class WorkerController(QtCore.QThread):
             raise ValueError("The number of workers must be an integer number.")
         self._n_workers = number
 
+    @property
+    def task_scheduler(self) -> str:
+        """
+        Get the name of the task scheduler.
+
+        Returns
+        -------
+        str
+            The task scheduler.
+        """
+        return self._task_scheduler
+
+    @task_scheduler.setter
+    def task_scheduler(self, scheduler: str) -> None:
+        """
+        Set the task scheduler.
+
+        *Note*: This change does not take effect until the next run.
+
+        Parameters
+        ----------
+        scheduler : str
+            The name of the task scheduler. Must be in TASK_SCHEDULERS.
+
+        Raises
+        ------
+        ValueError
+            If the scheduler name is not known.
+        """
+        if scheduler not in TASK_SCHEDULERS:
+            raise ValueError(
+                f"The task scheduler `{scheduler}` is unknown. Valid schedulers "
+                f"are: {TASK_SCHEDULERS}"
+            )
+        self._task_scheduler = scheduler
+
+    @property
+    def chunk_size(self) -> int:
+        """
+        Get the current number of tasks per TaskChunk.
+
+        Returns
+        -------
+        int
+            The chunk size.
+        """
+        return self._chunks["size"]
+
+    @property
+    def use_chunks(self) -> bool:
+        """
+        Get the flag whether tasks are sent to the workers as TaskChunks.
+
+        Returns
+        -------
+        bool
+            Flag whether TaskChunks are used.
+        """
+        return self._chunks["adaptive"] or self._chunks["initial_size"] > 1
+
     @property
     def progress(self) -> float:
         """
@@ -254,6 +389,7 @@ class WorkerController(QtCore.QThread):
         """
         with self.write_lock():
             self._to_process = []
+            self._locality_keys = {}
 
     def restart(self) -> None:
         """
@@ -285,7 +421,12 @@ class WorkerController(QtCore.QThread):
         with self.write_lock():
             self._to_process.append(task)
 
-    def add_tasks(self, tasks: Sequence, are_stop_tasks: bool = False) -> None:
+    def add_tasks(
+        self,
+        tasks: Sequence,
+        are_stop_tasks: bool = False,
+        locality_keys: Sequence | None = None,
+    ) -> None:
         """
         Add tasks to the worker pool.
 
@@ -302,10 +443,16 @@ class WorkerController(QtCore.QThread):
             Keyword to signal that the added tasks are stop tasks. This flag
             will disable updating the task target number. The default is
             False.
+        locality_keys : Sequence or None, optional
+            The locality keys of the tasks, e.g. the input file of each task.
+            The locality task scheduler keeps consecutive tasks with the same
+            key together. The default is None.
         """
         with self.write_lock():
             for task in tasks:
                 self._to_process.append(task)
+            if locality_keys is not None:
+                self._locality_keys.update(zip(tasks, locality_keys))
         if not are_stop_tasks:
             self._progress_target += len(tasks)
 
@@ -333,7 +480,22 @@ class WorkerController(QtCore.QThread):
         """
         logger.debug("WorkerController: Sending stop queue signals")
         for _ in self._workers:
-            self._queues["queue_stop"].put(1)
+            self._queues["queue_stop"].put(self._stop_signal)
+
+    @property
+    def _stop_signal(self) -> int:
+        """
+        Get the stop signal for the workers.
+
+        Workers of a WorkerPool only accept the ID of their current run as
+        stop signal.
+
+        Returns
+        -------
+        int
+            The stop signal.
+        """
+        return 1 if self._run_id is None else self._run_id
 
     def run(self) -> None:
         """
@@ -350,9 +512,8 @@ class WorkerController(QtCore.QThread):
             if self.flags["running"] and not self.flags["active"]:
                 self.cycle_pre_run()
             while self.flags["running"]:
-                while len(self._to_process) > 0:
-                    self._put_next_task_in_queue()
-                time.sleep(0.001)
+                self._queue_pending_tasks()
+                self._wait_for_queue_items()
                 self._get_and_emit_all_queue_items()
                 self._check_if_workers_finished()
             if self.flags["active"]:
@@ -373,7 +534,10 @@ class WorkerController(QtCore.QThread):
         Perform operations before entering the main processing loop.
         """
         self.flags["active"] = True
+        self._n_stop_tasks_queued = 0
         self._progress_done = 0
+        self._chunks["size"] = self._chunks["initial_size"]
+        self._chunks["n_in_flight"] = 0
         _tmp_to_process = self._to_process[:]
         while None in _tmp_to_process:
             _tmp_to_process.remove(None)
@@ -383,12 +547,29 @@ class WorkerController(QtCore.QThread):
     def _create_and_start_workers(self) -> None:
         """
         Create and start worker processes.
+
+        If a WorkerPool is used, the pool's workers are (re-)used and the
+        current run is submitted to the pool.
+
+        For locality scheduling, each worker receives its own local queue and
+        the local queues of all other workers to take over their tasks.
         """
+        if self._worker_pool is not None:
+            self._workers = self._worker_pool.start(self._n_workers)
+            self._local_queues = self._worker_pool.local_queues
+            self._run_id = self._worker_pool.submit_run(
+                self._processor["func"],
+                self._processor["args"],
+                self._processor["kwargs"],
+            )
+            return
         _pid = mp.current_process().pid
+        if self._task_scheduler == "locality":
+            self._local_queues = [mp.Queue() for _ in range(self._n_workers)]
         self._workers = [
             PydidasProcess(
                 target=self._processor["func"],
-                args=self._processor["args"],
+                args=self._get_worker_args(i),
                 kwargs=self._processor["kwargs"],
                 name=f"pydidas_{_pid}_worker-{i}",
                 daemon=True,
@@ -399,17 +580,216 @@ class WorkerController(QtCore.QThread):
             _worker.start()
             logger.debug("WorkerController: Started worker %i" % _i)
 
+    def _get_worker_args(self, index: int) -> tuple:
+        """
+        Get the processor arguments for a worker.
+
+        The multiprocessing configuration is extended with the worker's local
+        queue and the local queues of the other workers, if local queues are
+        used.
+
+        Parameters
+        ----------
+        index : int
+            The index of the worker.
+
+        Returns
+        -------
+        tuple
+            The processor arguments.
+        """
+        if not self._local_queues:
+            return self._processor["args"]
+        _config = self._mp_kwargs | {
+            "queue_local": self._local_queues[index],
+            "queues_steal": (
+                self._local_queues[index + 1 :] + self._local_queues[:index]
+            ),
+        }
+        return tuple(
+            _config if _arg is self._mp_kwargs else _arg
+            for _arg in self._processor["args"]
+        )
+
+    def _queue_pending_tasks(self) -> None:
+        """
+        Put the pending tasks into the input queue.
+
+        In adaptive chunk mode, the number of tasks in the queue is limited
+        to allow adjusting the size of later chunks. Otherwise, all pending
+        tasks are put into the queue at once.
+
+        With locality scheduling, all pending tasks are distributed to the
+        local queues of the workers.
+        """
+        if self._task_scheduler == "locality" and self._local_queues:
+            self._queue_pending_tasks_by_locality()
+            return
+        if self._chunks["adaptive"]:
+            while len(self._to_process) > 0 and (
+                self._chunks["n_in_flight"]
+                < MAX_CHUNKS_IN_FLIGHT_PER_WORKER * self._n_workers * self.chunk_size
+                or self._to_process[0] is None
+            ):
+                self._put_next_task_in_queue()
+            return
+        if len(self._to_process) == 0:
+            return
+        with self.write_lock():
+            _tasks = self._to_process
+            self._to_process = []
+        _index = 0
+        while _index < len(_tasks):
+            _n = self._get_queue_item_length(_tasks, _index)
+            self._put_item_in_queue(_tasks[_index : _index + _n])
+            _index += _n
+
+    def _queue_pending_tasks_by_locality(self) -> None:
+        """
+        Distribute the pending tasks to the local queues of the workers.
+
+        All tasks up to the next stop task are distributed to the workers in
+        contiguous ranges, based on their locality keys. Stop tasks are sent
+        to the workers in turn.
+        """
+        if len(self._to_process) == 0:
+            return
+        with self.write_lock():
+            _tasks = self._to_process
+            self._to_process = []
+        _start = 0
+        for _index in range(len(_tasks) + 1):
+            if _index < len(_tasks) and _tasks[_index] is not None:
+                continue
+            if _index > _start:
+                self._put_tasks_in_local_queues(_tasks[_start:_index])
+            if _index < len(_tasks):
+                _worker_index = self._n_stop_tasks_queued % len(self._local_queues)
+                self._local_queues[_worker_index].put(None)
+                self._n_stop_tasks_queued += 1
+            _start = _index + 1
+
+    def _put_tasks_in_local_queues(self, tasks: list) -> None:
+        """
+        Put the tasks in the local queues of the workers.
+
+        Parameters
+        ----------
+        tasks : list
+            The tasks. The list must not include any stop tasks.
+        """
+        _keys = [self._locality_keys.get(_task, None) for _task in tasks]
+        _distribution = distribute_tasks_by_locality(
+            tasks, _keys, len(self._local_queues), self._chunks["initial_size"]
+        )
+        for _queue, _chunks in zip(self._local_queues, _distribution):
+            for _chunk in _chunks:
+                self._put_item_in_queue(_chunk, queue=_queue)
+
     def _put_next_task_in_queue(self) -> None:
         """
-        Get the next task from the list and put it into the queue.
+        Get the next task (or chunk of tasks) from the list and put it into the queue.
         """
         with self.write_lock():
-            _arg = self._to_process.pop(0)
-        self._queues["queue_input"].put(_arg)
+            _n = self._get_queue_item_length(self._to_process, 0)
+            _tasks = self._to_process[:_n]
+            del self._to_process[:_n]
+        self._put_item_in_queue(_tasks)
+
+    def _get_queue_item_length(self, tasks: list, index: int) -> int:
+        """
+        Get the number of tasks for the next queue item.
+
+        Parameters
+        ----------
+        tasks : list
+            The list of tasks.
+        index : int
+            The index of the first task of the next queue item.
+
+        Returns
+        -------
+        int
+            The number of tasks for the next queue item.
+        """
+        if not self.use_chunks or tasks[index] is None:
+            return 1
+        _max_n = self.chunk_size
+        if self._chunks["adaptive"]:
+            # guided scheduling: reduce the chunk size at the end of the task
+            # list to keep all workers busy until the end.
+            _n_remaining = len(tasks) - index
+            _max_n = min(_max_n, max(1, _n_remaining // (2 * self._n_workers)))
+        _n = 0
+        for _task in islice(tasks, index, index + _max_n):
+            if _task is None:
+                break
+            _n += 1
+        return _n
+
+    def _put_item_in_queue(self, tasks: list, queue: Optional[mp.Queue] = None) -> None:
+        """
+        Put the tasks into the input queue, either as single task or as TaskChunk.
+
+        Parameters
+        ----------
+        tasks : list
+            The list of tasks for the queue item.
+        queue : mp.Queue or None, optional
+            The target queue. If None, the shared input queue is used. The
+            default is None.
+        """
+        _queue = self._queues["queue_input"] if queue is None else queue
+        if tasks[0] is None or not self.use_chunks:
+            for _task in tasks:
+                _queue.put(_task)
+            return
+        self._chunks["n_in_flight"] += len(tasks)
+        _queue.put(TaskChunk(tasks))
+
+    def _update_chunk_size(self, chunk: TaskChunk) -> None:
+        """
+        Update the chunk size based on the runtime of a processed chunk.
+
+        The chunk size is adjusted to match the targeted processing time per
+        chunk. To prevent oscillations, the chunk size can at most double
+        with each update.
+
+        Parameters
+        ----------
+        chunk : TaskChunk
+            The processed TaskChunk.
+        """
+        self._chunks["n_in_flight"] = max(0, self._chunks["n_in_flight"] - len(chunk))
+        if not self._chunks["adaptive"] or chunk.runtime <= 0 or len(chunk) == 0:
+            return
+        _target_size = int(ADAPTIVE_CHUNK_TARGET_TIME * len(chunk) / chunk.runtime)
+        self._chunks["size"] = max(
+            1, min(_target_size, 2 * self.chunk_size, ADAPTIVE_CHUNK_MAX_SIZE)
+        )
+
+    def _wait_for_queue_items(self) -> None:
+        """
+        Block until the workers have sent any items or the timeout expired.
+
+        The timeout is required to periodically check for new tasks and
+        changes in the thread's flags.
+        """
+        wait_for_queues(
+            [
+                self._queues["queue_output"],
+                self._queues["queue_signal"],
+                self._queues["queue_shutting_down"],
+            ],
+            timeout=CONTROLLER_WAIT_TIMEOUT,
+        )
 
     def _get_and_emit_all_queue_items(self) -> None:
         """
         Get all items from the queue and emit them as signals.
+
+        Output items of pool workers are tagged with their run ID. Items from
+        other runs are discarded.
         """
         while True:
             try:
@@ -418,16 +798,37 @@ class WorkerController(QtCore.QThread):
             except Empty:
                 pass
             try:
-                _task, _results = self._queues["queue_output"].get_nowait()
-                if _task is None and _results is None:
-                    self._workers_done += 1
-                    logger.debug("WorkerController: Received None result - Worker done")
-                else:
-                    self.sig_results.emit(_task, _results)
-                    self._progress_done += 1
-                    self.sig_progress.emit(self.progress)
+                _item = self._queues["queue_output"].get_nowait()
             except Empty:
                 break
+            if len(_item) > 2 and _item[2] != self._run_id:
+                logger.debug("WorkerController: Discarded output of run %s" % _item[2])
+                continue
+            _task, _results = _item[:2]
+            if _task is None and _results is None:
+                self._workers_done += 1
+                logger.debug("WorkerController: Received None result - Worker done")
+            elif isinstance(_task, TaskChunk):
+                self._update_chunk_size(_task)
+                for _chunk_task, _chunk_results in zip(_task, _results):
+                    self._emit_results(_chunk_task, _chunk_results)
+            else:
+                self._emit_results(_task, _results)
+
+    def _emit_results(self, task: Any, results: Any) -> None:
+        """
+        Emit the results of a single task and the updated progress.
+
+        Parameters
+        ----------
+        task : Any
+            The task.
+        results : Any
+            The results of the task.
+        """
+        self.sig_results.emit(task, results)
+        self._progress_done += 1
+        self.sig_progress.emit(self.progress)
 
     def _check_if_workers_finished(self) -> None:
         """
@@ -438,8 +839,9 @@ class WorkerController(QtCore.QThread):
         try:
             for _worker in self._workers:
                 _val = self._queues["queue_shutting_down"].get_nowait()
-                self._workers_shutdown += 1
-                logger.debug("WorkerController: Worker shutting down.")
+                if self._run_id is None or _val == self._run_id:
+                    self._workers_shutdown += 1
+                    logger.debug("WorkerController: Worker shutting down.")
         except Empty:
             pass
         if max(self._workers_done, self._workers_shutdown) >= len(self._workers):
@@ -465,6 +867,9 @@ class WorkerController(QtCore.QThread):
 
     def join_workers(self) -> None:
         """Join the workers back to the thread and free their resources."""
+        if self._worker_pool is not None:
+            self._release_pool_workers()
+            return
         for _worker in self._workers:
             self._queues["queue_stop"].put(1)
         for _worker in self._workers:
@@ -474,15 +879,99 @@ class WorkerController(QtCore.QThread):
                 self._queues["queue_shutting_down"].get_nowait()
             except Empty:
                 break
+        self._close_queues(self._local_queues)
+        self._local_queues = []
         self._workers = []
         self.flags["active"] = False
         self._lock_manager.shutdown()
         logger.debug("WorkerController: Joined all workers")
 
+    def _release_pool_workers(self) -> None:
+        """
+        Stop the current run of the WorkerPool's workers and keep them alive.
+
+        The method waits for all workers to finish the current run and clears
+        any leftover items from the pool's queues. Results which have not been
+        received yet are discarded to allow waiting workers to finish.
+
+        If not all workers have confirmed that they finished the run within
+        the POOL_RUN_FINISH_TIMEOUT, the WorkerPool is shut down instead to
+        prevent busy workers from interfering with the next run. The pool
+        will be restarted with new queues for the next run.
+        """
+        for _ in self._workers:
+            self._queues["queue_stop"].put(self._stop_signal)
+        _n_finished = 0
+        _t0 = time.time()
+        while _n_finished < len(self._workers):
+            if time.time() - _t0 >= POOL_RUN_FINISH_TIMEOUT:
+                logger.debug("WorkerController: Pool worker finish timeout")
+                self._restart_worker_pool()
+                return
+            try:
+                while True:
+                    self._queues["queue_output"].get_nowait()
+            except Empty:
+                pass
+            try:
+                _val = self._queues["queue_finished"].get(
+                    timeout=CONTROLLER_WAIT_TIMEOUT
+                )
+            except Empty:
+                continue
+            if _val == self._run_id:
+                _n_finished += 1
+        self._worker_pool.clear_queues()
+        self._reset_pool_run()
+        logger.debug("WorkerController: Released all pool workers")
+
+    def _restart_worker_pool(self) -> None:
+        """
+        Shut down the WorkerPool and use its new queues for later runs.
+
+        The queues are re-created because terminated workers might have left
+        them in an inconsistent state.
+        """
+        self._worker_pool.shutdown()
+        _old_mp_kwargs = self._mp_kwargs
+        self._queues = self._worker_pool.queues
+        self._mp_kwargs = self._worker_pool.mp_kwargs
+        self._processor["args"] = tuple(
+            self._mp_kwargs if _arg is _old_mp_kwargs else _arg
+            for _arg in self._processor["args"]
+        )
+        self._reset_pool_run()
+        logger.debug("WorkerController: Restarted the worker pool")
+
+    def _reset_pool_run(self) -> None:
+        """Reset the references to the finished run of the WorkerPool."""
+        self._workers = []
+        self._local_queues = []
+        self._run_id = None
+        self.flags["active"] = False
+
     def join_queues(self) -> None:
         """Joining all active queues."""
+        if self._worker_pool is not None:
+            # The queues are owned by the WorkerPool and must be kept open.
+            self._queues = {}
+            return
         logger.debug("WorkerController: Telling queues to join.")
-        for _queue in self._queues.values():
+        self._close_queues(self._queues.values())
+        self._queues = {}
+        logger.debug("WorkerController: Joined all queues.")
+
+    @staticmethod
+    def _close_queues(queues: Iterable[mp.Queue]) -> None:
+        """
+        Remove all items from the queues and close them.
+
+        Parameters
+        ----------
+        queues : Iterable[mp.Queue]
+            The queues.
+        """
+        for _queue in queues:
             while True:
                 try:
                     _queue.get_nowait()
@@ -490,8 +979,6 @@ class WorkerController(QtCore.QThread):
                     break
             _queue.close()
             _queue.join_thread()
-        self._queues = {}
-        logger.debug("WorkerController: Joined all queues.")
 
     def _wait_for_worker_finished_signals(self, timeout: float = 10) -> None:
         """
@@ -543,7 +1030,8 @@ class WorkerController(QtCore.QThread):
         """
         logger.debug("WorkerController: Exiting thread")
         self.join_queues()
-        self._lock_manager.shutdown()
+        if self._lock_manager is not None:
+            self._lock_manager.shutdown()
         if code is not None:
             super().exit(code)
         else:
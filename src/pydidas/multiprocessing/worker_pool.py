@@ -0,0 +1,411 @@
+# This file is part of pydidas.
+#
+# Copyright 2026, Helmholtz-Zentrum Hereon
+# SPDX-License-Identifier: GPL-3.0-only
+#
+# pydidas is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# Pydidas is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pydidas. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module with the WorkerPool singleton which keeps worker processes alive
+between several runs of a WorkerController.
+"""
+
+__author__ = "Malte Storm"
+__copyright__ = "Copyright 2026, Helmholtz-Zentrum Hereon"
+__license__ = "GPL-3.0-only"
+__maintainer__ = "Malte Storm"
+__status__ = "Production"
+__all__ = ["WorkerPool", "PoolRun", "pool_worker_func"]
+
+
+import multiprocessing as mp
+from queue import Empty
+from typing import Any, Callable
+
+from pydidas.core import SingletonObject
+from pydidas.core.utils import pydidas_logger
+from pydidas.logging_level import LOGGING_LEVEL
+from pydidas.multiprocessing.pydidas_process import PydidasProcess
+
+
+logger = pydidas_logger()
+
+# The placeholder for the multiprocessing configuration in the run arguments.
+# Queues cannot be sent through queues and each worker inserts its own config.
+MP_CONFIG_PLACEHOLDER = "::multiprocessing_config::"
+# The marker to identify the end of a queue while clearing it.
+QUEUE_END_MARKER = "::queue_end_marker::"
+# The timeout to wait for items while clearing the queues.
+QUEUE_CLEAR_TIMEOUT = 0.05
+
+
+class PoolRun:
+    """
+    The definition of a single run of a persistent worker.
+
+    Parameters
+    ----------
+    run_id : int
+        The unique ID of the run.
+    func : Callable
+        The function to be called by the worker. The function must be
+        defined on module level to allow pickling.
+    args : tuple
+        The function arguments. The MP_CONFIG_PLACEHOLDER will be replaced
+        with the worker's multiprocessing configuration.
+    kwargs : dict
+        The function keyword arguments.
+    """
+
+    __slots__ = ("run_id", "func", "args", "kwargs")
+
+    def __init__(self, run_id: int, func: Callable, args: tuple, kwargs: dict):
+        self.run_id = run_id
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+    def __repr__(self) -> str:
+        return f"PoolRun({self.run_id}, {self.func.__name__})"
+
+
+def pool_worker_func(multiprocessing_config: dict) -> None:
+    """
+    Run the main loop of a persistent worker process.
+
+    The worker blocks on its own run queue and calls the function of each
+    received PoolRun. The worker's multiprocessing configuration is updated
+    with the "run_id" and the "worker_state" keys. The worker_state
+    dictionary is kept between runs and allows the called functions to re-use
+    objects from previous runs. The run ID is written to the "queue_finished"
+    queue after each run. A None item terminates the worker.
+
+    Parameters
+    ----------
+    multiprocessing_config : dict
+        The multiprocessing configuration dictionary of the WorkerPool,
+        including the worker's own run queue.
+    """
+    logger.setLevel(multiprocessing_config.get("logging_level", LOGGING_LEVEL))
+    _run_queue = multiprocessing_config.get("queue_run")
+    _worker_state = {}
+    while True:
+        _run = _run_queue.get()
+        if _run is None:
+            break
+        _config = multiprocessing_config | {
+            "run_id": _run.run_id,
+            "worker_state": _worker_state,
+        }
+        _args = tuple(
+            (
+                _config
+                if isinstance(_arg, str) and _arg == MP_CONFIG_PLACEHOLDER
+                else _arg
+            )
+            for _arg in _run.args
+        )
+        try:
+            _run.func(*_args, **_run.kwargs)
+        except Exception as _ex:
+            logger.error("Exception in persistent worker run: %s" % _ex)
+            _worker_state.clear()
+            multiprocessing_config["queue_shutting_down"].put(_run.run_id)
+        multiprocessing_config["queue_finished"].put(_run.run_id)
+
+
+class WorkerPool(SingletonObject):
+    """
+    A persistent pool of worker processes which is re-used for several runs.
+
+    Spawning new worker processes requires re-importing pydidas (and all its
+    dependencies) in every process. The WorkerPool keeps its processes alive
+    between runs to remove this startup cost for repeated processing.
+
+    The WorkerPool owns the queues and the lock which are used for the
+    communication with the workers. WorkerControllers which use the pool
+    submit their runs with the submit_run method. The pool is a singleton
+    and can only be used by one WorkerController at a time.
+    """
+
+    def initialize(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Initialize the WorkerPool.
+
+        Parameters
+        ----------
+        *args : Any
+            Unused positional arguments.
+        **kwargs : Any
+            Unused keyword arguments.
+        """
+        self._workers = []
+        self._run_queues = []
+        self._local_queues = []
+        self._queues = {}
+        self._mp_kwargs = {}
+        self._lock_manager = None
+        self._run_id = 0
+
+    @property
+    def n_workers(self) -> int:
+        """
+        Get the number of worker processes.
+
+        Returns
+        -------
+        int
+            The number of workers.
+        """
+        return len(self._workers)
+
+    @property
+    def workers(self) -> list[PydidasProcess]:
+        """
+        Get the list of worker processes.
+
+        Returns
+        -------
+        list[PydidasProcess]
+            The worker processes.
+        """
+        return self._workers[:]
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Get the flag whether all worker processes are alive.
+
+        Returns
+        -------
+        bool
+            Flag whether the pool is running.
+        """
+        return len(self._workers) > 0 and all(
+            _worker.is_alive() for _worker in self._workers
+        )
+
+    @property
+    def local_queues(self) -> list[mp.Queue]:
+        """
+        Get the local task queues of the workers.
+
+        Returns
+        -------
+        list[mp.Queue]
+            The local queues in the order of the workers.
+        """
+        return self._local_queues[:]
+
+    @property
+    def queues(self) -> dict[str, mp.Queue]:
+        """
+        Get the queues of the pool.
+
+        Returns
+        -------
+        dict[str, mp.Queue]
+            The queues with the names as keys.
+        """
+        if not self._queues:
+            self._create_queues()
+        return self._queues
+
+    @property
+    def mp_kwargs(self) -> dict:
+        """
+        Get the multiprocessing configuration of the pool.
+
+        Returns
+        -------
+        dict
+            The multiprocessing configuration with the queues and lock.
+        """
+        if not self._queues:
+            self._create_queues()
+        return self._mp_kwargs
+
+    def _create_queues(self) -> None:
+        """
+        Create the queues and the lock for communication with the workers.
+        """
+        self._lock_manager = mp.Manager()
+        self._queues = {
+            _key: mp.Queue()
+            for _key in [
+                "queue_input",
+                "queue_output",
+                "queue_stop",
+                "queue_shutting_down",
+                "queue_signal",
+                "queue_finished",
+            ]
+        }
+        self._mp_kwargs = {
+            "logging_level": LOGGING_LEVEL,
+            "lock": self._lock_manager.Lock(),
+            **self._queues,
+        }
+
+    def start(self, n_workers: int) -> list[PydidasProcess]:
+        """
+        Start the worker processes, if required.
+
+        Running workers are kept if their number matches the requested
+        number. Otherwise, the pool is restarted with the new number of
+        workers.
+
+        Each worker receives its own local task queue and the local queues
+        of all other workers to take over their tasks.
+
+        Parameters
+        ----------
+        n_workers : int
+            The number of worker processes.
+
+        Returns
+        -------
+        list[PydidasProcess]
+            The worker processes.
+        """
+        if self.is_running and self.n_workers == n_workers:
+            return self.workers
+        self.stop_workers()
+        _pid = mp.current_process().pid
+        self._run_queues = [mp.Queue() for _ in range(n_workers)]
+        self._local_queues = [mp.Queue() for _ in range(n_workers)]
+        self._workers = [
+            PydidasProcess(
+                target=pool_worker_func,
+                args=(
+                    self.mp_kwargs
+                    | {
+                        "queue_run": _run_queue,
+                        "queue_local": self._local_queues[_i],
+                        "queues_steal": (
+                            self._local_queues[_i + 1 :] + self._local_queues[:_i]
+                        ),
+                    },
+                ),
+                name=f"pydidas_{_pid}_pool_worker-{_i}",
+                daemon=True,
+            )
+            for _i, _run_queue in enumerate(self._run_queues)
+        ]
+        for _i, _worker in enumerate(self._workers):
+            _worker.start()
+            logger.debug("WorkerPool: Started worker %i" % _i)
+        return self.workers
+
+    def submit_run(self, func: Callable, args: tuple, kwargs: dict) -> int:
+        """
+        Submit a new run to all workers.
+
+        Each worker has its own run queue to guarantee that every worker
+        receives exactly one PoolRun.
+
+        The multiprocessing configuration of the pool in the args will be
+        replaced by a placeholder because queues cannot be pickled.
+
+        Parameters
+        ----------
+        func : Callable
+            The function to be called by the workers.
+        args : tuple
+            The function arguments.
+        kwargs : dict
+            The function keyword arguments.
+
+        Returns
+        -------
+        int
+            The ID of the new run.
+        """
+        self._run_id += 1
+        _args = tuple(
+            MP_CONFIG_PLACEHOLDER if _arg is self._mp_kwargs else _arg for _arg in args
+        )
+        for _run_queue in self._run_queues:
+            _run_queue.put(PoolRun(self._run_id, func, _args, kwargs))
+        return self._run_id
+
+    def clear_queues(self) -> None:
+        """
+        Remove all leftover items of a finished run from the queues.
+
+        This method must only be called when all workers are idle. The input,
+        stop and local queues are cleared up to an end marker because items
+        may still be in transit.
+        """
+        for _queue in [
+            self._queues["queue_input"],
+            self._queues["queue_stop"],
+            *self._local_queues,
+        ]:
+            _queue.put(QUEUE_END_MARKER)
+            while True:
+                try:
+                    _item = _queue.get(timeout=QUEUE_CLEAR_TIMEOUT)
+                except Empty:
+                    break
+                if isinstance(_item, str) and _item == QUEUE_END_MARKER:
+                    break
+        for _key in [
+            "queue_output",
+            "queue_signal",
+            "queue_shutting_down",
+            "queue_finished",
+        ]:
+            while True:
+                try:
+                    self._queues[_key].get(timeout=QUEUE_CLEAR_TIMEOUT)
+                except Empty:
+                    break
+
+    def stop_workers(self, timeout: float = 2) -> None:
+        """
+        Stop and join all worker processes.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum time to wait for each worker (in seconds). Workers
+            which have not finished are terminated. The default is 2.
+        """
+        for _run_queue in self._run_queues:
+            _run_queue.put(None)
+        for _worker in self._workers:
+            _worker.join(timeout)
+            if _worker.is_alive():
+                _worker.terminate()
+                _worker.join()
+        for _queue in self._run_queues + self._local_queues:
+            _queue.close()
+        self._workers = []
+        self._run_queues = []
+        self._local_queues = []
+        logger.debug("WorkerPool: Stopped all workers")
+
+    def shutdown(self) -> None:
+        """
+        Stop all workers and release the queues and the lock manager.
+        """
+        self.stop_workers()
+        for _queue in self._queues.values():
+            _queue.close()
+            _queue.join_thread()
+        if self._lock_manager is not None:
+            self._lock_manager.shutdown()
+        self._queues = {}
+        self._mp_kwargs = {}
+        self._lock_manager = None
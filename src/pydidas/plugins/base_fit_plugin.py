@@ -33,8 +33,12 @@ from scipy.optimize import least_squares
 
 from pydidas.core import Dataset, UserConfigError, get_generic_param_collection
 from pydidas.core.constants import PROC_PLUGIN, PROC_PLUGIN_INTEGRATED
-from pydidas.core.fitting import FitFuncMeta
+from pydidas.core.fitting import FitFuncMeta, batch_least_squares, batch_profile
 from pydidas.core.utils import process_1d_with_multi_input_dims
+from pydidas.core.utils.iterable_utils import (
+    insert_item_in_tuple,
+    remove_item_at_index_from_iterable,
+)
 from pydidas.plugins.base_proc_plugin import ProcPlugin
 
 
@@ -58,12 +62,17 @@ class BaseFitPlugin(ProcPlugin):
         "fit_upper_limit",
         "fit_sigma_threshold",
         "fit_min_peak_height",
+        "fit_warm_start",
     )
     input_data_dim = -1
     output_data_dim = -1
     num_peaks = 1
     new_dataset = True
-    advanced_parameters = ["fit_sigma_threshold", "fit_min_peak_height"]
+    advanced_parameters = [
+        "fit_sigma_threshold",
+        "fit_min_peak_height",
+        "fit_warm_start",
+    ]
     has_unique_parameter_config_widget = True
 
     def __init__(self, *args: tuple, **kwargs: dict):
@@ -78,7 +87,9 @@ class BaseFitPlugin(ProcPlugin):
             "range_slice": None,
             "settings_updated_from_data": False,
             "data_x_hash": -1,
+            "warm_start_params": None,
         }
+        self.reset_fit_statistics()
 
     @property
     def detailed_results(self) -> dict:
@@ -104,15 +115,51 @@ class BaseFitPlugin(ProcPlugin):
         """
         return [item.strip() for item in self.get_param_value("fit_output").split(";")]
 
+    @property
+    def fit_statistics(self) -> dict[str, int]:
+        """
+        Get the statistics of the fits performed by this plugin.
+
+        The statistics include the number of fits, the number of fits which
+        used the results of the previous scan point as starting values and
+        the number of these fits which were rejected and repeated with
+        estimated starting values.
+
+        Returns
+        -------
+        dict[str, int]
+            The fit statistics.
+        """
+        return self._fit_statistics.copy()
+
+    def reset_fit_statistics(self) -> None:
+        """Reset the fit statistics."""
+        self._fit_statistics = {
+            "n_fits": 0,
+            "n_warm_start": 0,
+            "n_warm_start_rejected": 0,
+        }
+
+    def reset_run_state(self) -> None:
+        """
+        Reset the warm start parameters and the fit statistics.
+        """
+        self._config["warm_start_params"] = None
+        self.reset_fit_statistics()
+
     def pre_execute(self):
         """
         Set up the required functions and fit variable labels.
         """
         self._fitter = FitFuncMeta.get_fitter(self.get_param_value("fit_func"))
+        self._config["jacobian"] = (
+            self._fitter.delta_jacobian if self._fitter.analytic_jacobian else "2-point"
+        )
         self._config["range_slice"] = None
         self._config["settings_updated_from_data"] = False
         self._config["min_peak_height"] = self.get_param_value("fit_min_peak_height")
         self._config["sigma_threshold"] = self.get_param_value("fit_sigma_threshold")
+        self._config["warm_start"] = self.get_param_value("fit_warm_start")
         self._config["result_shape"] = (self.num_peaks, len(self.fit_outputs))
         for _key in ["param_bounds_low", "param_bounds_high", "param_labels"]:
             self._config[_key] = getattr(self._fitter, _key).copy()
@@ -129,8 +176,8 @@ class BaseFitPlugin(ProcPlugin):
             self._config["param_bounds_high"].append(np.inf)
         self.update_fit_param_bounds()
         self.create_fit_start_param_dict()
+        self.reset_run_state()
 
-    @process_1d_with_multi_input_dims
     def execute(self, data: Dataset, **kwargs: dict) -> tuple[Dataset, dict]:
         """
         Fit a peak to the data.
@@ -139,6 +186,36 @@ class BaseFitPlugin(ProcPlugin):
         the residual and that the fit Parameters are included in the kwarg
         metadata.
 
+        Multi-dimensional input data is fitted in one batch for all profiles,
+        unless detailed results are requested.
+
+        If the "fit_warm_start" Parameter is set, the accepted fit results of
+        the previous call are used as starting values. Fits from these starting
+        values which are rejected are repeated with estimated starting values.
+
+        Parameters
+        ----------
+        data : pydidas.core.Dataset
+            The input Dataset
+        **kwargs : dict
+            Any calling keyword arguments.
+
+        Returns
+        -------
+        _data : pydidas.core.Dataset
+            The image data.
+        kwargs : dict
+            Any calling kwargs, appended by any changes in the function.
+        """
+        if data.ndim > 1 and not kwargs.get("store_details", False):
+            return self._execute_batch(data, **kwargs)
+        return self._execute_single(data, **kwargs)
+
+    @process_1d_with_multi_input_dims
+    def _execute_single(self, data: Dataset, **kwargs: dict) -> tuple[Dataset, dict]:
+        """
+        Fit a peak to each 1D profile of the data individually.
+
         Parameters
         ----------
         data : pydidas.core.Dataset
@@ -155,39 +232,379 @@ class BaseFitPlugin(ProcPlugin):
         """
         self.prepare_input_data(data)
         if not self.check_min_peak_height():
+            self._config["warm_start_params"] = None
             return self.create_result_dataset(valid=False), kwargs
 
-        _startguess = self._fitter.guess_fit_start_params(
-            self._data_x,
-            self._data,
-            bg_order=self.get_param_value("fit_bg_order"),
-            bounds=(
-                self._config["param_bounds_low"],
-                self._config["param_bounds_high"],
-            ),
-            **self._fit_presets,
-        )
+        self._fit_statistics["n_fits"] += 1
+        _startguess = self._get_warm_start_params((len(self._config["param_labels"]),))
+        if _startguess is not None:
+            _results = self._fit_profile(_startguess)
+            if self._fit_accepted(_results):
+                self._fit_statistics["n_warm_start"] += 1
+            else:
+                self._fit_statistics["n_warm_start_rejected"] += 1
+                _startguess = None
+        if _startguess is None:
+            _startguess = self._guess_start_params(self._data)
+            _results = self._fit_profile(_startguess)
+        if self._config["warm_start"]:
+            self._config["warm_start_params"] = (
+                np.array(tuple(self._fit_params.values()))
+                if self._fit_accepted(_results)
+                else None
+            )
+        kwargs = kwargs | {
+            "fit_params": self._fit_params,
+            "fit_func": self._fitter.name,
+            "fitted_axis_label": self._data.axis_labels[0],
+            "fitted_axis_unit": self._data.axis_units[0],
+        }
+        if kwargs.get("store_details", False):
+            self._details = {None: self.create_detailed_results(_results, _startguess)}
+        return _results, kwargs
+
+    def _fit_profile(self, start_params: np.ndarray) -> Dataset:
+        """
+        Fit the stored 1D profile and create the results.
+
+        Parameters
+        ----------
+        start_params : np.ndarray
+            The starting parameters for the fit.
+
+        Returns
+        -------
+        pydidas.core.Dataset
+            The results of the fit.
+        """
         _res = least_squares(
             self._fitter.delta,
-            _startguess,
+            start_params,
             args=(self._data_x, self._data.array),
             bounds=(
                 self._config["param_bounds_low"],
                 self._config["param_bounds_high"],
             ),
+            jac=self._config["jacobian"],
         )
         _res_c = self._fitter.sort_fitted_peaks_by_position(tuple(_res.x))
         self._fit_params = dict(zip(self._config["param_labels"], _res_c))
-        kwargs = kwargs | {
-            "fit_params": self._fit_params,
-            "fit_func": self._fitter.name,
-            "fitted_axis_label": self._data.axis_labels[0],
-            "fitted_axis_unit": self._data.axis_units[0],
-        }
-        _results = self.create_result_dataset()
-        if kwargs.get("store_details", False):
-            self._details = {None: self.create_detailed_results(_results, _startguess)}
-        return _results, kwargs
+        return self.create_result_dataset()
+
+    def _fit_accepted(self, results: Dataset) -> bool:
+        """
+        Check whether the fit results have passed the residual check.
+
+        Parameters
+        ----------
+        results : pydidas.core.Dataset
+            The results created by the create_result_dataset method.
+
+        Returns
+        -------
+        bool
+            Flag whether the fit has been accepted.
+        """
+        return bool(
+            results.metadata["fit_residual_std"] <= self._config["sigma_threshold"]
+        )
+
+    def _guess_start_params(self, y: np.ndarray) -> tuple[float]:
+        """
+        Estimate the starting parameters for the fit of a profile.
+
+        Parameters
+        ----------
+        y : np.ndarray
+            The cropped profile.
+
+        Returns
+        -------
+        tuple[float]
+            The starting parameters.
+        """
+        return self._fitter.guess_fit_start_params(
+            self._data_x,
+            y,
+            bg_order=self.get_param_value("fit_bg_order"),
+            bounds=(
+                self._config["param_bounds_low"],
+                self._config["param_bounds_high"],
+            ),
+            **self._fit_presets,
+        )
+
+    def _get_warm_start_params(self, shape: tuple[int]) -> np.ndarray | None:
+        """
+        Get the fit results of the previous call as starting parameters.
+
+        Parameters
+        ----------
+        shape : tuple[int]
+            The required shape of the parameters.
+
+        Returns
+        -------
+        np.ndarray | None
+            The previous fit results, limited to the fit bounds, or None if
+            no matching previous results are available.
+        """
+        _params = self._config["warm_start_params"]
+        if not self._config["warm_start"] or _params is None or _params.shape != shape:
+            return None
+        return np.clip(
+            _params, self._config["param_bounds_low"], self._config["param_bounds_high"]
+        )
+
+    def _execute_batch(self, data: Dataset, **kwargs: dict) -> tuple[Dataset, dict]:
+        """
+        Fit a peak to all 1D profiles of multi-dimensional data in one batch.
+
+        The starting parameters are guessed for each profile and all profiles
+        are fitted at once with the vectorized batch_least_squares function.
+        The results have the same layout as the results of individual fits:
+        The metadata of the results are taken from the first profile and the
+        returned kwargs from the last profile.
+
+        Parameters
+        ----------
+        data : pydidas.core.Dataset
+            The multi-dimensional input Dataset
+        **kwargs : dict
+            Any calling keyword arguments.
+
+        Returns
+        -------
+        _data : pydidas.core.Dataset
+            The fit results for all profiles.
+        kwargs : dict
+            Any calling kwargs, appended by the fit parameters of the last
+            profile.
+        """
+        _dim = np.mod(self.get_param_value("process_data_dim"), data.ndim)
+        _other_shape = remove_item_at_index_from_iterable(data.shape, _dim)
+        self.prepare_input_data(
+            data[insert_item_in_tuple((0,) * len(_other_shape), _dim, slice(None))]
+        )
+        _y = np.moveaxis(data.array, _dim, -1).reshape(-1, data.shape[_dim])
+        _y = _y[:, self._config["range_slice"]].astype(float)
+        _params = self._fit_batch(_y)
+        _results, _residuals = self._create_batch_results(_params, _y)
+        if self._config["warm_start"]:
+            self._config["warm_start_params"] = np.where(
+                (_residuals <= self._config["sigma_threshold"])[:, None],
+                _params,
+                np.nan,
+            )
+        _labels = self._config["param_labels"]
+        _fit_params = [
+            None if np.isnan(_p[0]) else dict(zip(_labels, _p.tolist()))
+            for _p in _params[[0, -1]]
+        ]
+        self._fit_params = {} if _fit_params[0] is None else _fit_params[0]
+        _first_result = self.create_result_dataset(valid=False)
+        _first_result.metadata["fit_residual_std"] = _residuals[0]
+        if _fit_params[1] is not None:
+            self._fit_params = _fit_params[1]
+            kwargs = kwargs | {
+                "fit_params": self._fit_params,
+                "fit_func": self._fitter.name,
+                "fitted_axis_label": self._data.axis_labels[0],
+                "fitted_axis_unit": self._data.axis_units[0],
+            }
+        _results = np.moveaxis(
+            _results.reshape(_other_shape + _first_result.shape),
+            tuple(range(len(_other_shape), len(_other_shape) + _first_result.ndim)),
+            tuple(range(_dim, _dim + _first_result.ndim)),
+        )
+        _dataset = Dataset(
+            _results,
+            data_unit=_first_result.data_unit,
+            data_label=_first_result.data_label,
+            metadata=_first_result.metadata,
+        )
+        for _prop in ["axis_labels", "axis_units", "axis_ranges"]:
+            _vals = list(getattr(data, _prop).values())
+            _vals[_dim : _dim + 1] = list(getattr(_first_result, _prop).values())
+            setattr(_dataset, _prop, _vals)
+        return _dataset, kwargs
+
+    def _fit_batch(self, y: np.ndarray) -> np.ndarray:
+        """
+        Fit all profiles and return the sorted fit parameters.
+
+        Profiles which have not converged or which fail the checks of the
+        fit quality are fitted again individually, like in the _execute_single
+        method, and the better fit is used. This guards against local minima
+        which the batch fit can reach from poor starting parameters. Profiles
+        which were started from the accepted results of the previous call are
+        fitted again from estimated starting parameters.
+
+        Parameters
+        ----------
+        y : np.ndarray
+            The cropped profiles in an array of shape (N, n_points).
+
+        Returns
+        -------
+        np.ndarray
+            The fitted parameters of shape (N, n_params). The parameters of
+            profiles which were not fitted (because of non-finite values or an
+            insufficient peak height) are NaN.
+        """
+        _bg_order = self.get_param_value("fit_bg_order")
+        _bounds = (self._config["param_bounds_low"], self._config["param_bounds_high"])
+        _min_peak = self._config["min_peak_height"]
+        _valid = np.all(np.isfinite(y), axis=1)
+        _params = np.full((y.shape[0], len(self._config["param_labels"])), np.nan)
+        _warm_params = self._get_warm_start_params(_params.shape)
+        _warm = np.zeros(y.shape[0], dtype=bool)
+        if _warm_params is not None:
+            _warm = np.all(np.isfinite(_warm_params), axis=1)
+        for _index in np.flatnonzero(_valid):
+            if _min_peak is not None:
+                _tmp_y, _ = self._fitter.estimate_background_params(
+                    self._data_x, y[_index], _bg_order
+                )
+                if np.amax(_tmp_y) < _min_peak:
+                    _valid[_index] = False
+                    continue
+            _params[_index] = (
+                _warm_params[_index]
+                if _warm[_index]
+                else self._guess_start_params(y[_index])
+            )
+        if not np.any(_valid):
+            return _params
+        _warm = _warm[_valid]
+        _start = _params[_valid]
+        _params[_valid], _success = batch_least_squares(
+            self._fitter, _start, self._data_x, y[_valid], bounds=_bounds
+        )
+        _okay, _ = self._check_batch_fits(_params[_valid], y[_valid])
+        _rejected = ~(_success & _okay)
+        self._fit_statistics["n_fits"] += _start.shape[0]
+        self._fit_statistics["n_warm_start"] += int(np.sum(_warm & ~_rejected))
+        self._fit_statistics["n_warm_start_rejected"] += int(np.sum(_warm & _rejected))
+        for _index, _c0, _is_warm in zip(
+            np.flatnonzero(_valid)[_rejected], _start[_rejected], _warm[_rejected]
+        ):
+            if _is_warm:
+                _c0 = self._guess_start_params(y[_index])
+            _res = least_squares(
+                self._fitter.delta,
+                _c0,
+                args=(self._data_x, y[_index]),
+                bounds=_bounds,
+                jac=self._config["jacobian"],
+            )
+            _delta = self._fitter.delta(_params[_index], self._data_x, y[_index])
+            if 2 * _res.cost <= np.sum(_delta**2):
+                _params[_index] = _res.x
+        return self._sort_batch_peaks_by_position(_params)
+
+    def _sort_batch_peaks_by_position(self, params: np.ndarray) -> np.ndarray:
+        """
+        Sort the peaks of all fitted profiles by their center positions.
+
+        Parameters
+        ----------
+        params : np.ndarray
+            The fit parameters of shape (N, n_params).
+
+        Returns
+        -------
+        np.ndarray
+            The sorted fit parameters.
+        """
+        _n_peaks = self._fitter.num_peaks
+        if _n_peaks == 1:
+            return params
+        _n_peak_params = _n_peaks * self._fitter.num_peak_params
+        _order = np.argsort(params[:, self._fitter._center_param_indices()], axis=1)
+        _peaks = np.take_along_axis(
+            params[:, :_n_peak_params].reshape(params.shape[0], _n_peaks, -1),
+            _order[..., None],
+            axis=1,
+        )
+        return np.concatenate(
+            (_peaks.reshape(params.shape[0], -1), params[:, _n_peak_params:]), axis=1
+        )
+
+    def _check_batch_fits(
+        self, params: np.ndarray, y: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Check the center positions and the residuals of all fitted profiles.
+
+        Parameters
+        ----------
+        params : np.ndarray
+            The fit parameters of shape (N, n_params).
+        y : np.ndarray
+            The cropped profiles of shape (N, n_points).
+
+        Returns
+        -------
+        valid : np.ndarray
+            The flags of shape (N,) whether the fits are valid.
+        residuals : np.ndarray
+            The normalized standard deviations of the fits of shape (N,). The
+            residuals of fits with centers outside of the data range are NaN.
+        """
+        _residuals = np.full(y.shape[0], np.nan)
+        _centers = params[:, self._fitter._center_param_indices()]
+        _valid = np.all(
+            (self._data_x[0] <= _centers) & (_centers <= self._data_x[-1]), axis=1
+        )
+        _datafit = batch_profile(self._fitter, params[_valid], self._data_x)
+        _residuals[_valid] = np.abs(
+            np.std(y[_valid] - _datafit, axis=1) / np.mean(y[_valid], axis=1)
+        )
+        _valid[_valid] = _residuals[_valid] <= self._config["sigma_threshold"]
+        return _valid, _residuals
+
+    def _create_batch_results(
+        self, params: np.ndarray, y: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Create the results for all fitted profiles.
+
+        The same checks as in the create_result_dataset method are applied to
+        each fit.
+
+        Parameters
+        ----------
+        params : np.ndarray
+            The fit parameters of shape (N, n_params).
+        y : np.ndarray
+            The cropped profiles of shape (N, n_points).
+
+        Returns
+        -------
+        results : np.ndarray
+            The results of shape (N, num_peaks, n_outputs), squeezed for a
+            single peak.
+        residuals : np.ndarray
+            The normalized standard deviations of the fits of shape (N,).
+        """
+        _results = np.full((y.shape[0],) + self._config["result_shape"], np.nan)
+        _valid, _residuals = self._check_batch_fits(params, y)
+        _c = params[_valid].T
+        for _i, _key in enumerate(self.fit_outputs):
+            if _key in ["position", "amplitude", "area", "FWHM"]:
+                _values = getattr(self._fitter, _key.lower())(_c)
+            elif _key == "total count intensity":
+                _dx = self._data_x[1] - self._data_x[0]
+                _values = np.asarray(self._fitter.area(_c)) / _dx
+            elif _key == "background at peak":
+                _values = self._fitter.background_at_peak(_c)
+            else:
+                continue
+            _results[_valid, :, _i] = np.asarray(_values).T
+        if self.num_peaks == 1:
+            _results = _results.squeeze(axis=1)
+        return _results, _residuals
 
     def create_result_dataset(self, valid: bool = True) -> Dataset:
         """
@@ -28,13 +28,20 @@ __all__ = ["InputPlugin"]
 
 
 import time
+from itertools import chain, islice
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 import numpy as np
 
 from pydidas.contexts import ScanContext
-from pydidas.core import Dataset, FileReadError, UserConfigError, get_generic_parameter
+from pydidas.core import (
+    Dataset,
+    FileReadError,
+    FramePrefetcher,
+    UserConfigError,
+    get_generic_parameter,
+)
 from pydidas.core.constants import INPUT_PLUGIN
 from pydidas.plugins.base_plugin import BasePlugin
 
@@ -75,6 +82,10 @@ class InputPlugin(BasePlugin):
         self._config["pre_executed"] = False
         self._base_dir = Path()
         self._filename = ""
+        self._prefetcher = None
+        self._prefetch_depth = 0
+        self._upcoming_ordinals = []
+        self.reset_io_statistics()
         if self.base_output_data_dim == 2:
             self.add_params(
                 get_generic_parameter("roi_ylow"),
@@ -166,6 +177,220 @@ class InputPlugin(BasePlugin):
         ) + self._SCAN.get_param_value("pattern_number_offset")
         return self._base_dir / self._filename.format(index=_file_index)
 
+    def get_frame_locality_key(self, frame_index: int) -> tuple[int, int]:
+        """
+        Get the locality key of a frame.
+
+        Frames with the same locality key are stored in the same file and in
+        the same storage chunk. The generic implementation only uses the file
+        index and assumes a single chunk per file.
+
+        Parameters
+        ----------
+        frame_index : int
+            The index of the frame.
+
+        Returns
+        -------
+        tuple[int, int]
+            The index of the file and the index of the chunk in the file.
+        """
+        return frame_index // self.get_param_value("_counted_images_per_file"), 0
+
+    def get_locality_key(self, ordinal: int) -> tuple[int, int]:
+        """
+        Get the locality key of a scan point.
+
+        Parameters
+        ----------
+        ordinal : int
+            The ordinal index of the scan point.
+
+        Returns
+        -------
+        tuple[int, int]
+            The locality key of the first frame of the scan point.
+        """
+        return self.get_frame_locality_key(
+            self._SCAN.get_frame_indices_from_ordinal(ordinal)[0]
+        )
+
+    @property
+    def io_statistics(self) -> dict[str, int]:
+        """
+        Get the I/O statistics of the frames read by this plugin.
+
+        The statistics include the number of frames, the number of file opens
+        (i.e. frames read from a different file than the previous frame) and
+        the number of chunk cache hits (i.e. frames read from the same file
+        and storage chunk as the previous frame).
+
+        Returns
+        -------
+        dict[str, int]
+            The I/O statistics.
+        """
+        return self._io_statistics.copy()
+
+    def reset_io_statistics(self) -> None:
+        """Reset the I/O statistics."""
+        self._io_statistics = {"n_frames": 0, "file_opens": 0, "chunk_cache_hits": 0}
+        self._last_locality_key = None
+
+    def _update_io_statistics(self, frame_index: int) -> None:
+        """
+        Update the I/O statistics for a frame which is read.
+
+        Parameters
+        ----------
+        frame_index : int
+            The index of the frame.
+        """
+        _key = self.get_frame_locality_key(frame_index)
+        self._io_statistics["n_frames"] += 1
+        if self._last_locality_key is None or _key[0] != self._last_locality_key[0]:
+            self._io_statistics["file_opens"] += 1
+        elif _key == self._last_locality_key:
+            self._io_statistics["chunk_cache_hits"] += 1
+        self._last_locality_key = _key
+
+    @property
+    def prefetch_depth(self) -> int:
+        """
+        Get the number of frames of upcoming scan points which are read ahead.
+
+        Returns
+        -------
+        int
+            The prefetch depth. A value of 0 means that prefetching is disabled.
+        """
+        return 0 if self._prefetcher is None else self._prefetch_depth
+
+    @property
+    def prefetch_statistics(self) -> dict[str, int]:
+        """
+        Get the statistics of the prefetched frames.
+
+        Returns
+        -------
+        dict[str, int]
+            The number of frames which were used from the prefetched frames
+            (hits), which had not been prefetched (misses) and which were
+            discarded. All values are 0 if prefetching is disabled.
+        """
+        if self._prefetcher is None:
+            return {"hits": 0, "misses": 0, "discarded": 0}
+        return self._prefetcher.statistics
+
+    def configure_prefetching(self, depth: int, max_size: float = 256) -> None:
+        """
+        Configure reading frames ahead in a pool of background threads.
+
+        When prefetching is enabled, all frames of the current scan point and
+        the frames of the next upcoming scan points (as given by the
+        set_upcoming_ordinals method) are read in background threads while
+        the current frame is being processed. Only frames which are read
+        without additional keyword arguments are prefetched.
+
+        Parameters
+        ----------
+        depth : int
+            The number of frames of upcoming scan points to be read ahead. A
+            value of 0 disables prefetching and stops the background threads.
+        max_size : float, optional
+            The maximum size of all prefetched frames in MB. The default is 256.
+        """
+        if self._prefetcher is not None:
+            self._prefetcher.shutdown()
+            self._prefetcher = None
+        self._prefetch_depth = depth
+        self._upcoming_ordinals = []
+        if depth > 0:
+            self._prefetcher = FramePrefetcher(
+                self.get_frame, max_size=max_size, n_threads=min(depth, 4)
+            )
+
+    def set_upcoming_ordinals(self, ordinals: Iterable[int]) -> None:
+        """
+        Set the ordinals of the scan points which will be processed next.
+
+        The frames of these scan points are read ahead if prefetching is
+        enabled.
+
+        Parameters
+        ----------
+        ordinals : Iterable[int]
+            The ordinal indices of the upcoming scan points in order of
+            processing.
+        """
+        self._upcoming_ordinals = list(islice(ordinals, self.prefetch_depth))
+
+    def _request_prefetch(self, frame_indices: list[int]) -> None:
+        """
+        Request the frames of the current and the upcoming scan points.
+
+        Parameters
+        ----------
+        frame_indices : list[int]
+            The indices of the frames of the current scan point.
+        """
+        _upcoming_frames = chain.from_iterable(
+            self._SCAN.get_frame_indices_from_ordinal(_ordinal)
+            for _ordinal in self._upcoming_ordinals
+        )
+        self._prefetcher.request(
+            list(frame_indices) + list(islice(_upcoming_frames, self._prefetch_depth))
+        )
+
+    def _uses_prefetched_frames(self, kwargs: dict) -> bool:
+        """
+        Check whether prefetched frames can be used with the given kwargs.
+
+        Parameters
+        ----------
+        kwargs : dict
+            The calling keyword arguments.
+
+        Returns
+        -------
+        bool
+            Flag whether prefetched frames can be used.
+        """
+        return self._prefetcher is not None and set(kwargs).issubset({"global_index"})
+
+    def _get_prefetched_frame(
+        self, frame_index: int, use_prefetched: bool, **kwargs: Any
+    ) -> tuple[Dataset, dict]:
+        """
+        Get a frame from the prefetched frames or read it directly.
+
+        Parameters
+        ----------
+        frame_index : int
+            The index of the frame.
+        use_prefetched : bool
+            Flag whether to use the prefetched frames.
+        **kwargs : Any
+            Keyword arguments for the get_frame method.
+
+        Returns
+        -------
+        Dataset
+            The image data frame.
+        kwargs : dict
+            The updated kwargs.
+        """
+        if use_prefetched:
+            try:
+                _result = self._prefetcher.get(frame_index)
+            except FileReadError:
+                # the file might have been incomplete when it was prefetched
+                _result = None
+            if _result is not None:
+                _data, _frame_kwargs = _result
+                return _data, kwargs | _frame_kwargs
+        return self.get_frame(frame_index, **kwargs)
+
     def get_frame(self, frame_index: int, **kwargs: Any) -> tuple[Dataset, dict]:
         """
         Get the specified image frame (which does not necessarily correspond to the
@@ -210,8 +435,15 @@ class InputPlugin(BasePlugin):
                 "The pre_execute method must be called before the execute method."
             )
         _frames = self._SCAN.get_frame_indices_from_ordinal(ordinal)
+        for _frame_index in _frames:
+            self._update_io_statistics(_frame_index)
         if len(_frames) == 1:
-            _data, kwargs = self.get_frame(_frames[0], **kwargs)
+            _use_prefetched = self._uses_prefetched_frames(kwargs)
+            if _use_prefetched:
+                self._request_prefetch(_frames)
+            _data, kwargs = self._get_prefetched_frame(
+                _frames[0], _use_prefetched, **kwargs
+            )
         else:
             _data, kwargs = self.read_multi_image(_frames, **kwargs)
         _data.data_label = self.output_data_label
@@ -241,8 +473,13 @@ class InputPlugin(BasePlugin):
         _handling = self._SCAN.get_param_value("scan_multi_frame_handling")
         _factor = len(frame_indices) if _handling == "Average" else 1
         _data = None
+        _use_prefetched = self._uses_prefetched_frames(kwargs)
+        if _use_prefetched:
+            self._request_prefetch(frame_indices)
         for _i, _frame_index in enumerate(frame_indices):
-            _tmp_data, kwargs = self.get_frame(_frame_index, **kwargs)
+            _tmp_data, kwargs = self._get_prefetched_frame(
+                _frame_index, _use_prefetched, **kwargs
+            )
             if _data is None:
                 _shape = _tmp_data.shape
                 _metadata = _tmp_data.property_dict
@@ -28,20 +28,43 @@ __all__ = ["OutputPlugin"]
 
 
 import os
+from typing import Any, Callable
 
-from pydidas.core import get_generic_param_collection
+import numpy as np
+
+from pydidas.core import AsyncWriteQueue, get_generic_param_collection
 from pydidas.core.constants import OUTPUT_PLUGIN
 from pydidas.plugins.base_plugin import BasePlugin
 
 
+def _run_write_jobs(jobs: list[tuple[Callable, tuple, dict]]) -> None:
+    """
+    Run a batch of write jobs.
+
+    Parameters
+    ----------
+    jobs : list[tuple[Callable, tuple, dict]]
+        The write jobs, given as tuples of the function, the arguments and
+        the keyword arguments.
+    """
+    for _func, _args, _kwargs in jobs:
+        _func(*_args, **_kwargs)
+
+
 class OutputPlugin(BasePlugin):
     """
     The base class for output (file saving / plotting) plugins.
+
+    Output plugins should write their files with the write_output method.
+    If asynchronous output has been enabled for the process (with the
+    configure_async_output method), files are written by a background
+    thread and the processing does not wait for the disk.
     """
 
     plugin_type = OUTPUT_PLUGIN
     plugin_name = "Base output plugin"
     output_data_dim = None
+    _write_queue = None
     generic_params = BasePlugin.generic_params.copy()
     generic_params.add_params(
         get_generic_param_collection(
@@ -108,5 +131,78 @@ class OutputPlugin(BasePlugin):
         _index = _index + self.get_param_value("output_index_offset")
         return str(self._path / (self._base_name.format(_index) + f".{extension}"))
 
+    def write_output(self, func: Callable, *args: Any, **kwargs: Any) -> None:
+        """
+        Write output with the given function.
+
+        If asynchronous output is enabled, the call is queued and executed by
+        the background writer thread. Array arguments are copied to allow
+        the caller to modify the data afterwards.
+
+        Parameters
+        ----------
+        func : Callable
+            The function which writes the output.
+        *args : Any
+            The arguments for the function.
+        **kwargs : Any
+            The keyword arguments for the function.
+        """
+        if OutputPlugin._write_queue is None:
+            func(*args, **kwargs)
+            return
+        _args = tuple(
+            np.array(_arg) if isinstance(_arg, np.ndarray) else _arg for _arg in args
+        )
+        OutputPlugin._write_queue.put((func, _args, kwargs))
+
+    @classmethod
+    def configure_async_output(cls, max_size: int, max_batch_size: int = 16) -> None:
+        """
+        Configure the asynchronous output of all OutputPlugins in this process.
+
+        Any queued output is written before changing the configuration.
+
+        Parameters
+        ----------
+        max_size : int
+            The maximum number of queued write calls. A value of 0 disables
+            the asynchronous output.
+        max_batch_size : int, optional
+            The maximum number of write calls executed in one batch. The
+            default is 16.
+        """
+        _queue = OutputPlugin._write_queue
+        if _queue is not None:
+            if (_queue.max_size, _queue.max_batch_size) == (max_size, max_batch_size):
+                return
+            OutputPlugin._write_queue = None
+            _queue.close()
+        if max_size > 0:
+            OutputPlugin._write_queue = AsyncWriteQueue(
+                _run_write_jobs, max_size, max_batch_size, name="pydidas_output"
+            )
+
+    @classmethod
+    def flush_output(cls) -> None:
+        """Wait until all queued output of this process has been written."""
+        if OutputPlugin._write_queue is not None:
+            OutputPlugin._write_queue.flush()
+
+    @classmethod
+    def get_output_statistics(cls) -> dict[str, Any]:
+        """
+        Get the statistics of the asynchronous output of this process.
+
+        Returns
+        -------
+        dict[str, Any]
+            The statistics of the AsyncWriteQueue or an empty dictionary if
+            the asynchronous output is disabled.
+        """
+        if OutputPlugin._write_queue is None:
+            return {}
+        return OutputPlugin._write_queue.statistics
+
 
 OutputPlugin.register_as_base_class()
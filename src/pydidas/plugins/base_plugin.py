@@ -38,6 +38,7 @@ from qtpy import QtCore
 from pydidas.contexts import DiffractionExperimentContext, ScanContext
 from pydidas.core import (
     Dataset,
+    FramePrefetcher,
     ObjectWithParameterCollection,
     Parameter,
     ParameterCollection,
@@ -65,6 +66,7 @@ _TYPES_NOT_TO_COPY = (
     QtCore.QMetaObject,
     ParameterCollection,
     ImageMetadataManager,
+    FramePrefetcher,
 )
 
 EXP = DiffractionExperimentContext()
@@ -117,7 +119,8 @@ class BasePlugin(ObjectWithParameterCollection):
         plugin. The default is an empty ParameterCollection.
     generic_params : ParameterCollection, optional
         A ParameterCollection with the generic parameters for all plugins of a specific
-        type. The default are the Parameters "keep_results" and "label" for all plugins.
+        type. The default are the Parameters "keep_results", "label" and
+        "result_dtype" for all plugins.
     input_data_dim : int, optional
         The dimensionality of the input data. Use -1 for arbitrary dimensionality or
         None if the plugin does not accept any input data. The default is -1.
@@ -140,12 +143,20 @@ class BasePlugin(ObjectWithParameterCollection):
         the plugin's Parameter configuration widget be default and can be accessed
         through the associated button for "advances parameters" not to overwhelm
         users with too many options. The default is an empty list [].
+    pre_execute_is_reusable : bool, optional
+        Flag that the state set up in pre_execute only depends on the plugin's
+        Parameters, the files referenced by its Path Parameters and the global
+        contexts. Persistent workers skip the pre_execute call of such plugins
+        if none of these has changed since the last run. Input plugins are
+        always pre-executed. The default is False.
     """
 
     plugin_type = BASE_PLUGIN
     plugin_name = "Base plugin"
     default_params = ParameterCollection()
-    generic_params = get_generic_param_collection("keep_results", "label")
+    generic_params = get_generic_param_collection(
+        "keep_results", "label", "result_dtype"
+    )
 
     input_data_dim = -1
     output_data_dim = -1
@@ -154,6 +165,7 @@ class BasePlugin(ObjectWithParameterCollection):
     new_dataset = False
     has_unique_parameter_config_widget = False
     advanced_parameters = []
+    pre_execute_is_reusable = False
     base_classes = []
 
     @classmethod
@@ -376,7 +388,9 @@ class BasePlugin(ObjectWithParameterCollection):
         _state = {
             _key: _value
             for _key, _value in self.__dict__.items()
-            if not isinstance(_value, (QtCore.SignalInstance, QtCore.QMetaObject))
+            if not isinstance(
+                _value, (QtCore.SignalInstance, QtCore.QMetaObject, FramePrefetcher)
+            )
         }
         return _state
 
@@ -438,6 +452,14 @@ class BasePlugin(ObjectWithParameterCollection):
         Run the pre-execution code before processing individual datapoints.
         """
 
+    def reset_run_state(self) -> None:
+        """
+        Reset any state which is accumulated while processing a run.
+
+        This method is called at the start of every run, even if the
+        pre_execute call is skipped because the plugin has not changed.
+        """
+
     def get_parameter_config_widget(self):
         """
         Get the unique configuration widget associated with this Plugin.
@@ -38,7 +38,11 @@ from qtpy import QtWidgets
 from silx.opencl.common import OpenCL
 
 from pydidas.contexts import DiffractionExperimentContext
-from pydidas.core import UserConfigError, get_generic_param_collection
+from pydidas.core import (
+    SharedResources,
+    UserConfigError,
+    get_generic_param_collection,
+)
 from pydidas.core.constants import (
     ASCII_TO_UNI,
     PROC_PLUGIN,
@@ -89,6 +93,7 @@ class pyFAIintegrationBase(ProcPlugin):  # noqa C0103
     new_dataset = True
     has_unique_parameter_config_widget = True
     advanced_parameters = ["correct_solid_angle", "polarization_factor"]
+    pre_execute_is_reusable = True
 
     def __init__(self, *args: tuple, **kwargs: Any):
         self._EXP = kwargs.pop("diffraction_exp", DiffractionExperimentContext())
@@ -124,7 +129,7 @@ class pyFAIintegrationBase(ProcPlugin):  # noqa C0103
 
     def load_and_set_mask(self):
         """
-        Load and store the mask.
+        Load and store the mask as shared resource.
 
         If defined (and the file exists), the locally defined detector mask
         Parameter will be used. If not, the global QSetting detector mask
@@ -134,7 +139,11 @@ class pyFAIintegrationBase(ProcPlugin):  # noqa C0103
         _mask_file = self._EXP.get_param_value("detector_mask_file")
         if _mask_file != Path():
             if _mask_file.is_file():
-                self._mask = import_data(_mask_file)
+                self._mask = SharedResources().get(
+                    SharedResources.get_key("detector_mask", _mask_file),
+                    lambda: import_data(_mask_file),
+                    writable=True,
+                )
             else:
                 raise UserConfigError(
                     f"Cannot load detector mask: No file with the name \n{_mask_file}"
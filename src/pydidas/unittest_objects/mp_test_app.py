@@ -171,6 +171,26 @@ class MpTestApp(BaseApp):
         """
         self._composite.insert_image(image, index - self._config["min_index"])
 
+    def threading_func(self, index: int) -> int:
+        """
+        Perform the computation in a worker thread.
+
+        The MpTestApp will insert a random image directly into the composite.
+
+        Parameters
+        ----------
+        index : int
+            The input index of the image.
+
+        Returns
+        -------
+        int
+            The index of the image.
+        """
+        _image = get_test_image("dummy", shape=(20, 20))
+        self._composite.insert_image(_image, index - self._config["min_index"])
+        return index
+
     def multiprocessing_post_run(self):
         """
         Call post-run operations.
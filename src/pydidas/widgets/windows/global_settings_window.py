@@ -89,16 +89,34 @@ class GlobalSettingsWindow(SingletonObject, PydidasWindow):
             "section_multiprocessing", "Multiprocessing settings", **_section_options
         )
         self.create_param_widget("mp_n_workers", **_param_options)
+        self.create_param_widget("mp_chunk_size", **_param_options)
+        self.create_param_widget("mp_adaptive_chunk_size", **_param_options)
+        self.create_param_widget("mp_persistent_workers", **_param_options)
+        self.create_param_widget("mp_execution_backend", **_param_options)
+        self.create_param_widget("mp_task_scheduler", **_param_options)
         self.create_param_widget("shared_buffer_max_n", **_param_options)
         self.create_spacer("spacer_1")
 
         self.create_label("section_memory", "Memory settings", **_section_options)
         self.create_param_widget("data_buffer_size", **_param_options)
         self.create_param_widget("data_buffer_hdf5_max_size", **_param_options)
+        self.create_param_widget("hdf5_file_cache_size", **_param_options)
+        self.create_param_widget("input_prefetch_depth", **_param_options)
+        self.create_param_widget("input_prefetch_max_size", **_param_options)
+        self.create_param_widget("result_backing_store", **_param_options)
         self.create_param_widget("shared_buffer_size", **_param_options)
         self.create_param_widget("max_image_size", **_param_options)
         self.create_spacer("spacer_3")
 
+        self.create_label("section_output", "Result file settings", **_section_options)
+        self.create_param_widget("hdf5_compression", **_param_options)
+        self.create_param_widget("hdf5_flush_n_frames", **_param_options)
+        self.create_param_widget("hdf5_flush_interval", **_param_options)
+        self.create_param_widget("hdf5_single_file", **_param_options)
+        self.create_param_widget("async_write_queue_size", **_param_options)
+        self.create_param_widget("async_write_batch_size", **_param_options)
+        self.create_spacer("spacer_4")
+
         self.create_label("section_gui", "GUI behaviour", **_section_options)
         self.create_param_widget("plot_update_time", **_param_options)
         self.process_font_metrics_changed()
@@ -34,6 +34,7 @@ from .plugin_position_node import *
 from .processing_results import *
 from .processing_tree import *
 from .workflow_node import *
+from .workflow_profile import *
 from .workflow_results import *
 from .workflow_results_selector import *
 from .workflow_tree import *
@@ -46,6 +47,7 @@ __all__ = ["result_io", "processing_tree_io"] + (
     + processing_results.__all__
     + processing_tree.__all__
     + workflow_node.__all__
+    + workflow_profile.__all__
     + workflow_results.__all__
     + workflow_results_selector.__all__
     + workflow_tree.__all__
@@ -58,6 +60,7 @@ del (
     processing_results,
     processing_tree,
     workflow_node,
+    workflow_profile,
     workflow_results,
     workflow_results_selector,
     workflow_tree,
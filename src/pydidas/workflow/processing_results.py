@@ -29,10 +29,15 @@ __all__ = ["ProcessingResults"]
 
 
 import re
+import tempfile
+import threading
+import time
 from copy import deepcopy
+from numbers import Integral
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
+import h5py
 import numpy as np
 from qtpy import QtCore
 
@@ -48,11 +53,41 @@ from pydidas.core import (
     UserConfigError,
     utils,
 )
+from pydidas.core.utils.dataset_utils import update_dataset_properties_from_kwargs
+from pydidas.core.utils.hdf5 import create_nx_entry_groups, create_nxdata_entry
+from pydidas.data_io import import_data
 from pydidas.workflow.processing_tree import ProcessingTree
 from pydidas.workflow.result_io import ProcessingResultIoMeta as ResultSaver
+from pydidas.workflow.workflow_profile import WorkflowProfile
 from pydidas.workflow.workflow_tree import WorkflowTree
 
 
+def _create_temporary_memmap(shape: tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+    """
+    Create a writable memory map of a new temporary file.
+
+    The file is created in the system's temporary directory and is deleted
+    automatically when the memory map is released.
+
+    Parameters
+    ----------
+    shape : tuple[int, ...]
+        The shape of the array.
+    dtype : np.dtype
+        The datatype of the array.
+
+    Returns
+    -------
+    np.ndarray
+        The memory-mapped array, initialized with zeros. Arrays without
+        any elements are not memory-mapped.
+    """
+    if np.prod(shape) == 0:
+        return np.zeros(shape, dtype=dtype)
+    with tempfile.TemporaryFile(prefix="pydidas_results_") as _file:
+        return np.memmap(_file, dtype=dtype, mode="w+", shape=shape)
+
+
 class ProcessingResults(ObjectWithParameterCollection):
     """
     A class for handling composite data from multiple plugins.
@@ -60,6 +95,24 @@ class ProcessingResults(ObjectWithParameterCollection):
     This class handles Datasets from each plugin in the WorkflowTree. Results
     are referenced by the node ID of the data's producer.
 
+    Depending on the global "result_backing_store" setting, the composite
+    results are either kept in memory or in memory-mapped files. Memory-mapped
+    composites use the files of the active result savers (e.g. the HDF5
+    autosave files), if available, and temporary files otherwise.
+
+    The scan points with stored results are tracked for each node and can be
+    queried with the get_valid_points method. Floating point results of scan
+    points without stored results are NaN. Memory-mapped composites are not
+    initialized to avoid writing the full files. Instead, NaN is written to
+    the missing scan points when the results are accessed. Integer results
+    of missing scan points are zero and only the valid points identify them.
+
+    The scan points of new results are tracked for each node. The updated
+    regions are coalesced to bounding boxes in the scan dimensions and emitted
+    with the sig_regions_updated signal at most once per global
+    "plot_update_time". Consumers can use the regions to skip or limit the
+    update of displayed results.
+
     Warning: Users should generally only use the WorkflowResults singleton
     and never use the ProcessingResults directly unless explicitly required.
 
@@ -78,6 +131,7 @@ class ProcessingResults(ObjectWithParameterCollection):
     """
 
     new_results = QtCore.Signal()
+    sig_regions_updated = QtCore.Signal(object)
 
     def __init__(
         self,
@@ -100,6 +154,7 @@ class ProcessingResults(ObjectWithParameterCollection):
         }
         self._composites = {}
         self.__source_hash = -1
+        self._region_lock = threading.Lock()
         self.clear_all_results()
 
     def clear_all_results(self) -> None:
@@ -108,8 +163,12 @@ class ProcessingResults(ObjectWithParameterCollection):
         """
         self._composites = {}
         self.__source_hash = -1
+        self._updated_regions = {}
+        self._valid_points = {}
+        self._unfilled_points = {}
         for _key in (
             "shapes",
+            "dtypes",
             "plugin_names",
             "result_titles",
             "node_labels",
@@ -118,12 +177,18 @@ class ProcessingResults(ObjectWithParameterCollection):
             self._config[_key] = {}
         for _key in ("metadata_complete", "composites_created", "shapes_set"):
             self._config[_key] = False
+        self._config["profile"] = None
+        self._config["region_update_interval"] = 0
+        self._config["last_region_update"] = -np.inf
 
     def prepare_new_results(self) -> None:
         """
         Prepare the ProcessingResults for new results.
         """
         self.clear_all_results()
+        self._config["region_update_interval"] = self.q_settings_get(
+            "global/plot_update_time", float, 1.0
+        )
         for _node in self._TREE.get_all_nodes_with_results():
             _node_id = _node.node_id
             _plugin = self._TREE.nodes[_node_id].plugin
@@ -159,6 +224,24 @@ class ProcessingResults(ObjectWithParameterCollection):
         self._config["shapes"] = _shapes
         self._config["shapes_set"] = True
 
+    def store_frame_dtypes(self, dtypes: dict[int, np.dtype | str]) -> None:
+        """
+        Store the datatypes of the results in the ProcessingResults.
+
+        The datatypes are used for creating the composites. Results of nodes
+        without a stored datatype will use the datatype of the first
+        result.
+
+        Parameters
+        ----------
+        dtypes : dict[int, np.dtype or str]
+            The datatypes in the form of a dictionary with nodeID keys and
+            dtype values.
+        """
+        self._config["dtypes"] = {
+            _key: np.dtype(_dtype) for _key, _dtype in dtypes.items()
+        }
+
     def store_frame_metadata(self, metadata: dict[int, dict]) -> None:
         """
         Store the metadata for plugin results.
@@ -225,28 +308,256 @@ class ProcessingResults(ObjectWithParameterCollection):
                 {_node_id: _data.property_dict for _node_id, _data in results.items()}
             )
         if not self._config["composites_created"]:
+            for _key, _val in results.items():
+                self._config["dtypes"].setdefault(_key, np.asarray(_val).dtype)
             self._create_composites()
         _scan_index = self._SCAN.get_indices_from_ordinal(index)
+        self._mark_valid_points(results.keys(), _scan_index)
         for _key, _val in results.items():
             self._composites[_key][_scan_index] = _val
         self.new_results.emit()
+        self._mark_updated_region(results.keys(), _scan_index)
+
+    def store_result_block(
+        self, ordinals: np.ndarray, results: dict[int, np.ndarray]
+    ) -> None:
+        """
+        Store the results of a block of scan points in the ProcessingResults.
+
+        The frame metadata must have been stored before storing result
+        blocks.
+
+        Parameters
+        ----------
+        ordinals : np.ndarray
+            The ordinals of the scan points (i.e. their position in the
+            timeline of the scan).
+        results : dict[int, np.ndarray]
+            The results as dictionary with entries of the type
+            <node_id: array>. The first axis of each array corresponds to
+            the scan points given by the ordinals.
+        """
+        if not self._config["metadata_complete"]:
+            raise UserConfigError(
+                "The metadata of the results has not been set. Please store the "
+                "frame metadata before storing result blocks."
+            )
+        if not self._config["composites_created"]:
+            for _key, _val in results.items():
+                self._config["dtypes"].setdefault(_key, np.asarray(_val).dtype)
+            self._create_composites()
+        _scan_indices = np.unravel_index(
+            np.asarray(ordinals, dtype=int), self._config["frozen_SCAN"].shape
+        )
+        self._mark_valid_points(results.keys(), _scan_indices)
+        for _key, _val in results.items():
+            self._composites[_key][_scan_indices] = np.asarray(_val)
+        self.new_results.emit()
+        self._mark_updated_region(results.keys(), _scan_indices)
+
+    def _mark_valid_points(
+        self, node_ids: Iterable[int], scan_indices: tuple[int | np.ndarray, ...]
+    ) -> None:
+        """
+        Mark scan points as valid before their results are written.
+
+        Marking the points before writing the results ensures that they are
+        not overwritten with NaN by a concurrent call of _fill_unwritten_points.
+
+        Parameters
+        ----------
+        node_ids : Iterable[int]
+            The IDs of the updated nodes.
+        scan_indices : tuple[int | np.ndarray, ...]
+            The indices of the updated scan points in each scan dimension.
+        """
+        with self._region_lock:
+            for _node_id in node_ids:
+                self._valid_points[_node_id][scan_indices] = True
+                if _node_id in self._unfilled_points:
+                    self._unfilled_points[_node_id][scan_indices] = False
+
+    def _fill_unwritten_points(self, node_id: int) -> None:
+        """
+        Write NaN to all scan points of a composite without results.
+
+        This is only required for memory-mapped floating point composites
+        because they are not initialized when they are created. Each scan
+        point is filled at most once.
+
+        Parameters
+        ----------
+        node_id : int
+            The node ID of the composite.
+        """
+        if node_id not in self._unfilled_points:
+            return
+        with self._region_lock:
+            _unfilled = self._unfilled_points[node_id]
+            if np.any(_unfilled):
+                np.asarray(self._composites[node_id])[_unfilled] = np.nan
+                _unfilled[()] = False
+
+    def get_valid_points(self, node_id: int) -> np.ndarray:
+        """
+        Get the scan points for which results of the specified node are stored.
+
+        Parameters
+        ----------
+        node_id : int
+            The node ID.
+
+        Returns
+        -------
+        np.ndarray
+            A boolean array in the shape of the scan which is True for all
+            scan points with stored results.
+        """
+        self._check_that_results_are_available(node_id)
+        with self._region_lock:
+            return self._valid_points[node_id].copy()
+
+    def _mark_updated_region(
+        self, node_ids: Iterable[int], scan_indices: tuple[int | np.ndarray, ...]
+    ) -> None:
+        """
+        Add scan points to the updated regions of the given nodes.
+
+        The updated regions are emitted if the update interval has passed
+        since the last emission.
+
+        Parameters
+        ----------
+        node_ids : Iterable[int]
+            The IDs of the updated nodes.
+        scan_indices : tuple[int | np.ndarray, ...]
+            The indices of the updated scan points in each scan dimension.
+        """
+        _lower = np.array([np.min(_index) for _index in scan_indices])
+        _upper = np.array([np.max(_index) for _index in scan_indices])
+        with self._region_lock:
+            for _node_id in node_ids:
+                if _node_id in self._updated_regions:
+                    _node_lower, _node_upper = self._updated_regions[_node_id]
+                    _lower_bound = np.minimum(_node_lower, _lower)
+                    _upper_bound = np.maximum(_node_upper, _upper)
+                    self._updated_regions[_node_id] = (_lower_bound, _upper_bound)
+                else:
+                    self._updated_regions[_node_id] = (_lower, _upper)
+            _emit = (
+                time.perf_counter() - self._config["last_region_update"]
+                >= self._config["region_update_interval"]
+            )
+        if _emit:
+            self.emit_updated_regions()
+
+    def pop_updated_regions(self) -> dict[int, tuple[slice, ...]]:
+        """
+        Get and reset the regions which have been updated since the last call.
+
+        Returns
+        -------
+        dict[int, tuple[slice, ...]]
+            The updated regions with node ID keys. Each region is given as the
+            bounding box of all updated scan points, with one slice for each
+            scan dimension.
+        """
+        with self._region_lock:
+            _bounds, self._updated_regions = self._updated_regions, {}
+            self._config["last_region_update"] = time.perf_counter()
+        return {
+            _node_id: tuple(
+                slice(int(_start), int(_stop) + 1)
+                for _start, _stop in zip(_lower, _upper)
+            )
+            for _node_id, (_lower, _upper) in _bounds.items()
+        }
+
+    def emit_updated_regions(self) -> None:
+        """
+        Emit the regions updated since the last emission, if there are any.
+        """
+        _regions = self.pop_updated_regions()
+        if len(_regions) > 0:
+            self.sig_regions_updated.emit(_regions)
+
+    def store_profile(self, profile: WorkflowProfile) -> None:
+        """
+        Store the runtime profile of the workflow plugins.
+
+        Parameters
+        ----------
+        profile : WorkflowProfile
+            The profile, aggregated over all processes.
+        """
+        self._config["profile"] = profile
+
+    def get_profile(self) -> WorkflowProfile | None:
+        """
+        Get the runtime profile of the workflow plugins.
+
+        The profile is only available if profiling has been enabled for the
+        processing, e.g. with the "profile_workflow" Parameter of the
+        ExecuteWorkflowApp.
+
+        Returns
+        -------
+        WorkflowProfile or None
+            The profile or None if no profile has been stored.
+        """
+        return self._config["profile"]
 
     def _create_composites(self) -> None:
         """
         Create the composite datasets for all node results.
+
+        The composites use the stored datatype of the node results and
+        default to float32 if no datatype is known. Floating point and
+        complex composites in memory are initialized with NaN, all others with
+        zeros. Memory-mapped composites are not initialized to avoid writing
+        the full files. Their unwritten scan points are filled with NaN when
+        the results are accessed. Missing integer results cannot be marked in
+        the data and are only identified by the get_valid_points method.
         """
         if not self._config["shapes_set"]:
             raise UserConfigError(
                 "The shapes of the results have not been set. Please set the shapes "
                 "before storing results."
             )
-        self._composites = {
-            _key: Dataset(
-                np.full(_shape, np.nan, dtype=np.float32),
-                **self._config["plugin_res_metadata"].get(_key, {}),
-            )
-            for _key, _shape in self._config["shapes"].items()
+        self._composites = {}
+        _dtypes = {
+            _key: self._config["dtypes"].get(_key, np.dtype(np.float32))
+            for _key in self._config["shapes"]
         }
+        _memory_mapped = (
+            self.q_settings_get("global/result_backing_store", str, "memory")
+            == "memmap"
+        )
+        _saver_maps = (
+            ResultSaver.get_memory_maps_from_active_savers(
+                self._config["shapes"], _dtypes
+            )
+            if _memory_mapped
+            else {}
+        )
+        _scan_shape = self._config["frozen_SCAN"].shape
+        self._valid_points = {}
+        self._unfilled_points = {}
+        for _key, _shape in self._config["shapes"].items():
+            _dtype = _dtypes[_key]
+            _inexact = np.issubdtype(_dtype, np.inexact)
+            self._valid_points[_key] = np.zeros(_scan_shape, dtype=bool)
+            if _memory_mapped and _inexact:
+                self._unfilled_points[_key] = np.ones(_scan_shape, dtype=bool)
+            if _key in _saver_maps:
+                _array = _saver_maps[_key]
+            elif _memory_mapped:
+                _array = _create_temporary_memmap(_shape, _dtype)
+            else:
+                _array = np.full(_shape, np.nan if _inexact else 0, dtype=_dtype)
+            self._composites[_key] = update_dataset_properties_from_kwargs(
+                _array.view(Dataset), self._config["plugin_res_metadata"].get(_key, {})
+            )
         self._config["composites_created"] = True
 
     @property
@@ -261,6 +572,20 @@ class ProcessingResults(ObjectWithParameterCollection):
         """
         return self._config["shapes"].copy()
 
+    @property
+    def dtypes(self) -> dict[int, np.dtype]:
+        """
+        Return the datatypes of the results in the form of a dictionary.
+
+        Returns
+        -------
+        dict[int, np.dtype]
+            A dictionary with entries of the form <node_id: dtype>
+        """
+        return self._config["dtypes"] | {
+            _key: _item.dtype for _key, _item in self._composites.items()
+        }
+
     @property
     def node_labels(self) -> dict[int, str]:
         """
@@ -424,6 +749,7 @@ class ProcessingResults(ObjectWithParameterCollection):
             The combined results of all frames for a specific node.
         """
         self._check_that_results_are_available(node_id)
+        self._fill_unwritten_points(node_id)
         return self._composites[node_id]
 
     def get_results_for_flattened_scan(
@@ -448,10 +774,13 @@ class ProcessingResults(ObjectWithParameterCollection):
         Returns
         -------
         Dataset
-            The combined results of all frames for a specific node.
+            The combined results of all frames for a specific node. This is a
+            view of the stored results and it must be copied before it is
+            modified.
         """
         self._check_that_results_are_available(node_id)
-        _data = self._composites[node_id].copy()
+        self._fill_unwritten_points(node_id)
+        _data = self._composites[node_id].view(Dataset)
         _data.flatten_dims(
             *range(self._config["frozen_SCAN"].ndim),
             new_dim_label="Chronological scan points",
@@ -475,6 +804,11 @@ class ProcessingResults(ObjectWithParameterCollection):
         they are given as integers, or slices. Iterable objects keep a
         dimension of length 1.
 
+        Integers and slices are applied first and do not copy any data. Only
+        the selected subset is copied for iterable indices. If all slices are
+        integers or slices, the returned Dataset is a view of the stored
+        results and it must be copied before it is modified.
+
         Parameters
         ----------
         node_id : int
@@ -498,12 +832,22 @@ class ProcessingResults(ObjectWithParameterCollection):
             _data = self.get_results_for_flattened_scan(node_id)
         else:
             self._check_that_results_are_available(node_id)
-            _data = self._composites[node_id].copy()
-        if set(type(_slice) for _slice in slices).issubset({int, slice}):
-            _data = _data[slices]
-        else:
-            for _index, _slice in enumerate(slices[::-1]):
-                _dim = len(slices) - _index - 1
+            self._fill_unwritten_points(node_id)
+            _data = self._composites[node_id]
+        _is_basic_index = [isinstance(_slice, (Integral, slice)) for _slice in slices]
+        _data = _data[
+            tuple(
+                _slice if _is_basic else slice(None)
+                for _slice, _is_basic in zip(slices, _is_basic_index)
+            )
+        ]
+        _index_dims = (
+            np.cumsum([not isinstance(_slice, Integral) for _slice in slices]) - 1
+        )
+        for _dim, _slice, _is_basic in list(zip(_index_dims, slices, _is_basic_index))[
+            ::-1
+        ]:
+            if not _is_basic:
                 _data = _data.take(_slice, axis=_dim)
         if squeeze:
             return _data.squeeze()
@@ -593,6 +937,8 @@ class ProcessingResults(ObjectWithParameterCollection):
             _res = self._composites
         else:
             _res = {node_id: self._composites[node_id]}
+        for _id in _res:
+            self._fill_unwritten_points(_id)
         ResultSaver.export_full_data_to_active_savers(
             _res,
             scan_context=self._config["frozen_SCAN"],
@@ -647,9 +993,10 @@ class ProcessingResults(ObjectWithParameterCollection):
         _name = self._config["frozen_SCAN"].get_param_value("scan_title")
         ResultSaver.set_active_savers_and_title(save_formats, _name)
         if single_node is None:
-            _keys = list(self._composites.keys())
+            _keys = list(self._config["shapes"].keys())
         else:
             _keys = [single_node]
+        _dtypes = self.dtypes
         _node_info = {
             _id: {
                 "shape": (
@@ -659,6 +1006,7 @@ class ProcessingResults(ObjectWithParameterCollection):
                 ),
                 "node_label": self._config["node_labels"][_id],
                 "plugin_name": self._config["plugin_names"][_id],
+                "dtype": _dtypes.get(_id, np.dtype(np.float32)),
             }
             for _id in _keys
         }
@@ -744,6 +1092,7 @@ class ProcessingResults(ObjectWithParameterCollection):
             )
         )
         if self._composites[node_id].size == 1:
+            self._fill_unwritten_points(node_id)
             _val = np.atleast_1d(self._composites[node_id].squeeze())[0]
             _node_info += f"Data zero-dimensional\n  Value: {_val:.6f}"
         return _node_info
@@ -765,6 +1114,10 @@ class ProcessingResults(ObjectWithParameterCollection):
                 _id: _item[_key] for _id, _item in _node_info.items()
             }
         self._composites = _data
+        self._valid_points = {
+            _id: np.ones(_array.shape[: _scan.ndim], dtype=bool)
+            for _id, _array in _data.items()
+        }
         if _data != {}:
             self._SCAN.update_from_scan(_scan)
             self._EXP.update_from_diffraction_exp(_exp)
@@ -778,6 +1131,117 @@ class ProcessingResults(ObjectWithParameterCollection):
                 self._config["plugin_res_metadata"][_id] = _array.property_dict
                 self._config["plugin_res_metadata"][_id].pop("metadata")
 
+    def export_partition_to_file(
+        self, filename: Path | str, ordinals: np.ndarray
+    ) -> None:
+        """
+        Export the results of a partition of the scan to a NeXus file.
+
+        The results of each node are written with the scan points of the
+        partition as first axis and the ordinals of the scan points as axis
+        values. The file can be merged with the files of the other
+        partitions with the import_partition_files method.
+
+        Parameters
+        ----------
+        filename : Path or str
+            The full filename of the partition file.
+        ordinals : np.ndarray
+            The ordinals of the scan points in the partition.
+        """
+        if not self._config["composites_created"]:
+            raise UserConfigError(
+                "No results have been stored. Cannot export the partition results."
+            )
+        _ordinals = np.asarray(ordinals, dtype=int)
+        _scan_indices = np.unravel_index(_ordinals, self._config["frozen_SCAN"].shape)
+        with h5py.File(filename, "w") as _file:
+            create_nx_entry_groups(
+                _file,
+                "entry",
+                group_type="NXentry",
+                n_scan_points=self._config["frozen_SCAN"].n_points,
+            )
+            for _id, _composite in self._composites.items():
+                _metadata = self.get_result_metadata(_id, use_scan_timeline=True)
+                _metadata["axis_ranges"][0] = _ordinals
+                _data = np.asarray(_composite)[_scan_indices]
+                if _id in self._unfilled_points:
+                    _data[~self._valid_points[_id][_scan_indices]] = np.nan
+                create_nxdata_entry(
+                    _file,
+                    f"entry/node_{_id:02d}/data",
+                    Dataset(
+                        _data,
+                        axis_labels=_metadata["axis_labels"],
+                        axis_units=_metadata["axis_units"],
+                        axis_ranges=_metadata["axis_ranges"],
+                        data_label=_metadata["data_label"],
+                        data_unit=_metadata["data_unit"],
+                    ),
+                )
+
+    def import_partition_files(self, filenames: list[Path | str]) -> None:
+        """
+        Import and merge the results of all partitions of a scan.
+
+        The ProcessingResults are prepared for new results from the
+        current contexts and the results of all partition files, written
+        with the export_partition_to_file method, are stored.
+
+        Parameters
+        ----------
+        filenames : list[Path or str]
+            The filenames of all partition files.
+
+        Raises
+        ------
+        UserConfigError
+            If the partition files do not match the current WorkflowTree or
+            if they do not cover all scan points exactly once.
+        """
+        self.prepare_new_results()
+        _node_ids = sorted(self._config["plugin_res_metadata"])
+        _ordinals = []
+        for _filename in filenames:
+            with h5py.File(_filename, "r") as _file:
+                _file_node_ids = sorted(
+                    int(_key[5:]) for _key in _file["entry"] if _key.startswith("node_")
+                )
+            if _file_node_ids != _node_ids:
+                raise UserConfigError(
+                    f"The results in the partition file `{_filename}` do not match "
+                    "the nodes of the current WorkflowTree."
+                )
+            _data = {
+                _id: import_data(
+                    _filename, dataset=f"entry/node_{_id:02d}/data", auto_squeeze=False
+                )
+                for _id in _node_ids
+            }
+            if not self._config["metadata_complete"]:
+                self.store_frame_dtypes({_id: _d.dtype for _id, _d in _data.items()})
+                self.store_frame_metadata(
+                    {
+                        _id: {
+                            _key: dict(enumerate(list(getattr(_d, _key).values())[1:]))
+                            for _key in ["axis_labels", "axis_units", "axis_ranges"]
+                        }
+                        | {"data_label": _d.data_label, "data_unit": _d.data_unit}
+                        for _id, _d in _data.items()
+                    }
+                )
+            _ordinals.append(np.asarray(_data[_node_ids[0]].axis_ranges[0], dtype=int))
+            self.store_result_block(_ordinals[-1], _data)
+        _ordinals = np.concatenate(_ordinals) if _ordinals else np.array((), dtype=int)
+        if not np.array_equal(
+            np.sort(_ordinals), np.arange(self._config["frozen_SCAN"].n_points)
+        ):
+            raise UserConfigError(
+                "The partition files do not cover all points of the scan exactly "
+                "once. Please check the partition files."
+            )
+
     def update_from_processing_results(self, results: "ProcessingResults"):
         """
         Update the current ProcessingResults from another instance.
@@ -795,7 +1259,11 @@ class ProcessingResults(ObjectWithParameterCollection):
         self._config["frozen_SCAN"].update_from_scan(self._SCAN)
         self._config["frozen_EXP"].update_from_diffraction_exp(self._EXP)
         self._config["frozen_TREE"].update_from_tree(self._TREE)
+        for _key in results._composites:
+            results._fill_unwritten_points(_key)
         self._composites = {
             _key: deepcopy(_val) for _key, _val in results._composites.items()
         }
+        self._valid_points = deepcopy(results._valid_points)
+        self._unfilled_points = {}
         self._config = {_key: deepcopy(_val) for _key, _val in results._config.items()}
@@ -29,6 +29,8 @@ __all__ = ["ProcessingTree"]
 
 
 import ast
+import multiprocessing as mp
+import tracemalloc
 from numbers import Integral
 from pathlib import Path
 from typing import Any, Literal, Self
@@ -39,6 +41,7 @@ from pydidas.plugins import BasePlugin, PluginCollection
 from pydidas.workflow.generic_tree import GenericTree
 from pydidas.workflow.processing_tree_io import ProcessingTreeIoMeta
 from pydidas.workflow.workflow_node import WorkflowNode
+from pydidas.workflow.workflow_profile import NodeProfile, WorkflowProfile
 
 
 PLUGINS = PluginCollection()
@@ -55,6 +58,7 @@ class ProcessingTree(GenericTree):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self._pre_executed = False
+        self._started_tracemalloc = False
         PLUGINS.sig_updated_plugins.connect(self.clear)
 
     @property
@@ -217,6 +221,10 @@ class ProcessingTree(GenericTree):
             test : bool, optional
                 Flag to run the prepare_execution method in test mode. The default
                 is False.
+            skip_unchanged : bool, optional
+                Flag to skip the pre_execute calls of reusable plugins whose
+                Parameters have not changed since they were last pre-executed.
+                The default is False.
         """
         _forced = kwargs.get("forced", False)
         _test_mode = kwargs.get("test", False)
@@ -224,7 +232,9 @@ class ProcessingTree(GenericTree):
             raise UserConfigError("The ProcessingTree has no nodes.")
         if self._pre_executed and not self.tree_has_changed and not _forced:
             return
-        self.root.prepare_execution(test=_test_mode)
+        self.root.prepare_execution(
+            test=_test_mode, skip_unchanged=kwargs.get("skip_unchanged", False)
+        )
         self._pre_executed = True
         self.reset_tree_changed_flag()
 
@@ -321,16 +331,68 @@ class ProcessingTree(GenericTree):
         string : str
             The representation.
         """
+        self.restore_from_list_of_nodes(self.__get_nodes_from_string(string))
+        self._config["tree_changed"] = True
+
+    def update_from_string(self, string: str) -> None:
+        """
+        Update the ProcessingTree from a string representation.
+
+        In contrast to the restore_from_string method, the existing nodes and
+        plugins are kept if the tree structure and the plugin classes are
+        unchanged and only the plugin Parameter values are updated. This
+        allows to skip the pre_execute calls of unchanged plugins with the
+        skip_unchanged keyword of prepare_execution.
+
+        Parameters
+        ----------
+        string : str
+            The representation.
+        """
+        _nodes = self.__get_nodes_from_string(string)
+        _new_structure = {
+            _item["node_id"]: (_item["parent"], _item["plugin_class"])
+            for _item in _nodes
+        }
+        _structure = {
+            _id: (
+                None if _node.parent is None else _node.parent.node_id,
+                _node.plugin.__class__.__name__,
+            )
+            for _id, _node in self.nodes.items()
+        }
+        if _structure != _new_structure:
+            self.restore_from_list_of_nodes(_nodes)
+            return
+        for _item in _nodes:
+            _plugin = self.nodes[_item["node_id"]].plugin
+            for _key, _val in _item["plugin_params"]:
+                if _key in _plugin.params.keys():
+                    _plugin.set_param_value(_key, _val)
+        self._config["tree_changed"] = True
+
+    @staticmethod
+    def __get_nodes_from_string(string: str) -> list[dict]:
+        """
+        Get the list of node dictionaries from a string representation.
+
+        Parameters
+        ----------
+        string : str
+            The representation.
+
+        Returns
+        -------
+        list[dict]
+            The list with a dictionary entry for each node.
+        """
         try:
-            _nodes = ast.literal_eval(string)
+            return ast.literal_eval(string)
         except SyntaxError as _syntax_error:
-            _nodes = []
             raise UserConfigError(
                 "Could not interpret the given string representation of the "
                 "Workflow to be restored. The ProcessingTree has been reset."
             ) from _syntax_error
-        self.restore_from_list_of_nodes(_nodes)
-        self._config["tree_changed"] = True
 
     def update_from_tree(self, tree: Self) -> None:
         """
@@ -379,6 +441,48 @@ class ProcessingTree(GenericTree):
             self.clear()
         self._config["tree_changed"] = True
 
+    def enable_profiling(self, enable: bool, trace_memory: bool = False) -> None:
+        """
+        Enable or disable the runtime profiling of all nodes.
+
+        Enabling the profiling resets the profiles of all nodes.
+
+        Parameters
+        ----------
+        enable : bool
+            Flag to enable profiling.
+        trace_memory : bool, optional
+            Flag to trace the peak memory allocation of the plugins with
+            tracemalloc. Note that tracing the memory slows down the
+            processing. The default is False.
+        """
+        for _node in self.nodes.values():
+            _node.profile = NodeProfile(_node.plugin.plugin_name) if enable else None
+        if enable and trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        elif not (enable and trace_memory) and self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def get_profile(self) -> WorkflowProfile:
+        """
+        Get the runtime profile of all nodes recorded in the current process.
+
+        Returns
+        -------
+        WorkflowProfile
+            The profile. It is empty if profiling has not been enabled.
+        """
+        return WorkflowProfile(
+            {
+                _node_id: _node.profile
+                for _node_id, _node in self.nodes.items()
+                if _node.profile is not None
+            },
+            pid=mp.current_process().pid,
+        )
+
     def get_current_results(self) -> dict:
         """
         Get the results of the current WorkflowTree.
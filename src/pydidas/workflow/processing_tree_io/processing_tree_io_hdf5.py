@@ -32,7 +32,7 @@ from typing import Any, NewType
 
 import h5py
 
-from pydidas.core import UserConfigError
+from pydidas.core import Hdf5FileCache, UserConfigError
 from pydidas.core.constants import HDF5_EXTENSIONS
 from pydidas.core.utils.hdf5 import (
     create_nx_dataset,
@@ -77,6 +77,7 @@ class ProcessingTreeIoHdf5(ProcessingTreeIoBase):
         """
         cls.check_for_existing_file(filename, **kwargs)
         _group_name = "entry/pydidas_config"
+        Hdf5FileCache().close(filename)
         with h5py.File(filename, "a") as _file:
             create_nx_entry_groups(_file, _group_name, group_type="NXcollection")
             create_nx_dataset(_file[_group_name], "workflow", tree.export_to_string())
@@ -32,6 +32,8 @@ import re
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from pydidas.contexts import DiffractionExperiment, Scan
 from pydidas.core import Dataset
 from pydidas.core.io_registry import GenericIoBase
@@ -47,6 +49,7 @@ class ProcessingResultIoBase(GenericIoBase, metaclass=ProcessingResultIoMeta):
     extensions = []
     default_suffix = ""
     format_name = "unknown"
+    container_filename = None
     scan_title = ""
     _node_information = {}
 
@@ -208,6 +211,72 @@ class ProcessingResultIoBase(GenericIoBase, metaclass=ProcessingResultIoMeta):
         """
         raise NotImplementedError
 
+    @classmethod
+    def export_frames_to_file(
+        cls, frames: dict[int, dict[int, Dataset]], **kwargs: Any
+    ) -> None:
+        """
+        Export the results of several frames and store them on disk.
+
+        The default implementation exports each frame individually. Subclasses
+        can override this method to write several frames in one operation.
+
+        Parameters
+        ----------
+        frames : dict[int, dict[int, Dataset]]
+            The frame result dictionaries with the frame indices as keys.
+        **kwargs
+            Any kwargs which should be passed to the underlying exporter.
+        """
+        for _index, _frame_result_dict in frames.items():
+            cls.export_frame_to_file(_index, _frame_result_dict, **kwargs)
+
+    @classmethod
+    def flush_files(cls) -> None:
+        """
+        Flush the written data to disk.
+
+        This method is a placeholder for savers which keep files open and
+        does nothing by default.
+        """
+
+    @classmethod
+    def close_files(cls) -> None:
+        """
+        Close all files which have been kept open for writing.
+
+        This method is a placeholder for savers which keep files open and
+        does nothing by default.
+        """
+
+    @classmethod
+    def get_memory_maps(
+        cls, shapes: dict[int, tuple[int, ...]], dtypes: dict[int, np.dtype]
+    ) -> dict[int, np.memmap]:
+        """
+        Get memory maps of the prepared result datasets in the files.
+
+        Savers which support memory-mapping return writable memory maps of
+        the datasets of all nodes with matching shape and datatype. The
+        results of these nodes are written through the memory maps and the
+        saver does not write them again when exporting frames. This
+        implementation does not support memory-mapping and returns an empty
+        dictionary.
+
+        Parameters
+        ----------
+        shapes : dict[int, tuple[int, ...]]
+            The shapes of the results with the node IDs as keys.
+        dtypes : dict[int, np.dtype]
+            The datatypes of the results with the node IDs as keys.
+
+        Returns
+        -------
+        dict[int, np.memmap]
+            The memory maps with the node IDs as keys.
+        """
+        return {}
+
     @classmethod
     def update_frame_metadata(cls, metadata: dict, scan: Scan | None = None) -> None:
         """
@@ -228,9 +297,35 @@ class ProcessingResultIoBase(GenericIoBase, metaclass=ProcessingResultIoMeta):
         """
         raise NotImplementedError
 
+    @classmethod
+    def get_node_ids_in_container(cls, filename: Path | str) -> list[int]:
+        """
+        Get the IDs of the nodes with results in a single result file.
+
+        This method only needs to be implemented by exporters which define a
+        container_filename for writing the results of all nodes to one file.
+
+        Parameters
+        ----------
+        filename : Path or str
+            The full filename of the result file.
+
+        Raises
+        ------
+        NotImplementedError
+            This method needs to be implemented by concrete subclasses with
+            a container_filename.
+
+        Returns
+        -------
+        list[int]
+            The node IDs.
+        """
+        raise NotImplementedError
+
     @classmethod
     def import_results_from_file(
-        cls, filename: Path | str
+        cls, filename: Path | str, node_id: int | None = None
     ) -> tuple[Dataset, dict[str, Any], Scan, DiffractionExperiment, ProcessingTree]:
         """
         Import results from a file and store them as a Dataset.
@@ -239,6 +334,10 @@ class ProcessingResultIoBase(GenericIoBase, metaclass=ProcessingResultIoMeta):
         ----------
         filename : Path or str
             The full filename of the file to be imported.
+        node_id : int or None, optional
+            The node ID for importing results from a single file with the
+            results of all nodes. If None, the file is expected to include
+            the results of a single node. The default is None.
 
         Raises
         ------
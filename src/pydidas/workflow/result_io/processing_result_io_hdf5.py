@@ -28,16 +28,19 @@ __status__ = "Production"
 __all__ = ["ProcessingResultIoHdf5"]
 
 
+import time
 from functools import partial
 from pathlib import Path
 from typing import Any
 
 import h5py
+import hdf5plugin
+import numpy as np
 
 from pydidas.contexts import DiffractionExperimentContext, ScanContext
 from pydidas.contexts.diff_exp import DiffractionExperiment
 from pydidas.contexts.scan import Scan
-from pydidas.core import Dataset, UserConfigError
+from pydidas.core import Dataset, Hdf5FileCache, PydidasQsettings, UserConfigError
 from pydidas.core.constants import HDF5_EXTENSIONS
 from pydidas.core.utils.hdf5 import (
     create_nx_dataset,
@@ -57,7 +60,6 @@ from pydidas.workflow.workflow_tree import WorkflowTree
 
 _DEFAULT_GROUPS = [
     ["entry", "NXentry"],
-    ["entry/data", "NXdata"],
     ["entry/instrument", "NXinstrument"],
     ["entry/instrument/detector", "NXdetector"],
     ["entry/instrument/detector/COLLECTION", "NXcollection"],
@@ -65,6 +67,147 @@ _DEFAULT_GROUPS = [
     ["entry/pydidas_config/diffraction_exp", "NXcollection"],
     ["entry/pydidas_config/scan", "NXcollection"],
 ]
+# The compression filters from hdf5plugin which can be selected for results.
+_HDF5PLUGIN_FILTERS = {
+    "lz4": hdf5plugin.LZ4,
+    "zstd": hdf5plugin.Zstd,
+    "bitshuffle-lz4": partial(hdf5plugin.Bitshuffle, cname="lz4"),
+}
+# The maximum size of a single chunk. Larger chunks are not supported by HDF5.
+MAX_CHUNK_BYTES = 2**31 - 1
+# The name of the result file with the results of all nodes.
+SINGLE_RESULT_FILENAME = "pydidas_results.nxs"
+
+
+def node_group_name(node_id: int | None = None) -> str:
+    """
+    Get the name of the HDF5 group with the results of a node.
+
+    Parameters
+    ----------
+    node_id : int or None, optional
+        The node ID for results in a single file with all nodes. If None,
+        the group name for files with the results of a single node is
+        returned. The default is None.
+
+    Returns
+    -------
+    str
+        The group name.
+    """
+    if node_id is None:
+        return "entry"
+    return f"entry/node_{node_id:02d}"
+
+
+def get_compression_kwargs(compression: str) -> dict[str, Any]:
+    """
+    Get the keyword arguments for creating a compressed HDF5 dataset.
+
+    Parameters
+    ----------
+    compression : str
+        The name of the compression filter. Supported filters are "gzip",
+        "lzf" and the hdf5plugin filters "lz4", "zstd" and "bitshuffle-lz4".
+        If the filter is not available, the data will not be compressed.
+
+    Returns
+    -------
+    dict[str, Any]
+        The keyword arguments for the h5py create_dataset method.
+    """
+    if compression == "gzip":
+        return {"compression": "gzip", "compression_opts": 4, "shuffle": True}
+    if compression == "lzf":
+        return {"compression": "lzf", "shuffle": True}
+    if compression in _HDF5PLUGIN_FILTERS:
+        _filter = _HDF5PLUGIN_FILTERS[compression]()
+        if h5py.h5z.filter_avail(_filter.filter_id):
+            return dict(_filter)
+    return {}
+
+
+def get_memory_mappable_dcpl() -> h5py.h5p.PropDCID:
+    """
+    Get the dataset creation property list for memory-mappable datasets.
+
+    The space of the dataset is allocated in the file when the dataset is
+    created and the data is never written with fill values. This allows to
+    memory-map the (contiguous and uncompressed) dataset without writing any
+    data. The unwritten parts of the allocated space are not stored on disk
+    on file systems which support sparse files.
+
+    Returns
+    -------
+    h5py.h5p.PropDCID
+        The dataset creation property list.
+    """
+    _dcpl = h5py.h5p.create(h5py.h5p.DATASET_CREATE)
+    _dcpl.set_alloc_time(h5py.h5d.ALLOC_TIME_EARLY)
+    _dcpl.set_fill_time(h5py.h5d.FILL_TIME_NEVER)
+    return _dcpl
+
+
+def get_consecutive_runs(indices: list[int], row_length: int) -> list[tuple[int, int]]:
+    """
+    Get the runs of consecutive indices which do not cross a row boundary.
+
+    Parameters
+    ----------
+    indices : list[int]
+        The sorted, unique (flattened) indices.
+    row_length : int
+        The length of a row, i.e. of the last dimension.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        The start index and the length of each run.
+    """
+    _runs = []
+    for _index in indices:
+        if len(_runs) > 0 and _index == sum(_runs[-1]) and _index % row_length != 0:
+            _runs[-1] = (_runs[-1][0], _runs[-1][1] + 1)
+        else:
+            _runs.append((_index, 1))
+    return _runs
+
+
+def get_chunk_shape(
+    shape: tuple[int, ...], scan: Scan, dtype: Any = np.float32
+) -> tuple[int, ...] | bool | None:
+    """
+    Get the chunk shape for a result dataset with chunks of one scan point.
+
+    Parameters
+    ----------
+    shape : tuple[int, ...]
+        The shape of the result dataset.
+    scan : Scan
+        The scan. The scan dimensions are the leading dimensions of the
+        dataset, optionally without the scan dimensions of length 1.
+    dtype : Any, optional
+        The datatype of the dataset. The default is float32.
+
+    Returns
+    -------
+    tuple[int, ...] or bool or None
+        The chunk shape. None is returned for datasets which cannot be
+        chunked and True if h5py should determine the chunk shape because
+        the data of a single scan point exceeds the maximum chunk size.
+    """
+    shape = tuple(shape)
+    if len(shape) == 0 or 0 in shape:
+        return None
+    _n_scan_dims = 0
+    for _scan_shape in (scan.shape, scan.squeezed_shape):
+        if shape[: len(_scan_shape)] == _scan_shape:
+            _n_scan_dims = len(_scan_shape)
+            break
+    _chunks = (1,) * _n_scan_dims + shape[_n_scan_dims:]
+    if np.prod(_chunks) * np.dtype(dtype).itemsize > MAX_CHUNK_BYTES:
+        return True
+    return _chunks
 
 
 def _context_config_entries(
@@ -143,14 +286,45 @@ def _context_config_entries(
 class ProcessingResultIoHdf5(ProcessingResultIoBase):
     """
     Implementation of the ProcessingResultIoBase for Hdf5 files.
+
+    The result datasets are chunked with one chunk per scan point and can be
+    compressed with the filter given by the global "hdf5_compression"
+    setting. The files are kept open between the export of frames and are
+    flushed after a number of frames or a time interval, as defined by the
+    global "hdf5_flush_n_frames" and "hdf5_flush_interval" settings. The
+    close_files method must be called to close the files after writing.
+
+    If the global "hdf5_single_file" setting is enabled, the results of all
+    nodes are written to a single file with the context configuration in the
+    shared "entry" group and the results of each node in an "entry/node_<ID>"
+    NXsubentry group. This file is switched to SWMR mode after the metadata
+    has been written and can be read while the results are written.
+
+    If the global "result_backing_store" setting is "memmap", the result
+    datasets are created contiguous and uncompressed with their space
+    allocated in the file. The ProcessingResults can then use memory maps of
+    the datasets as composites (see the get_memory_maps method) and the
+    results of mapped nodes are not written again by the saver.
     """
 
     extensions = HDF5_EXTENSIONS
     format_name = "HDF5"
     default_suffix = ".nxs"
-    _filenames = []
+    container_filename = SINGLE_RESULT_FILENAME
+    _filenames = {}
     _save_dir = None
     _metadata_written = False
+    _files = {}
+    _memory_maps = {}
+    _write_config = {
+        "compression": "None",
+        "flush_n_frames": 50,
+        "flush_interval": 5.0,
+        "single_file": False,
+        "memory_map": False,
+        "n_unflushed": 0,
+        "t_last_flush": 0.0,
+    }
 
     @classmethod
     def prepare_files_and_directories(
@@ -171,6 +345,8 @@ class ProcessingResultIoHdf5(ProcessingResultIoBase):
             the user's name for the processing node. The data_label gives
             the description of what the data shows (e.g. intensity) and the
             plugin_name is simply the name of the plugin.
+            The optional dtype key determines the datatype of the stored
+            data. The default is float32.
         **kwargs : Any
             Supported kwargs are:
 
@@ -190,6 +366,8 @@ class ProcessingResultIoHdf5(ProcessingResultIoBase):
         _scan = kwargs.get("scan_context", ScanContext())
         _exp = kwargs.get("diffraction_exp_context", DiffractionExperimentContext())
         _tree = kwargs.get("workflow_tree", WorkflowTree())
+        cls.close_files()
+        cls.update_write_config()
         cls._save_dir = Path(save_dir)
         if not cls._save_dir.exists():
             cls._save_dir.mkdir(parents=True)
@@ -200,6 +378,181 @@ class ProcessingResultIoHdf5(ProcessingResultIoBase):
         for _index in cls._node_information.keys():
             cls._create_file_and_populate_metadata(_index, _scan, _exp, _tree)
 
+    @classmethod
+    def get_filenames_from_labels(cls, labels: dict | None = None) -> dict:
+        """
+        Get the filenames from labels.
+
+        If the results are written to a single file, the filename of all
+        nodes is the name of this file.
+
+        Parameters
+        ----------
+        labels : dict or None, optional
+            The labels to be used. If labels are not supplied, they will be
+            taken from the internally stored node information. The default
+            is None.
+
+        Returns
+        -------
+        names : dict
+            The dictionary of filenames.
+        """
+        _names = super().get_filenames_from_labels(labels)
+        if cls._single_file_enabled():
+            return {_id: SINGLE_RESULT_FILENAME for _id in _names}
+        return _names
+
+    @classmethod
+    def _single_file_enabled(cls) -> bool:
+        """
+        Get the flag whether all results are written to a single file.
+
+        Returns
+        -------
+        bool
+            The flag value from the global settings.
+        """
+        return PydidasQsettings().q_settings_get("global/hdf5_single_file", bool, False)
+
+    @classmethod
+    def update_write_config(cls) -> None:
+        """Update the compression and flush configuration from the settings."""
+        _settings = PydidasQsettings()
+        cls._write_config["single_file"] = cls._single_file_enabled()
+        cls._write_config["memory_map"] = (
+            _settings.q_settings_get("global/result_backing_store", str, "memory")
+            == "memmap"
+        )
+        cls._write_config["compression"] = _settings.q_settings_get(
+            "global/hdf5_compression", str, "None"
+        )
+        cls._write_config["flush_n_frames"] = _settings.q_settings_get(
+            "global/hdf5_flush_n_frames", int, 50
+        )
+        cls._write_config["flush_interval"] = _settings.q_settings_get(
+            "global/hdf5_flush_interval", float, 5.0
+        )
+
+    @classmethod
+    def _node_group(cls, node_id: int) -> str:
+        """
+        Get the name of the group with the results of a node.
+
+        Parameters
+        ----------
+        node_id : int
+            The node ID.
+
+        Returns
+        -------
+        str
+            The group name.
+        """
+        return node_group_name(node_id if cls._write_config["single_file"] else None)
+
+    @classmethod
+    def _get_file(cls, node_id: int) -> h5py.File:
+        """
+        Get the open file handle for the results of a node.
+
+        Parameters
+        ----------
+        node_id : int
+            The node ID.
+
+        Returns
+        -------
+        h5py.File
+            The file handle. The file is opened if it is not yet open.
+        """
+        _filename = cls._filenames[node_id]
+        if _filename not in cls._files or not cls._files[_filename].id.valid:
+            _file_path = cls._save_dir / _filename  # type: ignore[operator]
+            Hdf5FileCache().close(_file_path)
+            if cls._write_config["single_file"]:
+                _file = h5py.File(_file_path, "r+", libver="latest")
+                if cls._metadata_written:
+                    _file.swmr_mode = True
+            else:
+                _file = h5py.File(_file_path, "r+")
+            cls._files[_filename] = _file
+        return cls._files[_filename]
+
+    @classmethod
+    def flush_files(cls) -> None:
+        """Flush all open files and memory maps to disk."""
+        for _file in cls._files.values():
+            if _file.id.valid:
+                _file.flush()
+        for _map in cls._memory_maps.values():
+            _map.flush()
+        cls._write_config["n_unflushed"] = 0
+        cls._write_config["t_last_flush"] = time.perf_counter()
+
+    @classmethod
+    def close_files(cls) -> None:
+        """
+        Close all open files.
+
+        The memory maps are flushed and released by the saver but remain
+        valid for other references, e.g. in the ProcessingResults.
+        """
+        cls.flush_files()
+        for _file in cls._files.values():
+            if _file.id.valid:
+                _file.close()
+        cls._files = {}
+        cls._memory_maps = {}
+        cls._write_config["n_unflushed"] = 0
+
+    @classmethod
+    def get_memory_maps(
+        cls, shapes: dict[int, tuple[int, ...]], dtypes: dict[int, np.dtype]
+    ) -> dict[int, np.memmap]:
+        """
+        Get memory maps of the prepared result datasets in the files.
+
+        Memory maps are only available if the files have been prepared with
+        the "memmap" result_backing_store setting. The results of mapped
+        nodes are not written again when exporting frames.
+
+        Parameters
+        ----------
+        shapes : dict[int, tuple[int, ...]]
+            The shapes of the results with the node IDs as keys.
+        dtypes : dict[int, np.dtype]
+            The datatypes of the results with the node IDs as keys.
+
+        Returns
+        -------
+        dict[int, np.memmap]
+            The writable memory maps with the node IDs as keys.
+        """
+        if not cls._write_config["memory_map"]:
+            return {}
+        for _node_id, _shape in shapes.items():
+            if _node_id in cls._memory_maps or _node_id not in cls._node_information:
+                continue
+            _file = cls._get_file(_node_id)
+            _dset = _file[f"{cls._node_group(_node_id)}/data/data"]
+            _offset = _dset.id.get_offset()
+            if (
+                _offset is None
+                or _dset.shape != tuple(_shape)
+                or _dset.dtype != np.dtype(dtypes.get(_node_id, np.float32))
+            ):
+                continue
+            _file.flush()
+            cls._memory_maps[_node_id] = np.memmap(
+                _file.filename,
+                dtype=_dset.dtype,
+                mode="r+",
+                offset=_offset,
+                shape=_dset.shape,
+            )
+        return {_id: _map for _id, _map in cls._memory_maps.items() if _id in shapes}
+
     @classmethod
     def _create_file_and_populate_metadata(
         cls,
@@ -211,6 +564,10 @@ class ProcessingResultIoHdf5(ProcessingResultIoBase):
         """
         Create a hdf5 file and populate it with the Scan metadata.
 
+        If all results are written to a single file, the file is only created
+        for the first node and the groups of the other nodes are added to the
+        existing file.
+
         Parameters
         ----------
         node_id : int
@@ -222,13 +579,42 @@ class ProcessingResultIoHdf5(ProcessingResultIoBase):
         workflow : ProcessingTree
             The workflow tree.
         """
-        _dsets = cls._get_datasets_to_be_written(node_id, scan, exp, workflow)
-        _file_path = cls._save_dir / cls._filenames[node_id]
-        with h5py.File(_file_path, "w") as _file:  # type: ignore[operator]
+        _filename = cls._filenames[node_id]
+        _group = cls._node_group(node_id)
+        _file_open = _filename in cls._files and cls._files[_filename].id.valid
+        if cls._write_config["single_file"] and _file_open:
+            _file = cls._files[_filename]
+            if _group in _file:
+                del _file[_group]
+            _new_file = False
+        else:
+            if _file_open:
+                cls._files.pop(_filename).close()
+            Hdf5FileCache().close(cls._save_dir / _filename)  # type: ignore[operator]
+            if cls._write_config["memory_map"]:
+                # The file is removed instead of overwritten to keep existing
+                # memory maps of the old file valid:
+                (cls._save_dir / _filename).unlink(missing_ok=True)  # type: ignore[operator]
+            _file = h5py.File(
+                cls._save_dir / _filename,  # type: ignore[operator]
+                "w",
+                **({"libver": "latest"} if cls._write_config["single_file"] else {}),
+            )
             for _group_key, _type in _DEFAULT_GROUPS:
                 create_nx_entry_groups(_file, _group_key, group_type=_type)
-            for _group, _name, kws, _nxs_attrs in _dsets:
-                create_nx_dataset(_file[_group], _name, kws, **_nxs_attrs)
+            _new_file = True
+        if cls._write_config["single_file"]:
+            create_nx_entry_groups(
+                _file, _group, group_type="NXsubentry", default="data"
+            )
+            _file["entry"].attrs.setdefault("default", _group.removeprefix("entry/"))
+        create_nx_entry_groups(_file, f"{_group}/data", group_type="NXdata")
+        _dsets = cls._get_datasets_to_be_written(
+            node_id, scan, exp, workflow, include_context=_new_file
+        )
+        for _group_key, _name, kws, _nxs_attrs in _dsets:
+            create_nx_dataset(_file[_group_key], _name, kws, **_nxs_attrs)
+        cls._files[_filename] = _file
 
     @classmethod
     def _get_datasets_to_be_written(
@@ -237,6 +623,7 @@ class ProcessingResultIoHdf5(ProcessingResultIoBase):
         scan: Scan,
         exp: DiffractionExperiment,
         workflow: ProcessingTree,
+        include_context: bool = True,
     ) -> list[tuple[str, str, Any, dict[str, Any]]]:
         """
         Get the datasets to be written to the hdf5 file.
@@ -251,6 +638,9 @@ class ProcessingResultIoHdf5(ProcessingResultIoBase):
             The diffraction experiment (context).
         workflow : ProcessingTree
             The workflow tree.
+        include_context : bool, optional
+            Flag to include the scan title and the context configuration
+            which are shared by all nodes. The default is True.
 
         Returns
         -------
@@ -261,39 +651,53 @@ class ProcessingResultIoHdf5(ProcessingResultIoBase):
         """
 
         _node_attribute = partial(cls.get_node_attribute, node_id)
+        _group = cls._node_group(node_id)
+        _dtype = cls._node_information[node_id].get("dtype", "float32")
+        _chunks = get_chunk_shape(_node_attribute("shape"), scan, _dtype)
+        _data_kwargs = {"shape": _node_attribute("shape"), "dtype": _dtype}
+        if cls._write_config["memory_map"]:
+            _data_kwargs["dcpl"] = get_memory_mappable_dcpl()
+        elif _chunks is not None:
+            _data_kwargs["chunks"] = _chunks
+            _data_kwargs.update(
+                get_compression_kwargs(cls._write_config["compression"])
+            )
         _dsets: list[tuple[str, str, Any, dict[str, Any]]] = [
             (
-                "entry",
-                "scan_title",
-                {"data": cls.scan_title},
-                {"NX_class": "NX_CHAR", "units": ""},
-            ),
-            (
-                "entry",
+                _group,
                 "node_id",
                 {"data": node_id},
                 {"NX_class": "NX_INT", "units": ""},
             ),
             (
-                "entry",
+                _group,
                 "node_label",
                 {"data": _node_attribute("node_label")},
                 {"NX_class": "NX_CHAR", "units": ""},
             ),
             (
-                "entry",
+                _group,
                 "plugin_name",
                 {"data": _node_attribute("plugin_name")},
                 {"NX_class": "NX_CHAR", "units": ""},
             ),
             (
-                "entry/data",
+                f"{_group}/data",
                 "data",
-                {"shape": _node_attribute("shape")},
+                _data_kwargs,
                 {"NX_class": "NX_INT", "units": ""},
             ),
         ]
-        _dsets.extend(_context_config_entries(scan, exp, workflow))  # type: ignore[arg-type]
+        if include_context:
+            _dsets.append(
+                (
+                    "entry",
+                    "scan_title",
+                    {"data": cls.scan_title},
+                    {"NX_class": "NX_CHAR", "units": ""},
+                )
+            )
+            _dsets.extend(_context_config_entries(scan, exp, workflow))  # type: ignore[arg-type]
         return _dsets
 
     @classmethod
@@ -307,6 +711,9 @@ class ProcessingResultIoHdf5(ProcessingResultIoBase):
         """
         Export the results of one frame and store them on disk.
 
+        The files are kept open and are flushed after the number of frames
+        or the time interval given in the write configuration.
+
         Parameters
         ----------
         index : int
@@ -325,9 +732,73 @@ class ProcessingResultIoHdf5(ProcessingResultIoBase):
             _metadata = cls.update_with_scan_metadata(frame_result_dict, _scan)
             cls.update_metadata(_metadata, scan=_scan)
         for _node_id, _data in frame_result_dict.items():
-            _file_path = cls._save_dir / cls._filenames[_node_id]
-            with h5py.File(_file_path, "r+") as _file:  # type: ignore[operator]
-                _file["entry/data/data"][_indices] = _data
+            if _node_id in cls._memory_maps:
+                continue
+            _dset = cls._get_file(_node_id)[f"{cls._node_group(_node_id)}/data/data"]
+            _dset[_indices] = np.asarray(_data)
+        cls._register_written_frames(1)
+
+    @classmethod
+    def export_frames_to_file(
+        cls,
+        frames: dict[int, dict[int, Dataset]],
+        scan_context: Scan | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Export the results of several frames and store them on disk.
+
+        Frames with consecutive indices in the same row of the scan are
+        written together in a single hyperslab.
+
+        Parameters
+        ----------
+        frames : dict[int, dict[int, Dataset]]
+            The frame result dictionaries with the frame indices as keys.
+        scan_context : Scan or None, optional
+            The scan context to be used for exporting to file. If None, the
+            global scan context will be used. The default is None.
+        **kwargs : Any
+            Kwargs which should be passed to the underlying exporter.
+        """
+        if len(frames) == 0:
+            return
+        _scan = ScanContext() if scan_context is None else scan_context
+        if not cls._metadata_written:
+            _first_frame = frames[min(frames)]
+            _metadata = cls.update_with_scan_metadata(_first_frame, _scan)
+            cls.update_metadata(_metadata, scan=_scan)
+        _node_ids = [_id for _id in frames[min(frames)] if _id not in cls._memory_maps]
+        for _start, _n in get_consecutive_runs(sorted(frames), _scan.shape[-1]):
+            _indices = _scan.get_indices_from_ordinal(_start)
+            _slices = _indices[:-1] + (slice(_indices[-1], _indices[-1] + _n),)
+            for _node_id in _node_ids:
+                _data = np.stack(
+                    [np.asarray(frames[_start + _i][_node_id]) for _i in range(_n)]
+                )
+                _dset = cls._get_file(_node_id)[
+                    f"{cls._node_group(_node_id)}/data/data"
+                ]
+                _dset[_slices] = _data
+        cls._register_written_frames(len(frames))
+
+    @classmethod
+    def _register_written_frames(cls, n_frames: int) -> None:
+        """
+        Register written frames and flush the files, if required.
+
+        Parameters
+        ----------
+        n_frames : int
+            The number of written frames.
+        """
+        cls._write_config["n_unflushed"] += n_frames
+        if (
+            cls._write_config["n_unflushed"] >= cls._write_config["flush_n_frames"]
+            or time.perf_counter() - cls._write_config["t_last_flush"]
+            >= cls._write_config["flush_interval"]
+        ):
+            cls.flush_files()
 
     @classmethod
     def export_full_data_to_file(
@@ -339,6 +810,8 @@ class ProcessingResultIoHdf5(ProcessingResultIoBase):
         """
         Export the full dataset to disk.
 
+        The files are closed after writing the data.
+
         Parameters
         ----------
         full_data : dict
@@ -354,11 +827,13 @@ class ProcessingResultIoHdf5(ProcessingResultIoBase):
         if not cls._metadata_written:
             cls.update_metadata(full_data, scan=scan_context, squeeze=squeeze)
         for _node_id, _data in full_data.items():
+            if _node_id in cls._memory_maps:
+                continue
             if squeeze:
                 _data = _data.squeeze()
-            _file_path = cls._save_dir / cls._filenames[_node_id]
-            with h5py.File(_file_path, "r+") as _file:  # type: ignore[operator]
-                _file["entry/data/data"][()] = _data.array
+            _dset = cls._get_file(_node_id)[f"{cls._node_group(_node_id)}/data/data"]
+            _dset[()] = _data.array
+        cls.close_files()
 
     @classmethod
     def update_with_scan_metadata(
@@ -425,6 +900,9 @@ class ProcessingResultIoHdf5(ProcessingResultIoBase):
         Update the frame metadata with a separately supplied metadata
         dictionary.
 
+        If all results are written to a single file, the file is switched to
+        SWMR mode after writing the metadata.
+
         Parameters
         ----------
         metadata : dict[int, Dataset or dict[str, Any]]
@@ -449,30 +927,33 @@ class ProcessingResultIoHdf5(ProcessingResultIoBase):
                     _metadata = _metadata.squeeze()
                 _metadata = _metadata.property_dict
             _ndim = len(_metadata["axis_labels"])
-            _file_path = cls._save_dir / cls._filenames[_id]
-            with h5py.File(_file_path, "r+") as _file:  # type: ignore[operator]
-                _nxdata_group = _file["entry/data"]
-                _nxdata_group.attrs["title"] = _metadata.get("data_label", "")
-                _nxdata_group.attrs["signal"] = "data"
-                _nxdata_group.attrs["axes"] = [f"axis_{_i}" for _i in range(_ndim)]
-                _file["entry/data/data"].attrs["units"] = _metadata.get("data_unit", "")
-                for _dim in range(_ndim):
-                    _nxdata_group.attrs[f"axis_{_dim}_indices"] = [_dim]
-                    _ = create_nx_dataset(
-                        _nxdata_group,
-                        f"axis_{_dim}",
-                        _metadata["axis_ranges"][_dim],
-                        units=_metadata["axis_units"][_dim],
-                        long_name=_metadata["axis_labels"][_dim],
-                        axis=_dim,
-                    )
-                create_nx_dataset(
-                    _file["entry/pydidas_config"],
-                    "squeezed_scan_dims",
-                    {"data": _squeezed_scan_dims},
-                    NX_class="NX_CHAR",
-                    units="",
+            _nxdata_group = cls._get_file(_id)[f"{cls._node_group(_id)}/data"]
+            _nxdata_group.attrs["title"] = _metadata.get("data_label", "")
+            _nxdata_group.attrs["signal"] = "data"
+            _nxdata_group.attrs["axes"] = [f"axis_{_i}" for _i in range(_ndim)]
+            _nxdata_group["data"].attrs["units"] = _metadata.get("data_unit", "")
+            for _dim in range(_ndim):
+                _nxdata_group.attrs[f"axis_{_dim}_indices"] = [_dim]
+                _ = create_nx_dataset(
+                    _nxdata_group,
+                    f"axis_{_dim}",
+                    _metadata["axis_ranges"][_dim],
+                    units=_metadata["axis_units"][_dim],
+                    long_name=_metadata["axis_labels"][_dim],
+                    axis=_dim,
                 )
+        for _filename in {cls._filenames[_id] for _id in metadata}:
+            _file = cls._files[_filename]
+            create_nx_dataset(
+                _file["entry/pydidas_config"],
+                "squeezed_scan_dims",
+                {"data": _squeezed_scan_dims},
+                NX_class="NX_CHAR",
+                units="",
+            )
+            if cls._write_config["single_file"] and not _file.swmr_mode:
+                _file.swmr_mode = True
+        cls.flush_files()
         cls._metadata_written = True
 
     @classmethod
@@ -510,17 +991,48 @@ class ProcessingResultIoHdf5(ProcessingResultIoBase):
             data.update_axis_range(_dim, _range)
         return data  # type: ignore[return-value]
 
+    @classmethod
+    def get_node_ids_in_container(cls, filename: Path | str) -> list[int]:
+        """
+        Get the IDs of the nodes with results in a single result file.
+
+        Parameters
+        ----------
+        filename : Path or str
+            The full filename of the result file.
+
+        Returns
+        -------
+        list[int]
+            The sorted node IDs.
+        """
+        with h5py.File(filename, "r", swmr=True) as _file:
+            return sorted(
+                int(read_and_decode_hdf5_dataset(_group["node_id"]))
+                for _group in _file["entry"].values()
+                if isinstance(_group, h5py.Group)
+                and _group.attrs.get("NX_class", "") == "NXsubentry"
+                and "node_id" in _group
+            )
+
     @classmethod
     def import_results_from_file(
-        cls, filename: Path | str
+        cls, filename: Path | str, node_id: int | None = None
     ) -> tuple[Dataset, dict[str, Any], Scan, DiffractionExperiment, ProcessingTree]:
         """
         Import results from a file and store them as a Dataset.
 
+        Files are opened in SWMR mode and can be imported while the results
+        are written.
+
         Parameters
         ----------
         filename : Path or str
             The full filename of the file to be imported.
+        node_id : int or None, optional
+            The node ID for importing results from a single file with the
+            results of all nodes. If None, the file is expected to include
+            the results of a single node. The default is None.
 
         Returns
         -------
@@ -539,10 +1051,11 @@ class ProcessingResultIoHdf5(ProcessingResultIoBase):
         _tree = ProcessingTree()
         _scan = Scan()
         _exp = DiffractionExperiment()
-        _data = import_data(filename, auto_squeeze=False)
+        _group = node_group_name(node_id)
+        _data = import_data(filename, auto_squeeze=False, dataset=f"{_group}/data/data")
         _scan.import_from_file(filename)
         _exp.import_from_file(filename)
-        with h5py.File(filename, "r") as _file:
+        with h5py.File(filename, "r", swmr=True) as _file:
             try:
                 _tree.restore_from_string(
                     str(
@@ -558,13 +1071,13 @@ class ProcessingResultIoHdf5(ProcessingResultIoBase):
                 )
             _info = {
                 "node_label": read_and_decode_hdf5_dataset(  # type: ignore[arg-type]
-                    _file["entry/node_label"]
+                    _file[f"{_group}/node_label"]
                 ),
                 "plugin_name": read_and_decode_hdf5_dataset(  # type: ignore[arg-type]
-                    _file["entry/plugin_name"]
+                    _file[f"{_group}/plugin_name"]
                 ),
                 "node_id": read_and_decode_hdf5_dataset(  # type: ignore[arg-type]
-                    _file["entry/node_id"]
+                    _file[f"{_group}/node_id"]
                 ),
             }
             _info["result_title"] = (
@@ -35,6 +35,8 @@ import os
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from pydidas.contexts.diff_exp import DiffractionExperiment
 from pydidas.contexts.scan import Scan
 from pydidas.core import Dataset
@@ -203,6 +205,62 @@ class ProcessingResultIoMeta(GenericIoMeta):
             _saver = cls.registry[_ext]
             _saver.export_frame_to_file(index, frame_result_dict, **kwargs)
 
+    @classmethod
+    def export_frames_to_active_savers(cls, frames: dict, **kwargs: dict):
+        """
+        Export the results of several frames to all active savers.
+
+        Parameters
+        ----------
+        frames : dict
+            The frame result dictionaries with the frame indices as keys.
+        kwargs : dict
+            Any kwargs which should be passed to the underlying exporter.
+        """
+        for _ext in cls.active_savers:
+            _saver = cls.registry[_ext]
+            _saver.export_frames_to_file(frames, **kwargs)
+
+    @classmethod
+    def flush_active_savers(cls):
+        """Flush the written data of all active savers to disk."""
+        for _ext in cls.active_savers:
+            cls.registry[_ext].flush_files()
+
+    @classmethod
+    def close_active_savers(cls):
+        """Close all files which have been kept open by the active savers."""
+        for _ext in cls.active_savers:
+            cls.registry[_ext].close_files()
+
+    @classmethod
+    def get_memory_maps_from_active_savers(
+        cls, shapes: dict[int, tuple[int, ...]], dtypes: dict[int, np.dtype]
+    ) -> dict[int, np.memmap]:
+        """
+        Get memory maps of the prepared result datasets of the active savers.
+
+        Parameters
+        ----------
+        shapes : dict[int, tuple[int, ...]]
+            The shapes of the results with the node IDs as keys.
+        dtypes : dict[int, np.dtype]
+            The datatypes of the results with the node IDs as keys.
+
+        Returns
+        -------
+        dict[int, np.memmap]
+            The memory maps with the node IDs as keys. Each node is only
+            mapped by one saver.
+        """
+        _maps = {}
+        for _ext in cls.active_savers:
+            _remaining_shapes = {
+                _id: _shape for _id, _shape in shapes.items() if _id not in _maps
+            }
+            _maps.update(cls.registry[_ext].get_memory_maps(_remaining_shapes, dtypes))
+        return _maps
+
     @classmethod
     def export_full_data_to_active_savers(
         cls,
@@ -263,7 +321,9 @@ class ProcessingResultIoMeta(GenericIoMeta):
         Import data from files in a directory.
 
         This method imports data, reads the metadata and passes it in a format for
-        the ProcessingResults to update itself.
+        the ProcessingResults to update itself. Both files with the results of
+        single nodes and files with the results of all nodes (as defined by
+        the exporters' container_filename) are imported.
 
         Parameters
         ----------
@@ -290,20 +350,34 @@ class ProcessingResultIoMeta(GenericIoMeta):
         _exp = DiffractionExperiment()
         _tree = ProcessingTree()
         dir_name = Path(dir_name)
+        _containers = {
+            _importer.container_filename: _importer
+            for _importer in cls.registry.values()
+            if _importer.container_filename is not None
+        }
         _files = [
             _file
             for _file in os.listdir(dir_name)
-            if (dir_name / _file).exists() and _file.startswith("node_")
+            if (dir_name / _file).exists()
+            and (_file.startswith("node_") or _file in _containers)
         ]
         for _file in _files:
-            _ext = get_extension(_file)
-            cls.verify_extension_is_registered(_ext)
-            _importer = cls.registry[_ext]
-            _node_id = int(_file[5:7])
             _path = dir_name / _file
-            _data, _node_info, _scan, _exp, _tree = _importer.import_results_from_file(
-                _path
-            )
-            _data_dict[_node_id] = _data
-            _node_info_dict[_node_id] = _node_info
+            if _file in _containers:
+                _importer = _containers[_file]
+                _import_kwargs = {
+                    _node_id: {"node_id": _node_id}
+                    for _node_id in _importer.get_node_ids_in_container(_path)
+                }
+            else:
+                _ext = get_extension(_file)
+                cls.verify_extension_is_registered(_ext)
+                _importer = cls.registry[_ext]
+                _import_kwargs = {int(_file[5:7]): {}}
+            for _node_id, _kwargs in _import_kwargs.items():
+                _data, _node_info, _scan, _exp, _tree = (
+                    _importer.import_results_from_file(_path, **_kwargs)
+                )
+                _data_dict[_node_id] = _data
+                _node_info_dict[_node_id] = _node_info
         return _data_dict, _node_info_dict, _scan, _exp, _tree
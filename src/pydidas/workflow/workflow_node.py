@@ -28,14 +28,18 @@ __status__ = "Production"
 __all__ = ["WorkflowNode"]
 
 
+import time
+import tracemalloc
 from copy import deepcopy
 from numbers import Integral, Real
 from typing import Any, Self
 
 from pydidas.core import Dataset
-from pydidas.core.utils import TimerSaveRuntime
+from pydidas.core.constants import INPUT_PLUGIN, OUTPUT_PLUGIN
+from pydidas.core.utils import TimerSaveRuntime, get_param_file_stamps
 from pydidas.plugins import BasePlugin
 from pydidas.workflow.generic_node import GenericNode
+from pydidas.workflow.workflow_profile import NodeProfile
 
 
 class WorkflowNode(GenericNode):
@@ -44,6 +48,11 @@ class WorkflowNode(GenericNode):
 
     The WorkflowNode allows executing plugins individually or in a full workflow
     chain through the WorkflowTree.
+
+    If a NodeProfile is set as the node's profile attribute, the runtime, the
+    data sizes and the peak memory allocation (if tracemalloc is tracing) of
+    each plugin execution are recorded in the profile. The runtimes of input
+    and output plugins are counted as I/O time.
     """
 
     kwargs_for_copy_creation = ["plugin", "node_id"]
@@ -54,6 +63,8 @@ class WorkflowNode(GenericNode):
         self.results = None
         self.result_kws = None
         self.runtime = -1
+        self.profile: NodeProfile | None = None
+        self._pre_execute_hash = None
 
     def __preprocess_kwargs(self, kwargs: dict) -> None:
         """
@@ -163,7 +174,12 @@ class WorkflowNode(GenericNode):
         Prepare the execution of the plugin chain.
 
         This method recursively calls the pre_execute methods of all (child)
-        plugins.
+        plugins. The plugins' reset_run_state methods are always called, even
+        if the pre_execute call is skipped.
+
+        Only plugins which declare their pre_execute state as reusable
+        (through the pre_execute_is_reusable class attribute) can be skipped.
+        Input plugins are always pre-executed.
 
         Parameters
         ----------
@@ -175,11 +191,35 @@ class WorkflowNode(GenericNode):
                 Flag to indicate that the plugin should be executed in test
                 mode. This flag will prevent the plugin from storing any
                 data to the file system.
+            skip_unchanged : bool, optional
+                Flag to skip the pre_execute call of reusable plugins if the
+                plugin Parameters and the files referenced by them have not
+                changed since the last call. If the Parameters or files of a
+                plugin have changed, all child plugins will be pre-executed
+                as well. The default is False.
         """
         _test_mode = kwargs.get("test", False)
         self.results = None
         self.plugin.test_mode = _test_mode
-        self.plugin.pre_execute()
+        _hash = hash(
+            (
+                hash(self.plugin.params),
+                get_param_file_stamps(self.plugin.params),
+                _test_mode,
+            )
+        )
+        _changed = _hash != self._pre_execute_hash
+        if _changed:
+            kwargs = kwargs | {"skip_unchanged": False}
+        if (
+            _changed
+            or not kwargs.get("skip_unchanged", False)
+            or not self.plugin.pre_execute_is_reusable
+            or self.plugin.plugin_type == INPUT_PLUGIN
+        ):
+            self.plugin.pre_execute()
+            self._pre_execute_hash = _hash
+        self.plugin.reset_run_state()
         for _child in self._children:
             _child.prepare_execution(**kwargs)
 
@@ -203,6 +243,12 @@ class WorkflowNode(GenericNode):
         kwargs : dict
             Any keywords required for calling the next plugin.
         """
+        if self.profile is not None:
+            _t_start = time.time()
+            _trace_memory = tracemalloc.is_tracing()
+            if _trace_memory:
+                tracemalloc.reset_peak()
+                _memory_start = tracemalloc.get_traced_memory()[0]
         with TimerSaveRuntime() as _runtime:
             self.clear_data()
             if kwargs.get("store_input_data", False):
@@ -210,6 +256,23 @@ class WorkflowNode(GenericNode):
             _results, kwargs = self.plugin.execute(arg, **kwargs)
         self._store_results_if_required(_results, kwargs)
         self.runtime = _runtime()
+        if self.profile is not None:
+            self.profile.add_call(
+                _t_start,
+                self.runtime,
+                io_time=(
+                    self.runtime
+                    if self.plugin.plugin_type in (INPUT_PLUGIN, OUTPUT_PLUGIN)
+                    else 0.0
+                ),
+                bytes_in=getattr(arg, "nbytes", 0),
+                bytes_out=getattr(_results, "nbytes", 0),
+                peak_memory=(
+                    tracemalloc.get_traced_memory()[1] - _memory_start
+                    if _trace_memory
+                    else 0
+                ),
+            )
         return _results, kwargs
 
     def execute_plugin_chain(self, arg: Dataset | int, **kwargs: Any) -> None:
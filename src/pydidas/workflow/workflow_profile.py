@@ -0,0 +1,368 @@
+# This file is part of pydidas.
+#
+# Copyright 2026, Helmholtz-Zentrum Hereon
+# SPDX-License-Identifier: GPL-3.0-only
+#
+# pydidas is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# Pydidas is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pydidas. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module with the NodeProfile and WorkflowProfile classes to collect runtime
+profiles of the plugins in a workflow.
+"""
+
+__author__ = "Malte Storm"
+__copyright__ = "Copyright 2026, Helmholtz-Zentrum Hereon"
+__license__ = "GPL-3.0-only"
+__maintainer__ = "Malte Storm"
+__status__ = "Production"
+__all__ = ["NodeProfile", "WorkflowProfile"]
+
+
+import json
+from bisect import bisect_right
+from pathlib import Path
+from typing import Any, Self
+
+import numpy as np
+
+
+# The bin edges of the runtime histograms (in seconds) with four bins per
+# decade between 1 us and 100 s.
+RUNTIME_HISTOGRAM_EDGES = tuple(float(_v) for _v in np.logspace(-6, 2, 33))
+# The maximum number of trace events stored for each node in each process.
+MAX_TRACE_EVENTS = 100_000
+PROFILE_EXPORT_FORMATS = ("json", "chrome_trace")
+
+
+class NodeProfile:
+    """
+    The runtime profile of a single WorkflowNode.
+
+    The profile collects the number of calls, the total runtime (split into
+    I/O and compute time), the number of bytes passed into and returned by
+    the plugin, the peak memory allocation and a histogram of the runtimes.
+    The start time and duration of each call are stored for trace exports.
+
+    Parameters
+    ----------
+    label : str, optional
+        The label of the node, e.g. the plugin name. The default is "".
+    """
+
+    __slots__ = (
+        "label",
+        "n_calls",
+        "runtime",
+        "io_time",
+        "bytes_in",
+        "bytes_out",
+        "peak_memory",
+        "histogram",
+        "events",
+    )
+
+    def __init__(self, label: str = ""):
+        self.label = label
+        self.n_calls = 0
+        self.runtime = 0.0
+        self.io_time = 0.0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.peak_memory = 0
+        self.histogram = [0] * (len(RUNTIME_HISTOGRAM_EDGES) + 1)
+        self.events = []
+
+    def __getstate__(self) -> dict:
+        return {_key: getattr(self, _key) for _key in self.__slots__}
+
+    def __setstate__(self, state: dict) -> None:
+        for _key, _value in state.items():
+            setattr(self, _key, _value[:] if isinstance(_value, list) else _value)
+
+    @classmethod
+    def from_state(cls, state: dict) -> Self:
+        """
+        Create a new NodeProfile from the state of another profile.
+
+        The state only consists of builtin types and allows to pass profiles
+        to processes without importing pydidas, e.g. to a mp.Manager.
+
+        Parameters
+        ----------
+        state : dict
+            The state, as returned by the __getstate__ method.
+
+        Returns
+        -------
+        NodeProfile
+            The new profile.
+        """
+        _profile = cls()
+        _profile.__setstate__(state)
+        return _profile
+
+    @property
+    def compute_time(self) -> float:
+        """
+        Get the total compute (i.e. non-I/O) time.
+
+        Returns
+        -------
+        float
+            The compute time in seconds.
+        """
+        return self.runtime - self.io_time
+
+    def add_call(
+        self,
+        t_start: float,
+        runtime: float,
+        io_time: float = 0.0,
+        bytes_in: int = 0,
+        bytes_out: int = 0,
+        peak_memory: int = 0,
+    ) -> None:
+        """
+        Add a single plugin call to the profile.
+
+        Parameters
+        ----------
+        t_start : float
+            The start time of the call as a unix timestamp (in seconds).
+        runtime : float
+            The runtime of the call in seconds.
+        io_time : float, optional
+            The part of the runtime spent in I/O operations. The default is 0.
+        bytes_in : int, optional
+            The number of bytes of the input data. The default is 0.
+        bytes_out : int, optional
+            The number of bytes of the results. The default is 0.
+        peak_memory : int, optional
+            The peak memory allocation during the call in bytes. The default
+            is 0.
+        """
+        self.n_calls += 1
+        self.runtime += runtime
+        self.io_time += io_time
+        self.bytes_in += bytes_in
+        self.bytes_out += bytes_out
+        self.peak_memory = max(self.peak_memory, peak_memory)
+        self.histogram[bisect_right(RUNTIME_HISTOGRAM_EDGES, runtime)] += 1
+        if len(self.events) < MAX_TRACE_EVENTS:
+            self.events.append((t_start, runtime))
+
+    def merge(self, other: Self) -> None:
+        """
+        Merge the statistics of another profile into this profile.
+
+        The trace events are not merged because they refer to the process
+        which has recorded them.
+
+        Parameters
+        ----------
+        other : NodeProfile
+            The other profile.
+        """
+        self.label = self.label or other.label
+        self.n_calls += other.n_calls
+        self.runtime += other.runtime
+        self.io_time += other.io_time
+        self.bytes_in += other.bytes_in
+        self.bytes_out += other.bytes_out
+        self.peak_memory = max(self.peak_memory, other.peak_memory)
+        self.histogram = [_a + _b for _a, _b in zip(self.histogram, other.histogram)]
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Get the profile statistics as a dictionary.
+
+        Returns
+        -------
+        dict[str, Any]
+            The profile statistics.
+        """
+        return {
+            "label": self.label,
+            "n_calls": self.n_calls,
+            "runtime": self.runtime,
+            "io_time": self.io_time,
+            "compute_time": self.compute_time,
+            "mean_runtime": self.runtime / max(1, self.n_calls),
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "peak_memory": self.peak_memory,
+            "histogram": {
+                "bin_edges": list(RUNTIME_HISTOGRAM_EDGES),
+                "counts": self.histogram[:],
+            },
+        }
+
+
+class WorkflowProfile:
+    """
+    The runtime profile of all nodes of a workflow, aggregated over processes.
+
+    Parameters
+    ----------
+    node_profiles : dict[int, NodeProfile] or None, optional
+        The profiles of the nodes with the node IDs as keys. The default is
+        None.
+    pid : int, optional
+        The ID of the process which has recorded the node profiles. The
+        default is 0.
+    """
+
+    def __init__(
+        self, node_profiles: dict[int, NodeProfile] | None = None, pid: int = 0
+    ):
+        self._nodes = {}
+        self._events = {}
+        self._pids = set()
+        if node_profiles:
+            self.add_process_profiles(node_profiles, pid)
+
+    @property
+    def nodes(self) -> dict[int, NodeProfile]:
+        """
+        Get the aggregated profiles of all nodes.
+
+        Returns
+        -------
+        dict[int, NodeProfile]
+            The node profiles with the node IDs as keys.
+        """
+        return self._nodes
+
+    @property
+    def n_processes(self) -> int:
+        """
+        Get the number of processes which have contributed to the profile.
+
+        Returns
+        -------
+        int
+            The number of processes.
+        """
+        return len(self._pids)
+
+    def add_process_profiles(
+        self, node_profiles: dict[int, NodeProfile], pid: int
+    ) -> None:
+        """
+        Add the node profiles of a single process.
+
+        Parameters
+        ----------
+        node_profiles : dict[int, NodeProfile]
+            The profiles of the nodes with the node IDs as keys.
+        pid : int
+            The ID of the process.
+        """
+        for _node_id, _profile in node_profiles.items():
+            if _profile.n_calls == 0:
+                continue
+            self._pids.add(pid)
+            self._nodes.setdefault(_node_id, NodeProfile(_profile.label)).merge(
+                _profile
+            )
+            self._events.setdefault((pid, _node_id), []).extend(_profile.events)
+
+    def merge(self, other: Self) -> None:
+        """
+        Merge another WorkflowProfile into this profile.
+
+        Parameters
+        ----------
+        other : WorkflowProfile
+            The other profile.
+        """
+        for _node_id, _profile in other.nodes.items():
+            self._nodes.setdefault(_node_id, NodeProfile(_profile.label)).merge(
+                _profile
+            )
+        for _key, _events in other._events.items():
+            self._events.setdefault(_key, []).extend(_events)
+        self._pids.update(other._pids)
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Get the profile as a dictionary.
+
+        Returns
+        -------
+        dict[str, Any]
+            The profile with the total I/O and compute times and the
+            statistics of all nodes.
+        """
+        return {
+            "n_processes": self.n_processes,
+            "io_time": sum(_p.io_time for _p in self._nodes.values()),
+            "compute_time": sum(_p.compute_time for _p in self._nodes.values()),
+            "nodes": {
+                _node_id: self._nodes[_node_id].as_dict()
+                for _node_id in sorted(self._nodes)
+            },
+        }
+
+    def get_chrome_trace_events(self) -> list[dict]:
+        """
+        Get the trace events in the Chrome trace event format.
+
+        Returns
+        -------
+        list[dict]
+            The list of complete ("X") events, sorted by their start time.
+        """
+        _events = [
+            {
+                "name": self._nodes[_node_id].label or f"node {_node_id}",
+                "cat": f"node_{_node_id:02d}",
+                "ph": "X",
+                "ts": 1e6 * _t_start,
+                "dur": 1e6 * _runtime,
+                "pid": _pid,
+                "tid": _pid,
+                "args": {"node_id": _node_id},
+            }
+            for (_pid, _node_id), _node_events in self._events.items()
+            for _t_start, _runtime in _node_events
+        ]
+        return sorted(_events, key=lambda _event: _event["ts"])
+
+    def export_to_file(self, filename: Path | str, export_format: str = "json") -> None:
+        """
+        Export the profile to a file.
+
+        Parameters
+        ----------
+        filename : Path or str
+            The filename.
+        export_format : str, optional
+            The export format. "json" writes the profile statistics and
+            "chrome_trace" writes the trace events which can be opened in
+            the Chrome tracing tools or Perfetto. The default is "json".
+        """
+        if export_format not in PROFILE_EXPORT_FORMATS:
+            raise ValueError(
+                f"The export format `{export_format}` is not supported. Supported "
+                f"formats are: {PROFILE_EXPORT_FORMATS}"
+            )
+        if export_format == "json":
+            _content = self.as_dict()
+        else:
+            _content = {
+                "traceEvents": self.get_chrome_trace_events(),
+                "displayTimeUnit": "ms",
+            }
+        with open(filename, "w") as _file:
+            json.dump(_content, _file, indent=1)
@@ -63,6 +63,7 @@ class WorkflowResultsSelector(ObjectWithParameterCollection):
     """
 
     new_selection = QtCore.Signal(bool, int, int, object)
+    sig_selected_results_updated = QtCore.Signal()
 
     default_params = get_generic_param_collection(
         "use_scan_timeline", "result_n_dim", "use_data_range"
@@ -81,6 +82,7 @@ class WorkflowResultsSelector(ObjectWithParameterCollection):
         self._config["active_ranges"] = {}
         self._config["param_hash"] = -1
         self._re_pattern = re.compile(r"^(\s*(-?\d*\.?\d*:?){1,3},?)*?$")
+        self._RESULTS.sig_regions_updated.connect(self._process_updated_regions)
 
     def reset(self):
         """
@@ -164,6 +166,58 @@ class WorkflowResultsSelector(ObjectWithParameterCollection):
             _index for _index, _items in enumerate(self._selection) if _items.size > 1
         ]
 
+    def selection_intersects_region(self, region: tuple[slice, ...]) -> bool:
+        """
+        Check whether the current selection includes points of a scan region.
+
+        Parameters
+        ----------
+        region : tuple[slice, ...]
+            The region with one slice for each scan dimension, as emitted by
+            the ProcessingResults' sig_regions_updated signal.
+
+        Returns
+        -------
+        bool
+            Flag whether any selected scan point is in the region.
+        """
+        _selection = self.selection
+        if self.get_param_value("use_scan_timeline"):
+            _scan_indices = np.unravel_index(_selection[0], self._SCAN.shape)
+            return bool(
+                np.any(
+                    np.all(
+                        [
+                            (_index >= _slice.start) & (_index < _slice.stop)
+                            for _index, _slice in zip(_scan_indices, region)
+                        ],
+                        axis=0,
+                    )
+                )
+            )
+        return all(
+            np.any((_indices >= _slice.start) & (_indices < _slice.stop))
+            for _indices, _slice in zip(_selection, region)
+        )
+
+    @QtCore.Slot(object)
+    def _process_updated_regions(self, regions: dict[int, tuple[slice, ...]]):
+        """
+        Process the updated regions of the results.
+
+        The sig_selected_results_updated signal is emitted if the updated
+        region of the active node includes selected points.
+
+        Parameters
+        ----------
+        regions : dict[int, tuple[slice, ...]]
+            The updated regions of the results with node ID keys.
+        """
+        if self._config["active_node"] not in regions:
+            return
+        if self.selection_intersects_region(regions[self._config["active_node"]]):
+            self.sig_selected_results_updated.emit()
+
     def _get_param_hash(self) -> int:
         """
         Get the hash value for all Parameter values.
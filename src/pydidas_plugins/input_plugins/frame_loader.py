@@ -29,23 +29,44 @@ __all__ = ["FrameLoader"]
 
 from typing import Any
 
-from pydidas.core import Dataset
-from pydidas.data_io import import_data
+from pydidas.core import Dataset, get_generic_param_collection
+from pydidas.data_io import IoManager, import_data
 from pydidas.plugins import InputPlugin
 
 
 class FrameLoader(InputPlugin):
     """
-    Load 2d data frames from files with a single image in each, for example tif files.
+    Load 2d data frames from files with one or multiple images, for example tif files.
 
     This class is designed to load data from a series of files. The file
     series is defined through the first and last file and file stepping.
+    Multi-page tiff files and multi-frame files supported by FabIO (e.g. EDF)
+    can hold several images per file. Only the requested frame is decoded.
 
     A region of interest and image binning can be supplied to apply directly
     to the raw image.
+
+    Parameters
+    ----------
+    images_per_file : int, optional
+        The number of images per file. If -1, pydidas will auto-discover the
+        number of images per file based on the first file. The default is 1.
     """
 
     plugin_name = "Single frame loader"
+    # modification of the images_per_file default to load single-frame files
+    default_params = get_generic_param_collection("images_per_file")
+    default_params["images_per_file"].default = 1
+    default_params["images_per_file"].restore_default()
+    advanced_parameters = InputPlugin.advanced_parameters.copy() + ["images_per_file"]
+
+    def pre_execute(self) -> None:
+        """Prepare loading images from a file series."""
+        InputPlugin.pre_execute(self)
+        _i_per_file = self.get_param_value("images_per_file")
+        if _i_per_file == -1:
+            _i_per_file = IoManager.get_number_of_frames(self.get_filename(0))
+        self.set_param_value("_counted_images_per_file", _i_per_file)
 
     def get_frame(self, frame_index: int, **kwargs: Any) -> tuple[Dataset, dict]:
         """
@@ -67,7 +88,10 @@ class FrameLoader(InputPlugin):
             The updated calling keyword arguments.
         """
         _fname = self.get_filename(frame_index)
+        _n_per_file = self.get_param_value("_counted_images_per_file")
         kwargs["roi"] = self._get_own_roi()
+        if _n_per_file > 1:
+            kwargs["frame"] = frame_index % _n_per_file
         _data = import_data(_fname, **kwargs)
         _data.axis_units = ["pixel", "pixel"]
         _data.axis_labels = ["detector y", "detector x"]
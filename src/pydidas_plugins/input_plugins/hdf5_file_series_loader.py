@@ -30,7 +30,7 @@ __all__ = ["Hdf5fileSeriesLoader"]
 
 from typing import Any
 
-from pydidas.core import Dataset, get_generic_param_collection
+from pydidas.core import Dataset, FileReadError, get_generic_param_collection
 from pydidas.core.utils.hdf5 import get_hdf5_metadata
 from pydidas.data_io import import_data
 from pydidas.plugins import InputPlugin
@@ -90,16 +90,59 @@ class Hdf5fileSeriesLoader(InputPlugin):
                 self.get_filename(0), "shape", dset=self.get_param_value("hdf5_key")
             )[_slice_ax]
         self.set_param_value("_counted_images_per_file", _i_per_file)
+        self._config["frames_per_chunk"] = self._get_frames_per_chunk()
         self._standard_kwargs = {
             "dataset": self.get_param_value("hdf5_key"),
             "binning": self.get_param_value("binning"),
             "forced_dimension": 2,
             "import_metadata": False,
+            "use_file_cache": True,
         }
         self._index_func = lambda i: (
             None if _slice_ax is None else ((None,) * _slice_ax + (i,))
         )
 
+    def _get_frames_per_chunk(self) -> int:
+        """
+        Get the number of frames per HDF5 chunk from the first file.
+
+        Returns
+        -------
+        int
+            The number of frames per chunk. Contiguous datasets, missing files
+            and single frames per file are treated as one frame per chunk.
+        """
+        _slice_ax = self.get_param_value("hdf5_slicing_axis")
+        if _slice_ax is None or not self.get_filename(0).is_file():
+            return 1
+        try:
+            _chunks = get_hdf5_metadata(
+                self.get_filename(0), "chunks", dset=self.get_param_value("hdf5_key")
+            )
+        except FileReadError:
+            return 1
+        return 1 if _chunks is None else _chunks[_slice_ax]
+
+    def get_frame_locality_key(self, frame_index: int) -> tuple[int, int]:
+        """
+        Get the locality key of a frame.
+
+        Parameters
+        ----------
+        frame_index : int
+            The index of the frame.
+
+        Returns
+        -------
+        tuple[int, int]
+            The index of the file and the index of the HDF5 chunk in the file.
+        """
+        _n_per_file = self.get_param_value("_counted_images_per_file")
+        return (
+            frame_index // _n_per_file,
+            (frame_index % _n_per_file) // self._config.get("frames_per_chunk", 1),
+        )
+
     def get_frame(self, frame_index: int, **kwargs: Any) -> tuple[Dataset, dict]:
         """
         Load a frame and pass it on.
@@ -39,6 +39,27 @@ from pydidas.core import Dataset, Parameter, UserConfigError
 from pydidas.plugins import OutputPlugin
 
 
+def _write_ascii_file(filename: str, header: str, x: np.ndarray, y: np.ndarray) -> None:
+    """
+    Write the data to an ASCII file with two columns.
+
+    Parameters
+    ----------
+    filename : str
+        The full filename.
+    header : str
+        The file header.
+    x : np.ndarray
+        The data of the first column.
+    y : np.ndarray
+        The data of the second column.
+    """
+    with open(filename, "w") as _file:
+        _file.write(header)
+        for _x, _y in zip(x, y):
+            _file.write(f"{_x}\t{_y}\n")
+
+
 class GeneralAsciiSaver(OutputPlugin):
     """
     An Ascii saver to export one-dimensional data.
@@ -111,10 +132,13 @@ class GeneralAsciiSaver(OutputPlugin):
             data.update_axis_label(0, "index")
         self._data = data
         _ext, _header = self._get_ext_and_header()
-        with open(self.get_output_filename(_ext), "w") as _file:
-            _file.write(_header)
-            for _x, _y in zip(data.axis_ranges[0], data.array):
-                _file.write(f"{_x}\t{_y}\n")
+        self.write_output(
+            _write_ascii_file,
+            self.get_output_filename(_ext),
+            _header,
+            np.asarray(data.axis_ranges[0]),
+            data.array,
+        )
         return data, kwargs
 
     def _get_ext_and_header(self) -> tuple[str, str]:
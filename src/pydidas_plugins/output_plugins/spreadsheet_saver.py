@@ -183,7 +183,8 @@ class SpreadsheetSaver(OutputPlugin):
             data[data.array < 0] = 0
         self._data = data
         _ext, _header = self._get_ext_and_header()
-        np.savetxt(
+        self.write_output(
+            np.savetxt,
             self.get_output_filename(_ext),
             data.array,
             header=_header,
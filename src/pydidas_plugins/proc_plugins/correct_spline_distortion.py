@@ -35,7 +35,13 @@ import numpy as np
 import pyFAI
 from pyFAI.distortion import Distortion
 
-from pydidas.core import Dataset, Parameter, ParameterCollection, UserConfigError
+from pydidas.core import (
+    Dataset,
+    Parameter,
+    ParameterCollection,
+    SharedResources,
+    UserConfigError,
+)
 from pydidas.core.constants import PROC_PLUGIN_IMAGE
 from pydidas.plugins import ProcPlugin
 
@@ -104,6 +110,9 @@ class CorrectSplineDistortion(ProcPlugin):
     def pre_execute(self):
         """
         Initialize the detector and modify the spline, if necessary.
+
+        The look-up table of the distortion correction is calculated only once
+        and shared between all processes.
         """
         _spline = self.get_param_value("spline_file")
         if not _spline.is_file():
@@ -115,9 +124,40 @@ class CorrectSplineDistortion(ProcPlugin):
                 self._detector.spline = self._detector.spline.flipud()
                 self._detector.mask = np.flipud(self._detector.mask)
         self._correction = Distortion(self._detector)
+        _key = SharedResources.get_key(
+            self.__class__.__name__, _spline, self.get_param_value("geometry")
+        )
+        self._correction.lut = SharedResources().get(
+            _key, self._calculate_lut, writable=True
+        )
         if self.get_param_value("fill_nan"):
-            _dummy = self._correction.correct(np.ones(self._detector.max_shape))
-            self._nan_mask = np.where(_dummy < 0.8, 1, 0)
+            self._nan_mask = SharedResources().get(
+                SharedResources.get_key(_key, "nan_mask"), self._calculate_nan_mask
+            )
+
+    def _calculate_lut(self) -> tuple[np.ndarray, ...]:
+        """
+        Calculate the look-up table of the distortion correction.
+
+        Returns
+        -------
+        tuple[np.ndarray, ...]
+            The look-up table in the CSR sparse matrix format.
+        """
+        self._correction.calc_LUT()
+        return tuple(self._correction.lut)
+
+    def _calculate_nan_mask(self) -> np.ndarray:
+        """
+        Calculate the mask of image regions without input data.
+
+        Returns
+        -------
+        np.ndarray
+            The mask with invalid pixels set to 1.
+        """
+        _dummy = self._correction.correct(np.ones(self._detector.max_shape))
+        return np.where(_dummy < 0.8, 1, 0)
 
     def execute(
         self, data: Dataset | np.ndarray, **kwargs: dict
@@ -76,6 +76,11 @@ class FitTriplePeak(BaseFitPlugin):
     *Fit sigma rejection threshold* will be handled as failed and will return NaN
     values. Adjusting the rejection threshold will allow to modify the goodness of the
     fits to accept.
+
+    For scans with slowly changing peaks, the *Use previous fit as start values*
+    parameter allows to start each fit from the accepted results of the previous
+    scan point processed by the same worker. Fits from these values which are
+    rejected are repeated with starting values estimated from the data.
     """
 
     plugin_name = "Fit triple peak"
@@ -33,6 +33,7 @@ import numpy as np
 from pydidas.core import (
     Dataset,
     ParameterCollection,
+    SharedResources,
     UserConfigError,
     get_generic_parameter,
 )
@@ -70,7 +71,10 @@ class MaskImage(ProcPlugin):
         """
         _maskfile = self.get_param_value("detector_mask_file")
         self._maskval = self.get_param_value("detector_mask_val")
-        self._mask = import_data(_maskfile)
+        self._mask = SharedResources().get(
+            SharedResources.get_key("detector_mask", _maskfile),
+            lambda: import_data(_maskfile),
+        )
 
     def execute(
         self, data: Union[Dataset, np.ndarray], **kwargs: dict
@@ -36,6 +36,7 @@ from qtpy import QtCore, QtWidgets
 from pydidas.core import (
     Dataset,
     Parameter,
+    SharedResources,
     UserConfigError,
     get_generic_param_collection,
 )
@@ -98,27 +99,49 @@ class SubtractBackgroundImage(ProcPlugin):
         self._thresh = None
 
     def pre_execute(self) -> None:
-        """Load the background image."""
+        """Load the background image as shared resource."""
         _bg_fname = self.get_param_value("bg_file")
         if not _bg_fname.is_file():
             raise UserConfigError(
                 f'The filename "{_bg_fname}" does not point to a valid file. Please '
                 "verify the path."
             )
+        _key = SharedResources.get_key(
+            self.__class__.__name__,
+            _bg_fname,
+            self.get_param_value("bg_hdf5_key"),
+            self.get_param_value("bg_hdf5_frame"),
+            self.get_param_value("hdf5_slicing_axis"),
+            self.get_param_value("binning"),
+            self._get_own_roi(),
+            self.get_param_value("multiplicator"),
+        )
+        self._bg_image = SharedResources().get(_key, self._load_bg_image)
+        self._thresh = self.get_param_value("threshold_low")
+        if self._thresh is not None and not np.isfinite(self._thresh):
+            self._thresh = None
+
+    def _load_bg_image(self) -> Dataset:
+        """
+        Load the background image and apply the multiplicator.
+
+        Returns
+        -------
+        Dataset
+            The background image.
+        """
         _slice_ax = self.get_param_value("hdf5_slicing_axis")
         _indices = (None,) * _slice_ax + (self.get_param_value("bg_hdf5_frame"),)
-        self._bg_image = import_data(
-            _bg_fname,
+        _bg_image = import_data(
+            self.get_param_value("bg_file"),
             dataset=self.get_param_value("bg_hdf5_key"),
             indices=_indices,
             binning=self.get_param_value("binning"),
             roi=self._get_own_roi(),
         )
         if self.get_param_value("multiplicator") != 1.0:
-            self._bg_image = self._bg_image * self.get_param_value("multiplicator")
-        self._thresh = self.get_param_value("threshold_low")
-        if self._thresh is not None and not np.isfinite(self._thresh):
-            self._thresh = None
+            _bg_image = _bg_image * self.get_param_value("multiplicator")
+        return _bg_image
 
     def execute(self, data: Dataset, **kwargs: Any) -> tuple[Dataset, dict]:
         """
@@ -32,12 +32,13 @@ __all__ = ["SinSquareChiAnalysis"]
 from typing import Any, Callable
 
 import numpy as np
-import scipy
 from matplotlib import pyplot as plt
 from qtpy import QtCore, QtWidgets
 
 from pydidas_plugins.residual_stress_plugins.sin_2chi_grouping import Sin_2chiGrouping
 from pydidas_plugins.residual_stress_plugins.sin_square_chi_grouping import (
+    LABELS_DIM0,
+    LABELS_SIN2CHI,
     SinSquareChiGrouping,
 )
 
@@ -55,6 +56,7 @@ from pydidas.core.constants import (
 from pydidas.core.utils.scattering_geometry import convert_integration_result
 from pydidas.plugins import OutputPlugin, ProcPlugin
 from pydidas.widgets.plugin_config_widgets import GenericPluginConfigWidget
+from pydidas.workflow import ProcessingResults, WorkflowResults
 
 
 _VALID_DATA_AXIS_1_LABELS = ("2theta", "d-spacing", "Q", "r")
@@ -63,6 +65,7 @@ _VALID_UNITS = ("nm", "A", "nm^-1", "A^-1", "deg", "rad", "mm")
 _PARAM_KEY_ORDER = [
     "keep_results",
     "label",
+    "result_dtype",
     "output_type",
     "sin_square_chi_low_fit_limit",
     "sin_square_chi_high_fit_limit",
@@ -81,30 +84,93 @@ _COLORS = {
     "fit": PYDIDAS_COLORS["blue"],
     "data vs sin(2*chi)": PYDIDAS_COLORS["orange"],
 }
+_RESULT_AXIS_LABEL = "Fitted parameters (see Plugin docstring)"
+_RESULT_METADATA = {
+    "point #0": "fitted sin^2(chi) slope",
+    "point #1": "slope error",
+    "point #2": "fitted intercept",
+    "point #3": "intercept error",
+    "point #4": "fitted sin(2*chi) slope",
+    "point #5": "slope error",
+}
 
 
-def _sin_2chi_fit_func(c, x):
-    return c * x
+def _fit_linear(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Fit linear functions to (stacked) data using the closed-form least squares.
 
+    The fit is performed along the last axis and NaN values are ignored. All
+    leading axes of x and y are broadcast against each other and each entry
+    is fitted individually. The errors are calculated with the same scaling
+    as np.polyfit(..., cov=True) and are only given for more than four
+    valid data points.
 
-def _filter_nan_from_1d_dataset(data: Dataset) -> tuple[np.ndarray, np.ndarray]:
+    Parameters
+    ----------
+    x : np.ndarray
+        The x values.
+    y : np.ndarray
+        The y values.
+
+    Returns
+    -------
+    np.ndarray
+        The fitted parameters with a shape of (..., 4). The entries of the last
+        axis are the slope, slope error, intercept and intercept error.
     """
-    Filter NaN values from a 1D dataset and return the filtered x and y values.
+    _valid = np.isfinite(x) & np.isfinite(y)
+    _n = np.sum(_valid, axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        _x_mean = np.sum(np.where(_valid, x, 0), axis=-1) / _n
+        _y_mean = np.sum(np.where(_valid, y, 0), axis=-1) / _n
+        _dx = np.where(_valid, x - _x_mean[..., None], 0)
+        _dy = np.where(_valid, y - _y_mean[..., None], 0)
+        _sxx = np.sum(_dx**2, axis=-1)
+        _slope = np.sum(_dx * _dy, axis=-1) / _sxx
+        _intercept = _y_mean - _slope * _x_mean
+        _ssr = np.sum((_dy - _slope[..., None] * _dx) ** 2, axis=-1)
+        _var = _ssr / (_n - 2)
+        _slope_err = np.sqrt(_var / _sxx)
+        _intercept_err = np.sqrt(_var * (1 / _n + _x_mean**2 / _sxx))
+    _results = np.stack((_slope, _slope_err, _intercept, _intercept_err), axis=-1)
+    _results[_n <= 4, 1::2] = np.nan
+    _results[_n < 2] = np.nan
+    return _results
+
+
+def _fit_proportional(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Fit proportional functions (y = c * x) to (stacked) data.
+
+    The closed-form least squares solution is used along the last axis and
+    NaN values are ignored. The error is calculated with the same scaling as
+    scipy.optimize.curve_fit and is infinite for a single data point.
 
     Parameters
     ----------
-    data : Dataset
-        The input dataset to filter.
+    x : np.ndarray
+        The x values.
+    y : np.ndarray
+        The y values.
 
     Returns
     -------
-    tuple[np.ndarray, np.ndarray]
-        The filtered x and y values.
+    np.ndarray
+        The fitted parameters with a shape of (..., 2). The entries of the last
+        axis are the slope and the slope error.
     """
-    _nan_filter = ~np.isnan(data).view(np.ndarray)
-    data = data[_nan_filter]
-    _x = data.axis_ranges[0]
-    return _x, data
+    _valid = np.isfinite(x) & np.isfinite(y)
+    _n = np.sum(_valid, axis=-1)
+    _x = np.where(_valid, x, 0)
+    _y = np.where(_valid, y, 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        _sxx = np.sum(_x**2, axis=-1)
+        _slope = np.sum(_x * _y, axis=-1) / _sxx
+        _ssr = np.sum((_y - _slope[..., None] * _x) ** 2, axis=-1)
+        _slope_err = np.where(_n > 1, np.sqrt(_ssr / (_n - 1) / _sxx), np.inf)
+    _results = np.stack((_slope, _slope_err), axis=-1)
+    _results[_n == 0] = np.nan
+    return _results
 
 
 class SinSquareChiAnalysis(ProcPlugin, OutputPlugin):
@@ -141,6 +207,11 @@ class SinSquareChiAnalysis(ProcPlugin, OutputPlugin):
     Optionally, this plugin also allows exporting images of the fits for
     each data point.
 
+    The fits are calculated with the closed-form least-squares solutions.
+    The analyze_stacked_groupings and analyze_workflow_results methods
+    use this to process stacked sin^2(chi) groupings (e.g. the stored
+    results of a SinSquareChiGrouping node) for all scan points at once.
+
     NOTE: This plugin currently only allows chi to be given in degrees.
     """
 
@@ -237,15 +308,8 @@ class SinSquareChiAnalysis(ProcPlugin, OutputPlugin):
             np.append(_fit_sin_square_res, _fit_sin_2chi_res),
             data_label=f"fitted coefficients ({_sin_square_chi_data.data_label})",
             data_unit=_sin_square_chi_data.data_unit,
-            axis_labels=["Fitted parameters (see Plugin docstring)"],
-            metadata={
-                "point #0": "fitted sin^2(chi) slope",
-                "point #1": "slope error",
-                "point #2": "fitted intercept",
-                "point #3": "intercept error",
-                "point #4": "fitted sin(2*chi) slope",
-                "point #5": "slope error",
-            },
+            axis_labels=[_RESULT_AXIS_LABEL],
+            metadata=_RESULT_METADATA.copy(),
         )
         kwargs["sin_2chi_data"] = _sin_2chi_data
         kwargs["sin_square_chi_data"] = _sin_square_chi_data
@@ -281,6 +345,100 @@ class SinSquareChiAnalysis(ProcPlugin, OutputPlugin):
         )
         return _sin_square_chi_data, _sin_2chi_data
 
+    def analyze_stacked_groupings(self, data: Dataset) -> Dataset:
+        """
+        Analyze stacked sin^2(chi) groupings in one vectorized call.
+
+        The input are stacked results of the SinSquareChiGrouping plugin, for
+        example the composite results of a grouping node for a full scan. The
+        sin^2(chi) values must be the same for all entries, as is the case for
+        the results of the same workflow node.
+
+        Parameters
+        ----------
+        data : Dataset
+            The stacked input data with a shape of (..., 3, n). The last two
+            axes must be the d-/d+/d_mean axis and the sin^2(chi) axis.
+
+        Returns
+        -------
+        Dataset
+            The fit results with a shape of (..., 6). The leading axes keep the
+            metadata of the input and the last axis holds the same entries as
+            the results of the execute method.
+        """
+        self._check_stacked_input_data(data)
+        self._set_up_converter(data)
+        _data = self._converter(data, *self._config["converter_args"])
+        _s2c = _data.axis_ranges[_data.ndim - 1]
+        self._calculate_fit_slice(_s2c)
+        _values = np.asarray(_data)
+        _fit_sin_square_res = _fit_linear(
+            _s2c[self._fit_slice], _values[..., 2, self._fit_slice]
+        )
+        _fit_sin_2chi_res = _fit_proportional(
+            self._plugin_group_in_sin_2_chi._calculate_sin_2chi_values(_s2c),
+            _values[..., 1, :] - _values[..., 0, :],
+        )
+        _n_stack = data.ndim - 2
+        return Dataset(
+            np.concatenate((_fit_sin_square_res, _fit_sin_2chi_res), axis=-1),
+            data_label=self.output_data_label,
+            data_unit=self.output_data_unit,
+            axis_labels=[data.axis_labels[_i] for _i in range(_n_stack)]
+            + [_RESULT_AXIS_LABEL],
+            axis_units=[data.axis_units[_i] for _i in range(_n_stack)] + [""],
+            axis_ranges=[data.axis_ranges[_i] for _i in range(_n_stack)] + [None],
+            metadata=_RESULT_METADATA.copy(),
+        )
+
+    def analyze_workflow_results(
+        self, node_id: int, results: ProcessingResults | None = None
+    ) -> Dataset:
+        """
+        Analyze the stored results of a SinSquareChiGrouping workflow node.
+
+        This method allows to create the stress analysis for a full scan
+        from the composite results of a grouping node in a single call.
+
+        Parameters
+        ----------
+        node_id : int
+            The node ID of the SinSquareChiGrouping plugin in the workflow.
+        results : ProcessingResults | None, optional
+            The results instance. If None, the WorkflowResults singleton is
+            used. The default is None.
+
+        Returns
+        -------
+        Dataset
+            The fit results with a shape of (<scan shape>, 6).
+        """
+        if results is None:
+            results = WorkflowResults()
+        return self.analyze_stacked_groupings(results.get_results(node_id))
+
+    def _check_stacked_input_data(self, data: Dataset) -> None:
+        """
+        Check that the input data are stacked sin^2(chi) groupings.
+
+        Parameters
+        ----------
+        data : Dataset
+            The input data to be checked.
+        """
+        if (
+            data.ndim < 2
+            or data.shape[-2] != 3
+            or data.axis_labels[data.ndim - 2] != LABELS_DIM0
+            or data.axis_labels[data.ndim - 1] != LABELS_SIN2CHI
+        ):
+            self.raise_UserConfigError(
+                "The input data must be stacked results of the SinSquareChiGrouping "
+                f"plugin with the last two axes `{LABELS_DIM0}` and "
+                f"`{LABELS_SIN2CHI}`."
+            )
+
     def _check_input_data(self, data: Dataset) -> None:
         """
         Run basic checks on the input data.
@@ -357,19 +515,10 @@ class SinSquareChiAnalysis(ProcPlugin, OutputPlugin):
         """
         if self._fit_slice is None:
             self._calculate_fit_slice(data[2])
-        _x, _y = _filter_nan_from_1d_dataset(data[2, self._fit_slice])
-        if _y.size < 2:
-            return np.array([np.nan, np.nan, np.nan, np.nan], dtype=float)
-        # Note: np.polynomial.Polynomial.fit does not (as of 2.1.1) support
-        # covariance matrix calculation, so we use np.polyfit instead.
-        # TODO: check if this is still the case in future numpy releases
-        if _y.size <= 4:
-            _p = np.polyfit(_x, _y, 1)
-            _p_errors = np.array((np.nan, np.nan), dtype=float)
-        else:
-            _p, _cov = np.polyfit(_x, _y, 1, cov=True)
-            _p_errors = np.sqrt(np.diag(_cov))
-        return np.vstack((_p, _p_errors)).T.reshape(-1)
+        return _fit_linear(
+            data.axis_ranges[1][self._fit_slice],
+            data.array[2, self._fit_slice],
+        )
 
     @staticmethod
     def _fit_sin_2chi_data(data: Dataset) -> np.ndarray:
@@ -392,18 +541,18 @@ class SinSquareChiAnalysis(ProcPlugin, OutputPlugin):
             [0]: slope
             [1]: slope error
         """
-        _x, _y = _filter_nan_from_1d_dataset(data[2])
-        if _y.size == 0:
-            return np.array([np.nan, np.nan], dtype=float)
-        _popt, _pcov = scipy.optimize.curve_fit(_sin_2chi_fit_func, _x, _y)
-        _perr = np.sqrt(np.diag(_pcov))
-        return np.array([_popt[0], _perr[0]], dtype=float)
+        return _fit_proportional(data.axis_ranges[1], data.array[2])
 
-    def _calculate_fit_slice(self, data: Dataset) -> None:
+    def _calculate_fit_slice(self, data: Dataset | np.ndarray) -> None:
         """
         Calculate the slice for the fit.
+
+        Parameters
+        ----------
+        data : Dataset | np.ndarray
+            The sin^2(chi) data or directly the sin^2(chi) values.
         """
-        _x = data.axis_ranges[0]
+        _x = data.axis_ranges[0] if isinstance(data, Dataset) else data
         _xlow = self.get_param_value("sin_square_chi_low_fit_limit")
         _xhigh = self.get_param_value("sin_square_chi_high_fit_limit")
         _valid_indices = np.where((_x >= _xlow) & (_x <= _xhigh))[0]
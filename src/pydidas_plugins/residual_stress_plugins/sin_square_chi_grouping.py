@@ -35,8 +35,6 @@ __all__ = ["SinSquareChiGrouping"]
 from enum import IntEnum
 
 import numpy as np
-from scipy.sparse import csr_matrix
-from scipy.sparse.csgraph import connected_components
 
 from pydidas.core import Dataset
 from pydidas.core.constants import (
@@ -55,7 +53,6 @@ LABELS_DIM0 = "0: d-, 1: d+, 2: d_mean"
 UNITS_DEGREE = "deg"
 
 S2C_TOLERANCE = 1e-6
-NPT_AZIM_LIMIT = 3000
 
 PARAMETER_KEEP_RESULTS = "keep_results"
 
@@ -137,7 +134,7 @@ class SinSquareChiGrouping(ProcPlugin):
 
 
     NOTE: This plugin expects position (d-spacing) in [nm, A] and chi in [deg]
-    as input data. The limit for azimuthal points is set to 3000.
+    as input data.
     """
 
     plugin_name = "sin^2(chi) grouping"
@@ -171,29 +168,6 @@ class SinSquareChiGrouping(ProcPlugin):
         if not isinstance(ds, Dataset):
             self.raise_UserConfigError("Input must be an instance of Dataset.")
 
-    def _ensure_npt_azim_limit(self, chi: np.ndarray) -> None:
-        """
-        Ensure the number of azimuthal angles is below a certain limit.
-
-        The limit is hardcoded in the value for the NPT_AZIM_LIMIT constant. The limit
-        is defined to work with the default tolerance value for grouping similar
-        chi positions.
-
-        Parameters
-        ----------
-        chi : np.ndarray
-            The array of azimuthal angles.
-
-        Raises
-        ------
-        UserConfigError
-            If the number of azimuthal angles exceeds the limit.
-        """
-        if chi.size > NPT_AZIM_LIMIT:
-            self.raise_UserConfigError(
-                f"Number of azimuthal angles exceeds the limit of {NPT_AZIM_LIMIT}."
-            )
-
     @staticmethod
     def _get_param_unit_at_index(
         ds_units: dict[int, list[str, str]], pos_idx: int
@@ -305,7 +279,6 @@ class SinSquareChiGrouping(ProcPlugin):
             self.raise_UserConfigError("The input dataset has to be 1D or 2D.")
         self._update_data_labels_from_extracted_units(d_spacing)
 
-        self._ensure_npt_azim_limit(chi)
         d_spacing_pos, d_spacing_neg = self._group_d_spacing_by_chi(d_spacing, chi)
         d_spacing_combined = self._combine_sort_d_spacing_pos_neg(
             d_spacing_pos, d_spacing_neg
@@ -780,28 +753,69 @@ class SinSquareChiGrouping(ProcPlugin):
 
         Notes
         -----
-        The function internally computes the sin^2(chi) for each angle in `chi`,
-        then creates a similarity matrix to identify groups of angles with
-        sin^2(chi) values within the specified tolerance. It uses sparse matrix
-        techniques to efficiently handle large arrays of angles.
+        The function internally computes the sin^2(chi) for each angle in `chi`
+        and sorts these values. Groups are chains of sorted values where each
+        step is within the specified tolerance, i.e. the groups are split where
+        the difference between neighbouring sorted values exceeds the tolerance.
+        This is equivalent to the connected components of the similarity graph
+        of all sin^2(chi) values but only requires O(n log n) time and O(n)
+        memory. The groups are labelled in the order of their first occurrence
+        in `chi`.
         """
         if not isinstance(chi, np.ndarray):
             raise TypeError("Chi needs to be an np.ndarray.")
 
         s2c = np.sin(np.deg2rad(chi)) ** 2
+        if s2c.size == 0:
+            return 0, np.array([], dtype=np.int32)
+
+        # Split the sorted values where the gap exceeds the tolerance. NaN values
+        # are sorted to the end and form individual groups.
+        sort_idx = np.argsort(s2c, kind="stable")
+        group_starts = np.ones(s2c.size, dtype=bool)
+        group_starts[1:] = ~(np.diff(s2c[sort_idx]) <= tolerance)
+        sorted_labels = np.cumsum(group_starts) - 1
+        n_components = int(sorted_labels[-1]) + 1
+
+        # Relabel the groups in the order of their first occurrence in chi
+        first_idx = np.minimum.reduceat(sort_idx, np.flatnonzero(group_starts))
+        group_rank = np.empty(n_components, dtype=np.int32)
+        group_rank[np.argsort(first_idx)] = np.arange(n_components)
+        s2c_labels = np.empty(s2c.size, dtype=np.int32)
+        s2c_labels[sort_idx] = group_rank[sorted_labels]
 
-        # Create the similarity matrix
-        similarity_matrix = np.abs(s2c[:, np.newaxis] - s2c[np.newaxis, :]) <= tolerance
+        return n_components, s2c_labels
 
-        # Convert boolean matrix to sparse matrix
-        sparse_matrix = csr_matrix(similarity_matrix.astype(int))
+    @staticmethod
+    def _nanmean_by_group(
+        values: np.ndarray, labels: np.ndarray, n_groups: int, mask: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate the mean of the masked values in each group, ignoring NaNs.
 
-        # Find connected components
-        n_components, s2c_labels = connected_components(
-            csgraph=sparse_matrix, directed=False, return_labels=True
-        )
+        Parameters
+        ----------
+        values : np.ndarray
+            The 1D array of values.
+        labels : np.ndarray
+            The group labels of the values in the range [0, n_groups).
+        n_groups : int
+            The number of groups.
+        mask : np.ndarray
+            The boolean mask of values to include.
 
-        return n_components, s2c_labels
+        Returns
+        -------
+        np.ndarray
+            The mean values of all groups. Groups without any valid values
+            are NaN.
+        """
+        _valid = mask & ~np.isnan(values)
+        _sums = np.bincount(labels[_valid], weights=values[_valid], minlength=n_groups)
+        _counts = np.bincount(labels[_valid], minlength=n_groups)
+        return np.divide(
+            _sums, _counts, out=np.full(n_groups, np.nan), where=_counts > 0
+        )
 
     def _group_d_spacing_by_chi(
         self, d_spacing: Dataset, chi: np.ndarray, tolerance: float = S2C_TOLERANCE
@@ -891,9 +905,6 @@ class SinSquareChiGrouping(ProcPlugin):
         # Calculate sin2chi
         s2c = np.sin(np.deg2rad(chi)) ** 2
 
-        # both are ordered in ascending order of increasing sin2chi
-        s2c_unique_labels = np.unique(self.config._s2c_labels)
-
         # Calculate first derivative
         first_derivative = np.gradient(s2c, edge_order=2)
 
@@ -913,46 +924,18 @@ class SinSquareChiGrouping(ProcPlugin):
         # maximum or minimum
         mask_pos = (categories == Category.POSITIVE) | (categories == Category.ZERO)
         mask_neg = (categories == Category.NEGATIVE) | (categories == Category.ZERO)
-        # Advanced indexing
-        # Here, s2c_labels specifies the row indices, and np.arange(s2c_num_elements)
-        # specifies the column indices.
-        s2c_advanced_idx = (self.config._s2c_labels, np.arange(s2c.size))
-        # expected shape for future matrices
-        s2c_groups_matrix_shape = s2c_unique_labels.size, s2c.size
-
-        # s2c_label_matrix and d_spacing_matrix are useful for quality assurance
-        # via visual inspection
-        s2c_labels_matrix = np.full(s2c_groups_matrix_shape, np.nan)
-        s2c_labels_matrix[*s2c_advanced_idx] = self.config._s2c_labels
-
-        d_spacing_matrix = np.full(s2c_groups_matrix_shape, np.nan)
-        d_spacing_matrix[*s2c_advanced_idx] = d_spacing
-
-        s2c_matrix = np.full(s2c_groups_matrix_shape, np.nan)
-        s2c_matrix[*s2c_advanced_idx] = s2c
-
-        # Create pre-filled matrices for filtering based on the slopes and groups
-        d_spacing_pos_slope_matrix = np.full(s2c_groups_matrix_shape, np.nan)
-        d_spacing_neg_slope_matrix = np.full(s2c_groups_matrix_shape, np.nan)
-        s2c_pos_slope_matrix = np.full(s2c_groups_matrix_shape, np.nan)
-        s2c_neg_slope_matrix = np.full(s2c_groups_matrix_shape, np.nan)
-        # Apply masks to create filtered matrices
-        # Combination of advanced indexing and conditional assignment with np.where
-        d_spacing_pos_slope_matrix[*s2c_advanced_idx] = np.where(
-            mask_pos, d_spacing, np.nan
+        # Group-wise averaging of the values with positive and negative slopes
+        _labels = self.config._s2c_labels
+        _n_groups = self.config._n_components
+        _d_values = np.asarray(d_spacing, dtype=float)
+        s2c_mean_pos = self._nanmean_by_group(s2c, _labels, _n_groups, mask_pos)
+        d_spacing_mean_pos = self._nanmean_by_group(
+            _d_values, _labels, _n_groups, mask_pos
         )
-        s2c_pos_slope_matrix[*s2c_advanced_idx] = np.where(mask_pos, s2c, np.nan)
-
-        d_spacing_neg_slope_matrix[*s2c_advanced_idx] = np.where(
-            mask_neg, d_spacing, np.nan
+        s2c_mean_neg = self._nanmean_by_group(s2c, _labels, _n_groups, mask_neg)
+        d_spacing_mean_neg = self._nanmean_by_group(
+            _d_values, _labels, _n_groups, mask_neg
         )
-        s2c_neg_slope_matrix[*s2c_advanced_idx] = np.where(mask_neg, s2c, np.nan)
-        # Averaging, positive slope
-        s2c_mean_pos = np.nanmean(s2c_pos_slope_matrix, axis=1)
-        d_spacing_mean_pos = np.nanmean(d_spacing_pos_slope_matrix, axis=1)
-        # Averaging, negative slope
-        s2c_mean_neg = np.nanmean(s2c_neg_slope_matrix, axis=1)
-        d_spacing_mean_neg = np.nanmean(d_spacing_neg_slope_matrix, axis=1)
         # Aim for a complete common s2c_mean_pos/neg without NaN values
         s2c_mean = np.nanmean(np.vstack((s2c_mean_pos, s2c_mean_neg)), axis=0)
         # create Datasets for output
@@ -35,9 +35,10 @@ import skimage
 from qtpy import QtCore
 
 from pydidas.contexts import ScanContext
-from pydidas.core import Dataset, UserConfigError
+from pydidas.core import Dataset, UserConfigError, get_generic_parameter
 from pydidas.plugins import BasePlugin
 from pydidas.unittest_objects import LocalPluginCollection
+from pydidas.workflow import ProcessingTree
 
 
 PLUGIN_COLLECTION = LocalPluginCollection()
@@ -45,6 +46,7 @@ PLUGIN_COLLECTION = LocalPluginCollection()
 SCAN = ScanContext()
 _IMG_SHAPE = (11, 13)
 _N = 50
+_N_PER_FILE = 10
 _DATA = np.repeat(np.arange(_N, dtype=np.uint16), np.prod(_IMG_SHAPE)).reshape(
     _N, *_IMG_SHAPE
 )
@@ -65,6 +67,18 @@ def temp_dir():
     qs.remove("unittesting")
 
 
+@pytest.fixture(scope="module")
+def temp_dir_multi_page():
+    _path = Path(tempfile.mkdtemp())
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for i in range(_N // _N_PER_FILE):
+            _fname = _path / f"test_{i:05d}.tiff"
+            skimage.io.imsave(_fname, _DATA[i * _N_PER_FILE : (i + 1) * _N_PER_FILE])
+    yield _path
+    shutil.rmtree(_path)
+
+
 @pytest.fixture
 def set_up_scan(temp_dir):
     SCAN.restore_all_defaults(True)
@@ -72,11 +86,25 @@ def set_up_scan(temp_dir):
     SCAN.set_param_value("scan_base_directory", temp_dir)
 
 
+@pytest.fixture
+def set_up_scan_multi_page(temp_dir_multi_page):
+    SCAN.restore_all_defaults(True)
+    SCAN.set_param_value("scan_name_pattern", "test_#####.tiff")
+    SCAN.set_param_value("scan_base_directory", temp_dir_multi_page)
+
+
 def test_creation():
     plugin = PLUGIN_COLLECTION.get_plugin_by_name("FrameLoader")()
     assert isinstance(plugin, BasePlugin)
 
 
+def test_images_per_file__default():
+    plugin = PLUGIN_COLLECTION.get_plugin_by_name("FrameLoader")()
+    assert plugin.get_param_value("images_per_file") == 1
+    assert plugin.params["images_per_file"].default == 1
+    assert get_generic_parameter("images_per_file").default == -1
+
+
 def test_execute__no_input():
     plugin = PLUGIN_COLLECTION.get_plugin_by_name("FrameLoader")()
     with pytest.raises(UserConfigError):
@@ -96,6 +124,63 @@ def test_get_frame(set_up_scan, ordinal, use_roi):
     assert np.allclose(_data, ordinal)
 
 
+@pytest.mark.parametrize("images_per_file", [-1, _N_PER_FILE])
+def test_pre_execute__multi_page(set_up_scan_multi_page, images_per_file):
+    plugin = PLUGIN_COLLECTION.get_plugin_by_name("FrameLoader")()
+    plugin.set_param_value("images_per_file", images_per_file)
+    plugin.pre_execute()
+    assert plugin.get_param_value("_counted_images_per_file") == _N_PER_FILE
+
+
+def test_pre_execute__auto_discover_single_frame(set_up_scan):
+    plugin = PLUGIN_COLLECTION.get_plugin_by_name("FrameLoader")()
+    plugin.set_param_value("images_per_file", -1)
+    plugin.pre_execute()
+    assert plugin.get_param_value("_counted_images_per_file") == 1
+
+
+def test_prepare_execution__warm_tree_w_changed_input_files(tmp_path):
+    SCAN.restore_all_defaults(True)
+    SCAN.set_param_value("scan_name_pattern", "test_#####.tiff")
+    SCAN.set_param_value("scan_base_directory", tmp_path)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for i in range(_N // _N_PER_FILE):
+            skimage.io.imsave(tmp_path / f"test_{i:05d}.tiff", _DATA[i])
+    _tree = ProcessingTree()
+    _tree.create_and_add_node(PLUGIN_COLLECTION.get_plugin_by_name("FrameLoader")())
+    _plugin = _tree.root.plugin
+    _plugin.set_param_value("images_per_file", -1)
+    _tree.prepare_execution()
+    assert _plugin.get_param_value("_counted_images_per_file") == 1
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for i in range(_N // _N_PER_FILE):
+            skimage.io.imsave(
+                tmp_path / f"test_{i:05d}.tiff",
+                _DATA[i * _N_PER_FILE : (i + 1) * _N_PER_FILE],
+            )
+    _tree.prepare_execution(forced=True, skip_unchanged=True)
+    assert _plugin.get_param_value("_counted_images_per_file") == _N_PER_FILE
+
+
+@pytest.mark.parametrize("ordinal", [0, 11, 29, 34])
+@pytest.mark.parametrize("use_roi", [True, False])
+def test_get_frame__multi_page(set_up_scan_multi_page, ordinal, use_roi):
+    plugin = PLUGIN_COLLECTION.get_plugin_by_name("FrameLoader")()
+    plugin.set_param_value("images_per_file", -1)
+    plugin.set_param_value("use_roi", use_roi)
+    plugin.set_param_value("roi_yhigh", 5)
+    plugin.pre_execute()
+    _data, kwargs = plugin.get_frame(ordinal)
+    assert (
+        plugin.get_filename(ordinal).name == f"test_{ordinal // _N_PER_FILE:05d}.tiff"
+    )
+    assert kwargs["frame"] == ordinal % _N_PER_FILE
+    assert _data.shape == (5 if use_roi else _IMG_SHAPE[0], _IMG_SHAPE[1])
+    assert np.allclose(_data, ordinal)
+
+
 @pytest.mark.parametrize("ordinal", [0, 11, 21, 34])
 @pytest.mark.parametrize("use_roi", [True, False])
 def test__integration__execute(set_up_scan, ordinal, use_roi):
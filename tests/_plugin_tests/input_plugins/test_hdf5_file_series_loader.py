@@ -119,6 +119,31 @@ def test_pre_execute__w_none_slice_ax(config, plugin, index, n_per_file):
     assert "binning" in plugin._standard_kwargs.keys()
 
 
+def test_pre_execute__contiguous_dataset(config, plugin):
+    plugin.set_param_value("hdf5_slicing_axis", 0)
+    plugin.pre_execute()
+    assert plugin._config["frames_per_chunk"] == 1
+
+
+def test_get_frames_per_chunk__chunked_dataset(config, plugin):
+    _fname = config.path / "chunked.h5"
+    with h5py.File(_fname, "w") as f:
+        f.create_dataset("/entry/data/data", data=config.data, chunks=(4,) + _SHAPE)
+    plugin.set_param_value("hdf5_slicing_axis", 0)
+    plugin.get_filename = lambda index: _fname
+    assert plugin._get_frames_per_chunk() == 4
+
+
+@pytest.mark.parametrize(
+    "frame_index, expected", [(0, (0, 0)), (3, (0, 0)), (5, (0, 1)), (14, (1, 0))]
+)
+def test_get_frame_locality_key(config, plugin, frame_index, expected):
+    plugin.set_param_value("hdf5_slicing_axis", 0)
+    plugin.pre_execute()
+    plugin._config["frames_per_chunk"] = 4
+    assert plugin.get_frame_locality_key(frame_index) == expected
+
+
 @pytest.mark.parametrize("slice_ax", [0, 1, 2])
 @pytest.mark.parametrize("frame_index", [0, 7, 27, 76])
 @pytest.mark.parametrize("n_per_file", [-1, None])
@@ -151,6 +151,32 @@ class TestCorrectSplineDistortion(unittest.TestCase):
         self.assertIsInstance(plugin._correction, pyFAI.distortion.Distortion)
         self.check_shrunk_nan_mask(np.flipud(plugin._nan_mask))
 
+    def test_pre_execute__shared_lut(self):
+        _plugins = [
+            PLUGIN_COLLECTION.get_plugin_by_name("CorrectSplineDistortion")(
+                spline_file=self._spline_files["shrink"], geometry="pyFAI"
+            )
+            for _ in range(2)
+        ]
+        for _plugin in _plugins:
+            _plugin.pre_execute()
+        for _item0, _item1 in zip(
+            _plugins[0]._correction.lut, _plugins[1]._correction.lut
+        ):
+            self.assertTrue(np.shares_memory(_item0, _item1))
+        self.assertTrue(np.shares_memory(_plugins[0]._nan_mask, _plugins[1]._nan_mask))
+
+    def test_execute__shared_lut(self):
+        plugin = PLUGIN_COLLECTION.get_plugin_by_name("CorrectSplineDistortion")()
+        plugin.set_param_value("spline_file", self._spline_files["shrink"])
+        plugin.set_param_value("geometry", "pyFAI")
+        plugin.set_param_value("fill_nan", False)
+        plugin.pre_execute()
+        _data_in = Dataset(np.random.random(self.data_shape))
+        _ref = self._corrections["shrink"].correct(_data_in.array)
+        _data_out, _ = plugin.execute(_data_in.copy())
+        self.assertTrue(np.allclose(_data_out, _ref))
+
     def test_execute__pyFAI_shrink_no_fill(self):
         plugin = PLUGIN_COLLECTION.get_plugin_by_name("CorrectSplineDistortion")()
         plugin.set_param_value("spline_file", self._spline_files["shrink"])
@@ -348,6 +348,21 @@ class TestFitDoublePeak(unittest.TestCase):
                     _new_data[*_slice], _kwargs["fit_params"], None
                 )
 
+    def test_execute__multidim_batch_same_as_individual_fits(self):
+        _rng = np.random.default_rng(seed=7)
+        _data = np.tile(self._data, (3, 4, 1))
+        _data += _rng.normal(0, 0.1, _data.shape)
+        _data.axis_ranges = (np.arange(3), np.arange(4), self._x)
+        plugin = self.create_generic_plugin()
+        plugin.set_param_value("fit_upper_limit", 40)
+        plugin.set_param_value("fit_output", "position; amplitude")
+        plugin.pre_execute()
+        _batch, _ = plugin.execute(_data)
+        _single, _ = plugin._execute_single(_data)
+        self.assertEqual(_batch.shape, (3, 4, 2, 2))
+        self.assertTrue(np.allclose(_batch, _single, rtol=1e-4, atol=1e-4))
+        self.assertTrue(np.all(_batch[..., 0, 0] < _batch[..., 1, 0]))
+
     def test_detailed_results(self):
         plugin = self.create_generic_plugin()
         plugin.pre_execute()
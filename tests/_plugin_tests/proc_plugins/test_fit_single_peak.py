@@ -342,6 +342,161 @@ class TestFitSinglePeak(unittest.TestCase):
                     _new_data[*_slice], _kwargs["fit_params"], None
                 )
 
+    def create_noisy_multidim_input_data(
+        self, shape: tuple, with_nan: bool = False
+    ) -> Dataset:
+        _rng = np.random.default_rng(seed=12)
+        _n = int(np.prod(shape))
+        _params = np.column_stack(
+            (
+                _rng.uniform(20, 30, _n),
+                _rng.uniform(1.0, 1.5, _n),
+                _rng.uniform(19, 23, _n),
+                np.ones(_n),
+            )
+        )
+        _profiles = Gaussian.profile(_params.T[..., None], self._x)
+        _profiles += _rng.normal(0, 0.1, _profiles.shape)
+        _profiles[1] = 1  # profile without a peak
+        if with_nan:
+            _profiles[2, 60] = np.nan
+        return Dataset(
+            _profiles.reshape(shape + (self._x.size,)),
+            axis_labels=[f"axis {_i}" for _i in range(len(shape))] + ["data"],
+            axis_ranges=[np.arange(_n) for _n in shape] + [self._x],
+            axis_units=[f"u{_i}" for _i in range(len(shape))] + ["x_unit"],
+        )
+
+    def test_execute__multidim_batch_same_as_individual_fits(self):
+        for _func, _bg_order in itertools.product(
+            ["Gaussian", "Lorentzian", "Voigt"], [None, 0, 1]
+        ):
+            with self.subTest(fit_func=_func, bg_order=_bg_order):
+                _data = self.create_noisy_multidim_input_data((4, 5))
+                plugin = self.create_generic_plugin(_func)
+                plugin.set_param_value("fit_bg_order", _bg_order)
+                plugin.set_param_value("fit_min_peak_height", 5)
+                plugin.set_param_value("fit_output", "position; area; FWHM")
+                plugin.pre_execute()
+                _batch, _batch_kwargs = plugin.execute(_data)
+                _single, _single_kwargs = plugin._execute_single(_data)
+                self.assertTrue(
+                    np.allclose(_batch, _single, rtol=1e-3, atol=5e-3, equal_nan=True)
+                )
+                self.assertTrue(np.all(np.isnan(_batch[0, 1])))
+                self.assertEqual(_batch.axis_labels, _single.axis_labels)
+                self.assertEqual(_batch.axis_units, _single.axis_units)
+                for _key, _range in _single.axis_ranges.items():
+                    self.assertTrue(np.allclose(_batch.axis_ranges[_key], _range))
+                self.assertEqual(_batch.metadata.keys(), _single.metadata.keys())
+                self.assertEqual(_batch_kwargs.keys(), _single_kwargs.keys())
+
+    def test_execute__multidim_more_than_500_profiles(self):
+        _data = self.create_noisy_multidim_input_data((25, 24), with_nan=True)
+        _data = Dataset(
+            np.moveaxis(_data.array, 2, 0),
+            axis_ranges=[self._x, np.arange(25), np.arange(24)],
+        )
+        plugin = self.create_generic_plugin()
+        plugin.set_param_value("fit_bg_order", 0)
+        plugin.set_param_value("fit_min_peak_height", 5)
+        plugin.set_param_value("process_data_dim", 0)
+        plugin.pre_execute()
+        _new_data, _kwargs = plugin.execute(_data)
+        self.assertEqual(_new_data.shape, (1, 25, 24))
+        self.assertTrue(np.all(np.isnan(_new_data[0, 0, 1:3])))
+        self.assertEqual(np.sum(np.isnan(_new_data)), 2)
+        self.assertTrue(np.nanmax(np.abs(_new_data - 21)) < 2.1)
+
+    def test_pre_execute__resets_warm_start(self):
+        plugin = self.create_generic_plugin()
+        plugin.set_param_value("fit_warm_start", True)
+        plugin._config["warm_start_params"] = np.ones(4)
+        plugin._fit_statistics["n_fits"] = 5
+        plugin.pre_execute()
+        self.assertIsNone(plugin._config["warm_start_params"])
+        self.assertEqual(
+            plugin.fit_statistics,
+            {"n_fits": 0, "n_warm_start": 0, "n_warm_start_rejected": 0},
+        )
+
+    def test_reset_run_state(self):
+        plugin = self.create_generic_plugin()
+        plugin.set_param_value("fit_warm_start", True)
+        plugin.pre_execute()
+        plugin._config["warm_start_params"] = np.ones(4)
+        plugin._fit_statistics["n_warm_start"] = 3
+        plugin.reset_run_state()
+        self.assertIsNone(plugin._config["warm_start_params"])
+        self.assertTrue(plugin._config["warm_start"])
+        self.assertEqual(
+            plugin.fit_statistics,
+            {"n_fits": 0, "n_warm_start": 0, "n_warm_start_rejected": 0},
+        )
+
+    def test_execute__warm_start(self):
+        _data = self.create_noisy_multidim_input_data((12,))
+        _results = {}
+        for _warm_start in [True, False]:
+            plugin = self.create_generic_plugin()
+            plugin.set_param_value("fit_bg_order", 0)
+            plugin.set_param_value("fit_min_peak_height", 5)
+            plugin.set_param_value("fit_output", "position; area; FWHM")
+            plugin.set_param_value("fit_warm_start", _warm_start)
+            plugin.pre_execute()
+            _results[_warm_start] = np.array(
+                [plugin.execute(_data[_index])[0] for _index in range(12)]
+            )
+            self.assertEqual(plugin.fit_statistics["n_fits"], 11)
+            self.assertEqual(plugin.fit_statistics["n_warm_start"] > 0, _warm_start)
+        self.assertTrue(
+            np.allclose(_results[True], _results[False], rtol=1e-4, equal_nan=True)
+        )
+
+    def test_execute__warm_start_statistics(self):
+        _data = self.create_noisy_multidim_input_data((12,))
+        plugin = self.create_generic_plugin()
+        plugin.set_param_value("fit_bg_order", 0)
+        plugin.set_param_value("fit_min_peak_height", 5)
+        plugin.set_param_value("fit_warm_start", True)
+        plugin.pre_execute()
+        for _index in range(12):
+            plugin.execute(_data[_index])
+        # profile 1 has no peak and the following profile uses the guess:
+        self.assertEqual(
+            plugin.fit_statistics,
+            {"n_fits": 11, "n_warm_start": 9, "n_warm_start_rejected": 0},
+        )
+
+    def test_execute__warm_start_rejected(self):
+        plugin = self.create_generic_plugin()
+        plugin.set_param_value("fit_warm_start", True)
+        plugin.pre_execute()
+        _ref, _ = plugin.execute(self._data)
+        plugin._config["warm_start_params"] = np.array([0, 1, 12, 1])
+        _data, _kwargs = plugin.execute(self._data)
+        self.assertEqual(plugin.fit_statistics["n_warm_start_rejected"], 1)
+        self.assertTrue(np.allclose(_data, _ref))
+        self.assert_fit_results_okay(_data, _kwargs["fit_params"], 0)
+
+    def test_execute__warm_start_multidim(self):
+        _data = self.create_noisy_multidim_input_data((4, 5))
+        plugin = self.create_generic_plugin()
+        plugin.set_param_value("fit_min_peak_height", 5)
+        plugin.set_param_value("fit_warm_start", True)
+        plugin.pre_execute()
+        _results, _ = plugin.execute(_data)
+        _warm_results, _ = plugin.execute(_data[::-1, ::-1])
+        self.assertTrue(
+            np.allclose(_warm_results[::-1, ::-1], _results, rtol=1e-3, equal_nan=True)
+        )
+        self.assertEqual(
+            plugin.fit_statistics["n_warm_start"]
+            + plugin.fit_statistics["n_warm_start_rejected"],
+            18,
+        )
+        self.assertEqual(plugin.fit_statistics["n_fits"], 38)
+
     def test_detailed_results(self):
         plugin = self.create_generic_plugin()
         plugin.pre_execute()
@@ -30,9 +30,11 @@ from pathlib import Path
 
 import numpy as np
 import pytest
+import scipy
 
 from pydidas_plugins.residual_stress_plugins.sin_square_chi_analysis import (
-    _filter_nan_from_1d_dataset,
+    _fit_linear,
+    _fit_proportional,
 )
 
 import pydidas
@@ -259,7 +261,9 @@ def test_fit_sin_square_chi_data__w_nan_values(
     if non_nan_values in [0, 1]:
         assert np.all(np.isnan(_fitted_slope_and_errors))
     else:
-        _x, _y = _filter_nan_from_1d_dataset(_sin_square_chi_data[2])
+        _valid = np.isfinite(_sin_square_chi_data[2])
+        _x = _sin_square_chi_data[2].axis_ranges[0][_valid]
+        _y = np.asarray(_sin_square_chi_data[2])[_valid]
         _slope_estimate = np.mean(np.diff(_y) / np.diff(_x))
         _intercept_estimate = np.mean(_y - _slope_estimate * _x)
         assert np.allclose(_fitted_slope_and_errors[0], _slope_estimate, atol=0.1)
@@ -277,7 +281,9 @@ def test_fit_sin_square_chi_data(plugin, fitted_data, output_type):
     _sin_square_chi_data, _sin_2chi_data = plugin._regroup_data_w_sin_chi(fitted_data)
     _sin_square_chi_data[2, 4] = np.nan
     _fitted_slope_and_errors = plugin._fit_sin_square_chi_data(_sin_square_chi_data)
-    _x, _y = _filter_nan_from_1d_dataset(_sin_square_chi_data[2])
+    _valid = np.isfinite(_sin_square_chi_data[2])
+    _x = _sin_square_chi_data[2].axis_ranges[0][_valid]
+    _y = np.asarray(_sin_square_chi_data[2])[_valid]
     _slope_estimate = np.mean(np.diff(_y) / np.diff(_x))
     _intercept_estimate = np.mean(_y - _slope_estimate * _x)
     assert np.allclose(_fitted_slope_and_errors[0], _slope_estimate, atol=0.1)
@@ -331,6 +337,142 @@ def test_calculate_fit_slice(plugin, limit_low, limit_high):
     assert plugin._fit_slice.stop == _valid_indices[-1] + 1
 
 
+@pytest.mark.parametrize("n_points", [2, 3, 4, 5, 12])
+def test_fit_linear(n_points):
+    _rng = np.random.default_rng(seed=n_points)
+    _x = _rng.random(n_points)
+    _y = 0.2 * _x + 3.1 + _rng.normal(0, 0.01, n_points)
+    _res = _fit_linear(_x, _y)
+    if n_points <= 4:
+        _p = np.polyfit(_x, _y, 1)
+        _ref = [_p[0], np.nan, _p[1], np.nan]
+    else:
+        _p, _cov = np.polyfit(_x, _y, 1, cov=True)
+        _err = np.sqrt(np.diag(_cov))
+        _ref = [_p[0], _err[0], _p[1], _err[1]]
+    assert np.allclose(_res, _ref, rtol=1e-10, equal_nan=True)
+
+
+@pytest.mark.parametrize("n_valid", [0, 1])
+def test_fit_linear__too_few_points(n_valid):
+    _y = np.full(8, np.nan)
+    _y[:n_valid] = 1
+    _res = _fit_linear(np.linspace(0, 1, 8), _y)
+    assert np.all(np.isnan(_res))
+
+
+def test_fit_linear__stacked_w_nan():
+    _rng = np.random.default_rng(seed=42)
+    _x = np.linspace(0, 1, 10)
+    _y = _rng.random((4, 3, 10))
+    _y[0, 1, 3:] = np.nan
+    _y[2, 0, ::2] = np.nan
+    _y[3, 2] = np.nan
+    _res = _fit_linear(_x, _y)
+    assert _res.shape == (4, 3, 4)
+    for _index in np.ndindex(_y.shape[:2]):
+        assert np.allclose(
+            _res[_index], _fit_linear(_x, _y[_index]), rtol=1e-12, equal_nan=True
+        )
+
+
+@pytest.mark.parametrize("n_points", [2, 5, 12])
+def test_fit_proportional(n_points):
+    _rng = np.random.default_rng(seed=n_points)
+    _x = _rng.random(n_points)
+    _y = 0.7 * _x + _rng.normal(0, 0.01, n_points)
+    _popt, _pcov = scipy.optimize.curve_fit(lambda x, c: c * x, _x, _y)
+    _res = _fit_proportional(_x, _y)
+    assert np.allclose(_res, [_popt[0], np.sqrt(_pcov[0, 0])], rtol=1e-6)
+
+
+def test_fit_proportional__single_point():
+    _res = _fit_proportional(np.array([0.5, 0.8]), np.array([1.0, np.nan]))
+    assert _res[0] == pytest.approx(2)
+    assert _res[1] == np.inf
+
+
+def test_fit_proportional__stacked_w_all_nan():
+    _x = np.linspace(0, 1, 6)
+    _y = np.stack((1.5 * _x, np.full(6, np.nan)))
+    _res = _fit_proportional(_x, _y)
+    assert np.allclose(_res[0], [1.5, 0])
+    assert np.all(np.isnan(_res[1]))
+
+
+def _create_stacked_groupings(
+    fitted_data: Dataset, sin_square_plugin
+) -> tuple[list[Dataset], Dataset]:
+    _inputs = []
+    _groupings = []
+    for _index, _offset in enumerate([0, 0.05, -0.1, 0.2, 0.08, 0.01]):
+        _data = fitted_data.copy()
+        _data[:, 0] += _offset * np.sin(np.deg2rad(_CHI + 3 * _index)) ** 2
+        if _index == 4:
+            _data[::3, 0] = np.nan
+        _inputs.append(_data)
+        _groupings.append(sin_square_plugin.execute(_data)[0])
+    _stack = Dataset(
+        np.stack(_groupings).reshape((2, 3) + _groupings[0].shape),
+        axis_labels=["scan_0", "scan_1"] + list(_groupings[0].axis_labels.values()),
+        axis_units=["mm", "um"] + list(_groupings[0].axis_units.values()),
+        axis_ranges=[np.arange(2), 0.5 * np.arange(3)]
+        + list(_groupings[0].axis_ranges.values()),
+        data_label=_groupings[0].data_label,
+        data_unit=_groupings[0].data_unit,
+    )
+    return _inputs, _stack
+
+
+@pytest.mark.parametrize(
+    "output_type", ["Same as input", "2theta / rad", "d-spacing / nm", "Q / A^-1"]
+)
+def test_analyze_stacked_groupings(
+    plugin, fitted_2theta_deg_data, sin_square_plugin, output_type
+):
+    plugin.set_param_value("output_type", output_type)
+    plugin.set_param_value("sin_square_chi_low_fit_limit", 0.1)
+    plugin.set_param_value("sin_square_chi_high_fit_limit", 0.85)
+    _inputs, _stack = _create_stacked_groupings(
+        fitted_2theta_deg_data, sin_square_plugin
+    )
+    plugin.pre_execute()
+    _ref = [plugin.execute(_data)[0] for _data in _inputs]
+    _results = plugin.analyze_stacked_groupings(_stack)
+    assert _results.shape == (2, 3, 6)
+    assert np.allclose(
+        _results.reshape(6, 6), np.stack(_ref), rtol=1e-6, equal_nan=True
+    )
+    assert _results.axis_labels == {
+        0: "scan_0",
+        1: "scan_1",
+        2: _ref[0].axis_labels[0],
+    }
+    assert _results.axis_units == {0: "mm", 1: "um", 2: ""}
+    assert np.allclose(_results.axis_ranges[1], 0.5 * np.arange(3))
+    assert _results.data_label == _ref[0].data_label
+    assert _results.data_unit == _ref[0].data_unit
+    assert _results.metadata == _ref[0].metadata
+
+
+def test_analyze_stacked_groupings__invalid_input(plugin, fitted_2theta_deg_data):
+    with pytest.raises(UserConfigError):
+        plugin.analyze_stacked_groupings(fitted_2theta_deg_data)
+
+
+def test_analyze_workflow_results(plugin, fitted_2theta_deg_data, sin_square_plugin):
+    class _Results:
+        def get_results(self, node_id):
+            assert node_id == 3
+            return _stack
+
+    _, _stack = _create_stacked_groupings(fitted_2theta_deg_data, sin_square_plugin)
+    _results = plugin.analyze_workflow_results(3, results=_Results())
+    assert np.allclose(
+        _results, plugin.analyze_stacked_groupings(_stack), equal_nan=True
+    )
+
+
 def test_create_detailed_results(plugin, fitted_2theta_deg_data):
     plugin.pre_execute()
     _sin_square_chi_data, _sin_2chi_data = plugin._regroup_data_w_sin_chi(
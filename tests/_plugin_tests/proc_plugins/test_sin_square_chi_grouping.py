@@ -33,12 +33,13 @@ from typing import Callable
 import numpy as np
 import numpy.testing as npt
 import pytest
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
 
 from pydidas_plugins.residual_stress_plugins.sin_square_chi_grouping import (
     LABELS_CHI,
     LABELS_POSITION,
     LABELS_SIN2CHI,
-    NPT_AZIM_LIMIT,
     PARAMETER_KEEP_RESULTS,
     S2C_TOLERANCE,
     UNITS_DEGREE,
@@ -717,25 +718,6 @@ def test__ds_slicing_1d_validation(plugin, base_dataset_one_fit_parameter_factor
     assert len(ds.axis_labels) == 1
 
 
-@pytest.mark.parametrize(
-    "chi, should_raise_error",
-    [
-        (np.arange(3000), False),  # Valid case, exactly at the limit
-        (np.arange(2999), False),  # Valid case, below the limit
-        (np.arange(3001), True),  # Invalid case, above the limit
-    ],
-)
-def test__ensure_npt_azim_limit(plugin, chi, should_raise_error):
-    if should_raise_error:
-        with pytest.raises(
-            UserConfigError,
-            match=f"Number of azimuthal angles exceeds the limit of {NPT_AZIM_LIMIT}.",
-        ):
-            plugin._ensure_npt_azim_limit(chi)
-    else:
-        plugin._ensure_npt_azim_limit(chi)  # Should not raise an error
-
-
 @pytest.fixture
 def base_dataset_with_fit_labels_factory():
     def _create_dataset(fit_labels):
@@ -1058,6 +1040,42 @@ def test__idx_s2c_grouping_very_small_array(plugin):
     assert len(labels) == 1  # One label for the one value
 
 
+@pytest.mark.parametrize("tolerance", [1e-6, 1e-4, 1e-2])
+@pytest.mark.parametrize(
+    "chi",
+    [
+        np.arange(-180, 180, 5.0),
+        np.random.default_rng(12).choice(np.arange(-180, 181, 7.5), 300),
+        np.random.default_rng(13).uniform(-180, 180, 500),
+        np.array([0, 10, np.nan, 170, -10, np.nan, 180, 90]),
+    ],
+)
+def test__idx_s2c_grouping_same_as_connected_components(plugin, chi, tolerance):
+    s2c = np.sin(np.deg2rad(chi)) ** 2
+    n_expected, labels_expected = connected_components(
+        csr_matrix(np.abs(s2c[:, None] - s2c[None, :]) <= tolerance), directed=False
+    )
+    n_components, labels = plugin._idx_s2c_grouping(chi, tolerance=tolerance)
+    assert n_components == n_expected
+    npt.assert_array_equal(labels, labels_expected)
+
+
+def test__idx_s2c_grouping_chained_values(plugin):
+    # neighbouring values are within the tolerance but the extreme values are not
+    chi = np.rad2deg(np.arcsin(np.sqrt([0.5, 0.5008, 0.5016, 0.5024, 0.6])))
+    n_components, labels = plugin._idx_s2c_grouping(chi, tolerance=1e-3)
+    assert n_components == 2
+    npt.assert_array_equal(labels, [0, 0, 0, 0, 1])
+
+
+def test__nanmean_by_group(plugin):
+    values = np.array([1.0, 2.0, np.nan, 4.0, 5.0, 6.0])
+    labels = np.array([0, 0, 1, 1, 2, 2])
+    mask = np.array([True, True, True, True, False, False])
+    means = plugin._nanmean_by_group(values, labels, 4, mask)
+    npt.assert_array_equal(means, [1.5, 4.0, np.nan, np.nan])
+
+
 def test__group_d_spacing_by_chi_basic(plugin):
     chi = np.arange(-175, 185, 10)
     d_spacing = Dataset(
@@ -2465,6 +2483,23 @@ def test_execute_with_various_cases_1d(plugin, case):
     ), "result.axis_ranges[1] is not in ascending order (ignoring NaNs)."
 
 
+def test_execute_with_large_number_of_azimuthal_points(plugin):
+    chi = np.linspace(-180, 180, 7200, endpoint=False)
+    s2c = np.sin(np.deg2rad(chi)) ** 2
+    input_ds = Dataset(
+        1 + 0.01 * s2c + 0.001 * np.sin(np.deg2rad(2 * chi)),
+        axis_ranges={0: chi},
+        axis_labels={0: LABELS_CHI},
+        axis_units={0: UNITS_DEGREE},
+        data_label=f"position / {UNITS_NANOMETER}",
+    )
+    result, _ = plugin.execute(input_ds)
+    assert result.shape == (3, plugin._idx_s2c_grouping(chi)[0])
+    assert result.shape[1] > 1700
+    npt.assert_allclose(result[2], 1 + 0.01 * result.axis_ranges[1], atol=1e-12)
+    assert np.all(result[1] - result[0] >= -1e-15)
+
+
 @pytest.mark.parametrize(
     "invalid_input",
     [
@@ -128,6 +128,24 @@ def test_pre_execute__outputs(temp_path, multiplicator, threshold, ROI, use_roi)
         assert plugin._thresh == threshold
 
 
+def test_pre_execute__shared_bg_image(temp_path):
+    image_file = get_image_file(temp_path, "shared.npy", float)
+    plugins = [SubtractBackgroundImage(bg_file=image_file) for _ in range(2)]
+    for plugin in plugins:
+        plugin.pre_execute()
+    assert np.shares_memory(plugins[0]._bg_image, plugins[1]._bg_image)
+    assert not plugins[0]._bg_image.flags.writeable
+
+
+def test_pre_execute__shared_bg_image_w_new_file_content(temp_path):
+    plugin = SubtractBackgroundImage()
+    plugin.set_param_value("bg_file", get_image_file(temp_path, "new.npy", float))
+    plugin.pre_execute()
+    np.save(temp_path / "new.npy", 2 * _IMAGE)
+    plugin.pre_execute()
+    assert np.allclose(plugin._bg_image, 2 * _IMAGE)
+
+
 @pytest.mark.parametrize("bg_image_dtype", [float, np.float32, int, np.uint32])
 @pytest.mark.parametrize("data_dtype", [float, np.float32, np.uint16, np.int32])
 @pytest.mark.parametrize("multiplicator", [0.1, 1.0, 2.5])
@@ -28,10 +28,14 @@ import multiprocessing as mp
 import queue
 import shutil
 import tempfile
+import threading
 import time
+import tracemalloc
 import unittest
+from collections import deque
 from numbers import Integral
 from pathlib import Path
+from unittest import mock
 
 import h5py
 import numpy as np
@@ -42,11 +46,20 @@ from pydidas import IS_QT6, LOGGING_LEVEL, unittest_objects
 from pydidas.apps import ExecuteWorkflowApp
 from pydidas.apps.parsers import execute_workflow_app_parser
 from pydidas.contexts import DiffractionExperimentContext, ScanContext
-from pydidas.core import PydidasQsettings, UserConfigError, get_generic_parameter, utils
+from pydidas.core import (
+    AsyncWriteQueue,
+    FileReadError,
+    PydidasQsettings,
+    SharedResources,
+    UserConfigError,
+    get_generic_parameter,
+    utils,
+)
 from pydidas.core.utils import get_random_string
+from pydidas.multiprocessing import AppThreadRunner
 from pydidas.multiprocessing.app_processor import app_processor_func
-from pydidas.plugins import PluginCollection
-from pydidas.workflow import WorkflowResults, WorkflowTree
+from pydidas.plugins import OutputPlugin, PluginCollection
+from pydidas.workflow import NodeProfile, WorkflowResults, WorkflowTree
 from pydidas.workflow.result_io import ProcessingResultIoMeta
 
 
@@ -95,6 +108,7 @@ class TestExecuteWorkflowApp(unittest.TestCase):
 
     def tearDown(self):
         ExecuteWorkflowApp.parse_func = execute_workflow_app_parser
+        OutputPlugin.configure_async_output(0)
         for _app in self._apps:
             _app.close_shared_arrays_and_memory()
         for _share in self._shares:
@@ -120,6 +134,7 @@ class TestExecuteWorkflowApp(unittest.TestCase):
     ) -> tuple[ExecuteWorkflowApp, ExecuteWorkflowApp]:
         manager = ExecuteWorkflowApp()
         manager.prepare_run()
+        manager.multiprocessing_set_n_workers(2)
         self._apps.append(manager)
         clone = manager.copy(clone_mode=True)
         clone.prepare_run()
@@ -152,7 +167,14 @@ class TestExecuteWorkflowApp(unittest.TestCase):
     def test_prepare_mp_configuration(self):
         app = self.get_exec_workflow_app()
         self.assertEqual(app._mp_manager_instance.__class__, mp.managers.SyncManager)
-        for _key in ("shapes_available", "shapes_set", "shapes_dict", "metadata_dict"):
+        for _key in (
+            "shapes_available",
+            "shapes_set",
+            "shapes_dict",
+            "metadata_dict",
+            "io_stats_dict",
+            "profile_dict",
+        ):
             self.assertIn(_key, app.mp_manager)
 
     def test_prepare_mp_configuration__clone_mode(self):
@@ -235,6 +257,46 @@ class TestExecuteWorkflowApp(unittest.TestCase):
         for _key, _val in _exp_copy.items():
             self.assertEqual(EXP.get_param_value(_key), _val)
 
+    def test_recreate_context__unchanged(self):
+        app = self.get_exec_workflow_app()
+        app._config["scan_context"] = SCAN.get_param_values_as_dict(
+            filter_types_for_export=True
+        )
+        app._config["exp_context"] = EXP.get_param_values_as_dict(
+            filter_types_for_export=True
+        )
+        app._config["tree_str_rep"] = TREE.export_to_string()
+        _plugins = [_node.plugin for _node in TREE.nodes.values()]
+        self.assertFalse(app._recreate_context())
+        self.assertEqual([_node.plugin for _node in TREE.nodes.values()], _plugins)
+
+    def test_recreate_context__changed(self):
+        app = self.get_exec_workflow_app()
+        EXP.set_param_value("xray_energy", 42)
+        app._config["exp_context"] = EXP.get_param_values_as_dict(
+            filter_types_for_export=True
+        )
+        EXP.set_param_value("xray_energy", 12)
+        self.assertTrue(app._recreate_context())
+
+    def test_recreate_context__changed_mask_file(self):
+        app = self.get_exec_workflow_app()
+        _mask_fname = self._path.joinpath("mask.npy")
+        np.save(_mask_fname, np.zeros((10, 10)))
+        EXP.set_param_value("detector_mask_file", _mask_fname)
+        app._config["scan_context"] = SCAN.get_param_values_as_dict(
+            filter_types_for_export=True
+        )
+        app._config["exp_context"] = EXP.get_param_values_as_dict(
+            filter_types_for_export=True
+        )
+        app._config["tree_str_rep"] = TREE.export_to_string()
+        app._recreate_context()
+        self.assertFalse(app._recreate_context())
+        np.save(_mask_fname, np.ones((20, 20)))
+        self.assertTrue(app._recreate_context())
+        EXP.set_param_value("detector_mask_file", Path())
+
     def test_close_shared_arrays_and_memory__empty(self):
         app = self.get_exec_workflow_app()
         app.close_shared_arrays_and_memory()
@@ -285,12 +347,233 @@ class TestExecuteWorkflowApp(unittest.TestCase):
         app.prepare_run()
         self.assertFalse(app._config["export_files_prepared"])
 
+    def test_prepare_run__result_writer(self):
+        app = self.get_exec_workflow_app()
+        app.set_param_value("autosave_results", True)
+        app.set_param_value("autosave_directory", self._path.joinpath("test"))
+        app.prepare_run()
+        self.assertIsInstance(app._locals["result_writer"], AsyncWriteQueue)
+        self.assertIsNone(OutputPlugin._write_queue)
+
+    def test_prepare_run__result_writer_disabled(self):
+        _queue_size = self.q_settings.value("global/async_write_queue_size", int)
+        self.q_settings.set_value("global/async_write_queue_size", 0)
+        try:
+            app = self.get_exec_workflow_app()
+            app.set_param_value("autosave_results", True)
+            app.set_param_value("autosave_directory", self._path.joinpath("test"))
+            app.prepare_run()
+        finally:
+            self.q_settings.set_value("global/async_write_queue_size", _queue_size)
+        self.assertIsNone(app._locals["result_writer"])
+
+    def test_prepare_run__clone_async_output(self):
+        _, clone = self.get_main_app_and_app_clone()
+        self.assertIsInstance(OutputPlugin._write_queue, AsyncWriteQueue)
+        clone.multiprocessing_post_run()
+        self.assertIsNone(OutputPlugin._write_queue)
+
+    def test_prepare_run__prefetching(self):
+        _depth = self.q_settings.value("global/input_prefetch_depth", int)
+        self.q_settings.set_value("global/input_prefetch_depth", 3)
+        try:
+            app = self.get_exec_workflow_app()
+            app.prepare_run()
+        finally:
+            self.q_settings.set_value("global/input_prefetch_depth", _depth)
+        self.assertEqual(TREE.root.plugin.prefetch_depth, 3)
+        app.multiprocessing_post_run()
+        self.assertEqual(TREE.root.plugin.prefetch_depth, 0)
+
+    def test_prepare_run__w_partitions(self):
+        app = self.get_exec_workflow_app()
+        app.set_param_value("n_partitions", 3)
+        _tasks = []
+        for _index in range(3):
+            app.set_param_value("partition_index", _index)
+            app.prepare_run()
+            _tasks.append(app.multiprocessing_get_tasks())
+        self.assertTrue(
+            np.array_equal(np.concatenate(_tasks), np.arange(SCAN.n_points))
+        )
+        self.assertTrue(np.all(np.diff([_t.size for _t in _tasks]) <= 0))
+
+    def test_prepare_run__invalid_partition(self):
+        app = self.get_exec_workflow_app()
+        for _n_partitions, _index in [(2, 2), (SCAN.n_points + 1, 0)]:
+            app.set_param_value("n_partitions", _n_partitions)
+            app.set_param_value("partition_index", _index)
+            with self.assertRaises(UserConfigError):
+                app.prepare_run()
+
+    def test_prepare_run__shared_resource_keys(self):
+        with mock.patch.object(
+            SharedResources, "keys", new_callable=mock.PropertyMock
+        ) as _keys:
+            _keys.return_value = {"base": "key"}
+            app = self.get_exec_workflow_app()
+        self.assertEqual(app._config["shared_resource_keys"], {"base": "key"})
+
+    def test_prepare_run__clone_assigns_shared_resource_keys(self):
+        main_app, _ = self.get_main_app_and_app_clone()
+        main_app._config["shared_resource_keys"] = {"base": "key"}
+        clone = main_app.copy(clone_mode=True)
+        self._apps.append(clone)
+        with (
+            mock.patch.object(mp, "parent_process", return_value=True),
+            mock.patch.object(SharedResources(), "assign_keys") as _assign,
+        ):
+            clone.prepare_run()
+        _assign.assert_called_once_with({"base": "key"})
+
+    def test_prepare_run__clone_in_main_process(self):
+        main_app, _ = self.get_main_app_and_app_clone()
+        clone = main_app.copy(clone_mode=True)
+        self._apps.append(clone)
+        with mock.patch.object(SharedResources(), "assign_keys") as _assign:
+            clone.prepare_run()
+        _assign.assert_not_called()
+
+    def test_prepare_run__w_profile(self):
+        app = self.get_exec_workflow_app()
+        app.set_param_value("profile_workflow", True)
+        app.prepare_run()
+        try:
+            for _node in TREE.nodes.values():
+                self.assertIsInstance(_node.profile, NodeProfile)
+        finally:
+            TREE.enable_profiling(False)
+
+    def test_prepare_run__w_profile_memory(self):
+        if tracemalloc.is_tracing():
+            self.skipTest("tracemalloc is already tracing.")
+        app = self.get_exec_workflow_app()
+        app.set_param_value("profile_workflow", True)
+        app.set_param_value("profile_memory", True)
+        app.prepare_run()
+        try:
+            self.assertTrue(tracemalloc.is_tracing())
+        finally:
+            TREE.enable_profiling(False)
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_prepare_run__w_profile_no_memory_tracing(self):
+        if tracemalloc.is_tracing():
+            self.skipTest("tracemalloc is already tracing.")
+        app = self.get_exec_workflow_app()
+        app.set_param_value("profile_workflow", True)
+        app.prepare_run()
+        try:
+            self.assertFalse(tracemalloc.is_tracing())
+        finally:
+            TREE.enable_profiling(False)
+
+    def test_multiprocessing_post_run__worker_disables_profiling(self):
+        if tracemalloc.is_tracing():
+            self.skipTest("tracemalloc is already tracing.")
+        _, clone = self.get_main_app_and_app_clone()
+        clone.set_param_value("profile_workflow", True)
+        clone.set_param_value("profile_memory", True)
+        clone.prepare_run()
+        self.assertTrue(tracemalloc.is_tracing())
+        with mock.patch.object(mp, "parent_process", return_value=True):
+            clone.multiprocessing_post_run()
+        self.assertFalse(tracemalloc.is_tracing())
+        for _node in TREE.nodes.values():
+            self.assertIsNone(_node.profile)
+
+    def test_prepare_run__no_profile(self):
+        app = self.get_exec_workflow_app()
+        TREE.enable_profiling(True)
+        app.set_param_value("profile_workflow", False)
+        app.prepare_run()
+        self.assertTrue(len(TREE.nodes) > 0)
+        for _node in TREE.nodes.values():
+            self.assertIsNone(_node.profile)
+
+    def test_publish_profile(self):
+        app = self.get_exec_workflow_app()
+        app.set_param_value("profile_workflow", True)
+        TREE.enable_profiling(True, trace_memory=False)
+        TREE.execute_process(0)
+        app._publish_profile()
+        TREE.enable_profiling(False)
+        _states = app.mp_manager["profile_dict"][mp.current_process().pid]
+        self.assertEqual(set(_states), set(TREE.nodes))
+        self.assertEqual(_states[0]["n_calls"], 1)
+
+    def test_publish_profile__disabled(self):
+        app = self.get_exec_workflow_app()
+        app._publish_profile()
+        self.assertEqual(dict(app.mp_manager["profile_dict"]), {})
+
+    def test_get_profile(self):
+        app = self.get_exec_workflow_app()
+        for _pid in [12, 17]:
+            _node_profile = NodeProfile("dummy")
+            _node_profile.add_call(0, 0.5)
+            app.mp_manager["profile_dict"][_pid] = {0: _node_profile.__getstate__()}
+        _profile = app.get_profile()
+        self.assertEqual(_profile.n_processes, 2)
+        self.assertEqual(_profile.nodes[0].n_calls, 2)
+        self.assertEqual(_profile.nodes[0].runtime, 1.0)
+
+    def test_get_profile__no_run(self):
+        app = self.get_exec_workflow_app()
+        self.assertEqual(app.get_profile().nodes, {})
+
+    def test_multiprocessing_get_task_locality_keys(self):
+        app = self.get_exec_workflow_app()
+        _keys = app.multiprocessing_get_task_locality_keys()
+        self.assertEqual(len(_keys), len(app.multiprocessing_get_tasks()))
+        self.assertEqual(
+            _keys[:3], [TREE.root.plugin.get_locality_key(_i) for _i in range(3)]
+        )
+
+    def test_multiprocessing_get_task_locality_keys__no_input_plugin(self):
+        app = self.get_exec_workflow_app()
+        TREE.clear()
+        TREE.create_and_add_node(unittest_objects.DummyProc())
+        self.assertIsNone(app.multiprocessing_get_task_locality_keys())
+
+    def test_get_io_statistics(self):
+        app = self.get_exec_workflow_app()
+        for _pid in [12, 17]:
+            app.mp_manager["io_stats_dict"][_pid] = {
+                "n_frames": 10,
+                "file_opens": 2,
+                "chunk_cache_hits": 7,
+            }
+        self.assertEqual(
+            app.get_io_statistics(),
+            {"n_workers": 2, "n_frames": 20, "file_opens": 4, "chunk_cache_hits": 14},
+        )
+
+    def test_get_io_statistics__no_run(self):
+        app = self.get_exec_workflow_app()
+        self.assertEqual(app.get_io_statistics()["n_workers"], 0)
+
     def test_multiprocessing_pre_cycle(self):
         _index = int(np.ceil(np.random.random() * 1e5))
         app = self.get_exec_workflow_app()
         app.multiprocessing_pre_cycle(_index)
         self.assertEqual(_index, app._index)
 
+    def test_multiprocessing_upcoming_tasks(self):
+        app = self.get_exec_workflow_app()
+        TREE.root.plugin.configure_prefetching(2)
+        app.multiprocessing_upcoming_tasks(np.arange(5, 10))
+        self.assertEqual(TREE.root.plugin._upcoming_ordinals, [5, 6])
+        TREE.root.plugin.configure_prefetching(0)
+
+    def test_multiprocessing_upcoming_tasks__live(self):
+        app = self.get_exec_workflow_app()
+        app.set_param_value("live_processing", True)
+        TREE.root.plugin.configure_prefetching(2)
+        app.multiprocessing_upcoming_tasks(np.arange(5, 10))
+        self.assertEqual(TREE.root.plugin._upcoming_ordinals, [])
+        TREE.root.plugin.configure_prefetching(0)
+
     def test_multiprocessing_carryon__not_live(self):
         app = self.get_exec_workflow_app()
         app.set_param_value("live_processing", False)
@@ -418,6 +701,24 @@ class TestExecuteWorkflowApp(unittest.TestCase):
                     app.mp_manager["metadata_dict"][_key]["data_label"], str
                 )
 
+    def test_publish_shapes_and_metadata_to_manager__dtypes(self):
+        TREE.execute_process(0)
+        TREE.nodes[1].results = TREE.nodes[1].results.astype(np.uint16)
+        TREE.nodes[2].results = TREE.nodes[2].results.astype(np.float64)
+        app = self.get_exec_workflow_app()
+        app._publish_shapes_and_metadata_to_manager()
+        self.assertEqual(app._get_node_dtype(1), np.uint16)
+        self.assertEqual(app._get_node_dtype(2), np.float64)
+        self.assertEqual(RESULTS._config["dtypes"][1], np.uint16)
+
+    def test_publish_shapes_and_metadata_to_manager__dtype_downcast(self):
+        TREE.nodes[2].plugin.set_param_value("result_dtype", "float32")
+        TREE.execute_process(0)
+        TREE.nodes[2].results = TREE.nodes[2].results.astype(np.float64)
+        app = self.get_exec_workflow_app()
+        app._publish_shapes_and_metadata_to_manager()
+        self.assertEqual(app._get_node_dtype(2), np.float32)
+
     def test_create_shared_memory__not_set(self):
         app = self.get_exec_workflow_app()
         with self.assertRaises(UserConfigError):
@@ -440,6 +741,23 @@ class TestExecuteWorkflowApp(unittest.TestCase):
         with self.assertRaises(UserConfigError):
             app._check_size_of_results_and_buffer()
 
+    def test_check_size_of_results_and_buffer__fewer_slots_than_workers(self):
+        _max_n = self.q_settings.value("global/shared_buffer_max_n", int)
+        app = self.get_exec_workflow_app()
+        app._mp_tasks = np.arange(SCAN.n_points)
+        app.multiprocessing_set_n_workers(_max_n + 1)
+        app.mp_manager["shapes_dict"] = {1: (10, 10)}
+        with self.assertRaises(UserConfigError):
+            app._check_size_of_results_and_buffer()
+
+    def test_check_size_of_results_and_buffer__fewer_tasks_than_workers(self):
+        app = self.get_exec_workflow_app()
+        app._mp_tasks = np.arange(3)
+        app.multiprocessing_set_n_workers(6)
+        app.mp_manager["shapes_dict"] = {1: (10, 10)}
+        app._check_size_of_results_and_buffer()
+        self.assertEqual(app.mp_manager["buffer_n"].value, 3)
+
     def test_check_size_of_results_and_buffer__buffer_okay(self):
         app = self.get_exec_workflow_app()
         app._mp_tasks = np.arange(SCAN.n_points)
@@ -466,6 +784,24 @@ class TestExecuteWorkflowApp(unittest.TestCase):
             mp.shared_memory.SharedMemory,
         )
 
+    def test_initialize_shared_memory__partitions(self):
+        self.q_settings.set_value("global/mp_n_workers", 3)
+        app = self.get_exec_workflow_app()
+        app.mp_manager["buffer_n"].value = 10
+        app.mp_manager["buffer_n_writers"].value = 4
+        app.mp_manager["shapes_dict"] = {1: (10, 10)}
+        app._initialize_shared_memory()
+        self.assertEqual(app.mp_manager["buffer_n_partitions"].value, 3)
+        self.assertEqual(app.mp_manager["buffer_n_writers"].value, 0)
+
+    def test_initialize_shared_memory__partitions_small_buffer(self):
+        self.q_settings.set_value("global/mp_n_workers", 4)
+        app = self.get_exec_workflow_app()
+        app.mp_manager["buffer_n"].value = 2
+        app.mp_manager["shapes_dict"] = {1: (10, 10)}
+        app._initialize_shared_memory()
+        self.assertEqual(app.mp_manager["buffer_n_partitions"].value, 2)
+
     def test_initialize_arrays_from_shared_memory(self):
         main_app = self.get_exec_workflow_app()
         main_app.mp_manager["shapes_dict"] = {1: (10, 10), 2: (10, 10)}
@@ -479,6 +815,21 @@ class TestExecuteWorkflowApp(unittest.TestCase):
             self.assertEqual(app._shared_arrays[_key].shape, (10, 10, 10))
         self.assertIsInstance(app._shared_arrays["in_use_flag"], np.ndarray)
 
+    def test_initialize_arrays_from_shared_memory__native_dtypes(self):
+        main_app = self.get_exec_workflow_app()
+        main_app.mp_manager["shapes_dict"] = {1: (10, 10), 2: (10, 10)}
+        main_app.mp_manager["dtypes_dict"] = {1: "<u2", 2: "<f8"}
+        main_app.mp_manager["buffer_n"].value = 10
+        main_app._initialize_shared_memory()
+        self.assertEqual(
+            main_app._locals["shared_memory_buffers"]["node_001"].size, 2000
+        )
+        app = main_app.copy(clone_mode=True)
+        self._apps.append(app)
+        app._initialize_arrays_from_shared_memory()
+        self.assertEqual(app._shared_arrays[1].dtype, np.uint16)
+        self.assertEqual(app._shared_arrays[2].dtype, np.float64)
+
     def test_get_shared_memory__in_buffer(self):
         app = self.get_exec_workflow_app()
         _pid = app.mp_manager["main_pid"].value
@@ -508,6 +859,102 @@ class TestExecuteWorkflowApp(unittest.TestCase):
         for _key, _data in TREE.get_current_results().items():
             self.assertTrue(np.allclose(_data, app._shared_arrays[_key][0]))
 
+    def test_claim_buffer_slots(self):
+        self.q_settings.set_value("global/mp_n_workers", 3)
+        main_app = self.get_exec_workflow_app()
+        main_app.mp_manager["shapes_dict"] = {1: (10, 10)}
+        main_app.mp_manager["buffer_n"].value = 10
+        main_app._initialize_shared_memory()
+        _slots = []
+        for _ in range(3):
+            _clone = main_app.copy(clone_mode=True)
+            self._apps.append(_clone)
+            _clone._ExecuteWorkflowApp__claim_buffer_slots()
+            _slots.append(list(_clone._buffer_slots))
+        self.assertEqual(_slots, [[0, 3, 6, 9], [1, 4, 7], [2, 5, 8]])
+        self.assertEqual(main_app.mp_manager["buffer_n_writers"].value, 3)
+
+    def test_claim_buffer_slots__more_writers_than_partitions(self):
+        self.q_settings.set_value("global/mp_n_workers", 2)
+        main_app = self.get_exec_workflow_app()
+        main_app.mp_manager["shapes_dict"] = {1: (10, 10)}
+        main_app.mp_manager["buffer_n"].value = 4
+        main_app._initialize_shared_memory()
+        _clones = [main_app.copy(clone_mode=True) for _ in range(3)]
+        self._apps.extend(_clones)
+        _clones[0]._ExecuteWorkflowApp__claim_buffer_slots()
+        _clones[1]._ExecuteWorkflowApp__claim_buffer_slots()
+        with self.assertRaises(UserConfigError):
+            _clones[2]._ExecuteWorkflowApp__claim_buffer_slots()
+        self.assertEqual(list(_clones[0]._buffer_slots), [0, 2])
+        self.assertEqual(list(_clones[1]._buffer_slots), [1, 3])
+
+    def test_claim_buffer_slots__n_workers_of_run(self):
+        self.q_settings.set_value("global/mp_n_workers", 2)
+        main_app = self.get_exec_workflow_app()
+        main_app.multiprocessing_set_n_workers(4)
+        main_app.mp_manager["shapes_dict"] = {1: (10, 10)}
+        main_app.mp_manager["buffer_n"].value = 8
+        main_app._initialize_shared_memory()
+        self.assertEqual(main_app.mp_manager["buffer_n_partitions"].value, 4)
+        _slots = []
+        for _ in range(4):
+            _clone = main_app.copy(clone_mode=True)
+            self._apps.append(_clone)
+            _clone._ExecuteWorkflowApp__claim_buffer_slots()
+            _slots.extend(_clone._buffer_slots)
+        self.assertEqual(sorted(_slots), list(range(8)))
+
+    def test_get_free_buffer_slot(self):
+        main_app = self.get_exec_workflow_app()
+        main_app.mp_manager["shapes_dict"] = {1: (10, 10)}
+        main_app.mp_manager["buffer_n"].value = 6
+        main_app._initialize_shared_memory()
+        main_app._initialize_arrays_from_shared_memory()
+        main_app._buffer_slots = deque([0, 2, 4])
+        main_app._shared_arrays["in_use_flag"][:] = 0
+        main_app._shared_arrays["in_use_flag"][2] = 1
+        _get_slot = main_app._ExecuteWorkflowApp__get_free_buffer_slot
+        self.assertEqual([_get_slot() for _ in range(4)], [0, 4, 0, 4])
+        main_app._shared_arrays["in_use_flag"][2] = 0
+        self.assertEqual([_get_slot() for _ in range(3)], [0, 2, 4])
+
+    def test_get_free_buffer_slot__wait_for_release(self):
+        main_app = self.get_exec_workflow_app()
+        main_app.mp_manager["shapes_dict"] = {1: (10, 10)}
+        main_app.mp_manager["buffer_n"].value = 2
+        main_app._initialize_shared_memory()
+        main_app._initialize_arrays_from_shared_memory()
+        main_app._buffer_slots = deque([1])
+        main_app._shared_arrays["in_use_flag"][:] = 1
+        _timer = threading.Timer(
+            0.05, main_app._shared_arrays["in_use_flag"].__setitem__, args=(1, 0)
+        )
+        _timer.start()
+        _slot = main_app._ExecuteWorkflowApp__get_free_buffer_slot()
+        _timer.join()
+        self.assertEqual(_slot, 1)
+
+    def test_write_results_to_shared_arrays__multiple_writers(self):
+        self.q_settings.set_value("global/mp_n_workers", 2)
+        TREE.execute_process(0)
+        main_app = self.get_exec_workflow_app()
+        main_app._publish_shapes_and_metadata_to_manager()
+        main_app._create_shared_memory()
+        _clones = [main_app.copy(clone_mode=True) for _ in range(2)]
+        self._apps.extend(_clones)
+        _positions = []
+        for _ in range(2):
+            for _clone in _clones:
+                _clone._ExecuteWorkflowApp__write_results_to_shared_arrays()
+                _positions.append(_clone._config["buffer_pos"])
+        self.assertEqual(len(set(_positions)), 4)
+        self.assertEqual([_pos % 2 for _pos in _positions], [0, 1, 0, 1])
+        for _pos in _positions:
+            self.assertEqual(main_app._shared_arrays["in_use_flag"][_pos], 1)
+            for _key, _data in TREE.get_current_results().items():
+                self.assertTrue(np.allclose(_data, main_app._shared_arrays[_key][_pos]))
+
     def test_write_results_to_shared_arrays__arrays_created(self):
         TREE.execute_process(0)
         app = self.get_exec_workflow_app()
@@ -528,6 +975,20 @@ class TestExecuteWorkflowApp(unittest.TestCase):
         _sig = app.must_send_signal_and_wait_for_response()
         self.assertIsNone(_sig)
 
+    def test_shapes_set__not_set(self):
+        app = self.get_exec_workflow_app()
+        self.assertFalse(app._shapes_set())
+
+    def test_shapes_set__manager_event_set(self):
+        app = self.get_exec_workflow_app()
+        app.mp_manager["shapes_set"].set()
+        self.assertTrue(app._shapes_set())
+
+    def test_shapes_set__local_arrays_exist(self):
+        app = self.get_exec_workflow_app()
+        app._shared_arrays = {1: np.zeros((3, 3))}
+        self.assertTrue(app._shapes_set())
+
     def test_get_latest_results__shapes_not_set(self):
         main_app, app = self.get_main_app_and_app_clone()
         self.assertIsNone(app.get_latest_results())
@@ -540,6 +1001,37 @@ class TestExecuteWorkflowApp(unittest.TestCase):
         for _key, _data in TREE.get_current_results().items():
             self.assertTrue(np.allclose(_data, app._shared_arrays[_key][_index]))
 
+    def test_multiprocessing_max_results_per_message(self):
+        self.q_settings.set_value("global/mp_n_workers", 3)
+        app = self.get_exec_workflow_app()
+        app.mp_manager["buffer_n"].value = 20
+        self.assertEqual(app.multiprocessing_max_results_per_message(), 6)
+
+    def test_multiprocessing_max_results_per_message__n_workers_set(self):
+        self.q_settings.set_value("global/mp_n_workers", 3)
+        app = self.get_exec_workflow_app()
+        app.mp_manager["buffer_n"].value = 20
+        app.multiprocessing_set_n_workers(5)
+        self.assertEqual(app.multiprocessing_max_results_per_message(), 4)
+
+    def test_multiprocessing_set_n_workers(self):
+        main_app = self.get_exec_workflow_app()
+        app = main_app.copy(clone_mode=True)
+        self._apps.append(app)
+        app.multiprocessing_set_n_workers(7)
+        self.assertEqual(app.get_config()["mp_n_workers"], 7)
+        self.assertEqual(main_app._get_n_workers(), 7)
+
+    def test_get_n_workers__not_set(self):
+        self.q_settings.set_value("global/mp_n_workers", 3)
+        app = self.get_exec_workflow_app()
+        self.assertEqual(app._get_n_workers(), 3)
+
+    def test_multiprocessing_max_results_per_message__buffer_not_set(self):
+        app = self.get_exec_workflow_app()
+        app.mp_manager["buffer_n"].value = 0
+        self.assertEqual(app.multiprocessing_max_results_per_message(), 1)
+
     def test_received_signal_message__shapes_not_set(self):
         main_app, app = self.get_main_app_and_app_clone()
         _index = app.multiprocessing_func(0)
@@ -576,6 +1068,7 @@ class TestExecuteWorkflowApp(unittest.TestCase):
         self.assertTrue(
             np.all(RESULTS._composites[1][SCAN.get_indices_from_ordinal(0)] > 0)
         )
+        self.assertEqual(main_app._shared_arrays["in_use_flag"][_index], 0)
 
     def test_multiprocessing_store_results__autosave(self):
         main_app, _ = self.get_main_app_and_app_clone()
@@ -590,6 +1083,72 @@ class TestExecuteWorkflowApp(unittest.TestCase):
             _data = _f["entry/data/data"][SCAN.get_indices_from_ordinal(0)]
             self.assertTrue(np.all(_data > 0))
 
+    def test_multiprocessing_post_run__emits_pending_regions(self):
+        main_app, _ = self.get_main_app_and_app_clone()
+        main_app.prepare_run()
+        RESULTS._config["region_update_interval"] = 1e6
+        RESULTS._config["last_region_update"] = time.perf_counter()
+        _regions = []
+        RESULTS.sig_regions_updated.connect(_regions.append)
+        try:
+            for _i in range(2):
+                _index = main_app.multiprocessing_func(_i)
+                main_app.multiprocessing_store_results(_i, _index)
+            self.assertEqual(_regions, [])
+            main_app.multiprocessing_post_run()
+        finally:
+            RESULTS.sig_regions_updated.disconnect(_regions.append)
+        self.assertEqual(len(_regions), 1)
+        self.assertIn(1, _regions[0])
+        self.assertEqual(RESULTS.pop_updated_regions(), {})
+
+    def test_multiprocessing_store_results__async_autosave(self):
+        main_app, _ = self.get_main_app_and_app_clone()
+        main_app.set_param_value("autosave_results", True)
+        main_app.set_param_value("autosave_directory", self._path.joinpath("async"))
+        main_app.prepare_run()
+        _n = SCAN.shape[-1]
+        for _i in range(_n):
+            _index = main_app.multiprocessing_func(_i)
+            main_app.multiprocessing_store_results(_i, _index)
+        main_app.multiprocessing_post_run()
+        self.assertIsNone(main_app._locals["result_writer"])
+        self.assertEqual(main_app.get_write_statistics()["n_items"], _n)
+        _fname = self._path.joinpath("async", "node_01.nxs")
+        with h5py.File(_fname, "r") as _f:
+            _data = _f["entry/data/data"][(0,) * (SCAN.ndim - 1)]
+        self.assertTrue(
+            np.allclose(_data, RESULTS._composites[1][(0,) * (SCAN.ndim - 1)])
+        )
+
+    def test_multiprocessing_store_results__memmap_autosave(self):
+        _backing_store = self.q_settings.value("global/result_backing_store", str)
+        self.q_settings.set_value("global/result_backing_store", "memmap")
+        try:
+            main_app, _ = self.get_main_app_and_app_clone()
+            main_app.set_param_value("autosave_results", True)
+            main_app.set_param_value("autosave_directory", self._path / "memmap")
+            main_app.prepare_run()
+            for _i in range(SCAN.shape[-1]):
+                _index = main_app.multiprocessing_func(_i)
+                main_app.multiprocessing_store_results(_i, _index)
+            main_app.multiprocessing_post_run()
+        finally:
+            self.q_settings.set_value("global/result_backing_store", _backing_store)
+        _fname = self._path.joinpath("memmap", "node_01.nxs")
+        self.assertIsInstance(RESULTS._composites[1].base, np.memmap)
+        self.assertEqual(Path(RESULTS._composites[1].base.filename), _fname)
+        with h5py.File(_fname, "r") as _f:
+            _data = _f["entry/data/data"][(0,) * (SCAN.ndim - 1)]
+        self.assertTrue(np.all(_data > 0))
+        self.assertTrue(
+            np.allclose(_data, RESULTS._composites[1][(0,) * (SCAN.ndim - 1)])
+        )
+
+    def test_get_write_statistics__no_writer(self):
+        app = self.get_exec_workflow_app()
+        self.assertEqual(app.get_write_statistics(), {})
+
     def test_multiprocessing_store_results__repetitive(self):
         main_app, _ = self.get_main_app_and_app_clone()
         _spy = QtTest.QSignalSpy(main_app.sig_results_updated)
@@ -632,6 +1191,19 @@ class TestExecuteWorkflowApp(unittest.TestCase):
         _res = RESULTS.get_results(1)
         self.assertTrue(np.all(_res > 0))
 
+    def test_run__w_prefetching(self):
+        _depth = self.q_settings.value("global/input_prefetch_depth", int)
+        self.q_settings.set_value("global/input_prefetch_depth", 4)
+        try:
+            app = self.get_exec_workflow_app()
+            SCAN.set_param_value("scan_dim", 2)
+            app.run()
+        finally:
+            self.q_settings.set_value("global/input_prefetch_depth", _depth)
+        _res = RESULTS.get_results(1)
+        self.assertTrue(np.all(_res > 0))
+        self.assertEqual(TREE.root.plugin.prefetch_depth, 0)
+
     def test_run__repetitive(self):
         app = self.get_exec_workflow_app()
         SCAN.set_param_value("scan_dim", 2)
@@ -640,6 +1212,73 @@ class TestExecuteWorkflowApp(unittest.TestCase):
         _res = RESULTS.get_results(1)
         self.assertTrue(np.all(_res > 0))
 
+    def test_threading_carryon__not_live(self):
+        app = self.get_exec_workflow_app()
+        app.set_param_value("live_processing", False)
+        self.assertTrue(app.threading_carryon(0))
+
+    def test_threading_func(self):
+        app = self.get_exec_workflow_app()
+        _spy = QtTest.QSignalSpy(app.sig_results_updated)
+        _index = app.threading_func(3)
+        _spy_result = _spy.count() if IS_QT6 else len(_spy)
+        self.assertEqual(_index, 3)
+        self.assertEqual(_spy_result, 1)
+        self.assertTrue(app._config["result_metadata_set"])
+        self.assertTrue(
+            np.all(RESULTS._composites[1][SCAN.get_indices_from_ordinal(3)] > 0)
+        )
+        self.assertEqual(app._shared_arrays, {})
+
+    def test_threading_func__file_read_error(self):
+        app = self.get_exec_workflow_app()
+        _tree = app._get_thread_tree()
+        with (
+            mock.patch.object(
+                _tree, "execute_process", side_effect=FileReadError("test")
+            ),
+            mock.patch.object(app, "_report_file_read_error") as _report,
+        ):
+            _index = app.threading_func(3)
+        self.assertEqual(_index, -1)
+        _report.assert_not_called()
+
+    def test_threading_results_received(self):
+        app = self.get_exec_workflow_app()
+        with mock.patch.object(app, "_report_file_read_error") as _report:
+            app.threading_results_received(3, 3)
+            _report.assert_not_called()
+            app.threading_results_received(3, -1)
+        _report.assert_called_once_with(3)
+
+    def test_threading_func__thread_trees(self):
+        app = self.get_exec_workflow_app()
+        _threads = [
+            threading.Thread(target=app.threading_func, args=(_i,)) for _i in range(3)
+        ]
+        for _thread in _threads:
+            _thread.start()
+            _thread.join()
+        app.threading_func(3)
+        self.assertEqual(len(app._locals["thread_trees"]), 4)
+        for _, _tree in app._locals["thread_trees"]:
+            self.assertIsNot(_tree.root.plugin, TREE.root.plugin)
+
+    def test_run_in_app_thread_runner(self):
+        SCAN.set_param_value("scan_dim", 2)
+        app = ExecuteWorkflowApp()
+        app.set_param_value("profile_workflow", True)
+        self._apps.append(app)
+        _runner = AppThreadRunner(app, n_threads=3)
+        _runner.run()
+        self.assertEqual(_runner.progress, 1)
+        self.assertTrue(np.all(RESULTS.get_results(1) > 0))
+        self.assertTrue(np.all(RESULTS.get_results(2) > 0))
+        self.assertEqual(app._locals["thread_trees"], [])
+        _profile = RESULTS.get_profile()
+        self.assertEqual(_profile.nodes[0].n_calls, SCAN.n_points)
+        self.assertIn(_profile.n_processes, [1, 2, 3])
+
     def test_copy__to_clone(self):
         main_app = self.get_exec_workflow_app()
         for _key in ExecuteWorkflowApp.attributes_not_to_copy_to_app_clone:
@@ -663,7 +1302,18 @@ class TestExecuteWorkflowApp(unittest.TestCase):
                 pass
             else:
                 self.assertNotEqual(getattr(main_app, _key), getattr(_copy, _key))
-        self.assertEqual(_copy._locals, {"shared_memory_buffers": {}})
+        self.assertEqual(
+            set(_copy._locals),
+            {
+                "shared_memory_buffers",
+                "result_writer",
+                "thread_local",
+                "thread_trees",
+                "thread_lock",
+            },
+        )
+        self.assertEqual(_copy._locals["shared_memory_buffers"], {})
+        self.assertEqual(_copy._locals["thread_trees"], [])
         for _key in main_app.mp_manager:
             self.assertEqual(main_app.mp_manager[_key], _copy.mp_manager[_key])
 
@@ -25,17 +25,24 @@ __status__ = "Production"
 
 
 import io
+import json
 import shutil
+import subprocess
 import sys
 import tempfile
 from pathlib import Path
 from typing import Generator
 
 import h5py
+import numpy as np
 import pytest
 
 from pydidas import unittest_objects
 from pydidas.apps import ExecuteWorkflowRunner
+from pydidas.apps.execute_workflow_runner import (
+    PARTITION_DIRECTORY,
+    PARTITION_MERGE_LOCK,
+)
 from pydidas.contexts import DiffractionExperimentContext, ScanContext
 from pydidas.contexts.diff_exp import DiffractionExperiment
 from pydidas.contexts.scan import Scan
@@ -211,6 +218,83 @@ def test_update_parsed_args_from_kwargs_all_cases(key: str) -> None:
     assert obj.parsed_args[key] == new_val
 
 
+@pytest.mark.parametrize(
+    "key, value",
+    [
+        ("profile", "profile.json"),
+        ("profile_format", "chrome_trace"),
+        ("profile_memory", True),
+        ("backend", "threads"),
+    ],
+)
+def test_update_parsed_args_from_kwargs__profile(key: str, value: str) -> None:
+    obj = ExecuteWorkflowRunner()
+    obj.update_parsed_args_from_kwargs(**{key: value})
+    assert obj.parsed_args[key] == value
+
+
+def test_parse_args__profile_defaults() -> None:
+    obj = ExecuteWorkflowRunner()
+    assert obj.parsed_args["profile"] is None
+    assert obj.parsed_args["profile_format"] == "json"
+    assert obj.parsed_args["profile_memory"] is False
+
+
+def test_parse_args__backend_default() -> None:
+    obj = ExecuteWorkflowRunner()
+    assert obj.parsed_args["backend"] is None
+
+
+@pytest.mark.parametrize("backend", ["processes", "threads"])
+def test_get_execution_backend(backend: str) -> None:
+    obj = ExecuteWorkflowRunner(backend=backend)
+    assert obj.get_execution_backend() == backend
+
+
+def test_get_execution_backend__from_settings() -> None:
+    _q_settings = PydidasQsettings()
+    _backend = _q_settings.value("global/mp_execution_backend")
+    _q_settings.set_value("global/mp_execution_backend", "threads")
+    try:
+        obj = ExecuteWorkflowRunner()
+        assert obj.get_execution_backend() == "threads"
+    finally:
+        _q_settings.set_value("global/mp_execution_backend", _backend)
+
+
+def test_parse_args__partition_defaults() -> None:
+    obj = ExecuteWorkflowRunner()
+    assert obj.parsed_args["n_partitions"] == 1
+    assert obj.parsed_args["partition_index"] == 0
+    assert not obj.parsed_args["merge_only"]
+    assert not obj.partitioned
+
+
+def test_parse_args__partitions() -> None:
+    sys.argv = ["test", "--n_partitions", "4", "--partition_index", "2", "--merge_only"]
+    obj = ExecuteWorkflowRunner()
+    assert obj.parsed_args["n_partitions"] == 4
+    assert obj.parsed_args["partition_index"] == 2
+    assert obj.parsed_args["merge_only"]
+    assert obj.partitioned
+
+
+@pytest.mark.parametrize(
+    "key, value", [("n_partitions", 3), ("partition_index", 2), ("merge_only", True)]
+)
+def test_update_parsed_args_from_kwargs__partitions(key: str, value: object) -> None:
+    obj = ExecuteWorkflowRunner(**{key: value})
+    assert obj.parsed_args[key] == value
+
+
+def test_get_partition_filename(setup_module: object) -> None:
+    path, _, _, _, _ = setup_module
+    obj = ExecuteWorkflowRunner(output_dir=path, n_partitions=12)
+    assert obj.get_partition_filename(3) == (
+        path / PARTITION_DIRECTORY / "partition_0003_of_0012.nxs"
+    )
+
+
 def test_update_parsed_args_from_kwargs_diffraction_exp_alias() -> None:
     new_val = get_random_string(12)
     obj = ExecuteWorkflowRunner()
@@ -290,6 +374,33 @@ def test_write_results_to_disk__used_dir_w_overwrite(setup_module: object) -> No
     assert (_dir / "node_02.nxs").is_file()
 
 
+@pytest.mark.parametrize("export_format", ["json", "chrome_trace"])
+def test_write_results_to_disk__w_profile(
+    setup_module: object, export_format: str
+) -> None:
+    path, _, _, _, _ = setup_module
+    _dir = get_empty_dir_name(path)
+    TREE.prepare_execution()
+    TREE.enable_profiling(True, trace_memory=False)
+    _res = TREE.execute_process_and_get_results(0)
+    RESULTS.prepare_new_results()
+    RESULTS.store_results(0, _res)
+    RESULTS.store_profile(TREE.get_profile())
+    TREE.enable_profiling(False)
+    obj = ExecuteWorkflowRunner(
+        output_dir=_dir,
+        profile=_dir / "profile.json",
+        profile_format=export_format,
+    )
+    obj._write_results_to_disk()  # type: ignore[attr-defined]
+    with open(_dir / "profile.json") as f:
+        _content = json.load(f)
+    if export_format == "json":
+        assert _content["nodes"]["0"]["n_calls"] == 1
+    else:
+        assert len(_content["traceEvents"]) == 3
+
+
 def test_update_contexts_from_stored_args_scan_instance() -> None:
     scan = Scan()
     scan_params = {
@@ -404,6 +515,119 @@ def test_check_all_args_okay_dir_okay_no_overwrite(setup_module: object) -> None
     assert "directory is not empty" in str(error.value)
 
 
+@pytest.mark.parametrize("n_partitions, index", [(0, 0), (2, 2), (2, -1)])
+def test_check_all_args_okay__invalid_partition(
+    setup_module: object, n_partitions: int, index: int
+) -> None:
+    path, _, _, _, _ = setup_module
+    keys = {
+        item: get_random_string(8) for item in ["scan", "diffraction_exp", "workflow"]
+    }
+    obj = ExecuteWorkflowRunner(
+        output_dir=get_empty_dir_name(path),
+        n_partitions=n_partitions,
+        partition_index=index,
+        **keys,
+    )
+    with pytest.raises(UserConfigError) as error:
+        obj.check_all_args_okay()
+    assert "partition configuration is invalid" in str(error.value)
+
+
+def test_check_all_args_okay__merge_only_wo_partitions(setup_module: object):
+    path, _, _, _, _ = setup_module
+    keys = {
+        item: get_random_string(8) for item in ["scan", "diffraction_exp", "workflow"]
+    }
+    obj = ExecuteWorkflowRunner(
+        output_dir=get_empty_dir_name(path), merge_only=True, **keys
+    )
+    with pytest.raises(UserConfigError):
+        obj.check_all_args_okay()
+
+
+@pytest.mark.parametrize("n_partitions", [1, 2])
+def test_check_all_args_okay__w_partition_dir(setup_module: object, n_partitions):
+    path, _, _, _, _ = setup_module
+    _dir = get_empty_dir_name(path)
+    (_dir / PARTITION_DIRECTORY).mkdir(parents=True)
+    keys = {
+        item: get_random_string(8) for item in ["scan", "diffraction_exp", "workflow"]
+    }
+    obj = ExecuteWorkflowRunner(output_dir=_dir, n_partitions=n_partitions, **keys)
+    if n_partitions == 1:
+        with pytest.raises(UserConfigError):
+            obj.check_all_args_okay()
+    else:
+        obj.check_all_args_okay()
+
+
+def test_check_all_args_okay__partition_file_exists(setup_module: object):
+    path, _, _, _, _ = setup_module
+    _dir = get_empty_dir_name(path)
+    keys = {
+        item: get_random_string(8) for item in ["scan", "diffraction_exp", "workflow"]
+    }
+    obj = ExecuteWorkflowRunner(
+        output_dir=_dir, n_partitions=2, partition_index=1, **keys
+    )
+    obj.get_partition_filename(1).parent.mkdir(parents=True)
+    obj.get_partition_filename(1).touch()
+    with pytest.raises(UserConfigError) as error:
+        obj.check_all_args_okay()
+    assert "partition have already been written" in str(error.value)
+    obj.update_parsed_args_from_kwargs(partition_index=0)
+    obj.check_all_args_okay()
+    obj.update_parsed_args_from_kwargs(partition_index=1, overwrite=True)
+    obj.check_all_args_okay()
+
+
+def test_merge_partition_results__missing_files(setup_module: object) -> None:
+    path, _, _, _, _ = setup_module
+    obj = ExecuteWorkflowRunner(output_dir=get_empty_dir_name(path), n_partitions=3)
+    with pytest.raises(UserConfigError) as error:
+        obj.merge_partition_results()
+    assert str(obj.get_partition_filename(2)) in str(error.value)
+
+
+def test_acquire_merge_lock(setup_module: object) -> None:
+    path, _, _, _, _ = setup_module
+    _dir = get_empty_dir_name(path)
+    (_dir / PARTITION_DIRECTORY).mkdir(parents=True)
+    obj = ExecuteWorkflowRunner(output_dir=_dir, n_partitions=2)
+    assert obj._acquire_merge_lock()
+    assert (_dir / PARTITION_DIRECTORY / PARTITION_MERGE_LOCK).is_file()
+    assert not obj._acquire_merge_lock()
+
+
+def test_process_scan__merge_only(setup_module: object) -> None:
+    _path, _, _, _, _ = setup_module
+    _dir = get_empty_dir_name(_path)
+    TREE.prepare_execution()
+    RESULTS.prepare_new_results()
+    for _index in range(SCAN.n_points):
+        RESULTS.store_results(_index, TREE.execute_process_and_get_results(_index))
+    _ref = {_id: RESULTS.get_results(_id).copy() for _id in [1, 2]}
+    obj = ExecuteWorkflowRunner(
+        workflow=_path / "workflow_tree.yml",
+        scan=_path / "scan.yml",
+        diffraction_exp=_path / "diffraction_exp.yml",
+        output_dir=_dir,
+        n_partitions=2,
+    )
+    obj.get_partition_filename(0).parent.mkdir(parents=True)
+    for _index, _ordinals in enumerate(np.array_split(np.arange(SCAN.n_points), 2)):
+        RESULTS.export_partition_to_file(obj.get_partition_filename(_index), _ordinals)
+    RESULTS.prepare_new_results()
+    obj.process_scan(merge_only=True)
+    assert not (_dir / PARTITION_DIRECTORY).exists()
+    for _id in [1, 2]:
+        with h5py.File(_dir / f"node_{_id:02d}.nxs", "r") as f:
+            _data = f["entry/data/data"][()]
+        assert _data.shape == (5, 7, 3, 10, 10)
+        assert np.allclose(_data, _ref[_id])
+
+
 @pytest.mark.slow
 def test_process_scan_single_run(setup_module: object) -> None:
     _path, _, _, _, _ = setup_module
@@ -421,6 +645,141 @@ def test_process_scan_single_run(setup_module: object) -> None:
         assert shape == (5, 7, 3, 10, 10)
 
 
+@pytest.mark.slow
+@pytest.mark.parametrize("adaptive", [True, False])
+def test_process_scan_single_run__w_chunks(setup_module: object, adaptive: bool):
+    _path, q_settings, _, _, _ = setup_module
+    _dir = get_empty_dir_name(_path)
+    q_settings.set_value("global/mp_chunk_size", 4)
+    q_settings.set_value("global/mp_adaptive_chunk_size", adaptive)
+    obj = ExecuteWorkflowRunner(
+        workflow=_path / "workflow_tree.yml",
+        scan=_path / "scan.yml",
+        diffraction_exp=_path / "diffraction_exp.yml",
+        output_dir=_dir,
+    )
+    try:
+        obj.process_scan()
+    finally:
+        q_settings.set_value("global/mp_chunk_size", 1)
+        q_settings.set_value("global/mp_adaptive_chunk_size", False)
+    for name in ["node_01.nxs", "node_02.nxs"]:
+        with h5py.File(_dir / name, "r") as f:
+            _data = f["entry/data/data"][()]
+        assert _data.shape == (5, 7, 3, 10, 10)
+        assert np.all(np.isfinite(_data))
+
+
+@pytest.mark.slow
+def test_process_scan_single_run__w_profile(setup_module: object) -> None:
+    _path, _, _, _, _ = setup_module
+    _dir = get_empty_dir_name(_path)
+    obj = ExecuteWorkflowRunner(
+        workflow=_path / "workflow_tree.yml",
+        scan=_path / "scan.yml",
+        diffraction_exp=_path / "diffraction_exp.yml",
+        output_dir=_dir,
+        profile=_path / "profile.json",
+    )
+    obj.process_scan()
+    with open(_path / "profile.json") as f:
+        _content = json.load(f)
+    assert _content["n_processes"] == 1
+    for _node_id in ["0", "1", "2"]:
+        assert _content["nodes"][_node_id]["n_calls"] == 105
+
+
+@pytest.mark.slow
+def test_process_scan_single_run__w_threads(setup_module: object) -> None:
+    _path, _, _, _, _ = setup_module
+    _dir = get_empty_dir_name(_path)
+    obj = ExecuteWorkflowRunner(
+        workflow=_path / "workflow_tree.yml",
+        scan=_path / "scan.yml",
+        diffraction_exp=_path / "diffraction_exp.yml",
+        output_dir=_dir,
+        backend="threads",
+    )
+    obj.process_scan()
+    for name in ["node_01.nxs", "node_02.nxs"]:
+        with h5py.File(_dir / name, "r") as f:
+            _data = f["entry/data/data"][()]
+        assert _data.shape == (5, 7, 3, 10, 10)
+        assert np.all(np.isfinite(_data))
+
+
+@pytest.mark.slow
+def test_process_scan__partitions(setup_module: object) -> None:
+    _path, _, _, _, _ = setup_module
+    _dir = get_empty_dir_name(_path)
+    for _index, _backend in enumerate(["processes", "threads"]):
+        assert not (_dir / "node_01.nxs").is_file()
+        obj = ExecuteWorkflowRunner(
+            workflow=_path / "workflow_tree.yml",
+            scan=_path / "scan.yml",
+            diffraction_exp=_path / "diffraction_exp.yml",
+            output_dir=_dir,
+            n_partitions=2,
+            partition_index=_index,
+            backend=_backend,
+        )
+        obj.process_scan()
+        assert obj._app.multiprocessing_get_tasks().size == (53 if _index == 0 else 52)
+    assert not (_dir / PARTITION_DIRECTORY).exists()
+    for name in ["node_01.nxs", "node_02.nxs"]:
+        with h5py.File(_dir / name, "r") as f:
+            _data = f["entry/data/data"][()]
+        assert _data.shape == (5, 7, 3, 10, 10)
+        assert np.all(np.isfinite(_data))
+
+
+@pytest.mark.slow
+def test_process_scan__partitions_in_separate_processes(setup_module: object):
+    _path, _, _, _, _ = setup_module
+    _dir = get_empty_dir_name(_path)
+    _script = (
+        "from pathlib import Path\n"
+        "from pydidas import unittest_objects\n"
+        "from pydidas.apps import ExecuteWorkflowRunner\n"
+        "from pydidas.plugins import PluginCollection\n"
+        "PluginCollection().find_and_register_plugins("
+        "Path(unittest_objects.__file__).parent)\n"
+        "ExecuteWorkflowRunner().process_scan()\n"
+    )
+    _processes = [
+        subprocess.Popen(
+            [
+                sys.executable,
+                "-c",
+                _script,
+                "-workflow",
+                str(_path / "workflow_tree.yml"),
+                "-scan",
+                str(_path / "scan.yml"),
+                "-diffraction_exp",
+                str(_path / "diffraction_exp.yml"),
+                "-output_dir",
+                str(_dir),
+                "--backend",
+                "threads",
+                "--n_partitions",
+                "3",
+                "--partition_index",
+                str(_index),
+            ],
+        )
+        for _index in range(3)
+    ]
+    for _process in _processes:
+        assert _process.wait(timeout=300) == 0
+    assert not (_dir / PARTITION_DIRECTORY).exists()
+    for name in ["node_01.nxs", "node_02.nxs"]:
+        with h5py.File(_dir / name, "r") as f:
+            _data = f["entry/data/data"][()]
+        assert _data.shape == (5, 7, 3, 10, 10)
+        assert np.all(np.isfinite(_data))
+
+
 @pytest.mark.slow
 def test_process_scan_multiple_run(setup_module: object) -> None:
     path, _, _, _, _ = setup_module
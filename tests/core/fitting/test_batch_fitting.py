@@ -0,0 +1,172 @@
+# This file is part of pydidas.
+#
+# Copyright 2026, Helmholtz-Zentrum Hereon
+# SPDX-License-Identifier: GPL-3.0-only
+#
+# pydidas is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# Pydidas is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pydidas. If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for pydidas modules."""
+
+__author__ = "Malte Storm"
+__copyright__ = "Copyright 2026, Helmholtz-Zentrum Hereon"
+__license__ = "GPL-3.0-only"
+__maintainer__ = "Malte Storm"
+__status__ = "Production"
+
+
+import numpy as np
+import pytest
+from scipy.optimize import least_squares
+
+from pydidas.core.fitting import (
+    FitFuncMeta,
+    batch_jacobian,
+    batch_least_squares,
+    batch_profile,
+)
+from pydidas.core.fitting.batch_fitting import _finite_difference_jacobian
+
+
+_X = np.linspace(0, 20, 121)
+_N = 25
+
+
+def _create_params(fitter, n_peaks: int, rng: np.random.Generator) -> np.ndarray:
+    _params = []
+    for _ in range(_N):
+        _row = []
+        for _index in range(n_peaks):
+            _row += [30 + 10 * rng.random(), 0.8 + 0.3 * rng.random()]
+            if fitter.num_peak_params == 4:
+                _row += [0.4]
+            _row += [6 + 4 * _index + rng.random()]
+        _params.append(_row + [2.0, 0.01])
+    return np.array(_params)
+
+
+def _cost(fitter, c, x, y):
+    return 0.5 * np.sum((fitter.profile(c, x) - y) ** 2)
+
+
+@pytest.mark.parametrize(
+    "name", ["Gaussian", "Lorentzian", "Voigt", "Double Gaussian", "Triple Voigt"]
+)
+def test_batch_profile(name):
+    _fitter = FitFuncMeta.get_fitter(name)
+    _params = _create_params(_fitter, _fitter.num_peaks, np.random.default_rng(1))
+    _params[:, -1] = 0
+    _profiles = batch_profile(_fitter, _params, _X)
+    assert _profiles.shape == (_N, _X.size)
+    for _c, _profile in zip(_params, _profiles):
+        assert np.allclose(_profile, _fitter.profile(_c, _X))
+
+
+def test_batch_profile__constant_background():
+    _fitter = FitFuncMeta.get_fitter("Gaussian")
+    _profiles = batch_profile(_fitter, np.array([[0, 1, 5, 2], [0, 1, 5, 3]]), _X)
+    assert np.allclose(_profiles[0], 2)
+    assert np.allclose(_profiles[1], 3)
+
+
+@pytest.mark.parametrize("name", ["Gaussian", "Voigt", "Double Lorentzian"])
+def test_batch_jacobian(name):
+    _fitter = FitFuncMeta.get_fitter(name)
+    _params = _create_params(_fitter, _fitter.num_peaks, np.random.default_rng(2))
+    _f0 = batch_profile(_fitter, _params, _X)
+    _high = np.full(_params.shape[1], np.inf)
+    _jac = batch_jacobian(_fitter, _params, _X, _f0, _high)
+    assert _jac.shape == (_N, _X.size, _params.shape[1])
+    for _c, _jac_row in zip(_params, _jac):
+        assert np.allclose(_jac_row, _fitter.jacobian(_c, _X))
+    assert np.allclose(
+        _jac,
+        _finite_difference_jacobian(_fitter, _params, _X, _f0, _high),
+        rtol=1e-4,
+        atol=1e-5,
+    )
+
+
+def test_batch_jacobian__finite_differences(monkeypatch):
+    _fitter = FitFuncMeta.get_fitter("Gaussian")
+    monkeypatch.setattr(_fitter, "analytic_jacobian", False)
+    _params = _create_params(_fitter, 1, np.random.default_rng(4))
+    _f0 = batch_profile(_fitter, _params, _X)
+    _high = np.full(_params.shape[1], np.inf)
+    assert np.array_equal(
+        batch_jacobian(_fitter, _params, _X, _f0, _high),
+        _finite_difference_jacobian(_fitter, _params, _X, _f0, _high),
+    )
+
+
+@pytest.mark.parametrize(
+    "name", ["Gaussian", "Lorentzian", "Voigt", "Double Gaussian", "Triple Voigt"]
+)
+def test_batch_least_squares(name):
+    _fitter = FitFuncMeta.get_fitter(name)
+    _rng = np.random.default_rng(42)
+    _params = _create_params(_fitter, _fitter.num_peaks, _rng)[:, :-1]
+    _data = batch_profile(_fitter, _params, _X) + _rng.normal(0, 0.1, (_N, _X.size))
+    _bounds = (
+        _fitter.param_bounds_low + [-np.inf],
+        _fitter.param_bounds_high + [np.inf],
+    )
+    _start = _params * _rng.uniform(0.9, 1.1, _params.shape)
+    _fit, _success = batch_least_squares(_fitter, _start, _X, _data, bounds=_bounds)
+    assert _fit.shape == _start.shape
+    assert np.all(_success)
+    for _c0, _c, _y in zip(_start, _fit, _data):
+        _ref = least_squares(_fitter.delta, _c0, args=(_X, _y), bounds=_bounds).x
+        assert _cost(_fitter, _c, _X, _y) <= 1.0001 * _cost(_fitter, _ref, _X, _y)
+
+
+def test_batch_least_squares__respects_bounds():
+    _fitter = FitFuncMeta.get_fitter("Voigt")
+    _rng = np.random.default_rng(3)
+    _params = _create_params(_fitter, 1, _rng)
+    _data = batch_profile(_fitter, _params, _X) + _rng.normal(0, 0.1, (_N, _X.size))
+    _start = np.array(
+        [_fitter.guess_fit_start_params(_X, _y, bg_order=None) for _y in _data]
+    )
+    _fit, _success = batch_least_squares(
+        _fitter,
+        _start,
+        _X,
+        _data,
+        bounds=(_fitter.param_bounds_low, _fitter.param_bounds_high),
+    )
+    assert np.all(_success)
+    assert np.all(_fit >= np.asarray(_fitter.param_bounds_low))
+    assert np.all(_fit <= np.asarray(_fitter.param_bounds_high))
+
+
+def test_batch_least_squares__invalid_data():
+    _fitter = FitFuncMeta.get_fitter("Gaussian")
+    _params = _create_params(_fitter, 1, np.random.default_rng(5))[:4, :-1]
+    _data = batch_profile(_fitter, _params, _X)
+    _data[1, 3] = np.nan
+    _fit, _success = batch_least_squares(_fitter, _params * 1.05, _X, _data)
+    assert list(_success) == [True, False, True, True]
+    assert np.allclose(_fit[[0, 2, 3]], _params[[0, 2, 3]])
+
+
+def test_batch_least_squares__exact_start():
+    _fitter = FitFuncMeta.get_fitter("Lorentzian")
+    _params = _create_params(_fitter, 1, np.random.default_rng(7))[:, :-1]
+    _data = batch_profile(_fitter, _params, _X)
+    _fit, _success = batch_least_squares(_fitter, _params, _X, _data)
+    assert np.all(_success)
+    assert np.allclose(_fit, _params)
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -35,6 +35,39 @@ from pydidas.core.utils import flatten
 
 x = np.arange(20)
 y = np.random.rand(x.size)
+_FITTERS = [
+    "Gaussian",
+    "Lorentzian",
+    "Voigt",
+    "Double Gaussian",
+    "Double Lorentzian",
+    "Double Voigt",
+    "Triple Gaussian",
+    "Triple Lorentzian",
+    "Triple Voigt",
+]
+
+
+def _numeric_jacobian(fitter, c, x, step=1e-6):
+    _jac = []
+    for _index in range(len(c)):
+        _dc = np.zeros(len(c))
+        _dc[_index] = step * max(1, abs(c[_index]))
+        _jac.append(
+            (fitter.profile(c + _dc, x) - fitter.profile(c - _dc, x))
+            / (2 * _dc[_index])
+        )
+    return np.stack(_jac, axis=-1)
+
+
+def _peak_params(fitter, sigma=0.8):
+    _params = []
+    for _index in range(fitter.num_peaks):
+        _params += [12.0 + _index, sigma]
+        if fitter.num_peak_params == 4:
+            _params += [0.5]
+        _params += [7.3 + 3 * _index]
+    return np.array(_params)
 
 
 @pytest.fixture(autouse=True)
@@ -108,6 +141,94 @@ def test_delta(TestClass, num_peaks, bg_params):
     assert isinstance(_result, np.ndarray)
 
 
+def test_func_jacobian(TestClass):
+    assert not TestClass.analytic_jacobian
+    with pytest.raises(NotImplementedError):
+        TestClass.func_jacobian([1, 2, 3], x)
+
+
+@pytest.mark.parametrize("bg_params", [(), (2,), (2, 4)])
+def test_jacobian__background(TestClass, bg_params):
+    TestClass.num_peak_params = 1
+    TestClass.num_peaks = 2
+    TestClass.func_jacobian = staticmethod(lambda c, x: (c[0] * x,))
+    _jac = TestClass.jacobian((2, 3) + bg_params, x)
+    assert _jac.shape == (x.size, 2 + len(bg_params))
+    assert np.allclose(_jac[:, 0], 2 * x)
+    assert np.allclose(_jac[:, 1], 3 * x)
+    if len(bg_params) > 0:
+        assert np.allclose(_jac[:, 2], 1)
+    if len(bg_params) > 1:
+        assert np.allclose(_jac[:, 3], x)
+
+
+def test_jacobian__unsupported_bg_order(TestClass):
+    TestClass.num_peak_params = 1
+    TestClass.func_jacobian = staticmethod(lambda c, x: (x,))
+    with pytest.raises(ValueError):
+        TestClass.jacobian((2, 3, 4, 5), x)
+
+
+@pytest.mark.parametrize("name", _FITTERS)
+@pytest.mark.parametrize("bg_params", [(), (2.5,), (2.5, -0.1)])
+def test_jacobian__fitters(name, bg_params):
+    _fitter = FitFuncMeta.get_fitter(name)
+    _x = np.linspace(0, 20, 201)
+    _params = np.concatenate((_peak_params(_fitter), bg_params))
+    _jac = _fitter.jacobian(_params, _x)
+    assert _fitter.analytic_jacobian
+    assert _jac.shape == (_x.size, _params.size)
+    assert np.allclose(
+        _jac, _numeric_jacobian(_fitter, _params, _x), rtol=1e-5, atol=1e-6
+    )
+
+
+@pytest.mark.parametrize("sigma", [1e-4, 1e-2])
+def test_jacobian__voigt_small_sigma(sigma):
+    _fitter = FitFuncMeta.get_fitter("Voigt")
+    _x = np.linspace(0, 20, 201)
+    _params = _peak_params(_fitter, sigma=sigma)
+    assert np.allclose(
+        _fitter.jacobian(_params, _x),
+        _numeric_jacobian(_fitter, _params, _x, step=1e-8),
+        rtol=1e-4,
+        atol=1e-5,
+    )
+
+
+def test_jacobian__voigt_zero_sigma():
+    _voigt = FitFuncMeta.get_fitter("Voigt")
+    _lorentzian = FitFuncMeta.get_fitter("Lorentzian")
+    _x = np.linspace(0, 20, 201)
+    _jac = _voigt.jacobian(np.array([12, 0, 0.5, 7.3]), _x)
+    assert np.all(np.isfinite(_jac))
+    assert np.allclose(_jac[:, [0, 2, 3]], _lorentzian.jacobian((12, 0.5, 7.3), _x))
+
+
+@pytest.mark.parametrize("name", ["Gaussian", "Voigt", "Double Lorentzian"])
+def test_jacobian__broadcast_params(name):
+    _fitter = FitFuncMeta.get_fitter(name)
+    _x = np.linspace(0, 20, 51)
+    _params = np.array(
+        [np.concatenate((_peak_params(_fitter, _s), [1.5])) for _s in (0.5, 1, 2)]
+    )
+    _jac = _fitter.jacobian(_params.T[..., None], _x)
+    assert _jac.shape == (3, _x.size, _params.shape[1])
+    for _c, _jac_row in zip(_params, _jac):
+        assert np.allclose(_jac_row, _fitter.jacobian(_c, _x))
+
+
+@pytest.mark.parametrize("name", ["Gaussian", "Triple Voigt"])
+def test_delta_jacobian(name):
+    _fitter = FitFuncMeta.get_fitter(name)
+    _x = np.linspace(0, 20, 51)
+    _params = np.concatenate((_peak_params(_fitter), [1.5]))
+    assert np.array_equal(
+        _fitter.delta_jacobian(_params, _x, np.ones(_x.size)),
+        _fitter.jacobian(_params, _x),
+    )
+
+
 @pytest.mark.parametrize("num_peaks", [1, 2, 3])
 @pytest.mark.parametrize("amplitude_param", [0, 1, 2])
 def test_area(TestClass, num_peaks, amplitude_param):
@@ -0,0 +1,161 @@
+# This file is part of pydidas.
+#
+# Copyright 2026, Helmholtz-Zentrum Hereon
+# SPDX-License-Identifier: GPL-3.0-only
+#
+# pydidas is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# Pydidas is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pydidas. If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for pydidas modules."""
+
+__author__ = "Malte Storm"
+__copyright__ = "Copyright 2026, Helmholtz-Zentrum Hereon"
+__license__ = "GPL-3.0-only"
+__maintainer__ = "Malte Storm"
+__status__ = "Production"
+
+
+import threading
+import time
+
+import pytest
+
+from pydidas.core import AsyncWriteQueue
+
+
+class _Writer:
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.batches = []
+        self.threads = set()
+
+    def __call__(self, batch):
+        self.threads.add(threading.get_ident())
+        time.sleep(self.delay)
+        if self.fail:
+            raise ValueError("write failed")
+        self.batches.append(batch)
+
+    @property
+    def items(self):
+        return [_item for _batch in self.batches for _item in _batch]
+
+
+@pytest.fixture
+def writer():
+    return _Writer()
+
+
+@pytest.mark.parametrize("sizes", [(0, 4), (4, 0), (-1, 1)])
+def test_init__invalid_sizes(writer, sizes):
+    with pytest.raises(ValueError):
+        AsyncWriteQueue(writer, *sizes)
+
+
+def test_init(writer):
+    _queue = AsyncWriteQueue(writer, 12, 3)
+    assert _queue.max_size == 12
+    assert _queue.max_batch_size == 3
+    assert not _queue.active
+
+
+def test_put_and_flush(writer):
+    _queue = AsyncWriteQueue(writer, 8, 4)
+    for _i in range(20):
+        _queue.put(_i)
+    assert _queue.active
+    _queue.flush()
+    assert writer.items == list(range(20))
+    assert writer.threads != {threading.get_ident()}
+    _queue.close()
+
+
+def test_put__batches(writer):
+    writer.delay = 0.02
+    _queue = AsyncWriteQueue(writer, 20, 5)
+    for _i in range(20):
+        _queue.put(_i)
+    _queue.close()
+    assert writer.items == list(range(20))
+    assert max(len(_batch) for _batch in writer.batches) > 1
+    assert max(len(_batch) for _batch in writer.batches) <= 5
+    _stats = _queue.statistics
+    assert _stats["n_items"] == 20
+    assert _stats["n_batches"] == len(writer.batches)
+    assert _stats["mean_batch_size"] == pytest.approx(20 / len(writer.batches))
+
+
+def test_put__back_pressure(writer):
+    writer.delay = 0.01
+    _queue = AsyncWriteQueue(writer, 2, 1)
+    for _i in range(10):
+        _queue.put(_i)
+    _queue.close()
+    _stats = _queue.statistics
+    assert _stats["n_blocked"] > 0
+    assert _stats["blocked_time"] > 0
+    assert _stats["max_queue_length"] <= 2
+    assert _stats["write_time"] >= 0.1
+
+
+def test_flush__error_raised(writer):
+    writer.fail = True
+    _queue = AsyncWriteQueue(writer, 4, 2)
+    _queue.put(1)
+    with pytest.raises(ValueError):
+        _queue.flush()
+    writer.fail = False
+    _queue.put(2)
+    _queue.flush()
+    assert writer.items == [2]
+    _queue.close()
+
+
+def test_put__error_raised(writer):
+    writer.fail = True
+    _queue = AsyncWriteQueue(writer, 4, 2)
+    _queue.put(1)
+    while _queue._error is None:
+        time.sleep(0.005)
+    with pytest.raises(ValueError):
+        _queue.put(2)
+    _queue.close()
+
+
+def test_close(writer):
+    _queue = AsyncWriteQueue(writer, 4, 2)
+    _queue.put(1)
+    _queue.close()
+    assert not _queue.active
+    assert writer.items == [1]
+    _queue.put(2)
+    _queue.close()
+    assert writer.items == [1, 2]
+
+
+def test_close__not_started(writer):
+    _queue = AsyncWriteQueue(writer)
+    _queue.close()
+    assert not _queue.active
+
+
+def test_reset_statistics(writer):
+    _queue = AsyncWriteQueue(writer, 4, 2)
+    _queue.put(1)
+    _queue.close()
+    _queue.reset_statistics()
+    assert _queue.statistics["n_items"] == 0
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -47,6 +47,7 @@ class _TestApp(BaseApp):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.stored = []
+        self.upcoming = []
         self._config = {
             "item1": 1,
             "item2": slice(0, 5),
@@ -57,6 +58,9 @@ class _TestApp(BaseApp):
     def multiprocessing_get_tasks(self):
         return [1, 2, 3]
 
+    def multiprocessing_upcoming_tasks(self, tasks):
+        self.upcoming.append(list(tasks))
+
     def multiprocessing_carryon(self):
         self._config["carryon_counter"] += 1
         return self._config["carryon_counter"] % 2 == 0
@@ -102,6 +106,10 @@ class TestBaseApp(unittest.TestCase):
         app = BaseApp()
         self.assertIsNone(app.multiprocessing_post_run())
 
+    def test_multiprocessing_get_task_locality_keys(self):
+        app = BaseApp()
+        self.assertIsNone(app.multiprocessing_get_task_locality_keys())
+
     def test_multiprocessing_store_results(self):
         app = BaseApp()
         with self.assertRaises(NotImplementedError):
@@ -116,6 +124,10 @@ class TestBaseApp(unittest.TestCase):
         app = BaseApp()
         self.assertIsNone(app.multiprocessing_pre_cycle(0))
 
+    def test_multiprocessing_upcoming_tasks(self):
+        app = BaseApp()
+        self.assertIsNone(app.multiprocessing_upcoming_tasks([1, 2]))
+
     def test_multiprocessing_func(self):
         app = BaseApp()
         with self.assertRaises(NotImplementedError):
@@ -126,6 +138,24 @@ class TestBaseApp(unittest.TestCase):
         self.assertTrue(app.multiprocessing_carryon())
         self.assertFalse(app.multiprocessing_carryon())
 
+    def test_threading_carryon(self):
+        app = BaseApp()
+        self.assertTrue(app.threading_carryon(0))
+
+    def test_threading_func(self):
+        app = BaseApp()
+        with self.assertRaises(NotImplementedError):
+            app.threading_func(0)
+
+    def test_multiprocessing_max_results_per_message(self):
+        app = BaseApp()
+        self.assertIsNone(app.multiprocessing_max_results_per_message())
+
+    def test_multiprocessing_set_n_workers(self):
+        app = BaseApp()
+        app.multiprocessing_set_n_workers(4)
+        self.assertEqual(app.get_config()["mp_n_workers"], 4)
+
     def test_get_config(self):
         app = BaseApp()
         self.assertEqual(app.get_config(), {"run_prepared": False})
@@ -199,6 +229,8 @@ class TestBaseApp(unittest.TestCase):
         app = _TestApp()
         app.run()
         self.assertEqual(app.stored, app.multiprocessing_get_tasks())
+        self.assertEqual(app.get_config()["mp_n_workers"], 1)
+        self.assertEqual(app.upcoming, [[2, 3], [3], []])
 
     def test_parse_func(self):
         app = BaseApp()
@@ -0,0 +1,173 @@
+# This file is part of pydidas.
+#
+# Copyright 2026, Helmholtz-Zentrum Hereon
+# SPDX-License-Identifier: GPL-3.0-only
+#
+# pydidas is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# Pydidas is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pydidas. If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for pydidas modules."""
+
+__author__ = "Malte Storm"
+__copyright__ = "Copyright 2026, Helmholtz-Zentrum Hereon"
+__license__ = "GPL-3.0-only"
+__maintainer__ = "Malte Storm"
+__status__ = "Production"
+
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from pydidas.core import FramePrefetcher
+
+
+class _Loader:
+    def __init__(self, delay: float = 0.0, shape: tuple = (4, 4)):
+        self.delay = delay
+        self.shape = shape
+        self.calls = []
+        self.threads = set()
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, index):
+        self.calls.append(index)
+        self.threads.add(threading.get_ident())
+        self.release.wait()
+        time.sleep(self.delay)
+        if index < 0:
+            raise ValueError("invalid index")
+        return np.full(self.shape, index, dtype=np.float64), {"index": index}
+
+
+@pytest.fixture
+def loader():
+    return _Loader()
+
+
+@pytest.fixture
+def prefetcher(loader):
+    _prefetcher = FramePrefetcher(loader, max_size=1, n_threads=2)
+    yield _prefetcher
+    _prefetcher.shutdown()
+
+
+@pytest.mark.parametrize("args", [(0, 2), (-1, 2), (1, 0)])
+def test_init__invalid_args(loader, args):
+    with pytest.raises(ValueError):
+        FramePrefetcher(loader, *args)
+
+
+def test_init(loader):
+    _prefetcher = FramePrefetcher(loader, max_size=12, n_threads=3)
+    assert _prefetcher.max_size == 12
+    assert _prefetcher.prefetched_frames == []
+    assert _prefetcher._executor is None
+
+
+def test_get__not_requested(prefetcher, loader):
+    assert prefetcher.get(3) is None
+    assert loader.calls == []
+    assert prefetcher.statistics == {"hits": 0, "misses": 1, "discarded": 0}
+
+
+def test_request_and_get(prefetcher, loader):
+    prefetcher.request([3, 4, 3])
+    for _index in [3, 4]:
+        _data, _kwargs = prefetcher.get(_index)
+        assert np.all(_data == _index)
+        assert _kwargs == {"index": _index}
+    assert sorted(loader.calls) == [3, 4]
+    assert prefetcher.prefetched_frames == []
+    assert prefetcher.statistics == {"hits": 2, "misses": 0, "discarded": 0}
+
+
+def test_request__uses_background_threads(prefetcher, loader):
+    prefetcher.request([0, 1])
+    prefetcher.get(0)
+    prefetcher.get(1)
+    assert threading.get_ident() not in loader.threads
+
+
+def test_request__discards_unwanted_frames(prefetcher, loader):
+    prefetcher.request([0, 1, 2])
+    prefetcher.request([2, 3])
+    assert prefetcher.prefetched_frames == [2, 3]
+    assert prefetcher.get(0) is None
+    assert prefetcher.statistics["discarded"] == 2
+
+
+def test_request__memory_limit(loader):
+    loader.shape = (256, 256)  # 0.5 MB per frame
+    _prefetcher = FramePrefetcher(loader, max_size=1.2, n_threads=2)
+    _prefetcher.request([0])
+    _prefetcher.get(0)
+    _prefetcher.request([1, 2, 3, 4])
+    assert _prefetcher.prefetched_frames == [1, 2]
+    _prefetcher.get(1)
+    assert _prefetcher.prefetched_frames == [2, 3]
+    _prefetcher.shutdown()
+
+
+def test_request__always_submits_one_frame(loader):
+    loader.shape = (1024, 1024)
+    _prefetcher = FramePrefetcher(loader, max_size=1, n_threads=2)
+    _prefetcher.request([0])
+    _prefetcher.get(0)
+    _prefetcher.request([1, 2])
+    assert _prefetcher.prefetched_frames == [1]
+    _prefetcher.shutdown()
+
+
+def test_get__waits_for_frame(prefetcher, loader):
+    loader.release.clear()
+    prefetcher.request([5])
+    threading.Timer(0.05, loader.release.set).start()
+    _data, _ = prefetcher.get(5)
+    assert np.all(_data == 5)
+
+
+def test_get__reraises_exception(prefetcher):
+    prefetcher.request([-1, 2])
+    with pytest.raises(ValueError):
+        prefetcher.get(-1)
+    _data, _ = prefetcher.get(2)
+    assert np.all(_data == 2)
+
+
+def test_clear(prefetcher):
+    prefetcher.request([0, 1])
+    prefetcher.clear()
+    assert prefetcher.prefetched_frames == []
+    assert prefetcher._wanted == []
+
+
+def test_shutdown(prefetcher):
+    prefetcher.request([0, 1])
+    prefetcher.shutdown()
+    assert prefetcher._executor is None
+    prefetcher.request([2])
+    _data, _ = prefetcher.get(2)
+    assert np.all(_data == 2)
+
+
+def test_reset_statistics(prefetcher):
+    prefetcher.get(0)
+    prefetcher.reset_statistics()
+    assert prefetcher.statistics == {"hits": 0, "misses": 0, "discarded": 0}
+
+
+if __name__ == "__main__":
+    pytest.main()
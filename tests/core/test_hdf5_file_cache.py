@@ -0,0 +1,143 @@
+# This file is part of pydidas.
+#
+# Copyright 2026, Helmholtz-Zentrum Hereon
+# SPDX-License-Identifier: GPL-3.0-only
+#
+# pydidas is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# Pydidas is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pydidas. If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for pydidas modules."""
+
+__author__ = "Malte Storm"
+__copyright__ = "Copyright 2026, Helmholtz-Zentrum Hereon"
+__license__ = "GPL-3.0-only"
+__maintainer__ = "Malte Storm"
+__status__ = "Production"
+
+
+import h5py
+import numpy as np
+import pytest
+
+from pydidas.core import Hdf5FileCache
+
+
+def _write_file(filename, value):
+    with h5py.File(filename, "w") as _file:
+        _file["data"] = np.full((4, 5), value)
+
+
+@pytest.fixture
+def files(empty_temp_path):
+    _files = [empty_temp_path / f"test_{_index}.h5" for _index in range(4)]
+    for _index, _fname in enumerate(_files):
+        _write_file(_fname, _index)
+    yield _files
+
+
+@pytest.fixture
+def cache():
+    _cache = Hdf5FileCache()
+    _size = _cache.max_size
+    _cache.close()
+    _cache.max_size = 2
+    yield _cache
+    _cache.close()
+    _cache.max_size = _size
+
+
+def test_singleton(cache):
+    assert Hdf5FileCache() is cache
+
+
+def test_open__reuses_file(cache, files):
+    with cache.open(files[0]) as _file:
+        _id = _file.id.id
+        assert np.all(_file["data"][()] == 0)
+    with cache.open(str(files[0])) as _file:
+        assert _file.id.id == _id
+    assert cache.filenames == [str(files[0])]
+
+
+def test_open__lru_eviction(cache, files):
+    for _fname in files[:2]:
+        with cache.open(_fname) as _file:
+            pass
+    with cache.open(files[0]) as _file:
+        pass
+    with cache.open(files[2]) as _file:
+        pass
+    assert cache.filenames == [str(files[0]), str(files[2])]
+
+
+def test_open__modified_file(cache, files):
+    with cache.open(files[0]) as _file:
+        assert np.all(_file["data"][()] == 0)
+    cache.close(files[0])
+    _write_file(files[0], 42)
+    with cache.open(files[0]) as _file:
+        assert np.all(_file["data"][()] == 42)
+
+
+def test_open__file_modified_by_other_writer(cache, files):
+    with cache.open(files[0]) as _file:
+        _old_file = _file
+    # Simulate an external modification by changing the stored stamp:
+    _entry = cache._files[str(files[0])]
+    _entry["stamp"] = (0,) + _entry["stamp"][1:]
+    with cache.open(files[0]) as _file:
+        assert _file is not _old_file
+    assert not _old_file.id.valid
+
+
+def test_open__size_zero(cache, files):
+    cache.max_size = 0
+    with cache.open(files[1]) as _file:
+        assert np.all(_file["data"][()] == 1)
+    assert cache.filenames == []
+    assert not _file.id.valid
+
+
+def test_open__missing_file(cache, empty_temp_path):
+    with pytest.raises(FileNotFoundError):
+        with cache.open(empty_temp_path / "missing.h5"):
+            pass
+
+
+def test_close__file_in_use(cache, files):
+    with cache.open(files[0]) as _file:
+        cache.close()
+        assert _file.id.valid
+        assert cache.filenames == []
+    assert not _file.id.valid
+
+
+def test_close__single_file(cache, files):
+    for _fname in files[:2]:
+        with cache.open(_fname):
+            pass
+    cache.close(files[0])
+    assert cache.filenames == [str(files[1])]
+    _write_file(files[0], 3)
+
+
+def test_max_size__shrink(cache, files):
+    for _fname in files[:2]:
+        with cache.open(_fname):
+            pass
+    cache.max_size = 1
+    assert cache.filenames == [str(files[1])]
+
+
+def test_max_size__negative(cache):
+    with pytest.raises(ValueError):
+        cache.max_size = -1
@@ -149,6 +149,25 @@ class TestParameter(unittest.TestCase):
         obj.value = 0
         self.assertEqual(obj.default, 12)
 
+    def test_default_setter(self):
+        obj = Parameter("Test0", int, 12)
+        obj.default = 5
+        self.assertEqual(obj.default, 5)
+        self.assertEqual(obj.value, 12)
+        obj.restore_default()
+        self.assertEqual(obj.value, 5)
+
+    def test_default_setter__wrong_type(self):
+        obj = Parameter("Test0", int, 12)
+        with self.assertRaises(TypeError):
+            obj.default = "five"
+
+    def test_default_setter__not_in_choices(self):
+        obj = Parameter("Test0", int, 12, choices=[0, 12])
+        with self.assertRaises(ValueError):
+            obj.default = 5
+        self.assertEqual(obj.default, 12)
+
     def test_unit(self):
         obj = Parameter("Test0", int, 12, unit="The_unit")
         self.assertEqual(obj.unit, "The_unit")
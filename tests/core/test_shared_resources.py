@@ -0,0 +1,249 @@
+# This file is part of pydidas.
+#
+# Copyright 2026, Helmholtz-Zentrum Hereon
+# SPDX-License-Identifier: GPL-3.0-only
+#
+# pydidas is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# Pydidas is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pydidas. If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for pydidas modules."""
+
+__author__ = "Malte Storm"
+__copyright__ = "Copyright 2026, Helmholtz-Zentrum Hereon"
+__license__ = "GPL-3.0-only"
+__maintainer__ = "Malte Storm"
+__status__ = "Production"
+
+
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from pydidas.core import SharedResources
+from pydidas.core.shared_resources import _process_exists
+
+
+_ARRAY = np.arange(120, dtype=np.float32).reshape(10, 12)
+_TUPLE = (np.arange(5, dtype=np.float32), np.arange(7, dtype=np.int32))
+
+
+class _Loader:
+    def __init__(self, data):
+        self.data = data
+        self.n_calls = 0
+
+    def __call__(self):
+        self.n_calls += 1
+        return self.data
+
+
+@pytest.fixture
+def resources(tmp_path):
+    SharedResources.reset_instance()
+    _resources = SharedResources(directory=tmp_path)
+    yield _resources
+    _resources.clear()
+    SharedResources.reset_instance()
+
+
+def test_init(resources, tmp_path):
+    assert resources.directory == tmp_path
+
+
+def test_get_key__same_identifiers():
+    assert SharedResources.get_key("a", 1, None) == SharedResources.get_key(
+        "a", 1, None
+    )
+
+
+def test_get_key__different_identifiers():
+    assert SharedResources.get_key("a", 1) != SharedResources.get_key("a", 2)
+
+
+def test_get_key__array():
+    assert SharedResources.get_key(_ARRAY) != SharedResources.get_key(_ARRAY + 1)
+
+
+def _get_exited_pid() -> int:
+    _process = subprocess.Popen([sys.executable, "-c", "pass"])
+    _process.wait()
+    return _process.pid
+
+
+def test_get_key__file_stamp(tmp_path):
+    _fname = tmp_path / "test.npy"
+    np.save(_fname, _ARRAY)
+    _key = SharedResources.get_key(_fname)
+    assert SharedResources.get_key(_fname) == _key
+    np.save(_fname, np.arange(12))
+    assert SharedResources.get_key(_fname) != _key
+
+
+def test_keys(resources, tmp_path):
+    _fname = tmp_path / "test.npy"
+    np.save(_fname, _ARRAY)
+    _key = SharedResources.get_key("mask", _fname)
+    assert list(resources.keys.values()) == [_key]
+
+
+def test_assign_keys(resources, tmp_path):
+    _fname = tmp_path / "test.npy"
+    np.save(_fname, _ARRAY)
+    _key = SharedResources.get_key("mask", _fname)
+    _keys = resources.keys
+    SharedResources.reset_instance()
+    _resources = SharedResources(directory=tmp_path)
+    _resources.assign_keys(_keys)
+    np.save(_fname, np.arange(12))
+    assert SharedResources.get_key("mask", _fname) == _key
+    assert SharedResources.get_key("background", _fname) != _key
+    SharedResources.reset_instance()
+
+
+def test_get__assigned_key_not_published(resources, tmp_path):
+    resources.assign_keys({"base_key": "key"})
+    _loader = _Loader(_ARRAY)
+    _data = resources.get("key", _loader)
+    assert _loader.n_calls == 1
+    assert np.array_equal(_data, _ARRAY)
+    assert not resources.is_published("key")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_process_exists():
+    assert _process_exists(os.getpid())
+    assert not _process_exists(_get_exited_pid())
+
+
+def test_init__remove_stale_files(tmp_path):
+    _pid = _get_exited_pid()
+    for _name in [
+        f"stale.{_pid}.owner",
+        "stale.npy",
+        "stale.0.npy",
+        f"stale.npy.{_pid}.12.tmp",
+        f"shared.{_pid}.owner",
+        f"shared.{os.getpid()}.owner",
+        "shared.npy",
+        f"live.npy.{os.getpid()}.12.tmp",
+    ]:
+        (tmp_path / _name).touch()
+    SharedResources.reset_instance()
+    SharedResources(directory=tmp_path)
+    SharedResources.reset_instance()
+    assert sorted(_file.name for _file in tmp_path.iterdir()) == sorted(
+        [
+            f"shared.{_pid}.owner",
+            f"shared.{os.getpid()}.owner",
+            "shared.npy",
+            f"live.npy.{os.getpid()}.12.tmp",
+        ]
+    )
+
+
+def test_publish__owner_file(resources, tmp_path):
+    resources.get("key", _Loader(_ARRAY))
+    assert (tmp_path / f"key.{os.getpid()}.owner").is_file()
+
+
+def test_get__array(resources):
+    _loader = _Loader(_ARRAY)
+    _data = resources.get("key", _loader)
+    assert isinstance(_data, np.ndarray)
+    assert not isinstance(_data, np.memmap)
+    assert np.array_equal(_data, _ARRAY)
+    assert _data.dtype == _ARRAY.dtype
+    assert not _data.flags.writeable
+    assert resources.is_published("key")
+
+
+def test_get__tuple(resources):
+    _data = resources.get("key", _Loader(_TUPLE))
+    assert isinstance(_data, tuple)
+    for _item, _ref in zip(_data, _TUPLE):
+        assert np.array_equal(_item, _ref)
+        assert _item.dtype == _ref.dtype
+
+
+def test_get__repeated_call(resources):
+    _loader = _Loader(_ARRAY)
+    _data = resources.get("key", _loader)
+    assert resources.get("key", _loader) is _data
+    assert _loader.n_calls == 1
+
+
+def test_get__concurrent_threads(resources):
+    _loader = _Loader(_ARRAY)
+
+    def _slow_loader():
+        time.sleep(0.05)
+        return _loader()
+
+    _results = []
+    _threads = [
+        threading.Thread(
+            target=lambda: _results.append(resources.get("key", _slow_loader))
+        )
+        for _ in range(4)
+    ]
+    for _thread in _threads:
+        _thread.start()
+    for _thread in _threads:
+        _thread.join()
+    assert _loader.n_calls == 1
+    assert all(_data is _results[0] for _data in _results)
+
+
+def test_get__published_by_other_process(resources, tmp_path):
+    resources.get("key", _Loader(_TUPLE))
+    SharedResources.reset_instance()
+    _loader = _Loader(None)
+    _data = SharedResources(directory=tmp_path).get("key", _loader)
+    assert _loader.n_calls == 0
+    assert np.array_equal(_data[1], _TUPLE[1])
+
+
+def test_get__writable(resources, tmp_path):
+    resources.get("key", _Loader(_ARRAY))
+    _data = resources.get("key", _Loader(_ARRAY), writable=True)
+    _data[0, 0] = 42
+    assert np.array_equal(np.load(tmp_path / "key.npy"), _ARRAY)
+
+
+def test_get__object_array(resources):
+    with pytest.raises(TypeError):
+        resources.get("key", _Loader(np.array([None, 1], dtype=object)))
+
+
+def test_get__no_directory_access(tmp_path):
+    (tmp_path / "file").touch()
+    SharedResources.reset_instance()
+    _resources = SharedResources(directory=tmp_path / "file" / "dir")
+    _data = _resources.get("key", _Loader(_ARRAY))
+    assert np.array_equal(_data, _ARRAY)
+    SharedResources.reset_instance()
+
+
+def test_clear(resources, tmp_path):
+    resources.get("key", _Loader(_TUPLE))
+    resources.clear()
+    assert not resources.is_published("key")
+    assert list(tmp_path.iterdir()) == []
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -218,6 +218,15 @@ def test_get_hdf5_metadata_meta__single_item(hdf5_test_data, meta_item):
     assert _res == getattr(hdf5_test_data["data"], meta_item)
 
 
+def test_get_hdf5_metadata_meta__chunks(temp_path):
+    with h5py.File(temp_path / "chunked.h5", "w") as _file:
+        _file.create_dataset("chunked", data=np.zeros((8, 4, 4)), chunks=(2, 4, 4))
+        _file.create_dataset("contiguous", data=np.zeros((8, 4, 4)))
+    _fname = temp_path / "chunked.h5"
+    assert get_hdf5_metadata(_fname, "chunks", dset="chunked") == (2, 4, 4)
+    assert get_hdf5_metadata(_fname, "chunks", dset="contiguous") is None
+
+
 @pytest.mark.parametrize(
     "meta_item", [("ndim", "size"), "ndim, size", ["size", "ndim"]]
 )
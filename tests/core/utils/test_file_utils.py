@@ -36,13 +36,15 @@ from pathlib import Path
 
 import pytest
 
-from pydidas.core import FileReadError, UserConfigError
+from pydidas.core import FileReadError, Parameter, ParameterCollection, UserConfigError
 from pydidas.core.utils import (
     CatchFileErrors,
     find_valid_python_files,
     flatten,
     get_extension,
     get_file_naming_scheme,
+    get_file_stamp,
+    get_param_file_stamps,
     get_random_string,
     has_extension,
 )
@@ -262,5 +264,31 @@ def test_has_extension__no_ext(check):
     assert has_extension("test", check) is False
 
 
+def test_get_file_stamp(empty_temp_path):
+    _fname = empty_temp_path / "test.txt"
+    _fname.write_text("test")
+    _stamp = get_file_stamp(_fname)
+    assert _stamp == get_file_stamp(str(_fname))
+    _fname.write_text("another test")
+    assert get_file_stamp(_fname) != _stamp
+
+
+def test_get_file_stamp__missing_file(empty_temp_path):
+    with pytest.raises(FileNotFoundError):
+        get_file_stamp(empty_temp_path / "missing.txt")
+
+
+def test_get_param_file_stamps(empty_temp_path):
+    _fname = empty_temp_path / "test.txt"
+    _fname.write_text("test")
+    _params = ParameterCollection(
+        Parameter("file", Path, _fname),
+        Parameter("missing", Path, empty_temp_path / "missing.txt"),
+        Parameter("directory", Path, empty_temp_path),
+        Parameter("number", int, 12),
+    )
+    assert get_param_file_stamps(_params) == (get_file_stamp(_fname), None, None)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -52,6 +52,32 @@ class TestFabioIo(unittest.TestCase):
         data = FabioIo.import_from_file(self._fname)
         self.assertTrue(np.allclose(data, self._data))
 
+    def _write_multi_frame_file(self, n_frames):
+        _fname = self._path.joinpath("test_multi.edf")
+        _data = np.random.random((n_frames,) + self._img_shape)
+        _file = fabio.edfimage.EdfImage(_data[0])
+        for _frame in _data[1:]:
+            _file.append_frame(data=_frame)
+        _file.write(_fname)
+        return _fname, _data
+
+    def test_import_from_file__w_frame(self):
+        _fname, _data = self._write_multi_frame_file(4)
+        for _frame in [0, 2, 3, -1]:
+            with self.subTest(frame=_frame):
+                data = FabioIo.import_from_file(_fname, frame=_frame, roi=(2, 5, 1, 7))
+                self.assertTrue(np.allclose(data, _data[_frame, 2:5, 1:7]))
+
+    def test_import_from_file__w_frame_out_of_range(self):
+        _fname, _ = self._write_multi_frame_file(4)
+        with self.assertRaises(FileReadError):
+            FabioIo.import_from_file(_fname, frame=4)
+
+    def test_get_number_of_frames(self):
+        _fname, _ = self._write_multi_frame_file(4)
+        self.assertEqual(FabioIo.get_number_of_frames(_fname), 4)
+        self.assertEqual(FabioIo.get_number_of_frames(self._fname), 1)
+
     def test_read_image__wrong_name(self):
         with self.assertRaises(FileReadError):
             FabioIo.import_from_file(self._fname.joinpath("dummy"))
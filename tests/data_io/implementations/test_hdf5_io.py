@@ -28,8 +28,9 @@ import h5py
 import numpy as np
 import pytest
 
-from pydidas.core import Dataset, FileReadError, UserConfigError
+from pydidas.core import Dataset, FileReadError, Hdf5FileCache, UserConfigError
 from pydidas.core.constants import HDF5_EXTENSIONS
+from pydidas.core.utils.converters import convert_to_slice
 from pydidas.core.utils.hdf5 import create_nxdata_entry
 from pydidas.data_io.implementations.hdf5_io import Hdf5Io
 
@@ -188,6 +189,90 @@ def test_import_from_file__complex_indexing(config, indices, slicing, squeeze):
     assert np.allclose(_data, _ref)
 
 
+@pytest.mark.parametrize(
+    "indices, ndim",
+    [
+        ((3, None, 5), 2),
+        ((None, 2), 3),
+        (((2, 9), 4, 1), 2),
+        ((None, None, 2, 1), 2),
+        ((7,), 3),
+    ],
+)
+@pytest.mark.parametrize("roi", [(1, 5, 0, 3), (slice(2, None, 2), slice(1, -1))])
+def test_import_from_file__w_roi(config, indices, ndim, roi):
+    _roi = roi if ndim == 2 else (slice(1, 4), slice(1, 5), slice(0, 3))
+    _data = Hdf5Io.import_from_file(
+        config["fname"],
+        dataset="test/path/res",
+        indices=indices,
+        roi=_roi,
+        ndim=ndim,
+        import_metadata=False,
+    )
+    _full = Hdf5Io.import_from_file(
+        config["fname"], dataset="test/path/res", indices=indices, import_metadata=False
+    )
+    Hdf5Io._roi_controller.ndim = ndim
+    Hdf5Io._roi_controller.roi = _roi
+    assert np.allclose(_data, _full[Hdf5Io._roi_controller.roi])
+    assert _data.shape == _full[Hdf5Io._roi_controller.roi].shape
+
+
+@pytest.mark.parametrize(
+    "indices, roi, selection",
+    [
+        (
+            (3, None, 5),
+            (1, 5, 0, 3),
+            ((slice(3, 4, 1), slice(1, 5, 1), slice(5, 6, 1), slice(0, 3, 1)), (0, 2)),
+        ),
+        (
+            (None, (2, 8)),
+            (slice(1, 3), slice(None, None, 2)),
+            ((slice(1, 3, 1), slice(2, 8, 2), slice(0, 14, 1), slice(0, 15, 1)), ()),
+        ),
+        (
+            (None, None, 2, 1),
+            (1, 5, 0, 3),
+            ((slice(1, 5, 1), slice(0, 3, 1), slice(2, 3, 1), slice(1, 2, 1)), (2, 3)),
+        ),
+        ((2, 3, 4, 5), (1, 5, 0, 3), None),
+        ((None, None), (slice(None, None, -1), slice(None)), None),
+    ],
+)
+def test_get_selection_with_roi(indices, roi, selection):
+    _indices = tuple(convert_to_slice(_item) for _item in indices)
+    _selection = Hdf5Io._get_selection_with_roi(
+        (12, 13, 14, 15), _indices, roi, 2, True
+    )
+    assert _selection == selection
+
+
+def test_get_selection_with_roi__no_roi():
+    assert (
+        Hdf5Io._get_selection_with_roi((12, 13), (slice(None),), None, 2, True) is None
+    )
+
+
+def test_import_from_file__w_file_cache(config):
+    _cache = Hdf5FileCache()
+    _cache.close()
+    _data = Hdf5Io.import_from_file(
+        config["fname"], indices=(2, 3), use_file_cache=True, import_metadata=False
+    )
+    assert str(config["fname"].absolute()) in _cache.filenames
+    _cache.close()
+    assert np.allclose(_data, config["data"][config["data_slice"]][2, 3])
+
+
+def test_import_from_file__wo_file_cache(config):
+    _cache = Hdf5FileCache()
+    _cache.close()
+    Hdf5Io.import_from_file(config["fname"], import_metadata=False)
+    assert _cache.filenames == []
+
+
 @pytest.mark.parametrize("dset", ["entry/scalar/data", "entry/0d/data"])
 def test_import_from_file__w_0d_and_scalar_data(config, dset):
     _data = Hdf5Io.import_from_file(config["fname"], dataset=dset, import_metadata=True)
@@ -25,6 +25,7 @@ __status__ = "Production"
 
 
 import tempfile
+import threading
 import unittest
 from pathlib import Path
 
@@ -117,6 +118,24 @@ class TestIoBase(unittest.TestCase):
         _data = IoBase.return_data(binning=2)
         self.assertEqual(_data.shape, (5, 5))
 
+    def test_return_data__thread_local_state(self):
+        _barrier = threading.Barrier(4)
+        _results = {}
+
+        def _read(index):
+            IoBase._data = np.full((10, 10), index, dtype=float)
+            _barrier.wait()
+            _results[index] = IoBase.return_data(roi=[0, 2 + index, 0, 4])
+
+        _threads = [threading.Thread(target=_read, args=(_i,)) for _i in range(4)]
+        for _thread in _threads:
+            _thread.start()
+        for _thread in _threads:
+            _thread.join()
+        for _index, _data in _results.items():
+            self.assertEqual(_data.shape, (2 + _index, 4))
+            self.assertTrue(np.all(_data == _index))
+
     def test_get_data_range__simple(self):
         _data = np.random.random((15, 15))
         _range = IoBase.get_data_range(_data)
@@ -63,6 +63,41 @@ class TestNumpyIo(unittest.TestCase):
         _data = NumpyIo.import_from_file(self._fname)
         self.assertTrue(np.allclose(_data, self._data))
 
+    def test_import_from_file__w_roi(self):
+        _data = NumpyIo.import_from_file(self._fname, roi=self._target_roi)
+        self.assertTrue(np.allclose(_data, self._data[0:5, 0:5]))
+
+    def test_import_from_file__w_frame_and_roi(self):
+        _data = NumpyIo.import_from_file(self._fname, frame=-3, roi=self._target_roi)
+        self.assertEqual(_data.shape, (5, 5, 15))
+        self.assertTrue(np.allclose(_data, self._data[-3, 0:5, 0:5]))
+        self.assertTrue(_data.flags.writeable)
+
+    def test_import_from_file__w_invalid_frame(self):
+        with self.assertRaises(FileReadError):
+            NumpyIo.import_from_file(self._fname, frame=12)
+
+    def test_import_from_file__zero_copy(self):
+        _data = NumpyIo.import_from_file(
+            self._fname, frame=3, roi=self._target_roi, zero_copy=True
+        )
+        self.assertTrue(np.allclose(_data, self._data[3, 0:5, 0:5]))
+        self.assertFalse(_data.flags.writeable)
+        self.assertFalse(_data.flags.owndata)
+
+    def test_import_from_file__zero_copy_w_binning(self):
+        _data = NumpyIo.import_from_file(
+            self._fname, frame=3, roi=(0, 12, 0, 14), binning=2, zero_copy=True
+        )
+        self.assertEqual(_data.shape, (6, 7, 7))
+        self.assertTrue(_data.flags.writeable)
+
+    def test_get_number_of_frames(self):
+        _fname = self._path.joinpath("test_stack.npy")
+        np.save(_fname, np.zeros((7, 5, 6)))
+        self.assertEqual(NumpyIo.get_number_of_frames(_fname), 7)
+        self.assertEqual(NumpyIo.get_number_of_frames(self._fname), 1)
+
     def test_import_from_file__wrong_name(self):
         with self.assertRaises(FileReadError):
             NumpyIo.import_from_file(self._fname.joinpath("dummy"), datatype=np.float64)
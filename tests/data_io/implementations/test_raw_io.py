@@ -74,6 +74,42 @@ class TestRawIo(unittest.TestCase):
         with self.assertRaises(FileReadError):
             RawIo.import_from_file(self._fname.joinpath("dummy"), datatype=np.float64)
 
+    def test_import_from_file__wrong_shape(self):
+        with self.assertRaises(FileReadError):
+            RawIo.import_from_file(self._fname, datatype=np.float64, shape=(12, 13))
+
+    def test_import_from_file__w_offset(self):
+        _data = RawIo.import_from_file(
+            self._fname, datatype=np.float64, shape=(13, 14), offset=11 * 13 * 14 * 8
+        )
+        self.assertTrue(np.allclose(_data, self._data[11]))
+
+    def test_import_from_file__w_frame_and_roi(self):
+        _data = RawIo.import_from_file(
+            self._fname, **self._read_kws, frame=4, roi=self._target_roi
+        )
+        self.assertTrue(np.allclose(_data, self._data[4, 0:5, 0:5]))
+        self.assertTrue(_data.flags.writeable)
+        self.assertNotIsInstance(_data.base, np.memmap)
+
+    def test_import_from_file__w_roi_wo_squeeze(self):
+        _data = RawIo.import_from_file(
+            self._fname, datatype=np.float64, shape=(1, 12 * 13, 14), roi=(0, 1, 0, 5)
+        )
+        self.assertEqual(_data.shape, (1, 5, 14))
+
+    def test_import_from_file__w_invalid_frame(self):
+        with self.assertRaises(FileReadError):
+            RawIo.import_from_file(self._fname, **self._read_kws, frame=12)
+
+    def test_import_from_file__zero_copy(self):
+        _data = RawIo.import_from_file(
+            self._fname, **self._read_kws, frame=2, zero_copy=True
+        )
+        self.assertTrue(np.allclose(_data, self._data[2]))
+        self.assertFalse(_data.flags.writeable)
+        self.assertFalse(_data.flags.owndata)
+
     def test_import_from_file__wrong_type(self):
         _fname_new = self._path.joinpath("test2.dat")
         with open(_fname_new, "w") as f:
@@ -34,6 +34,7 @@ import skimage.io
 
 from pydidas.core import FileReadError
 from pydidas.core.constants import TIFF_EXTENSIONS
+from pydidas.core.utils import get_file_stamp
 from pydidas.data_io.implementations.tiff_io import TiffIo
 
 
@@ -80,6 +81,49 @@ class TestTiffIo(unittest.TestCase):
         with self.assertRaises(FileReadError):
             TiffIo.import_from_file(self._fname)
 
+    def test_import_from_file__w_frame(self):
+        _fname = self._path.joinpath(self.get_fname())
+        _raw = (np.random.random((7, 12, 13)) * 1257).astype(np.uint16)
+        TiffIo.export_to_file(_fname, _raw)
+        for _frame in [0, 4, 6, -2]:
+            with self.subTest(frame=_frame):
+                _data = TiffIo.import_from_file(
+                    _fname, frame=_frame, roi=self._target_roi
+                )
+                self.assertTrue(np.array_equal(_data, _raw[_frame, 0:5, 0:5]))
+
+    def test_import_from_file__w_frame_out_of_range(self):
+        _fname = self._path.joinpath(self.get_fname())
+        TiffIo.export_to_file(_fname, np.zeros((5, 12, 13), dtype=np.uint16))
+        with self.assertRaises(FileReadError):
+            TiffIo.import_from_file(_fname, frame=5)
+
+    def test_import_from_file__page_offsets_read_lazily(self):
+        _fname = self._path.joinpath(self.get_fname())
+        TiffIo.export_to_file(_fname, np.zeros((5, 12, 13), dtype=np.uint16))
+        TiffIo.import_from_file(_fname, frame=2)
+        _key = (str(_fname.absolute()), get_file_stamp(_fname))
+        self.assertEqual(len(TiffIo._page_offsets[_key][0]), 3)
+        self.assertFalse(TiffIo._page_offsets[_key][1])
+        TiffIo.import_from_file(_fname, frame=1)
+        self.assertEqual(len(TiffIo._page_offsets[_key][0]), 3)
+
+    def test_import_from_file__w_frame_after_file_update(self):
+        _fname = self._path.joinpath(self.get_fname())
+        TiffIo.export_to_file(_fname, np.zeros((2, 12, 13), dtype=np.uint16))
+        TiffIo.import_from_file(_fname, frame=1)
+        TiffIo.export_to_file(
+            _fname, np.ones((6, 12, 13), dtype=np.uint16), overwrite=True
+        )
+        _data = TiffIo.import_from_file(_fname, frame=5)
+        self.assertTrue(np.all(_data == 1))
+
+    def test_get_number_of_frames(self):
+        _fname = self._path.joinpath(self.get_fname())
+        TiffIo.export_to_file(_fname, np.zeros((5, 12, 13), dtype=np.uint16))
+        self.assertEqual(TiffIo.get_number_of_frames(_fname), 5)
+        self.assertEqual(TiffIo.get_number_of_frames(self._fname), 1)
+
     def test_export_to_file__file_exists(self):
         with self.assertRaises(FileExistsError):
             TiffIo.export_to_file(self._fname, self._data)
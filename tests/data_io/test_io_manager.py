@@ -175,6 +175,15 @@ def test_import_from_file(io_manager_with_test_class):
     assert _IoTestClass._imported[1] == _kws
 
 
+def test_get_number_of_frames(io_manager_with_test_class):
+    assert IoManager.get_number_of_frames(get_random_string(12) + ".test") == 1
+
+
+def test_get_number_of_frames__not_registered(io_manager_with_test_class):
+    with pytest.raises(UserConfigError):
+        IoManager.get_number_of_frames(get_random_string(12) + ".export")
+
+
 def test_import_from_file__w_forced_dim_kw():
     _fname = get_random_string(12) + ".test"
     IoManager.register_class(_IoTestClass)
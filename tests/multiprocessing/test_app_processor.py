@@ -29,8 +29,10 @@ import queue
 import threading
 import time
 import unittest
+import unittest.mock
 
 from pydidas.multiprocessing import app_processor_func
+from pydidas.multiprocessing.queue_utils import TaskChunk
 from pydidas.unittest_objects.mp_test_app import MpTestApp
 from pydidas.unittest_objects.mp_test_app_wo_tasks import MpTestAppWoTasks
 
@@ -196,6 +198,114 @@ class Test_app_processor(unittest.TestCase):
         self.assertEqual(self._mp_config["queue_shutting_down"].get(), 1)
         _thread.join()
 
+    def test_run__w_task_chunks(self):
+        self.app = MpTestApp()
+        self.app.multiprocessing_pre_run()
+        _n = self.app._config["max_index"]
+        self._mp_config["queue_input"].put(TaskChunk(range(0, _n - 5)))
+        self._mp_config["queue_input"].put(TaskChunk(range(_n - 5, _n)))
+        self._mp_config["queue_input"].put(None)
+        app_processor_func(
+            self._mp_config,
+            self.app.__class__,
+            self.app.params.copy(),
+            self.app._config,
+            wait_for_output_queue=False,
+        )
+        _tasks, _results = self._mp_config["queue_output"].get(timeout=1)
+        self.assertEqual(_tasks, TaskChunk(range(0, _n - 5)))
+        self.assertEqual(len(_results), _n - 5)
+        self.assertTrue(_tasks.runtime > 0)
+        _tasks, _results = self._mp_config["queue_output"].get(timeout=1)
+        self.assertEqual(_tasks, TaskChunk(range(_n - 5, _n)))
+        self.assertEqual(len(_results), 5)
+        _stopper = self._mp_config["queue_output"].get(timeout=1)
+        self.assertEqual(_stopper, [None, None])
+
+    def test_run__w_task_chunks_and_results_limit(self):
+        self.app = MpTestApp()
+        self.app.multiprocessing_pre_run()
+        self._mp_config["queue_input"].put(TaskChunk(range(0, 10)))
+        self._mp_config["queue_input"].put(None)
+        with unittest.mock.patch.object(
+            MpTestApp, "multiprocessing_max_results_per_message", return_value=4
+        ):
+            app_processor_func(
+                self._mp_config,
+                self.app.__class__,
+                self.app.params.copy(),
+                self.app._config,
+                wait_for_output_queue=False,
+            )
+        for _range in [range(0, 4), range(4, 8), range(8, 10)]:
+            _tasks, _results = self._mp_config["queue_output"].get(timeout=1)
+            self.assertEqual(_tasks, TaskChunk(_range))
+            self.assertEqual(len(_results), len(_range))
+        _stopper = self._mp_config["queue_output"].get(timeout=1)
+        self.assertEqual(_stopper, [None, None])
+
+    def test_run__w_run_id_and_task_chunks(self):
+        self.app = MpTestApp()
+        self.app.multiprocessing_pre_run()
+        self._mp_config["queue_input"].put(TaskChunk(range(0, 4)))
+        self._mp_config["queue_input"].put(5)
+        self._mp_config["queue_input"].put(None)
+        app_processor_func(
+            self._mp_config | {"run_id": 3},
+            self.app.__class__,
+            self.app.params.copy(),
+            self.app._config,
+            wait_for_output_queue=False,
+        )
+        _tasks, _results, _run_id = self._mp_config["queue_output"].get(timeout=1)
+        self.assertEqual(_tasks, TaskChunk(range(0, 4)))
+        self.assertEqual(_run_id, 3)
+        _task, _result, _run_id = self._mp_config["queue_output"].get(timeout=1)
+        self.assertEqual((_task, _run_id), (5, 3))
+        _stopper = self._mp_config["queue_output"].get(timeout=1)
+        self.assertEqual(_stopper, [None, None, 3])
+
+    def test_run__w_worker_state(self):
+        self.app = MpTestApp()
+        self.app.multiprocessing_pre_run()
+        _worker_state = {}
+        _config = self._mp_config | {"run_id": 4, "worker_state": _worker_state}
+        _apps = []
+        for _ in range(2):
+            self.put_ints_in_queue()
+            app_processor_func(
+                _config,
+                self.app.__class__,
+                self.app.params.copy(),
+                self.app._config,
+                wait_for_output_queue=False,
+            )
+            _tasks, _results = self.get_task_results()
+            self.assertEqual(_tasks, list(self.app.multiprocessing_get_tasks()))
+            self.assertEqual(
+                self._mp_config["queue_output"].get(timeout=1), [None, None, 4]
+            )
+            _apps.append(_worker_state["app"])
+        self.assertIs(_apps[0], _apps[1])
+
+    def test_run__stop_signal_w_run_id(self):
+        self.app = MpTestApp()
+        self.app.multiprocessing_pre_run()
+        self._mp_config["queue_stop"].put(3)
+        _thread = _ProcThread(
+            self._mp_config | {"run_id": 4},
+            self.app.__class__,
+            self.app.params.copy(),
+            self.app._config,
+            use_tasks=True,
+        )
+        _thread.start()
+        time.sleep(0.1)
+        self.assertTrue(_thread.is_alive())
+        self._mp_config["queue_stop"].put(4)
+        self.assertEqual(self._mp_config["queue_shutting_down"].get(timeout=1), 4)
+        _thread.join()
+
 
 if __name__ == "__main__":
     unittest.main()
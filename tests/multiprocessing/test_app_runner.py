@@ -32,7 +32,7 @@ from qtpy import QtCore, QtTest
 
 from pydidas import IS_QT6
 from pydidas.core import BaseApp, PydidasQsettings
-from pydidas.multiprocessing import AppRunner
+from pydidas.multiprocessing import AppRunner, WorkerPool
 from pydidas.unittest_objects.mp_test_app import MpTestApp
 
 
@@ -113,14 +113,64 @@ class TestAppRunner(unittest.TestCase):
         else:
             self.assertEqual(len(_spy2), 1)
 
+    def test_run__w_chunks(self):
+        self._runner = AppRunner(
+            self.app, n_workers=2, chunk_size=7, adaptive_chunks=True
+        )
+        _spy = QtTest.QSignalSpy(self._runner.sig_final_app_state)
+        _spy2 = QtTest.QSignalSpy(self._runner.finished)
+        self._runner.start()
+        time.sleep(0.1)
+        self.wait_for_spy_signal(_spy2)
+        time.sleep(1)
+        _new_app = _spy.at(0)[0] if IS_QT6 else _spy[0][0]
+        _image = _new_app._composite.image
+        self.assertTrue((_image > 0).all())
+
+    def test_run__w_locality_scheduler(self):
+        self._runner = AppRunner(
+            self.app, n_workers=2, chunk_size=5, task_scheduler="locality"
+        )
+        _spy = QtTest.QSignalSpy(self._runner.sig_final_app_state)
+        _spy2 = QtTest.QSignalSpy(self._runner.finished)
+        self._runner.start()
+        time.sleep(0.1)
+        self.wait_for_spy_signal(_spy2)
+        time.sleep(1)
+        _new_app = _spy.at(0)[0] if IS_QT6 else _spy[0][0]
+        _image = _new_app._composite.image
+        self.assertTrue((_image > 0).all())
+
+    def test_run__w_worker_pool(self):
+        WorkerPool.reset_instance()
+        _pool = WorkerPool()
+        try:
+            for _ in range(2):
+                self.app = MpTestApp()
+                self._runner = AppRunner(self.app, n_workers=2, worker_pool=_pool)
+                _spy = QtTest.QSignalSpy(self._runner.sig_final_app_state)
+                _spy2 = QtTest.QSignalSpy(self._runner.finished)
+                self._runner.start()
+                self.wait_for_spy_signal(_spy2, timeout=60)
+                time.sleep(0.5)
+                _new_app = _spy.at(0)[0] if IS_QT6 else _spy[0][0]
+                self.assertTrue((_new_app._composite.image > 0).all())
+                self.assertTrue(_pool.is_running)
+                self._runner.exit()
+                self._runner = None
+        finally:
+            _pool.shutdown()
+            WorkerPool.reset_instance()
+
     def test_get_app(self):
         self._runner = AppRunner(self.app)
         _app = self._runner.get_app()
         self.assertIsInstance(_app, BaseApp)
 
     def test_cycle_pre_run(self):
-        self._runner = AppRunner(self.app)
+        self._runner = AppRunner(self.app, n_workers=3)
         self._runner.cycle_pre_run()
+        self.assertEqual(self._runner._processor["args"][3]["mp_n_workers"], 3)
         if IS_QT6:
             _sig_results = QtCore.QMetaMethod.fromSignal(self._runner.sig_results)
             _sig_progress = QtCore.QMetaMethod.fromSignal(self._runner.sig_progress)
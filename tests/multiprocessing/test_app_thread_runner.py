@@ -0,0 +1,165 @@
+# This file is part of pydidas.
+#
+# Copyright 2026, Helmholtz-Zentrum Hereon
+# SPDX-License-Identifier: GPL-3.0-only
+#
+# pydidas is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# Pydidas is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pydidas. If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for pydidas modules."""
+
+__author__ = "Malte Storm"
+__copyright__ = "Copyright 2026, Helmholtz-Zentrum Hereon"
+__license__ = "GPL-3.0-only"
+__maintainer__ = "Malte Storm"
+__status__ = "Production"
+
+
+import threading
+
+import pytest
+from qtpy import QtTest
+
+from pydidas import IS_QT6
+from pydidas.core import BaseApp
+from pydidas.multiprocessing import AppThreadRunner
+from pydidas.unittest_objects.mp_test_app import MpTestApp
+
+
+def _spy_count(spy: QtTest.QSignalSpy) -> int:
+    return spy.count() if IS_QT6 else len(spy)
+
+
+class _LiveTestApp(MpTestApp):
+    """An MpTestApp which only processes indices which have been released."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.available = set()
+        self.processing_threads = set()
+
+    def threading_carryon(self, index: int) -> bool:
+        return index in self.available
+
+    def threading_func(self, index: int) -> int:
+        self.processing_threads.add(threading.get_ident())
+        return super().threading_func(index)
+
+
+@pytest.fixture
+def app():
+    return MpTestApp()
+
+
+def test_init(app):
+    _runner = AppThreadRunner(app, n_threads=2)
+    assert app._config["run_prepared"]
+    assert _runner.n_threads == 2
+    assert _runner.progress == -1
+
+
+def test_init__wrong_app():
+    with pytest.raises(TypeError):
+        AppThreadRunner(12)
+
+
+@pytest.mark.parametrize("n_threads", [0, 1.5, "2"])
+def test_n_threads__invalid(app, n_threads):
+    with pytest.raises(ValueError):
+        AppThreadRunner(app, n_threads=n_threads)
+
+
+def test_run(app):
+    _runner = AppThreadRunner(app, n_threads=3)
+    _spy_results = QtTest.QSignalSpy(_runner.sig_results)
+    _spy_final = QtTest.QSignalSpy(_runner.sig_final_app_state)
+    _runner.run()
+    assert _spy_count(_spy_results) == 40
+    assert _spy_count(_spy_final) == 1
+    assert _runner.progress == 1
+    assert (app._composite.image > 0).all()
+    assert app._config["mp_post_run_called"]
+
+
+def test_run__results_signal(app):
+    _runner = AppThreadRunner(app, n_threads=2)
+    _spy = QtTest.QSignalSpy(_runner.sig_results)
+    _runner.run()
+    _results = [(_spy.at(_i) if IS_QT6 else _spy[_i]) for _i in range(_spy_count(_spy))]
+    assert sorted(_task for _task, _ in _results) == list(range(40))
+    assert all(_task == _result for _task, _result in _results)
+
+
+def test_run__w_exception():
+    _app = BaseApp()
+    _app.multiprocessing_get_tasks = lambda: [0, 1]
+    _app._config["run_prepared"] = True
+    _runner = AppThreadRunner(_app, n_threads=2)
+    _spy = QtTest.QSignalSpy(_runner.sig_post_run_called)
+    _spy_exception = QtTest.QSignalSpy(_runner.sig_worker_exception)
+    _runner.run()
+    assert _spy_count(_spy) == 1
+    assert _spy_count(_spy_exception) == 1
+    _message = (_spy_exception.at(0) if IS_QT6 else _spy_exception[0])[0]
+    assert _message.startswith("NotImplementedError")
+
+
+def test_run__w_exception_stops_processing():
+    _app = _LiveTestApp()
+    _app.available = set(range(40))
+    _threading_func = _app.threading_func
+
+    def _failing_func(index: int) -> int:
+        if index == 5:
+            raise ValueError("test error")
+        return _threading_func(index)
+
+    _app.threading_func = _failing_func
+    _runner = AppThreadRunner(_app, n_threads=1)
+    _spy_exception = QtTest.QSignalSpy(_runner.sig_worker_exception)
+    _runner.run()
+    assert _spy_count(_spy_exception) == 1
+    assert _runner.progress == 5 / 40
+    assert _app._config["mp_post_run_called"]
+
+
+def test_run__carryon():
+    _app = _LiveTestApp()
+    _app.available = set(range(40))
+    _runner = AppThreadRunner(_app, n_threads=4)
+    _runner.run()
+    assert _runner.progress == 1
+    assert len(_app.processing_threads) >= 1
+
+
+def test_run__interrupted_while_waiting():
+    _app = _LiveTestApp()
+    _app.available = set(range(10))
+    _runner = AppThreadRunner(_app, n_threads=2)
+    _spy = QtTest.QSignalSpy(_runner.sig_results)
+    _timer = threading.Timer(0.2, _runner.send_stop_signal)
+    _timer.start()
+    _runner.run()
+    _timer.join()
+    assert _spy_count(_spy) == 10
+    assert _runner.progress == 0.25
+    assert _app._config["mp_post_run_called"]
+
+
+@pytest.mark.slow
+def test_start(app):
+    _runner = AppThreadRunner(app, n_threads=2)
+    _runner.start()
+    assert _runner.wait(10000)
+    QtTest.QTest.qWait(10)
+    assert (app._composite.image > 0).all()
+    assert app._config["mp_post_run_called"]
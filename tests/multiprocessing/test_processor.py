@@ -36,6 +36,7 @@ import numpy as np
 import pytest
 
 from pydidas.multiprocessing.processor import processor_func
+from pydidas.multiprocessing.queue_utils import TaskChunk
 
 
 _N_TEST = 20
@@ -135,6 +136,19 @@ def test_run__with_stop_signal(mp_config) -> None:
     assert mp_config["queue_shutting_down"].get() == 1
 
 
+def test_run__with_stop_signal_and_run_id(mp_config) -> None:
+    """Test processor_func ignores stop signals from other runs."""
+    _thread = _ProcThread(lambda x: x, mp_config | {"run_id": 7})
+    mp_config["queue_stop"].put(6)
+    _thread.start()
+    mp_config["queue_input"].put(3)
+    assert mp_config["queue_output"].get(timeout=1) == [3, 3, 7]
+    mp_config["queue_stop"].put(7)
+    assert mp_config["queue_shutting_down"].get(timeout=1) == 7
+    _thread.join(timeout=1)
+    assert not _thread.is_alive()
+
+
 def test_run__with_args(mp_config) -> None:
     """Test processor_func with additional arguments."""
     _args = (0, 1)
@@ -188,5 +202,23 @@ def test_run__with_class_method(mp_config) -> None:
     assert mp_config["queue_output"].get(timeout=1) == [None, None]
 
 
+def test_run__with_task_chunks(mp_config) -> None:
+    """Test processor_func with TaskChunks as input."""
+    _args = (0, 1)
+    _chunks = [TaskChunk(range(0, 8)), TaskChunk([8, 9]), TaskChunk(["a"])]
+    for _chunk in _chunks[:2]:
+        mp_config["queue_input"].put(_chunk)
+    mp_config["queue_input"].put(12)
+    mp_config["queue_input"].put(None)
+    processor_func(_test_func, mp_config, *_args)
+    for _chunk in _chunks[:2]:
+        _tasks, _results = mp_config["queue_output"].get(timeout=1)
+        assert _tasks == _chunk
+        assert _tasks.runtime > 0
+        assert _results == [_test_func(_i, *_args) for _i in _chunk]
+    assert mp_config["queue_output"].get(timeout=1) == [12, 12]
+    assert mp_config["queue_output"].get(timeout=1) == [None, None]
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
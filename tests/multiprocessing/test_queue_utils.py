@@ -0,0 +1,248 @@
+# This file is part of pydidas.
+#
+# Copyright 2026, Helmholtz-Zentrum Hereon
+# SPDX-License-Identifier: GPL-3.0-only
+#
+# pydidas is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# Pydidas is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pydidas. If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for pydidas modules."""
+
+__author__ = "Malte Storm"
+__copyright__ = "Copyright 2026, Helmholtz-Zentrum Hereon"
+__license__ = "GPL-3.0-only"
+__maintainer__ = "Malte Storm"
+__status__ = "Production"
+
+
+import multiprocessing as mp
+import pickle
+import queue
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from pydidas.multiprocessing.queue_utils import (
+    TaskChunk,
+    WorkerTaskQueues,
+    create_output_item,
+    get_from_queue,
+    get_stop_signal,
+    wait_for_queues,
+)
+
+
+@pytest.fixture
+def mp_queues():
+    _queues = [mp.Queue(), mp.Queue()]
+    yield _queues
+    for _queue in _queues:
+        _queue.close()
+
+
+def _delayed_put(q, item, delay: float):
+    time.sleep(delay)
+    q.put(item)
+
+
+def test_wait_for_queues__timeout(mp_queues):
+    _t0 = time.perf_counter()
+    _ready = wait_for_queues(mp_queues, timeout=0.05)
+    assert _ready == []
+    assert time.perf_counter() - _t0 >= 0.04
+
+
+def test_wait_for_queues__item_available(mp_queues):
+    mp_queues[1].put(42)
+    _ready = wait_for_queues(mp_queues, timeout=1)
+    assert _ready == [mp_queues[1]]
+
+
+def test_wait_for_queues__multiple_items_keep_order(mp_queues):
+    mp_queues[1].put(1)
+    mp_queues[0].put(0)
+    time.sleep(0.05)
+    _ready = wait_for_queues(mp_queues, timeout=1)
+    assert _ready == mp_queues
+
+
+def test_wait_for_queues__wakes_up_on_item(mp_queues):
+    _thread = threading.Thread(target=_delayed_put, args=(mp_queues[0], 1, 0.05))
+    _thread.start()
+    _t0 = time.perf_counter()
+    _ready = wait_for_queues(mp_queues, timeout=5)
+    _dt = time.perf_counter() - _t0
+    _thread.join()
+    assert _ready == [mp_queues[0]]
+    assert _dt < 1
+
+
+def test_wait_for_queues__no_timeout(mp_queues):
+    _thread = threading.Thread(target=_delayed_put, args=(mp_queues[1], 1, 0.02))
+    _thread.start()
+    _ready = wait_for_queues(mp_queues)
+    _thread.join()
+    assert _ready == [mp_queues[1]]
+
+
+def test_wait_for_queues__generic_queue():
+    _queues = [queue.Queue(), queue.Queue()]
+    assert wait_for_queues(_queues, timeout=0.01) == []
+    _queues[0].put(1)
+    assert wait_for_queues(_queues, timeout=0.01) == [_queues[0]]
+
+
+def test_get_from_queue__w_item(mp_queues):
+    mp_queues[0].put("item")
+    assert get_from_queue(mp_queues[0], timeout=1) == (True, "item")
+
+
+def test_get_from_queue__empty(mp_queues):
+    assert get_from_queue(mp_queues[0], timeout=0.01) == (False, None)
+
+
+def test_get_stop_signal__empty(mp_queues):
+    assert not get_stop_signal(mp_queues[0])
+
+
+@pytest.mark.parametrize("item", [1, 5])
+def test_get_stop_signal__no_run_id(mp_queues, item):
+    mp_queues[0].put(item)
+    assert get_stop_signal(mp_queues[0])
+
+
+@pytest.mark.parametrize("item, valid", [(3, True), (2, False)])
+def test_get_stop_signal__w_run_id(mp_queues, item, valid):
+    mp_queues[0].put(item)
+    assert get_stop_signal(mp_queues[0], run_id=3) == valid
+    assert wait_for_queues(mp_queues, timeout=0.01) == []
+
+
+@pytest.mark.parametrize("run_id, expected", [(None, [4, 12]), (7, [4, 12, 7])])
+def test_create_output_item(run_id, expected):
+    assert create_output_item(4, 12, run_id) == expected
+
+
+@pytest.mark.parametrize(
+    "tasks, expected_type",
+    [
+        ([3, 4, 5, 6], range),
+        (np.arange(12, 20), range),
+        (range(2, 7), range),
+        ([3, 5, 6], list),
+        ([3], list),
+        (["a", "b"], list),
+        ([1, 2.0, 3], list),
+    ],
+)
+def test_task_chunk__init(tasks, expected_type):
+    _chunk = TaskChunk(tasks)
+    assert isinstance(_chunk.tasks, expected_type)
+    assert list(_chunk) == list(tasks)
+    assert len(_chunk) == len(tasks)
+    assert _chunk.runtime == 0
+
+
+def test_task_chunk__getitem():
+    _chunk = TaskChunk([4, 5, 6])
+    assert _chunk[1] == 5
+
+
+def test_task_chunk__eq():
+    assert TaskChunk([1, 2, 3]) == TaskChunk(range(1, 4))
+    assert TaskChunk([1, 2, 3]) != TaskChunk([1, 2])
+    assert TaskChunk([1, 2, 3]) != [1, 2, 3]
+
+
+def test_task_chunk__pickle():
+    _chunk = TaskChunk(np.arange(10_000), runtime=0.5)
+    _dump = pickle.dumps(_chunk)
+    _new = pickle.loads(_dump)
+    assert _new == _chunk
+    assert _new.runtime == 0.5
+    assert len(_dump) < 200
+
+
+def test_task_chunk__via_queue(mp_queues):
+    _chunk = TaskChunk(["a", "b"])
+    mp_queues[0].put(_chunk)
+    assert mp_queues[0].get(timeout=1) == _chunk
+
+
+@pytest.fixture
+def worker_queues():
+    _queues = {
+        "queue_input": mp.Queue(),
+        "queue_local": mp.Queue(),
+        "queues_steal": [mp.Queue(), mp.Queue()],
+    }
+    yield _queues
+    for _queue in [_queues["queue_input"], _queues["queue_local"]]:
+        _queue.close()
+    for _queue in _queues["queues_steal"]:
+        _queue.close()
+
+
+def test_worker_task_queues__init__no_local_queue(mp_queues):
+    _queues = WorkerTaskQueues({"queue_input": mp_queues[0]})
+    assert _queues.queues == [mp_queues[0]]
+    assert not _queues.own_tasks_done
+
+
+def test_worker_task_queues__init(worker_queues):
+    _queues = WorkerTaskQueues(worker_queues)
+    assert _queues.queues == [
+        worker_queues["queue_input"],
+        worker_queues["queue_local"],
+    ]
+
+
+def test_worker_task_queues__get__not_ready(worker_queues):
+    _queues = WorkerTaskQueues(worker_queues)
+    assert _queues.get([]) == (False, None)
+
+
+@pytest.mark.parametrize("key", ["queue_input", "queue_local"])
+def test_worker_task_queues__get__item(worker_queues, key):
+    worker_queues[key].put(12)
+    _queues = WorkerTaskQueues(worker_queues)
+    _ready = wait_for_queues(_queues.queues, timeout=1)
+    assert _queues.get(_ready) == (True, 12)
+    assert not _queues.own_tasks_done
+
+
+def test_worker_task_queues__get__no_tasks_left(worker_queues):
+    worker_queues["queue_local"].put(None)
+    _queues = WorkerTaskQueues(worker_queues)
+    _ready = wait_for_queues(_queues.queues, timeout=1)
+    assert _queues.get(_ready) == (True, None)
+    assert _queues.own_tasks_done
+    assert _queues.queues == []
+
+
+def test_worker_task_queues__get__steal(worker_queues):
+    worker_queues["queue_local"].put(None)
+    worker_queues["queues_steal"][0].put(None)
+    worker_queues["queues_steal"][1].put(TaskChunk([4, 5]))
+    _queues = WorkerTaskQueues(worker_queues)
+    _ready = wait_for_queues(_queues.queues, timeout=1)
+    time.sleep(0.05)
+    assert _queues.get(_ready) == (True, TaskChunk([4, 5]))
+    assert _queues.get([]) == (True, None)
+    # the stop signal of the other worker must be put back:
+    assert worker_queues["queues_steal"][0].get(timeout=1) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
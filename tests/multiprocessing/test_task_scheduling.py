@@ -0,0 +1,112 @@
+# This file is part of pydidas.
+#
+# Copyright 2026, Helmholtz-Zentrum Hereon
+# SPDX-License-Identifier: GPL-3.0-only
+#
+# pydidas is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# Pydidas is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pydidas. If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for pydidas modules."""
+
+__author__ = "Malte Storm"
+__copyright__ = "Copyright 2026, Helmholtz-Zentrum Hereon"
+__license__ = "GPL-3.0-only"
+__maintainer__ = "Malte Storm"
+__status__ = "Production"
+
+
+import pytest
+
+from pydidas.multiprocessing.task_scheduling import (
+    distribute_tasks_by_locality,
+    get_block_boundaries,
+)
+
+
+@pytest.mark.parametrize(
+    "keys, expected",
+    [
+        ([], [0, 0]),
+        ([0, 0, 0], [0, 3]),
+        ([0, 0, 1, 1, 2], [0, 2, 4, 5]),
+        ([None, None], [0, 2]),
+        ([(0, 0), (0, 1), (0, 1), (1, 0)], [0, 1, 3, 4]),
+    ],
+)
+def test_get_block_boundaries(keys, expected):
+    assert get_block_boundaries(keys) == expected
+
+
+def test_distribute_tasks_by_locality__no_keys():
+    _tasks = list(range(10))
+    _distribution = distribute_tasks_by_locality(_tasks, [None] * 10, 2, 3)
+    assert _distribution == [[[0, 1, 2], [3, 4]], [[5, 6, 7], [8, 9]]]
+
+
+def test_distribute_tasks_by_locality__aligned_with_blocks():
+    _tasks = list(range(12))
+    _keys = [_i // 5 for _i in range(12)]
+    _distribution = distribute_tasks_by_locality(_tasks, _keys, 2, 10)
+    # the boundary at 6 is moved to the block boundary at 5:
+    assert _distribution == [[[0, 1, 2, 3, 4]], [[5, 6, 7, 8, 9, 10, 11]]]
+
+
+def test_distribute_tasks_by_locality__boundary_not_shifted():
+    _tasks = list(range(12))
+    _keys = [_i // 4 for _i in range(12)]
+    _distribution = distribute_tasks_by_locality(_tasks, _keys, 2, 10)
+    assert _distribution == [[[0, 1, 2, 3, 4, 5]], [[6, 7, 8, 9, 10, 11]]]
+
+
+def test_distribute_tasks_by_locality__chunks_combine_whole_blocks():
+    _tasks = list(range(12))
+    _keys = [_i // 2 for _i in range(12)]
+    _distribution = distribute_tasks_by_locality(_tasks, _keys, 2, 5)
+    assert _distribution == [[[0, 1, 2, 3], [4, 5]], [[6, 7, 8, 9], [10, 11]]]
+
+
+def test_distribute_tasks_by_locality__large_blocks():
+    _tasks = list(range(20))
+    _keys = [_i // 10 for _i in range(20)]
+    _distribution = distribute_tasks_by_locality(_tasks, _keys, 2, 4)
+    assert _distribution == [
+        [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]],
+        [[10, 11, 12, 13], [14, 15, 16, 17], [18, 19]],
+    ]
+
+
+def test_distribute_tasks_by_locality__more_workers_than_tasks():
+    _distribution = distribute_tasks_by_locality([3, 4], [0, 1], 4, 2)
+    assert len(_distribution) == 4
+    assert sorted(
+        _task for _chunks in _distribution for _c in _chunks for _task in _c
+    ) == [3, 4]
+
+
+@pytest.mark.parametrize("n_workers", [1, 3, 4, 7])
+@pytest.mark.parametrize("chunk_size", [1, 5, 50])
+def test_distribute_tasks_by_locality__all_tasks(n_workers, chunk_size):
+    _tasks = list(range(100, 197))
+    _keys = [_i // 13 for _i in range(97)]
+    _distribution = distribute_tasks_by_locality(_tasks, _keys, n_workers, chunk_size)
+    assert len(_distribution) == n_workers
+    _all_tasks = [
+        _task for _chunks in _distribution for _chunk in _chunks for _task in _chunk
+    ]
+    assert _all_tasks == _tasks
+    assert all(
+        0 < len(_chunk) <= chunk_size for _chunks in _distribution for _chunk in _chunks
+    )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
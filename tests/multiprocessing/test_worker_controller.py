@@ -34,6 +34,11 @@ from qtpy import QtCore, QtTest
 
 from pydidas import IS_QT6
 from pydidas.multiprocessing import WorkerController
+from pydidas.multiprocessing.queue_utils import TaskChunk
+from pydidas.multiprocessing.worker_controller import (
+    ADAPTIVE_CHUNK_MAX_SIZE,
+    ADAPTIVE_CHUNK_TARGET_TIME,
+)
 
 
 def local_test_func(index, *args, **kwargs):
@@ -211,6 +216,166 @@ class TestWorkerController(unittest.TestCase):
         self._wc._put_next_task_in_queue()
         self.assertEqual(self._wc._queues["queue_input"].qsize(), 1)
 
+    def test_put_next_task_in_queue__w_chunks(self):
+        self._wc = WorkerController(chunk_size=3, adaptive_chunks=False)
+        self._wc._to_process = [1, 2, 3, 4, 5, None, None]
+        self._wc._put_next_task_in_queue()
+        self._wc._put_next_task_in_queue()
+        self._wc._put_next_task_in_queue()
+        self.assertEqual(self._wc._to_process, [None])
+        _items = [self._wc._queues["queue_input"].get(timeout=1) for _ in range(3)]
+        self.assertEqual(_items, [TaskChunk([1, 2, 3]), TaskChunk([4, 5]), None])
+
+    def test_queue_pending_tasks__no_chunks(self):
+        self._wc = WorkerController(n_workers=2, chunk_size=1, adaptive_chunks=False)
+        self._wc._to_process = [1, 2, 3, None, None]
+        self._wc._queue_pending_tasks()
+        self.assertEqual(self._wc._to_process, [])
+        _items = [self._wc._queues["queue_input"].get(timeout=1) for _ in range(5)]
+        self.assertEqual(_items, [1, 2, 3, None, None])
+
+    def test_queue_pending_tasks__w_chunks(self):
+        self._wc = WorkerController(n_workers=2, chunk_size=4, adaptive_chunks=False)
+        self._wc._to_process = list(range(10)) + [None, None]
+        self._wc._queue_pending_tasks()
+        self.assertEqual(self._wc._to_process, [])
+        _items = [self._wc._queues["queue_input"].get(timeout=1) for _ in range(5)]
+        self.assertEqual(
+            _items,
+            [
+                TaskChunk(range(0, 4)),
+                TaskChunk(range(4, 8)),
+                TaskChunk(range(8, 10)),
+                None,
+                None,
+            ],
+        )
+
+    def test_queue_pending_tasks__adaptive(self):
+        self._wc = WorkerController(n_workers=2, chunk_size=2, adaptive_chunks=True)
+        self._wc._to_process = list(range(100)) + [None, None]
+        self._wc._queue_pending_tasks()
+        # the number of tasks in the queue is limited in adaptive mode:
+        self.assertEqual(self._wc._chunks["n_in_flight"], 8)
+        self.assertEqual(len(self._wc._to_process), 94)
+
+    def test_queue_pending_tasks__adaptive_guided_end(self):
+        self._wc = WorkerController(n_workers=2, chunk_size=50, adaptive_chunks=True)
+        self._wc._to_process = list(range(10)) + [None, None]
+        self._wc._put_next_task_in_queue()
+        _item = self._wc._queues["queue_input"].get(timeout=1)
+        self.assertEqual(_item, TaskChunk(range(0, 3)))
+
+    def test_update_chunk_size__fast_tasks(self):
+        self._wc = WorkerController(chunk_size=4, adaptive_chunks=True)
+        self._wc._chunks["n_in_flight"] = 12
+        _chunk = TaskChunk(range(4), runtime=ADAPTIVE_CHUNK_TARGET_TIME / 100)
+        self._wc._update_chunk_size(_chunk)
+        self.assertEqual(self._wc.chunk_size, 8)
+        self.assertEqual(self._wc._chunks["n_in_flight"], 8)
+        for _ in range(20):
+            self._wc._update_chunk_size(_chunk)
+        self.assertEqual(self._wc.chunk_size, 400)
+        _chunk.runtime = ADAPTIVE_CHUNK_TARGET_TIME / 1e5
+        for _ in range(20):
+            self._wc._update_chunk_size(_chunk)
+        self.assertEqual(self._wc.chunk_size, ADAPTIVE_CHUNK_MAX_SIZE)
+
+    def test_update_chunk_size__slow_tasks(self):
+        self._wc = WorkerController(chunk_size=8, adaptive_chunks=True)
+        _chunk = TaskChunk(range(8), runtime=ADAPTIVE_CHUNK_TARGET_TIME * 4)
+        self._wc._update_chunk_size(_chunk)
+        self.assertEqual(self._wc.chunk_size, 2)
+
+    def test_update_chunk_size__not_adaptive(self):
+        self._wc = WorkerController(chunk_size=8, adaptive_chunks=False)
+        _chunk = TaskChunk(range(8), runtime=ADAPTIVE_CHUNK_TARGET_TIME * 4)
+        self._wc._update_chunk_size(_chunk)
+        self.assertEqual(self._wc.chunk_size, 8)
+
+    def test_get_and_emit_all_queue_items__w_chunks(self):
+        self._wc = WorkerController(chunk_size=3)
+        self._wc._queues["queue_output"].put([TaskChunk([0, 1, 2]), [5, 6, 7]])
+        self._wc._queues["queue_output"].put([3, 8])
+        self._wc._progress_target = 4
+        _spy = QtTest.QSignalSpy(self._wc.sig_results)
+        _spy_progress = QtTest.QSignalSpy(self._wc.sig_progress)
+        time.sleep(0.005)
+        self._wc._get_and_emit_all_queue_items()
+        if IS_QT6:
+            _results = [tuple(_spy.at(_i)) for _i in range(_spy.count())]
+            _progress = [_spy_progress.at(_i)[0] for _i in range(_spy_progress.count())]
+        else:
+            _results = [tuple(_item) for _item in _spy]
+            _progress = [_item[0] for _item in _spy_progress]
+        self.assertEqual(_results, [(0, 5), (1, 6), (2, 7), (3, 8)])
+        self.assertEqual(_progress, [0.25, 0.5, 0.75, 1])
+
+    def test_run__w_chunks(self):
+        _tasks = list(range(20))
+        self._wc = WorkerController(n_workers=2, chunk_size=4, adaptive_chunks=True)
+        self._wc.change_function(local_test_func, *(0, 0))
+        self._wc.add_tasks(_tasks)
+        self._wc.finalize_tasks()
+        _spy = QtTest.QSignalSpy(self._wc.sig_results)
+        self._wc.start()
+        self.wait_for_finish_signal(self._wc)
+        if IS_QT6:
+            _results = {_spy.at(_i)[0]: _spy.at(_i)[1] for _i in range(_spy.count())}
+        else:
+            _results = {_item[0]: _item[1] for _item in _spy}
+        self.assertEqual(_results, {_i: 3 * _i for _i in _tasks})
+
+    def test_task_scheduler__set(self):
+        self._wc = WorkerController(task_scheduler="ordinal")
+        self._wc.task_scheduler = "locality"
+        self.assertEqual(self._wc.task_scheduler, "locality")
+
+    def test_task_scheduler__set_wrong(self):
+        self._wc = WorkerController()
+        with self.assertRaises(ValueError):
+            self._wc.task_scheduler = "random"
+
+    def test_add_tasks__w_locality_keys(self):
+        self._wc = WorkerController()
+        self._wc.add_tasks([1, 2, 3], locality_keys=[0, 0, 1])
+        self.assertEqual(self._wc._locality_keys, {1: 0, 2: 0, 3: 1})
+        self._wc.reset_task_list()
+        self.assertEqual(self._wc._locality_keys, {})
+
+    def test_queue_pending_tasks__locality(self):
+        self._wc = WorkerController(
+            n_workers=2, chunk_size=3, adaptive_chunks=True, task_scheduler="locality"
+        )
+        self._wc._local_queues = [mp.Queue(), mp.Queue()]
+        self._wc.add_tasks(list(range(8)), locality_keys=[0, 0, 0, 1, 1, 1, 1, 1])
+        self._wc.add_tasks([None, None], are_stop_tasks=True)
+        self._wc._queue_pending_tasks()
+        self.assertEqual(self._wc._to_process, [])
+        _items = [
+            [_queue.get(timeout=1) for _ in range(_n)]
+            for _queue, _n in zip(self._wc._local_queues, [2, 3])
+        ]
+        self.assertEqual(_items[0], [TaskChunk([0, 1, 2]), None])
+        self.assertEqual(_items[1], [TaskChunk([3, 4, 5]), TaskChunk([6, 7]), None])
+
+    def test_run__locality(self):
+        _tasks = list(range(20))
+        self._wc = WorkerController(
+            n_workers=2, chunk_size=3, task_scheduler="locality"
+        )
+        self._wc.change_function(local_test_func, *(0, 0))
+        self._wc.add_tasks(_tasks, locality_keys=[_i // 7 for _i in _tasks])
+        self._wc.finalize_tasks()
+        _spy = QtTest.QSignalSpy(self._wc.sig_results)
+        self._wc.start()
+        self.wait_for_finish_signal(self._wc, timeout=30)
+        if IS_QT6:
+            _results = {_spy.at(_i)[0]: _spy.at(_i)[1] for _i in range(_spy.count())}
+        else:
+            _results = {_item[0]: _item[1] for _item in _spy}
+        self.assertEqual(_results, {_i: 3 * _i for _i in _tasks})
+
     def test_get_and_emit_all_queue_items(self):
         _res1 = 3
         _res2 = [1, 1]
@@ -236,6 +401,24 @@ class TestWorkerController(unittest.TestCase):
             self.assertEqual(len(_spy_signal), 1)
             self.assertEqual(_spy_signal[0][0], "::test::")
 
+    def test_get_and_emit_all_queue_items__w_run_ids(self):
+        self._wc = WorkerController()
+        self._wc._run_id = 5
+        self._wc._queues["queue_output"].put([0, 3, 4])
+        self._wc._queues["queue_output"].put([None, None, 4])
+        self._wc._queues["queue_output"].put([1, 6, 5])
+        self._wc._progress_target = 2
+        _spy = QtTest.QSignalSpy(self._wc.sig_results)
+        time.sleep(0.005)
+        self._wc._get_and_emit_all_queue_items()
+        if IS_QT6:
+            self.assertEqual(_spy.count(), 1)
+            self.assertEqual(list(_spy.at(0)), [1, 6])
+        else:
+            self.assertEqual(len(_spy), 1)
+            self.assertEqual(list(_spy[0]), [1, 6])
+        self.assertEqual(self._wc._workers_done, 0)
+
     def test_check_if_workers_done__no_signal(self):
         self._wc = WorkerController(n_workers=2)
         self._wc.flags["running"] = True
@@ -0,0 +1,236 @@
+# This file is part of pydidas.
+#
+# Copyright 2026, Helmholtz-Zentrum Hereon
+# SPDX-License-Identifier: GPL-3.0-only
+#
+# pydidas is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# Pydidas is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pydidas. If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for pydidas modules."""
+
+__author__ = "Malte Storm"
+__copyright__ = "Copyright 2026, Helmholtz-Zentrum Hereon"
+__license__ = "GPL-3.0-only"
+__maintainer__ = "Malte Storm"
+__status__ = "Production"
+
+
+import multiprocessing as mp
+import threading
+import time
+import unittest
+from unittest import mock
+
+import pytest
+from qtpy import QtTest
+
+from pydidas import IS_QT6
+from pydidas.multiprocessing import WorkerController, WorkerPool
+from pydidas.multiprocessing.worker_pool import (
+    MP_CONFIG_PLACEHOLDER,
+    PoolRun,
+    pool_worker_func,
+)
+
+
+def _state_test_func(multiprocessing_config, offset):
+    _state = multiprocessing_config["worker_state"]
+    _state["n_calls"] = _state.get("n_calls", 0) + 1
+    multiprocessing_config["queue_output"].put(
+        (multiprocessing_config["run_id"], _state["n_calls"], offset)
+    )
+
+
+def _failing_test_func(multiprocessing_config):
+    raise ValueError("Test error")
+
+
+def _sleeping_test_func(multiprocessing_config):
+    time.sleep(30)
+
+
+def local_test_func(index, *args):
+    return 3 * index + sum(args)
+
+
+class TestPoolWorkerFunc(unittest.TestCase):
+    def setUp(self):
+        self._mp_config = {
+            "queue_run": mp.Queue(),
+            "queue_output": mp.Queue(),
+            "queue_shutting_down": mp.Queue(),
+            "queue_finished": mp.Queue(),
+        }
+        self._thread = threading.Thread(
+            target=pool_worker_func, args=(self._mp_config,)
+        )
+
+    def tearDown(self):
+        if self._thread.is_alive():
+            self._mp_config["queue_run"].put(None)
+            self._thread.join(timeout=1)
+        for _queue in self._mp_config.values():
+            _queue.close()
+
+    def test_run__keeps_worker_state(self):
+        self._thread.start()
+        for _run_id in [1, 2]:
+            self._mp_config["queue_run"].put(
+                PoolRun(_run_id, _state_test_func, (MP_CONFIG_PLACEHOLDER, 5), {})
+            )
+        self.assertEqual(self._mp_config["queue_output"].get(timeout=1), (1, 1, 5))
+        self.assertEqual(self._mp_config["queue_output"].get(timeout=1), (2, 2, 5))
+        self.assertEqual(self._mp_config["queue_finished"].get(timeout=1), 1)
+        self.assertEqual(self._mp_config["queue_finished"].get(timeout=1), 2)
+        self.assertTrue(self._thread.is_alive())
+
+    def test_run__terminate(self):
+        self._thread.start()
+        self._mp_config["queue_run"].put(None)
+        self._thread.join(timeout=1)
+        self.assertFalse(self._thread.is_alive())
+
+    def test_run__exception(self):
+        self._thread.start()
+        self._mp_config["queue_run"].put(
+            PoolRun(3, _failing_test_func, (MP_CONFIG_PLACEHOLDER,), {})
+        )
+        self.assertEqual(self._mp_config["queue_shutting_down"].get(timeout=1), 3)
+        self.assertEqual(self._mp_config["queue_finished"].get(timeout=1), 3)
+        self.assertTrue(self._thread.is_alive())
+
+
+@pytest.mark.slow
+class TestWorkerPool(unittest.TestCase):
+    def setUp(self):
+        WorkerPool.reset_instance()
+        self._pool = WorkerPool()
+
+    def tearDown(self):
+        if hasattr(self, "_wc") and isinstance(self._wc, WorkerController):
+            self._wc.exit()
+        self._pool.shutdown()
+        WorkerPool.reset_instance()
+
+    def wait_for_finish_signal(self, spy, timeout=60):
+        t0 = time.time()
+        while (spy.count() if IS_QT6 else len(spy)) == 0:
+            if time.time() - t0 >= timeout:
+                raise TimeoutError
+            time.sleep(0.05)
+
+    def run_controller(self, tasks, **kwargs):
+        self._wc = WorkerController(n_workers=2, worker_pool=self._pool, **kwargs)
+        self._wc.change_function(local_test_func, 1)
+        self._wc.add_tasks(tasks, locality_keys=[_task // 3 for _task in tasks])
+        self._wc.finalize_tasks()
+        _spy = QtTest.QSignalSpy(self._wc.sig_results)
+        _spy_finished = QtTest.QSignalSpy(self._wc.finished)
+        self._wc.start()
+        self.wait_for_finish_signal(_spy_finished)
+        self._wc.exit()
+        if IS_QT6:
+            return {_spy.at(_i)[0]: _spy.at(_i)[1] for _i in range(_spy.count())}
+        return {_item[0]: _item[1] for _item in _spy}
+
+    def test_init(self):
+        self.assertEqual(self._pool.n_workers, 0)
+        self.assertFalse(self._pool.is_running)
+
+    def test_queues(self):
+        self.assertIn("queue_input", self._pool.queues)
+        self.assertIs(
+            self._pool.mp_kwargs["queue_input"], self._pool.queues["queue_input"]
+        )
+
+    def test_start(self):
+        _workers = self._pool.start(2)
+        self.assertEqual(len(_workers), 2)
+        self.assertTrue(self._pool.is_running)
+
+    def test_start__local_queues(self):
+        self._pool.start(3)
+        self.assertEqual(len(self._pool.local_queues), 3)
+
+    def test_start__same_n_workers(self):
+        _workers = self._pool.start(2)
+        self.assertEqual(self._pool.start(2), _workers)
+
+    def test_start__new_n_workers(self):
+        self._pool.start(2)
+        _workers = self._pool.start(3)
+        self.assertEqual(len(_workers), 3)
+        self.assertTrue(self._pool.is_running)
+
+    def test_stop_workers(self):
+        _workers = self._pool.start(2)
+        self._pool.stop_workers()
+        self.assertEqual(self._pool.n_workers, 0)
+        self.assertFalse(any(_worker.is_alive() for _worker in _workers))
+
+    def test_submit_run(self):
+        self._pool.start(2)
+        _run_ids = [
+            self._pool.submit_run(_state_test_func, (self._pool.mp_kwargs, 2), {})
+            for _ in range(2)
+        ]
+        self.assertEqual(_run_ids, [1, 2])
+        _results = sorted(
+            self._pool.queues["queue_output"].get(timeout=60) for _ in range(4)
+        )
+        self.assertEqual(_results, [(1, 1, 2), (1, 1, 2), (2, 2, 2), (2, 2, 2)])
+
+    def test_clear_queues(self):
+        for _key in self._pool.queues:
+            self._pool.queues[_key].put(12)
+        time.sleep(0.05)
+        self._pool.clear_queues()
+        for _key in ["queue_input", "queue_output", "queue_stop", "queue_signal"]:
+            self.assertTrue(self._pool.queues[_key].empty())
+
+    def test_worker_controller__multiple_runs(self):
+        _results = self.run_controller(list(range(8)))
+        _pids = [_worker.pid for _worker in self._pool.workers]
+        self.assertEqual(_results, {_i: 3 * _i + 1 for _i in range(8)})
+        _results = self.run_controller(list(range(4, 12)))
+        self.assertEqual(_results, {_i: 3 * _i + 1 for _i in range(4, 12)})
+        self.assertEqual([_worker.pid for _worker in self._pool.workers], _pids)
+        self.assertTrue(self._pool.is_running)
+
+    def test_worker_controller__release_busy_workers(self):
+        self._wc = WorkerController(n_workers=2, worker_pool=self._pool)
+        self._wc._workers = self._pool.start(2)
+        _old_output_queue = self._pool.queues["queue_output"]
+        self._wc._run_id = self._pool.submit_run(
+            _sleeping_test_func, (self._pool.mp_kwargs,), {}
+        )
+        with mock.patch(
+            "pydidas.multiprocessing.worker_controller.POOL_RUN_FINISH_TIMEOUT", 0.2
+        ):
+            self._wc._release_pool_workers()
+        self.assertFalse(self._pool.is_running)
+        self.assertIs(self._wc._queues, self._pool.queues)
+        self.assertIsNot(self._wc._queues["queue_output"], _old_output_queue)
+        self.assertIsNone(self._wc._run_id)
+        self._wc.exit()
+        _results = self.run_controller(list(range(6)))
+        self.assertEqual(_results, {_i: 3 * _i + 1 for _i in range(6)})
+
+    def test_worker_controller__locality_scheduler(self):
+        for _tasks in [list(range(10)), list(range(5, 12))]:
+            _results = self.run_controller(_tasks, task_scheduler="locality")
+            self.assertEqual(_results, {_i: 3 * _i + 1 for _i in _tasks})
+        self.assertTrue(self._pool.is_running)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -306,6 +306,51 @@ def test_execute__multiple_frame_stack(
     assert isinstance(_data, Dataset)
 
 
+@pytest.mark.parametrize(
+    "frame_index, expected", [(0, (0, 0)), (4, (1, 0)), (11, (2, 0))]
+)
+def test_get_frame_locality_key(reset_scan, frame_index, expected):
+    plugin = _TestInputPlugin()
+    plugin.set_param_value("_counted_images_per_file", 4)
+    assert plugin.get_frame_locality_key(frame_index) == expected
+
+
+def test_get_locality_key(reset_scan):
+    SCAN.set_param_value("frame_indices_per_scan_point", 3)
+    plugin = _TestInputPlugin()
+    plugin.set_param_value("_counted_images_per_file", 4)
+    assert [plugin.get_locality_key(_i) for _i in range(4)] == [
+        (0, 0),
+        (0, 0),
+        (1, 0),
+        (2, 0),
+    ]
+
+
+def test_io_statistics__init():
+    plugin = _TestInputPlugin()
+    assert plugin.io_statistics == {
+        "n_frames": 0,
+        "file_opens": 0,
+        "chunk_cache_hits": 0,
+    }
+
+
+def test_io_statistics__execute(reset_scan):
+    plugin = _TestInputPlugin()
+    plugin.pre_execute()
+    plugin.set_param_value("_counted_images_per_file", 3)
+    for _ordinal in [0, 1, 2, 3, 4, 9]:
+        plugin.execute(_ordinal)
+    assert plugin.io_statistics == {
+        "n_frames": 6,
+        "file_opens": 3,
+        "chunk_cache_hits": 3,
+    }
+    plugin.reset_io_statistics()
+    assert plugin.io_statistics["n_frames"] == 0
+
+
 def test_copy():
     plugin = _TestInputPlugin()
     copy = plugin.copy()
@@ -313,5 +358,91 @@ def test_copy():
     assert copy._SCAN == SCAN
 
 
+def test_configure_prefetching():
+    plugin = _TestInputPlugin()
+    assert plugin.prefetch_depth == 0
+    plugin.configure_prefetching(6, 32)
+    assert plugin.prefetch_depth == 6
+    assert plugin._prefetcher.max_size == 32
+    assert plugin._prefetcher._n_threads == 4
+    plugin.configure_prefetching(0)
+    assert plugin.prefetch_depth == 0
+    assert plugin._prefetcher is None
+
+
+def test_set_upcoming_ordinals():
+    plugin = _TestInputPlugin()
+    plugin.set_upcoming_ordinals(range(10))
+    assert plugin._upcoming_ordinals == []
+    plugin.configure_prefetching(3)
+    plugin.set_upcoming_ordinals(range(10))
+    assert plugin._upcoming_ordinals == [0, 1, 2]
+    plugin.configure_prefetching(0)
+
+
+@pytest.mark.parametrize("i_per_point", [1, 3])
+def test_execute__prefetching(reset_scan, i_per_point):
+    SCAN.set_param_value("frame_indices_per_scan_point", i_per_point)
+    plugin = _TestInputPlugin()
+    plugin.pre_execute()
+    plugin.configure_prefetching(2)
+    _ordinals = [0, 4, 2, 7]
+    for _index, _ordinal in enumerate(_ordinals):
+        plugin.set_upcoming_ordinals(_ordinals[_index + 1 :])
+        _data, _kwargs = plugin.execute(_ordinal, global_index=_ordinal)
+        assert _data.mean() == _ordinal * i_per_point
+        assert _data.data_label == "Test data"
+        assert _kwargs == {"global_index": _ordinal}
+    assert plugin.prefetch_statistics == {"hits": 4, "misses": 0, "discarded": 0}
+    assert plugin.io_statistics["n_frames"] == 4
+    plugin.configure_prefetching(0)
+
+
+@pytest.mark.parametrize("multi_frame", ["Average", "Stack"])
+def test_execute__prefetching_multiple_frames(reset_scan, multi_frame):
+    SCAN.set_param_value("scan_frames_per_point", 3)
+    SCAN.set_param_value("scan_multi_frame_handling", multi_frame)
+    plugin = _TestInputPlugin()
+    plugin.pre_execute()
+    _ref = [plugin.execute(_ordinal)[0] for _ordinal in range(3)]
+    plugin.configure_prefetching(2)
+    for _ordinal in range(3):
+        plugin.set_upcoming_ordinals(range(_ordinal + 1, 3))
+        _data, _kwargs = plugin.execute(_ordinal)
+        assert np.allclose(_data, _ref[_ordinal])
+        assert _kwargs["frames"] == [_ordinal + _i for _i in range(3)]
+    assert plugin.prefetch_statistics["hits"] == 9
+    plugin.configure_prefetching(0)
+
+
+def test_execute__prefetching_with_kwargs(reset_scan):
+    plugin = _TestInputPlugin()
+    plugin.pre_execute()
+    plugin.configure_prefetching(2)
+    plugin.set_upcoming_ordinals([1, 2])
+    _data, _kwargs = plugin.execute(0, roi=None)
+    assert _kwargs == {"roi": None}
+    assert plugin.prefetch_statistics == {"hits": 0, "misses": 0, "discarded": 0}
+    assert plugin._prefetcher.prefetched_frames == []
+    plugin.configure_prefetching(0)
+
+
+def test_copy__w_prefetching():
+    plugin = _TestInputPlugin()
+    plugin.configure_prefetching(2)
+    _copy = plugin.copy()
+    assert _copy._prefetcher is None
+    assert _copy.prefetch_depth == 0
+    plugin.configure_prefetching(0)
+
+
+def test_pickle__w_prefetching():
+    plugin = InputPlugin()
+    plugin.configure_prefetching(2)
+    _new = pickle.loads(pickle.dumps(plugin))
+    assert _new._prefetcher is None
+    plugin.configure_prefetching(0)
+
+
 if __name__ == "__main__":
     pytest.main()
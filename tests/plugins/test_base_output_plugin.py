@@ -24,17 +24,26 @@ __maintainer__ = "Malte Storm"
 __status__ = "Production"
 
 
+import shutil
+import tempfile
 import unittest
+from pathlib import Path
 
+import numpy as np
+
+from pydidas.core import AsyncWriteQueue
 from pydidas.core.constants import OUTPUT_PLUGIN
 from pydidas.plugins import OutputPlugin
 from pydidas.unittest_objects import create_plugin_class
 
 
 class TestBaseOutputPlugin(unittest.TestCase):
-    def setUp(self): ...
+    def setUp(self):
+        self._path = Path(tempfile.mkdtemp())
 
-    def tearDown(self): ...
+    def tearDown(self):
+        OutputPlugin.configure_async_output(0)
+        shutil.rmtree(self._path)
 
     def test_class(self):
         plugin = create_plugin_class(OUTPUT_PLUGIN)
@@ -51,6 +60,43 @@ class TestBaseOutputPlugin(unittest.TestCase):
             with self.subTest(plugin=_plugin):
                 self.assertFalse(_plugin.is_basic_plugin())
 
+    def test_configure_async_output(self):
+        OutputPlugin.configure_async_output(8, 2)
+        self.assertIsInstance(OutputPlugin._write_queue, AsyncWriteQueue)
+        self.assertEqual(OutputPlugin._write_queue.max_size, 8)
+        self.assertEqual(OutputPlugin._write_queue.max_batch_size, 2)
+
+    def test_configure_async_output__unchanged(self):
+        OutputPlugin.configure_async_output(8, 2)
+        _queue = OutputPlugin._write_queue
+        OutputPlugin.configure_async_output(8, 2)
+        self.assertIs(OutputPlugin._write_queue, _queue)
+
+    def test_configure_async_output__disable(self):
+        OutputPlugin.configure_async_output(8, 2)
+        OutputPlugin.configure_async_output(0)
+        self.assertIsNone(OutputPlugin._write_queue)
+        self.assertEqual(OutputPlugin.get_output_statistics(), {})
+
+    def test_write_output__sync(self):
+        plugin = create_plugin_class(OUTPUT_PLUGIN)()
+        _data = np.arange(5.0)
+        plugin.write_output(np.savetxt, self._path / "sync.txt", _data)
+        self.assertTrue(np.allclose(np.loadtxt(self._path / "sync.txt"), _data))
+
+    def test_write_output__async(self):
+        OutputPlugin.configure_async_output(8, 2)
+        plugin = create_plugin_class(OUTPUT_PLUGIN)()
+        _data = np.arange(5.0)
+        for _i in range(4):
+            plugin.write_output(np.savetxt, self._path / f"async_{_i}.txt", _data)
+        _data[:] = -1
+        OutputPlugin.flush_output()
+        for _i in range(4):
+            _written = np.loadtxt(self._path / f"async_{_i}.txt")
+            self.assertTrue(np.allclose(_written, np.arange(5.0)))
+        self.assertEqual(OutputPlugin.get_output_statistics()["n_items"], 4)
+
 
 if __name__ == "__main__":
     unittest.main()
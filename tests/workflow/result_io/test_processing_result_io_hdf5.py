@@ -26,6 +26,8 @@ __status__ = "Production"
 
 import random
 import shutil
+import subprocess
+import sys
 from numbers import Integral, Real
 from pathlib import Path
 
@@ -38,14 +40,21 @@ from pydidas.contexts import (
     Scan,
     ScanContext,
 )
-from pydidas.core import Dataset, UserConfigError
+from pydidas.core import Dataset, PydidasQsettings, UserConfigError
 from pydidas.core.utils import get_random_string
 from pydidas.core.utils.hdf5 import read_and_decode_hdf5_dataset
 from pydidas.unittest_objects import create_hdf5_results_file
 from pydidas.unittest_objects.create_dataset_ import create_dataset
 from pydidas.workflow import ProcessingResults, WorkflowTree
 from pydidas.workflow.result_io import ProcessingResultIoMeta
-from pydidas.workflow.result_io.processing_result_io_hdf5 import ProcessingResultIoHdf5
+from pydidas.workflow.result_io.processing_result_io_hdf5 import (
+    SINGLE_RESULT_FILENAME,
+    ProcessingResultIoHdf5,
+    get_chunk_shape,
+    get_compression_kwargs,
+    get_consecutive_runs,
+    node_group_name,
+)
 
 
 TREE = WorkflowTree()
@@ -228,6 +237,42 @@ def setup_test_files(empty_temp_path, default_shapes):
         "data_units": default_shapes["data_units"],
         "filenames": default_shapes["filenames"],
     }
+    H5SAVER.close_files()
+
+
+@pytest.fixture
+def write_settings():
+    """Fixture to set the HDF5 write settings and restore them afterwards."""
+    _qsettings = PydidasQsettings()
+    _keys = [
+        "hdf5_compression",
+        "hdf5_flush_n_frames",
+        "hdf5_flush_interval",
+        "hdf5_single_file",
+    ]
+    _original = {
+        _key: _qsettings.q_settings_get(f"global/{_key}", str) for _key in _keys
+    }
+
+    def _set(**kwargs):
+        for _key, _value in kwargs.items():
+            _qsettings.set_value(f"global/{_key}", _value)
+
+    yield _set
+    for _key, _value in _original.items():
+        if _value is None:
+            _qsettings.remove(f"global/{_key}")
+        else:
+            _qsettings.set_value(f"global/{_key}", _value)
+
+
+def _prepare_files(result_dir, shapes):
+    """Helper function to prepare the files for the given shapes."""
+    _node_infos = {
+        _node: {"node_label": f"node{_node}", "shape": _shape, "plugin_name": "P"}
+        for _node, _shape in shapes.items()
+    }
+    H5SAVER.prepare_files_and_directories(result_dir, _node_infos, scan_context=SCAN)
 
 
 def get_datasets(shapes, start_dim=3):
@@ -395,6 +440,245 @@ def test_export_frame_to_file(setup_test_files):
         assert np.allclose(_written_data, _data[_node_id].array)
 
 
+@pytest.mark.parametrize(
+    "indices, row_length, expected",
+    [
+        [[], 5, []],
+        [[3], 5, [(3, 1)]],
+        [[0, 1, 2, 3], 5, [(0, 4)]],
+        [[0, 1, 3, 4], 5, [(0, 2), (3, 2)]],
+        [[3, 4, 5, 6, 7], 5, [(3, 2), (5, 3)]],
+        [[4, 5, 10, 11], 1, [(4, 1), (5, 1), (10, 1), (11, 1)]],
+    ],
+)
+def test_get_consecutive_runs(indices, row_length, expected):
+    assert get_consecutive_runs(indices, row_length) == expected
+
+
+def test_export_frames_to_file(setup_test_files):
+    _result_dir: Path = setup_test_files["result_dir"]  # type: ignore[type]
+    shapes = setup_test_files["shapes"]
+    filenames = setup_test_files["filenames"]
+    _indices = [3, 4, 5, 6, 7, 12, 17]
+    _frames = {_index: get_datasets(shapes) for _index in _indices}
+    H5SAVER.export_frames_to_file(_frames, scan_context=SCAN)
+    H5SAVER.close_files()
+    for _node_id in shapes:
+        with h5py.File(_result_dir / filenames[_node_id], "r") as _file:
+            _dset = _file["entry/data/data"]
+            for _index in _indices:
+                _written = _dset[SCAN.get_indices_from_ordinal(_index)]
+                assert np.allclose(_written, _frames[_index][_node_id].array)
+            assert np.all(_dset[SCAN.get_indices_from_ordinal(8)] == 0)
+            assert _file["entry/data"].attrs["signal"] == "data"
+
+
+def test_export_frames_to_file__empty(setup_test_files):
+    H5SAVER.export_frames_to_file({})
+    assert not H5SAVER._metadata_written
+
+
+@pytest.mark.parametrize(
+    "shape, expected",
+    [
+        [(3, 7, 5, 12, 6), (1, 1, 1, 12, 6)],
+        [(3, 7, 5), (1, 1, 1)],
+        [(4, 12), (4, 12)],
+        [(), None],
+        [(3, 0, 5), None],
+    ],
+)
+def test_get_chunk_shape(shape, expected):
+    _scan = _make_scan_with_size1_dims(3)
+    assert get_chunk_shape(shape, _scan) == expected
+
+
+def test_get_chunk_shape__squeezed_scan():
+    _scan = _make_scan_with_size1_dims(3, 1)
+    assert get_chunk_shape((3, 5, 12), _scan) == (1, 1, 12)
+    assert get_chunk_shape((3, 1, 5, 12), _scan) == (1, 1, 1, 12)
+
+
+def test_get_chunk_shape__too_large():
+    _scan = _make_scan_with_size1_dims(1)
+    assert get_chunk_shape((3, 2**15, 2**15), _scan, np.float64) is True
+
+
+@pytest.mark.parametrize("compression", ["None", "gzip", "lzf", "lz4", "zstd"])
+def test_get_compression_kwargs(compression):
+    _kwargs = get_compression_kwargs(compression)
+    if compression == "None":
+        assert _kwargs == {}
+    else:
+        assert "compression" in _kwargs
+
+
+@pytest.mark.parametrize("compression", ["None", "gzip", "lzf", "bitshuffle-lz4"])
+def test_create_file__chunks_and_compression(
+    empty_temp_path, write_settings, compression
+):
+    write_settings(hdf5_compression=compression)
+    _shapes = {1: SCAN.shape + (12, 7), 2: SCAN.shape}
+    _prepare_files(empty_temp_path, _shapes)
+    H5SAVER.close_files()
+    for _node_id, _shape in _shapes.items():
+        with h5py.File(empty_temp_path / H5SAVER._filenames[_node_id], "r") as _file:
+            _dset = _file["entry/data/data"]
+            assert _dset.chunks == (1,) * SCAN.ndim + _shape[SCAN.ndim :]
+            _n_filters = _dset.id.get_create_plist().get_nfilters()
+            assert (_n_filters == 0) == (compression == "None")
+
+
+def test_export_frame_to_file__compressed_roundtrip(empty_temp_path, write_settings):
+    write_settings(hdf5_compression="gzip")
+    _shapes = {1: SCAN.shape + (12, 7)}
+    _prepare_files(empty_temp_path, _shapes)
+    _data = get_datasets(_shapes, start_dim=SCAN.ndim)
+    for _index in range(SCAN.n_points):
+        H5SAVER.export_frame_to_file(_index, _data)
+    H5SAVER.close_files()
+    with h5py.File(empty_temp_path / H5SAVER._filenames[1], "r") as _file:
+        _written = _file["entry/data/data"][()]
+    assert np.allclose(_written, _data[1].array)
+
+
+def test_export_frame_to_file__persistent_handle(setup_test_files):
+    _data = get_datasets(setup_test_files["shapes"])
+    _handles = {_id: H5SAVER._get_file(_id) for _id in setup_test_files["shapes"]}
+    H5SAVER.export_frame_to_file(0, _data)
+    H5SAVER.export_frame_to_file(1, _data)
+    for _id, _handle in _handles.items():
+        assert H5SAVER._files[H5SAVER._filenames[_id]] is _handle
+        assert _handle.id.valid
+
+
+def test_export_frame_to_file__flush_after_n_frames(empty_temp_path, write_settings):
+    write_settings(hdf5_flush_n_frames=3, hdf5_flush_interval=1000.0)
+    _prepare_files(empty_temp_path, {1: SCAN.shape + (5,)})
+    _data = get_datasets({1: SCAN.shape + (5,)}, start_dim=SCAN.ndim)
+    H5SAVER.flush_files()
+    for _index in range(2):
+        H5SAVER.export_frame_to_file(_index, _data)
+    assert H5SAVER._write_config["n_unflushed"] == 2
+    H5SAVER.export_frame_to_file(2, _data)
+    assert H5SAVER._write_config["n_unflushed"] == 0
+
+
+def test_export_frame_to_file__flush_after_interval(empty_temp_path, write_settings):
+    write_settings(hdf5_flush_n_frames=1000, hdf5_flush_interval=0.0)
+    _prepare_files(empty_temp_path, {1: SCAN.shape + (5,)})
+    _data = get_datasets({1: SCAN.shape + (5,)}, start_dim=SCAN.ndim)
+    H5SAVER.export_frame_to_file(0, _data)
+    assert H5SAVER._write_config["n_unflushed"] == 0
+
+
+def test_close_files(setup_test_files):
+    _handles = [H5SAVER._get_file(_id) for _id in setup_test_files["shapes"]]
+    H5SAVER.close_files()
+    assert H5SAVER._files == {}
+    for _handle in _handles:
+        assert not _handle.id.valid
+
+
+def test_get_file__reopens_closed_file(setup_test_files):
+    H5SAVER.close_files()
+    _file = H5SAVER._get_file(1)
+    assert _file.id.valid
+    assert _file.mode == "r+"
+
+
+def test_export_full_data_to_file__closes_files(setup_test_files):
+    _data = {
+        _id: create_dataset(len(_shape), shape=_shape)
+        for _id, _shape in setup_test_files["shapes"].items()
+    }
+    H5SAVER.export_full_data_to_file(_data, SCAN)
+    assert H5SAVER._files == {}
+
+
+def test_meta_close_active_savers(setup_test_files):
+    META.set_active_savers_and_title(["HDF5"])
+    _handle = H5SAVER._get_file(1)
+    META.flush_active_savers()
+    assert _handle.id.valid
+    META.close_active_savers()
+    assert not _handle.id.valid
+    META.set_active_savers_and_title([])
+
+
+@pytest.mark.parametrize("node_id, expected", [[None, "entry"], [3, "entry/node_03"]])
+def test_node_group_name(node_id, expected):
+    assert node_group_name(node_id) == expected
+
+
+def test_get_filenames_from_labels__single_file(write_settings):
+    write_settings(hdf5_single_file=True)
+    _names = H5SAVER.get_filenames_from_labels({1: "a", 4: ""})
+    assert _names == {1: SINGLE_RESULT_FILENAME, 4: SINGLE_RESULT_FILENAME}
+
+
+def test_single_file__layout(empty_temp_path, write_settings):
+    write_settings(hdf5_single_file=True)
+    _shapes = {1: SCAN.shape + (12, 7), 2: SCAN.shape + (23,)}
+    _prepare_files(empty_temp_path, _shapes)
+    H5SAVER.close_files()
+    assert [_f.name for _f in empty_temp_path.iterdir()] == [SINGLE_RESULT_FILENAME]
+    with h5py.File(empty_temp_path / SINGLE_RESULT_FILENAME, "r") as _file:
+        assert _file["entry"].attrs["default"] == "node_01"
+        assert "data" not in _file["entry"]
+        assert "workflow" in _file["entry/pydidas_config"]
+        assert "scan_title" in _file["entry"]
+        for _node_id, _shape in _shapes.items():
+            _group = _file[f"entry/node_{_node_id:02d}"]
+            assert _group.attrs["NX_class"] == "NXsubentry"
+            assert read_and_decode_hdf5_dataset(_group["node_id"]) == _node_id
+            assert _group["data/data"].shape == _shape
+            assert "pydidas_config" not in _group
+
+
+def test_single_file__swmr_reader_sees_partial_results(empty_temp_path, write_settings):
+    write_settings(hdf5_single_file=True, hdf5_flush_n_frames=1)
+    _shapes = {1: SCAN.shape + (5,), 2: SCAN.shape + (3, 2)}
+    _prepare_files(empty_temp_path, _shapes)
+    _data = get_datasets(_shapes, start_dim=SCAN.ndim)
+    H5SAVER.export_frame_to_file(0, _data)
+    assert H5SAVER._get_file(1).swmr_mode
+    _code = (
+        "import h5py, sys\n"
+        "with h5py.File(sys.argv[1], 'r', swmr=True) as f:\n"
+        "    print(f['entry/node_02/data/data'][0, 0, 0].sum())"
+    )
+    _result = subprocess.run(
+        [sys.executable, "-c", _code, str(empty_temp_path / SINGLE_RESULT_FILENAME)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert np.isclose(float(_result.stdout), _data[2].array.sum())
+    H5SAVER.close_files()
+
+
+def test_single_file__import_roundtrip(empty_temp_path, write_settings):
+    write_settings(hdf5_single_file=True)
+    _shapes = {1: SCAN.shape + (12, 7), 3: SCAN.shape + (23,)}
+    _prepare_files(empty_temp_path, _shapes)
+    _data = {
+        _id: create_dataset(len(_shape), shape=_shape)
+        for _id, _shape in _shapes.items()
+    }
+    H5SAVER.export_full_data_to_file(_data, SCAN)
+    _fname = empty_temp_path / SINGLE_RESULT_FILENAME
+    assert H5SAVER.get_node_ids_in_container(_fname) == [1, 3]
+    _imported, _node_info, _scan, _, _ = META.import_data_from_directory(
+        empty_temp_path
+    )
+    assert set(_imported) == {1, 3}
+    for _id in _shapes:
+        assert np.allclose(_imported[_id], _data[_id])
+        assert _node_info[_id]["node_label"] == f"node{_id}"
+    assert _scan.shape == SCAN.shape
+
+
 def test_import_results_from_file(setup_module_data):
     _fname: Path = setup_module_data["import_test_filename"]  # type: ignore[type]
     _data, _node_info, _scan, _exp, _tree = H5SAVER.import_results_from_file(_fname)
@@ -38,7 +38,7 @@ from pydidas import unittest_objects
 from pydidas.contexts import DiffractionExperiment
 from pydidas.contexts.diff_exp import DiffractionExperimentContext
 from pydidas.contexts.scan import Scan, ScanContext
-from pydidas.core import Dataset, UserConfigError
+from pydidas.core import Dataset, PydidasQsettings, UserConfigError
 from pydidas.core.utils import get_random_string
 from pydidas.plugins import PluginCollection
 from pydidas.unittest_objects import (
@@ -50,6 +50,7 @@ from pydidas.unittest_objects import (
 from pydidas.workflow import (
     ProcessingResults,
     ProcessingTree,
+    WorkflowProfile,
     WorkflowTree,
 )
 from pydidas.workflow.result_io import ProcessingResultIoMeta
@@ -172,6 +173,17 @@ class TestProcessingResults(unittest.TestCase):
     def get_node_output_path(self, node_id: int, extension: str = ".nxs") -> Path:
         return self._tmpdir.joinpath(self.get_node_output_filename(node_id, extension))
 
+    def set_result_backing_store(self, value: str) -> None:
+        _qsettings = PydidasQsettings()
+        _original = _qsettings.q_settings_get("global/result_backing_store", str)
+        _qsettings.set_value("global/result_backing_store", value)
+        if _original is None:
+            self.addCleanup(_qsettings.remove, "global/result_backing_store")
+        else:
+            self.addCleanup(
+                _qsettings.set_value, "global/result_backing_store", _original
+            )
+
     def create_standard_workflow_results(self) -> ProcessingResults:
         res = ProcessingResults()
         res.prepare_new_results()
@@ -239,6 +251,22 @@ class TestProcessingResults(unittest.TestCase):
         for _key in ["metadata_complete", "composites_created", "shapes_set"]:
             self.assertFalse(res._config[_key])
 
+    def test_clear_all_results__profile(self) -> None:
+        res = ProcessingResults()
+        res.store_profile(WorkflowProfile())
+        res.clear_all_results()
+        self.assertIsNone(res.get_profile())
+
+    def test_store_profile(self) -> None:
+        res = ProcessingResults()
+        _profile = WorkflowProfile()
+        res.store_profile(_profile)
+        self.assertIs(res.get_profile(), _profile)
+
+    def test_get_profile__not_set(self) -> None:
+        res = ProcessingResults()
+        self.assertIsNone(res.get_profile())
+
     def test_prepare_new_results(self) -> None:
         res = ProcessingResults()
         res._TREE.prepare_execution()
@@ -339,6 +367,190 @@ class TestProcessingResults(unittest.TestCase):
         self.assertEqual(res._composites[1].shape, SCAN.shape + self._input_shape)
         self.assertEqual(res._composites[2].shape, SCAN.shape + self._new_shape)
 
+    def test_create_composites__w_dtypes(self) -> None:
+        res = ProcessingResults()
+        res.prepare_new_results()
+        res.store_frame_shapes({1: self._input_shape, 2: self._new_shape})  # type: ignore[arg-type]
+        res.store_frame_dtypes({1: "<u2", 2: np.float64})
+        res._create_composites()
+        self.assertEqual(res._composites[1].dtype, np.uint16)
+        self.assertTrue(np.all(res._composites[1] == 0))
+        self.assertEqual(res._composites[2].dtype, np.float64)
+        self.assertTrue(np.all(np.isnan(res._composites[2])))
+        self.assertEqual(res.dtypes, {1: np.uint16, 2: np.float64})
+
+    def test_create_composites__memmap(self) -> None:
+        self.set_result_backing_store("memmap")
+        res = self.create_standard_workflow_results()
+        for _id, _composite in res._composites.items():
+            self.assertIsInstance(_composite, Dataset)
+            self.assertIsInstance(_composite.base, np.memmap)
+            self.assertEqual(_composite.shape, res.shapes[_id])
+            self.assertEqual(
+                _composite.data_label, self._plugin_metadata[_id]["data_label"]
+            )
+        self.assertTrue(np.all(res._composites[1][0, 0, 0] == 0))
+        _, _, _results = self.generate_test_datasets()
+        res.store_results(247, _results)
+        _scan_indices = SCAN.get_indices_from_ordinal(247)
+        self.assertTrue(np.allclose(_results[2], res.get_results(2)[_scan_indices]))
+
+    def test_create_composites__memmap_nan_for_missing_points(self) -> None:
+        self.set_result_backing_store("memmap")
+        res = self.create_standard_workflow_results()
+        _, _, _results = self.generate_test_datasets()
+        res.store_results(247, _results)
+        _scan_indices = SCAN.get_indices_from_ordinal(247)
+        _missing = np.ones(SCAN.shape, dtype=bool)
+        _missing[_scan_indices] = False
+        _data = res.get_results(2)
+        self.assertTrue(np.allclose(_results[2], _data[_scan_indices]))
+        self.assertTrue(np.all(np.isnan(np.asarray(_data)[_missing])))
+        self.assertFalse(np.any(res._unfilled_points[2]))
+        self.assertTrue(np.array_equal(res._unfilled_points[1], _missing))
+
+    def test_create_composites__memmap_store_after_fill(self) -> None:
+        self.set_result_backing_store("memmap")
+        res = self.create_standard_workflow_results()
+        _, _, _results = self.generate_test_datasets()
+        _subset = res.get_result_subset(1, 0, 0, 0)
+        self.assertTrue(np.all(np.isnan(_subset)))
+        res.store_results(0, _results)
+        res.store_results(247, _results)
+        for _ordinal in [0, 247]:
+            _scan_indices = SCAN.get_indices_from_ordinal(_ordinal)
+            self.assertTrue(np.allclose(_results[1], res.get_results(1)[_scan_indices]))
+
+    def test_create_composites__memmap_autosave_files(self) -> None:
+        self.set_result_backing_store("memmap")
+        res = ProcessingResults()
+        res.prepare_new_results()
+        res.store_frame_dtypes({1: np.float32, 2: np.float32})
+        res.store_frame_metadata(self._plugin_metadata)
+        res.prepare_files_for_saving(self._tmpdir, "HDF5")
+        _, _, _results = self.generate_test_datasets()
+        res.store_results(247, _results)
+        SAVER.export_frame_to_active_savers(247, _results)
+        SAVER.close_active_savers()
+        _scan_indices = SCAN.get_indices_from_ordinal(247)
+        for _id in [1, 2]:
+            self.assertIsInstance(res._composites[_id].base, np.memmap)
+            self.assertEqual(
+                Path(res._composites[_id].base.filename),
+                self.get_node_output_path(_id),
+            )
+            with h5py.File(self.get_node_output_path(_id), "r") as _file:
+                _dset = _file["entry/data/data"]
+                self.assertIsNone(_dset.chunks)
+                self.assertTrue(np.allclose(_dset[_scan_indices], _results[_id]))
+        res.get_results(1)
+        with h5py.File(self.get_node_output_path(1), "r") as _file:
+            self.assertTrue(np.all(np.isnan(_file["entry/data/data"][0, 0, 0])))
+            self.assertTrue(
+                np.allclose(_file["entry/data/data"][_scan_indices], _results[1])
+            )
+        SAVER.set_active_savers_and_title([])
+
+    def test_get_valid_points(self) -> None:
+        res = ProcessingResults()
+        res.prepare_new_results()
+        res.store_frame_dtypes({1: np.uint16, 2: np.float32})
+        res.store_frame_metadata(self._plugin_metadata)
+        _, _, _results = self.generate_test_datasets()
+        res.store_results(247, _results)
+        res.store_result_block(np.array([3, 5]), {1: np.ones((2,) + self._input_shape)})
+        _expected = np.zeros(SCAN.shape, dtype=bool)
+        _expected[np.unravel_index([3, 5, 247], SCAN.shape)] = True
+        self.assertTrue(np.array_equal(res.get_valid_points(1), _expected))
+        _expected[np.unravel_index([3, 5], SCAN.shape)] = False
+        self.assertTrue(np.array_equal(res.get_valid_points(2), _expected))
+        _data = np.asarray(res.get_results(1))
+        self.assertTrue(np.all(_data[~res.get_valid_points(1)] == 0))
+
+    def test_get_valid_points__is_copy(self) -> None:
+        res = self.create_standard_workflow_results()
+        res.get_valid_points(1)[()] = True
+        self.assertFalse(np.any(res.get_valid_points(1)))
+
+    def test_get_valid_points__no_results(self) -> None:
+        res = ProcessingResults()
+        res.prepare_new_results()
+        with self.assertRaises(UserConfigError):
+            res.get_valid_points(1)
+
+    def test_store_results__dtype_from_results(self) -> None:
+        res = ProcessingResults()
+        res.prepare_new_results()
+        _shape1, _shape2, _results = self.generate_test_datasets()
+        _results[1] = _results[1].astype(np.float64)
+        res.store_results(247, _results)
+        self.assertEqual(res._composites[1].dtype, np.float64)
+
+    def test_store_result_block(self) -> None:
+        res = self.create_standard_workflow_results()
+        _ordinals = np.array([3, 17, 247])
+        _results = {
+            1: np.random.random((3,) + self._input_shape),
+            2: np.random.random((3,) + self._new_shape),
+        }
+        res.store_result_block(_ordinals, _results)
+        for _i, _ordinal in enumerate(_ordinals):
+            _scan_indices = SCAN.get_indices_from_ordinal(_ordinal)
+            for _id in [1, 2]:
+                self.assertTrue(
+                    np.allclose(_results[_id][_i], res._composites[_id][_scan_indices])
+                )
+        self.assertTrue(np.isnan(res._composites[1][0, 0, 0, 0, 0]))
+
+    def test_store_results__updated_regions(self) -> None:
+        res = self.create_standard_workflow_results()
+        _emitted = []
+        res.sig_regions_updated.connect(_emitted.append)
+        res._config["region_update_interval"] = 1e6
+        _shape1, _shape2, _results = self.generate_test_datasets()
+        for _index in (247, 3):
+            res.store_results(_index, _results)
+        _indices = [SCAN.get_indices_from_ordinal(_i) for _i in (247, 3)]
+        _ref = tuple(
+            slice(
+                min(_i[_dim] for _i in _indices), max(_i[_dim] for _i in _indices) + 1
+            )
+            for _dim in range(SCAN.ndim)
+        )
+        self.assertEqual(len(_emitted), 1)
+        for _emitted_region, _scan_indices in [
+            (_emitted[0], _indices[0]),
+            (res.pop_updated_regions(), _indices[1]),
+        ]:
+            _point = tuple(slice(_i, _i + 1) for _i in _scan_indices)
+            self.assertEqual(_emitted_region, {1: _point, 2: _point})
+        res.store_results(247, _results)
+        res.store_results(3, _results)
+        self.assertEqual(res.pop_updated_regions(), {1: _ref, 2: _ref})
+        self.assertEqual(res.pop_updated_regions(), {})
+
+    def test_store_result_block__updated_regions(self) -> None:
+        res = self.create_standard_workflow_results()
+        _emitted = []
+        res.sig_regions_updated.connect(_emitted.append)
+        _ordinals = np.array([3, 17, 247])
+        res.store_result_block(
+            _ordinals, {1: np.random.random((3,) + self._input_shape)}
+        )
+        _indices = np.unravel_index(_ordinals, SCAN.shape)
+        _ref = tuple(slice(int(np.min(_i)), int(np.max(_i)) + 1) for _i in _indices)
+        self.assertEqual(_emitted, [{1: _ref}])
+        res.emit_updated_regions()
+        self.assertEqual(len(_emitted), 1)
+
+    def test_store_result_block__no_metadata(self) -> None:
+        res = ProcessingResults()
+        res.prepare_new_results()
+        with self.assertRaises(UserConfigError):
+            res.store_result_block(
+                np.array([0]), {1: np.zeros((1,) + self._input_shape)}
+            )
+
     def test_create_composites__shapes_unset(self) -> None:
         res = ProcessingResults()
         res.prepare_new_results()
@@ -534,6 +746,15 @@ class TestProcessingResults(unittest.TestCase):
             tuple(_i for _i in (np.prod(SCAN.shape),) + self._new_shape if _i > 1),
         )
 
+    def test_get_results_for_flattened_scan__is_view(self) -> None:
+        res = self.create_standard_workflow_results()
+        _labels = res._composites[1].axis_labels
+        _res = res.get_results_for_flattened_scan(1)
+        self.assertTrue(np.shares_memory(_res, res._composites[1]))
+        self.assertEqual(_res.axis_labels[0], "Chronological scan points")
+        self.assertEqual(res._composites[1].axis_labels, _labels)
+        self.assertEqual(res._composites[1].shape, SCAN.shape + self._input_shape)
+
     def test_get_result_subset__wrong_node_id(self) -> None:
         res = self.create_standard_workflow_results()
         _slice = (0, 0, 0, 0, 0)
@@ -587,6 +808,42 @@ class TestProcessingResults(unittest.TestCase):
         self.assertIsInstance(_res, np.ndarray)
         self.assertEqual(_res.shape, (self._scan_n[0], self._scan_n[2] - 2, 3))
 
+    def test_get_result_subset__slices_are_view(self) -> None:
+        res = self.create_standard_workflow_results()
+        res._composites[1][()] = np.random.random(res._composites[1].shape)
+        _slice = (slice(0, self._scan_n[0]), 0, slice(0, self._scan_n[2]), 0)
+        _res = res.get_result_subset(1, *_slice)
+        self.assertTrue(np.shares_memory(_res, res._composites[1]))
+        self.assertTrue(np.allclose(_res, res._composites[1][_slice]))
+        self.assertEqual(
+            _res.axis_labels,
+            {
+                0: res._composites[1].axis_labels[0],
+                1: res._composites[1].axis_labels[2],
+                2: res._composites[1].axis_labels[4],
+            },
+        )
+
+    def test_get_result_subset__mixed_indices_values(self) -> None:
+        res = self.create_standard_workflow_results()
+        _composite = res._composites[1]
+        _composite[()] = np.random.random(_composite.shape)
+        _indices = [np.arange(1, self._scan_n[0]), [0, 2], np.arange(2)]
+        _slices = (_indices[0], 1, slice(1, None), _indices[1], _indices[2])
+        _res = res.get_result_subset(1, *_slices)
+        _ref = _composite.array[
+            np.ix_(_indices[0], [1], np.arange(1, self._scan_n[2]), *_indices[1:])
+        ][:, 0]
+        self.assertFalse(np.shares_memory(_res, _composite))
+        self.assertEqual(_res.shape, _ref.shape)
+        self.assertTrue(np.allclose(_res, _ref))
+        self.assertTrue(
+            np.allclose(_res.axis_ranges[0], _composite.axis_ranges[0][_indices[0]])
+        )
+        self.assertTrue(
+            np.allclose(_res.axis_ranges[3], _composite.axis_ranges[4][_indices[2]])
+        )
+
     def test_get_result_subset__flatten_single_point(self) -> None:
         res = self.create_standard_workflow_results()
         _slices = (0, 0, 0)
@@ -854,6 +1111,85 @@ class TestProcessingResults(unittest.TestCase):
                 },
             )
 
+    def create_results_for_partitions(self) -> ProcessingResults:
+        SCAN.set_param_value("scan_dim0_n_points", 2)
+        res = self.create_standard_workflow_results()
+        res._composites[1][:] = np.random.random(res._composites[1].shape)
+        res._composites[2][:] = np.random.random(res._composites[2].shape)
+        return res
+
+    def test_export_partition_to_file(self) -> None:
+        res = self.create_results_for_partitions()
+        _ordinals = np.arange(5, 12)
+        _filename = self._tmpdir / "partition.nxs"
+        res.export_partition_to_file(_filename, _ordinals)
+        with h5py.File(_filename, "r") as _file:
+            self.assertEqual(_file["entry"].attrs["n_scan_points"], SCAN.n_points)
+            self.assertTrue(np.all(_file["entry/node_01/axis_0"][()] == _ordinals))
+            _data = _file["entry/node_02/data"][()]
+        self.assertEqual(_data.shape, (_ordinals.size,) + self._new_shape)
+        for _i, _ordinal in enumerate(_ordinals):
+            _scan_indices = SCAN.get_indices_from_ordinal(_ordinal)
+            self.assertTrue(np.allclose(_data[_i], res._composites[2][_scan_indices]))
+
+    def test_export_partition_to_file__memmap_missing_points(self) -> None:
+        self.set_result_backing_store("memmap")
+        res = self.create_standard_workflow_results()
+        _, _, _results = self.generate_test_datasets()
+        res.store_results(7, _results)
+        _filename = self._tmpdir / "partition.nxs"
+        res.export_partition_to_file(_filename, np.arange(5, 9))
+        with h5py.File(_filename, "r") as _file:
+            _data = _file["entry/node_01/data"][()]
+        self.assertTrue(np.allclose(_data[2], _results[1]))
+        self.assertTrue(np.all(np.isnan(_data[[0, 1, 3]])))
+        self.assertTrue(np.all(res._unfilled_points[1][1:]))
+
+    def test_export_partition_to_file__no_results(self) -> None:
+        res = ProcessingResults()
+        res.prepare_new_results()
+        with self.assertRaises(UserConfigError):
+            res.export_partition_to_file(self._tmpdir / "partition.nxs", [0, 1])
+
+    def test_import_partition_files(self) -> None:
+        res = self.create_results_for_partitions()
+        _filenames = [self._tmpdir / f"partition_{_i}.nxs" for _i in range(3)]
+        for _filename, _ordinals in zip(
+            _filenames, np.array_split(np.arange(SCAN.n_points), 3)
+        ):
+            res.export_partition_to_file(_filename, _ordinals)
+        res2 = ProcessingResults()
+        res2.import_partition_files(_filenames[::-1])
+        self.assertEqual(res2.shapes, res.shapes)
+        for _id in [1, 2]:
+            self.assertTrue(np.allclose(res2._composites[_id], res._composites[_id]))
+            self.assertEqual(res2._composites[_id].dtype, res._composites[_id].dtype)
+            self.assertEqual(
+                res2.get_result_metadata(_id)["axis_labels"],
+                res.get_result_metadata(_id)["axis_labels"],
+            )
+            self.assertEqual(res2.data_labels[_id], res.data_labels[_id])
+            self.assertEqual(res2.data_units[_id], res.data_units[_id])
+            for _dim, _range in res._composites[_id].axis_ranges.items():
+                self.assertTrue(
+                    np.allclose(res2._composites[_id].axis_ranges[_dim], _range)
+                )
+
+    def test_import_partition_files__missing_scan_points(self) -> None:
+        res = self.create_results_for_partitions()
+        _filename = self._tmpdir / "partition.nxs"
+        res.export_partition_to_file(_filename, np.arange(SCAN.n_points - 1))
+        with self.assertRaises(UserConfigError):
+            ProcessingResults().import_partition_files([_filename])
+
+    def test_import_partition_files__wrong_nodes(self) -> None:
+        res = self.create_results_for_partitions()
+        _filename = self._tmpdir / "partition.nxs"
+        res.export_partition_to_file(_filename, np.arange(SCAN.n_points))
+        TREE.delete_node_by_id(2)
+        with self.assertRaises(UserConfigError):
+            ProcessingResults().import_partition_files([_filename])
+
     def test_update_from_processing_results__wrong_type(self) -> None:
         res = ProcessingResults()
         with self.assertRaises(TypeError):
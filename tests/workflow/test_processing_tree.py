@@ -28,6 +28,7 @@ import copy
 import pickle
 import shutil
 import tempfile
+import tracemalloc
 import unittest
 from pathlib import Path
 
@@ -36,7 +37,14 @@ import numpy as np
 from pydidas import unittest_objects
 from pydidas.core import Dataset, Parameter, UserConfigError
 from pydidas.plugins import PluginCollection
-from pydidas.workflow import GenericNode, ProcessingTree, WorkflowNode, WorkflowTree
+from pydidas.workflow import (
+    GenericNode,
+    NodeProfile,
+    ProcessingTree,
+    WorkflowNode,
+    WorkflowProfile,
+    WorkflowTree,
+)
 
 
 COLL = PluginCollection()
@@ -237,10 +245,71 @@ class TestProcessingTree(unittest.TestCase):
         for _node in nodes[_depth]:
             self.assertTrue(_node.plugin._pre_executed)
 
+    def test_prepare_execution__skip_unchanged(self):
+        self._curr_tree.create_and_add_node(self.get_dummy_loader_plugin())
+        self._curr_tree.create_and_add_node(self.get_dummy_proc_plugin())
+        self._curr_tree.create_and_add_node(self.get_dummy_proc_plugin())
+        self._curr_tree.create_and_add_node(self.get_dummy_proc_plugin(), parent=1)
+        self._curr_tree.create_and_add_node(self.get_dummy_proc_plugin(), parent=1)
+        for _node in self._curr_tree.nodes.values():
+            _node.plugin.pre_execute_is_reusable = True
+        self._curr_tree.nodes[4].plugin.pre_execute_is_reusable = False
+        self._curr_tree.prepare_execution()
+        for _node in self._curr_tree.nodes.values():
+            _node.plugin._pre_executed = False
+        self._curr_tree.nodes[2].plugin.set_param_value("keep_results", True)
+        self._curr_tree.prepare_execution(forced=True, skip_unchanged=True)
+        self.assertTrue(self._curr_tree.nodes[0].plugin._pre_executed)
+        self.assertFalse(self._curr_tree.nodes[1].plugin._pre_executed)
+        self.assertTrue(self._curr_tree.nodes[2].plugin._pre_executed)
+        self.assertFalse(self._curr_tree.nodes[3].plugin._pre_executed)
+        self.assertTrue(self._curr_tree.nodes[4].plugin._pre_executed)
+
     def test_prepare_execution__empty_tree(self):
         with self.assertRaises(UserConfigError):
             self._curr_tree.prepare_execution()
 
+    def test_enable_profiling(self):
+        TREE.enable_profiling(True, trace_memory=False)
+        for _node in TREE.nodes.values():
+            self.assertIsInstance(_node.profile, NodeProfile)
+            self.assertEqual(_node.profile.label, _node.plugin.plugin_name)
+        TREE.enable_profiling(False)
+        for _node in TREE.nodes.values():
+            self.assertIsNone(_node.profile)
+
+    def test_enable_profiling__trace_memory(self):
+        if tracemalloc.is_tracing():
+            self.skipTest("tracemalloc is already tracing.")
+        TREE.enable_profiling(True, trace_memory=True)
+        self.assertTrue(tracemalloc.is_tracing())
+        TREE.enable_profiling(False)
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_enable_profiling__no_memory_tracing_by_default(self):
+        if tracemalloc.is_tracing():
+            self.skipTest("tracemalloc is already tracing.")
+        TREE.enable_profiling(True)
+        self.assertFalse(tracemalloc.is_tracing())
+        TREE.enable_profiling(False)
+
+    def test_get_profile__disabled(self):
+        _profile = TREE.get_profile()
+        self.assertIsInstance(_profile, WorkflowProfile)
+        self.assertEqual(_profile.nodes, {})
+
+    def test_get_profile(self):
+        TREE.enable_profiling(True, trace_memory=False)
+        TREE.prepare_execution()
+        TREE.execute_process(0)
+        _profile = TREE.get_profile()
+        TREE.enable_profiling(False)
+        self.assertEqual(set(_profile.nodes), {0, 7, 91})
+        self.assertEqual(_profile.n_processes, 1)
+        for _node_profile in _profile.nodes.values():
+            self.assertEqual(_node_profile.n_calls, 1)
+        self.assertEqual(_profile.nodes[0].io_time, _profile.nodes[0].runtime)
+
     def test_create_and_add_node__wrong_plugin(self):
         with self.assertRaises(TypeError):
             self._curr_tree.create_and_add_node(12)
@@ -378,6 +447,32 @@ class TestProcessingTree(unittest.TestCase):
                 self._curr_tree.nodes[_id].plugin, tree.nodes[_id].plugin.__class__
             )
 
+    def test_update_from_string__same_structure(self):
+        for _plugin in [self.get_dummy_loader_plugin(), self.get_dummy_proc_plugin()]:
+            self._curr_tree.create_and_add_node(_plugin)
+        _plugins = [_node.plugin for _node in self._curr_tree.nodes.values()]
+        _tree = ProcessingTree()
+        _tree.restore_from_string(self._curr_tree.export_to_string())
+        _tree.nodes[1].plugin.set_param_value("keep_results", True)
+        self._curr_tree.reset_tree_changed_flag()
+        self._curr_tree.update_from_string(_tree.export_to_string())
+        self.assertEqual(
+            [_node.plugin for _node in self._curr_tree.nodes.values()], _plugins
+        )
+        self.assertTrue(self._curr_tree.nodes[1].plugin.get_param_value("keep_results"))
+        self.assertTrue(self._curr_tree.tree_has_changed)
+
+    def test_update_from_string__new_structure(self):
+        for _plugin in [self.get_dummy_loader_plugin(), self.get_dummy_proc_plugin()]:
+            self._curr_tree.create_and_add_node(_plugin)
+        _tree = ProcessingTree()
+        _tree.create_and_add_node(self.get_dummy_loader_plugin())
+        _tree.create_and_add_node(self.get_dummy_proc_plugin())
+        _tree.create_and_add_node(self.get_dummy_proc_plugin(), parent=0)
+        self._curr_tree.update_from_string(_tree.export_to_string())
+        self.assertEqual(set(self._curr_tree.nodes), {0, 1, 2})
+        self.assertEqual(self._curr_tree.nodes[2].parent.node_id, 0)
+
     def test_update_from_tree(self):
         _nodes, _index = self.create_node_tree()
         self._curr_tree.set_root(_nodes[0][0])
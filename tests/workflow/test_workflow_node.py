@@ -24,15 +24,18 @@ __maintainer__ = "Malte Storm"
 __status__ = "Production"
 
 
+import tracemalloc
+from pathlib import Path
 from typing import Any
+from unittest import mock
 
 import numpy as np
 import pytest
 
 from pydidas.contexts import DiffractionExperimentContext
-from pydidas.core import Dataset
+from pydidas.core import Dataset, get_generic_parameter
 from pydidas.unittest_objects import DummyLoader, DummyProc
-from pydidas.workflow import WorkflowNode
+from pydidas.workflow import NodeProfile, WorkflowNode
 
 
 EXP = DiffractionExperimentContext()
@@ -47,11 +50,18 @@ class _PluginModifyInPlace(DummyProc):
         return data, kwargs
 
 
+class _ReusableProc(DummyProc):
+    """Plugin which allows skipping its pre_execute for unchanged settings."""
+
+    pre_execute_is_reusable = True
+
+
 def create_node_tree(
     depth: int = 3,
     width: int = 3,
     root: WorkflowNode | None = None,
     node_register: dict | None = None,
+    proc_class: type = _ReusableProc,
 ) -> tuple:
     """
     Create a node tree for testing.
@@ -66,6 +76,9 @@ def create_node_tree(
         The root of the tree.
     node_register : dict or None
         A dictionary to register nodes by their node_id.
+    proc_class : type, optional
+        The plugin class for all nodes except the root. The default is
+        _ReusableProc.
 
     Returns
     -------
@@ -78,7 +91,7 @@ def create_node_tree(
     _this_tier = []
     for _ in range(width):
         _index = max(node_register) + 1
-        _node = WorkflowNode(node_id=_index, plugin=DummyProc())
+        _node = WorkflowNode(node_id=_index, plugin=proc_class())
         root.add_child(_node)
         node_register[_node.node_id] = _node
         _this_tier.append(_node)
@@ -86,7 +99,11 @@ def create_node_tree(
     if depth > 0:
         for _node in _this_tier:
             node_register = create_node_tree(
-                depth=depth - 1, width=width, root=_node, node_register=node_register
+                depth=depth - 1,
+                width=width,
+                root=_node,
+                node_register=node_register,
+                proc_class=proc_class,
             )
     return node_register
 
@@ -234,6 +251,45 @@ def test_execute_plugin__single_in_tree():
     assert isinstance(_kws, dict)
 
 
+def test_execute_plugin__no_profile():
+    """Test that no profile is recorded by default."""
+    _node = WorkflowNode(plugin=DummyProc())
+    _node.execute_plugin(np.random.random((10, 10)))
+    assert _node.profile is None
+
+
+@pytest.mark.parametrize("trace_memory", [True, False])
+def test_execute_plugin__w_profile(trace_memory):
+    """Test that plugin executions are recorded in the node profile."""
+    _input = np.random.random((10, 10))
+    _node = WorkflowNode(plugin=DummyProc())
+    _node.profile = NodeProfile("test")
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        _node.execute_plugin(_input)
+        _node.execute_plugin(_input)
+    finally:
+        tracemalloc.stop()
+    assert _node.profile.n_calls == 2
+    assert _node.profile.runtime > 0
+    assert _node.profile.io_time == 0
+    assert _node.profile.bytes_in == 2 * _input.nbytes
+    assert _node.profile.bytes_out == 2 * _input.nbytes
+    assert (_node.profile.peak_memory > 0) == trace_memory
+    assert len(_node.profile.events) == 2
+
+
+def test_execute_plugin__w_profile_input_plugin():
+    """Test that the runtime of input plugins is counted as I/O time."""
+    _node = WorkflowNode(plugin=DummyLoader())
+    _node.profile = NodeProfile("test")
+    _node.execute_plugin(0)
+    assert _node.profile.n_calls == 1
+    assert _node.profile.io_time == _node.profile.runtime
+    assert _node.profile.bytes_in == 0
+
+
 # Prepare execution test
 
 
@@ -246,6 +302,87 @@ def test_prepare_execution():
         assert _node.plugin._pre_executed
 
 
+def test_prepare_execution__skip_unchanged():
+    """Test prepare_execution skips unchanged reusable plugins."""
+    nodes = create_node_tree()
+    _root = nodes[0]
+    _root.prepare_execution()
+    for _node in nodes.values():
+        _node.plugin._pre_executed = False
+    _root.prepare_execution(skip_unchanged=True)
+    assert _root.plugin._pre_executed
+    for _node in _root.get_children(recursive=True):
+        assert not _node.plugin._pre_executed
+
+
+def test_prepare_execution__skip_unchanged_w_non_reusable_plugins():
+    """Test prepare_execution always pre-executes non-reusable plugins."""
+    nodes = create_node_tree(proc_class=DummyProc)
+    _root = nodes[0]
+    _root.prepare_execution()
+    for _node in nodes.values():
+        _node.plugin._pre_executed = False
+    _root.prepare_execution(skip_unchanged=True)
+    for _node in nodes.values():
+        assert _node.plugin._pre_executed
+
+
+def test_prepare_execution__skip_unchanged_w_reusable_input_plugin():
+    """Test prepare_execution always pre-executes input plugins."""
+    _root = WorkflowNode(node_id=0, plugin=DummyLoader())
+    _root.plugin.pre_execute_is_reusable = True
+    _root.prepare_execution()
+    _root.plugin._pre_executed = False
+    _root.prepare_execution(skip_unchanged=True)
+    assert _root.plugin._pre_executed
+
+
+def test_prepare_execution__skip_unchanged_w_changed_test_mode():
+    """Test prepare_execution pre-executes all plugins if the mode changes."""
+    nodes = create_node_tree()
+    _root = nodes[0]
+    _root.prepare_execution()
+    for _node in nodes.values():
+        _node.plugin._pre_executed = False
+    _root.prepare_execution(skip_unchanged=True, test=True)
+    for _node in nodes.values():
+        assert _node.plugin._pre_executed
+
+
+def test_prepare_execution__skip_unchanged_w_changed_file(temp_path):
+    """Test prepare_execution pre-executes plugins if a file has changed."""
+    _fname = Path(temp_path).joinpath("test_file.txt")
+    _fname.write_text("test")
+    nodes = create_node_tree()
+    nodes[1].plugin.add_param(get_generic_parameter("filename"))
+    nodes[1].plugin.set_param_value("filename", _fname)
+    _root = nodes[0]
+    _root.prepare_execution()
+    for _node in nodes.values():
+        _node.plugin._pre_executed = False
+    _fname.write_text("new test content")
+    _root.prepare_execution(skip_unchanged=True)
+    assert nodes[0].plugin._pre_executed
+    for _node in [nodes[1]] + nodes[1].get_children(recursive=True):
+        assert _node.plugin._pre_executed
+    for _node in [nodes[2]] + nodes[2].get_children(recursive=True):
+        assert not _node.plugin._pre_executed
+
+
+def test_prepare_execution__skip_unchanged_resets_run_state():
+    """Test prepare_execution resets the run state of skipped plugins."""
+    nodes = create_node_tree()
+    _root = nodes[0]
+    _root.prepare_execution()
+    for _node in nodes.values():
+        _node.plugin._pre_executed = False
+    with mock.patch.object(_ReusableProc, "reset_run_state") as _reset:
+        _root.prepare_execution(skip_unchanged=True)
+    assert _reset.call_count == len(nodes) - 1
+    for _node in _root.get_children(recursive=True):
+        assert not _node.plugin._pre_executed
+
+
 def test_confirm_plugin_existence_and_type__no_plugin():
     """Test that KeyError is raised when no plugin is provided."""
     with pytest.raises(KeyError):
@@ -0,0 +1,226 @@
+# This file is part of pydidas.
+#
+# Copyright 2026, Helmholtz-Zentrum Hereon
+# SPDX-License-Identifier: GPL-3.0-only
+#
+# pydidas is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# Pydidas is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Pydidas. If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for pydidas modules."""
+
+__author__ = "Malte Storm"
+__copyright__ = "Copyright 2026, Helmholtz-Zentrum Hereon"
+__license__ = "GPL-3.0-only"
+__maintainer__ = "Malte Storm"
+__status__ = "Production"
+
+
+import json
+import pickle
+
+import pytest
+
+from pydidas.workflow import NodeProfile, WorkflowProfile, workflow_profile
+from pydidas.workflow.workflow_profile import RUNTIME_HISTOGRAM_EDGES
+
+
+def _create_profile(label: str, runtimes: list[float], io: bool = False):
+    _profile = NodeProfile(label)
+    for _index, _runtime in enumerate(runtimes):
+        _profile.add_call(
+            100.0 + _index,
+            _runtime,
+            io_time=_runtime if io else 0.0,
+            bytes_in=8,
+            bytes_out=16,
+            peak_memory=1000 * (_index + 1),
+        )
+    return _profile
+
+
+def test_node_profile__init():
+    _profile = NodeProfile("test")
+    assert _profile.label == "test"
+    assert _profile.n_calls == 0
+    assert len(_profile.histogram) == len(RUNTIME_HISTOGRAM_EDGES) + 1
+    assert sum(_profile.histogram) == 0
+
+
+def test_node_profile__add_call():
+    _profile = _create_profile("test", [0.5, 0.25])
+    assert _profile.n_calls == 2
+    assert _profile.runtime == pytest.approx(0.75)
+    assert _profile.io_time == 0
+    assert _profile.compute_time == pytest.approx(0.75)
+    assert _profile.bytes_in == 16
+    assert _profile.bytes_out == 32
+    assert _profile.peak_memory == 2000
+    assert _profile.events == [(100.0, 0.5), (101.0, 0.25)]
+
+
+def test_node_profile__add_call__io_time():
+    _profile = _create_profile("test", [0.5, 0.25], io=True)
+    assert _profile.io_time == pytest.approx(0.75)
+    assert _profile.compute_time == pytest.approx(0)
+
+
+@pytest.mark.parametrize(
+    "runtime, expected_bin", [(1e-7, 0), (0.5, 23), (1e3, len(RUNTIME_HISTOGRAM_EDGES))]
+)
+def test_node_profile__add_call__histogram(runtime, expected_bin):
+    _profile = _create_profile("test", [runtime])
+    assert _profile.histogram[expected_bin] == 1
+    assert sum(_profile.histogram) == 1
+
+
+def test_node_profile__add_call__max_events(monkeypatch):
+    monkeypatch.setattr(workflow_profile, "MAX_TRACE_EVENTS", 3)
+    _profile = _create_profile("test", [0.1] * 5)
+    assert _profile.n_calls == 5
+    assert len(_profile.events) == 3
+
+
+def test_node_profile__merge():
+    _profile = _create_profile("test", [0.5, 0.25])
+    _other = _create_profile("test", [0.125], io=True)
+    _profile.merge(_other)
+    assert _profile.n_calls == 3
+    assert _profile.runtime == pytest.approx(0.875)
+    assert _profile.io_time == pytest.approx(0.125)
+    assert _profile.peak_memory == 2000
+    assert sum(_profile.histogram) == 3
+    assert len(_profile.events) == 2
+
+
+def test_node_profile__pickle():
+    _profile = _create_profile("test", [0.5, 0.25])
+    _copy = pickle.loads(pickle.dumps(_profile))
+    assert _copy.as_dict() == _profile.as_dict()
+    assert _copy.events == _profile.events
+
+
+def test_node_profile__from_state():
+    _profile = _create_profile("test", [0.5, 0.25])
+    _copy = NodeProfile.from_state(_profile.__getstate__())
+    assert _copy.as_dict() == _profile.as_dict()
+    assert _copy.events == _profile.events
+    assert _copy.events is not _profile.events
+
+
+def test_node_profile__as_dict():
+    _profile = _create_profile("test", [0.5, 0.25])
+    _dict = _profile.as_dict()
+    assert _dict["label"] == "test"
+    assert _dict["mean_runtime"] == pytest.approx(0.375)
+    assert _dict["histogram"]["bin_edges"] == list(RUNTIME_HISTOGRAM_EDGES)
+    assert sum(_dict["histogram"]["counts"]) == 2
+
+
+def test_node_profile__as_dict__no_calls():
+    assert NodeProfile("test").as_dict()["mean_runtime"] == 0
+
+
+def test_workflow_profile__init():
+    _profile = WorkflowProfile({0: _create_profile("a", [0.5])}, pid=12)
+    assert _profile.n_processes == 1
+    assert list(_profile.nodes) == [0]
+
+
+def test_workflow_profile__init__empty():
+    _profile = WorkflowProfile()
+    assert _profile.n_processes == 0
+    assert _profile.nodes == {}
+
+
+def test_workflow_profile__add_process_profiles():
+    _profile = WorkflowProfile()
+    _profile.add_process_profiles(
+        {0: _create_profile("a", [0.5], io=True), 1: _create_profile("b", [0.25])},
+        pid=1,
+    )
+    _profile.add_process_profiles(
+        {0: _create_profile("a", [0.5], io=True), 1: _create_profile("b", [0.25])},
+        pid=2,
+    )
+    assert _profile.n_processes == 2
+    assert _profile.nodes[0].n_calls == 2
+    assert _profile.nodes[1].runtime == pytest.approx(0.5)
+
+
+def test_workflow_profile__add_process_profiles__no_calls():
+    _profile = WorkflowProfile()
+    _profile.add_process_profiles({0: NodeProfile("a")}, pid=1)
+    assert _profile.n_processes == 0
+    assert _profile.nodes == {}
+
+
+def test_workflow_profile__merge():
+    _profile = WorkflowProfile({0: _create_profile("a", [0.5])}, pid=1)
+    _other = WorkflowProfile(
+        {0: _create_profile("a", [0.5]), 1: _create_profile("b", [0.25])}, pid=2
+    )
+    _profile.merge(_other)
+    assert _profile.n_processes == 2
+    assert _profile.nodes[0].n_calls == 2
+    assert _profile.nodes[1].n_calls == 1
+    assert len(_profile.get_chrome_trace_events()) == 3
+
+
+def test_workflow_profile__as_dict():
+    _profile = WorkflowProfile(
+        {1: _create_profile("b", [0.25]), 0: _create_profile("a", [0.5], io=True)},
+        pid=1,
+    )
+    _dict = _profile.as_dict()
+    assert _dict["n_processes"] == 1
+    assert _dict["io_time"] == pytest.approx(0.5)
+    assert _dict["compute_time"] == pytest.approx(0.25)
+    assert list(_dict["nodes"]) == [0, 1]
+
+
+def test_workflow_profile__get_chrome_trace_events():
+    _profile = WorkflowProfile({3: _create_profile("a", [0.5, 0.25])}, pid=7)
+    _events = _profile.get_chrome_trace_events()
+    assert len(_events) == 2
+    assert _events[0]["name"] == "a"
+    assert _events[0]["ph"] == "X"
+    assert _events[0]["pid"] == 7
+    assert _events[0]["ts"] == pytest.approx(100e6)
+    assert _events[1]["dur"] == pytest.approx(0.25e6)
+    assert _events[1]["args"]["node_id"] == 3
+
+
+def test_workflow_profile__export_to_file__json(tmp_path):
+    _profile = WorkflowProfile({0: _create_profile("a", [0.5])}, pid=1)
+    _profile.export_to_file(tmp_path / "profile.json")
+    with open(tmp_path / "profile.json") as _file:
+        _content = json.load(_file)
+    assert _content["nodes"]["0"]["n_calls"] == 1
+    assert _content["n_processes"] == 1
+
+
+def test_workflow_profile__export_to_file__chrome_trace(tmp_path):
+    _profile = WorkflowProfile({0: _create_profile("a", [0.5, 0.25])}, pid=1)
+    _profile.export_to_file(tmp_path / "trace.json", "chrome_trace")
+    with open(tmp_path / "trace.json") as _file:
+        _content = json.load(_file)
+    assert len(_content["traceEvents"]) == 2
+
+
+def test_workflow_profile__export_to_file__invalid_format(tmp_path):
+    _profile = WorkflowProfile({0: _create_profile("a", [0.5])}, pid=1)
+    with pytest.raises(ValueError):
+        _profile.export_to_file(tmp_path / "profile.txt", "txt")
+
+
+if __name__ == "__main__":
+    pytest.main()
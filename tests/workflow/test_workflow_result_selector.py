@@ -603,6 +603,67 @@ class TestWorkflowResultSelector(unittest.TestCase):
         for _item in _slices:
             self.assertIsInstance(_item, np.ndarray)
 
+    def test_selection_intersects_region(self):
+        self.populate_WorkflowResults()
+        obj = WorkflowResultsSelector()
+        obj.set_param_value("use_data_range", False)
+        obj.select_active_node(1)
+        obj.set_param_value("data_slice_0", "1")
+        obj.set_param_value("data_slice_2", "1:")
+        self.assertFalse(
+            obj.selection_intersects_region((slice(1, 2), slice(0, 2), slice(0, 1)))
+        )
+        self.assertFalse(
+            obj.selection_intersects_region((slice(2, 5), slice(0, 2), slice(0, 3)))
+        )
+        self.assertTrue(
+            obj.selection_intersects_region((slice(0, 3), slice(1, 2), slice(2, 3)))
+        )
+
+    def test_selection_intersects_region__w_timeline(self):
+        self.populate_WorkflowResults()
+        obj = WorkflowResultsSelector()
+        obj.set_param_value("use_data_range", False)
+        obj.set_param_value("use_scan_timeline", True)
+        obj.select_active_node(1)
+        obj.set_param_value("data_slice_0", "7")
+        self.assertTrue(
+            obj.selection_intersects_region((slice(1, 2), slice(0, 1), slice(1, 2)))
+        )
+        self.assertFalse(
+            obj.selection_intersects_region((slice(1, 2), slice(0, 1), slice(0, 1)))
+        )
+
+    def test_sig_regions_updated__w_selected_region(self):
+        self.populate_WorkflowResults()
+        obj = WorkflowResultsSelector()
+        obj.set_param_value("use_data_range", False)
+        obj.select_active_node(1)
+        obj.set_param_value("data_slice_0", "1")
+        _emitted = []
+        obj.sig_selected_results_updated.connect(lambda: _emitted.append(True))
+        RES.sig_regions_updated.emit({1: (slice(1, 2), slice(0, 2), slice(0, 3))})
+        self.assertEqual(_emitted, [True])
+
+    def test_sig_regions_updated__w_unselected_region(self):
+        self.populate_WorkflowResults()
+        obj = WorkflowResultsSelector()
+        obj.set_param_value("use_data_range", False)
+        obj.select_active_node(1)
+        obj.set_param_value("data_slice_0", "1")
+        _emitted = []
+        obj.sig_selected_results_updated.connect(lambda: _emitted.append(True))
+        RES.sig_regions_updated.emit({1: (slice(2, 5), slice(0, 2), slice(0, 3))})
+        RES.sig_regions_updated.emit({2: (slice(1, 2), slice(0, 2), slice(0, 3))})
+        self.assertEqual(_emitted, [])
+
+    def test_sig_regions_updated__no_active_node(self):
+        obj = WorkflowResultsSelector()
+        _emitted = []
+        obj.sig_selected_results_updated.connect(lambda: _emitted.append(True))
+        RES.sig_regions_updated.emit({1: (slice(0, 5), slice(0, 2), slice(0, 3))})
+        self.assertEqual(_emitted, [])
+
 
 if __name__ == "__main__":
     unittest.main()